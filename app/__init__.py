@@ -317,11 +317,14 @@ def _initialize_default_templates():
 def create_app():
     import os
     import logging
+    from .startup.startup_report import StartupTimer
+    startup_timer = StartupTimer()
     # Ensure schema preflight executes (module import side-effect)
     try:
         from .startup import schema_preflight  # noqa: F401
     except Exception as _spf_err:
         print(f"[APP] Warning: schema_preflight import failed: {_spf_err}")
+    startup_timer.mark('schema_preflight')
     
     # Ensure static folder exists and is correctly configured
     static_folder = os.path.join(os.path.dirname(__file__), 'static')
@@ -357,38 +360,70 @@ def create_app():
     import logging
     logging.getLogger('asyncio').setLevel(logging.INFO)
     
+    startup_timer.mark('flask_app')
+    
     with app.app_context():
         setup_debug_logging()
         print_debug_banner()
         
         # Check for SQLite migration needs
         _check_for_sqlite_migration()
+        startup_timer.mark('debug_setup')
         
-        # At end of factory before returning app, ensure backup scheduler initialized
-        try:
-            from .services.simple_backup_service import get_simple_backup_service
-            backup_service = get_simple_backup_service()
-            # Scheduler auto-starts if enabled; force ensure here
-            backup_service.ensure_scheduler()
-            app.logger.info("Automatic backup scheduler ensured (daily backups)")
-        except Exception as e:
-            app.logger.warning(f"Failed to initialize backup scheduler: {e}")
+        # Background threads (schedulers, sync runners). A preloading gunicorn master
+        # defers them to the worker, since threads do not survive fork(); the startup
+        # report is closed by then, so after_fork times them for the warm-up report.
+        from .startup.worker_warmup import preloading, run_in_worker
+        mark = (lambda _phase: None) if preloading() else startup_timer.mark
 
-        # Ensure Audiobookshelf sync runner is started (queue + scheduler)
-        try:
-            from .services.audiobookshelf_sync_runner import ensure_abs_sync_runner
-            ensure_abs_sync_runner()
-            app.logger.info("ABS sync runner ensured")
-        except Exception as e:
-            app.logger.warning(f"Failed to start ABS sync runner: {e}")
+        def _start_background_services():
+            with app.app_context():
+                # At end of factory before returning app, ensure backup scheduler initialized
+                try:
+                    from .services.simple_backup_service import get_simple_backup_service
+                    backup_service = get_simple_backup_service()
+                    # Scheduler auto-starts if enabled; force ensure here
+                    backup_service.ensure_scheduler()
+                    app.logger.info("Automatic backup scheduler ensured (daily backups)")
+                except Exception as e:
+                    app.logger.warning(f"Failed to initialize backup scheduler: {e}")
+                mark('backup_scheduler')
 
-        # Ensure OPDS sync runner is started for background jobs and scheduler
-        try:
-            from .services.opds_sync_runner import ensure_opds_sync_runner
-            ensure_opds_sync_runner()
-            app.logger.info("OPDS sync runner ensured")
-        except Exception as e:
-            app.logger.warning(f"Failed to start OPDS sync runner: {e}")
+                # Shared background job scheduler (imports, syncs, cover processing)
+                try:
+                    from .services.job_scheduler import get_job_scheduler
+                    get_job_scheduler().init_app(app)
+                except Exception as e:
+                    app.logger.warning(f"Failed to initialize background job scheduler: {e}")
+                mark('job_scheduler')
+
+                # Ensure Audiobookshelf sync runner is started (queue + scheduler)
+                try:
+                    from .services.audiobookshelf_sync_runner import ensure_abs_sync_runner
+                    ensure_abs_sync_runner()
+                    app.logger.info("ABS sync runner ensured")
+                except Exception as e:
+                    app.logger.warning(f"Failed to start ABS sync runner: {e}")
+                mark('abs_runner')
+
+                # Ensure OPDS sync runner is started for background jobs and scheduler
+                try:
+                    from .services.opds_sync_runner import ensure_opds_sync_runner
+                    ensure_opds_sync_runner()
+                    app.logger.info("OPDS sync runner ensured")
+                except Exception as e:
+                    app.logger.warning(f"Failed to start OPDS sync runner: {e}")
+                mark('opds_runner')
+
+                # Periodic cover storage integrity scan (orphans / dangling references)
+                try:
+                    from .services.cover_integrity import ensure_integrity_scheduler
+                    ensure_integrity_scheduler()
+                except Exception as e:
+                    app.logger.warning(f"Failed to start cover integrity scheduler: {e}")
+                mark('cover_integrity')
+
+        run_in_worker('background_services', _start_background_services)
 
         # Run series migration (idempotent)
         try:
@@ -397,6 +432,7 @@ def create_app():
             app.logger.info(f"Series migration summary: {mig_summary}")
         except Exception as e:
             app.logger.warning(f"Series migration failed (continuing): {e}")
+        startup_timer.mark('series_migration')
 
     # Initialize extensions (no SQLAlchemy)
     csrf.init_app(app)
@@ -480,6 +516,26 @@ def create_app():
         from app.services.unified_cover_manager import cover_manager
         return cover_manager.get_cover_info(book).has_cover
     
+    @app.template_filter('cover_srcset')
+    def cover_srcset_filter(cover, fmt='jpg'):
+        """srcset of responsive derivatives for a local cover URL or book ('' if remote)."""
+        from app.services.unified_cover_manager import cover_manager
+        return cover_manager.get_srcset(cover, fmt)
+
+    @app.template_filter('cover_sources')
+    def cover_sources_filter(cover, sizes=None):
+        """AVIF/WebP <source> tags for a <picture> wrapping a cover <img>."""
+        from markupsafe import Markup
+        from app.services.unified_cover_manager import cover_manager
+        return Markup(cover_manager.render_picture_sources(cover, sizes))
+
+    @app.template_filter('cover_html')
+    def cover_html_filter(book, css_classes="", style="", img_id="", sizes=None, alt=None):
+        """Full responsive cover markup (escaped) for a book or cover URL using UnifiedCoverManager."""
+        from markupsafe import Markup
+        from app.services.unified_cover_manager import cover_manager
+        return Markup(cover_manager.render_cover_html(book, css_classes, style, img_id, sizes, alt))
+
     # Markdown rendering filter
     @app.template_filter('markdown')
     def markdown_filter(text):
@@ -523,6 +579,8 @@ def create_app():
         # Migration is available through the admin panel -> /admin/migration
         pass
 
+    startup_timer.mark('extensions_and_templates')
+
     # KUZU DATABASE INITIALIZATION
     with app.app_context():
         # Use environment variable to control verbose logging across multiple workers
@@ -630,6 +688,8 @@ def create_app():
         # Check for SQLite databases that might need migration
         check_for_migration_reminder()
 
+    startup_timer.mark('kuzu_init')
+
     # Add middleware to check for setup requirements
     @app.before_request
     def check_setup_and_password_requirements():
@@ -815,93 +875,69 @@ def create_app():
                 return redirect(url_for('auth.forced_password_change'))
 
     # Add explicit static file serving for production (gunicorn doesn't serve static files by default)
+    # Directories are resolved once; see app.utils.static_files for sendfile/precompressed/X-Accel handling.
+    from app.utils.static_files import StaticRoot, send_static_file
+    _package_dir = os.path.dirname(__file__)
+    # Historically ./app/static was bind-mounted to /app/static in Docker; the package copy
+    # (app/static, i.e. /app/app/static in the container) is the fallback.
+    static_root = StaticRoot(
+        'static',
+        ['/app/static', os.path.join(_package_dir, 'static')],
+        'no-cache',
+        precompressed=True,
+    )
+    # Fingerprinted names (or ?v=<hash>) are cached forever; use static_url() in templates
+    from app.utils.static_manifest import StaticManifest
+    static_manifest = StaticManifest(static_root)
+    app.jinja_env.globals['static_url'] = static_manifest.url_for
+    covers_root = StaticRoot(
+        'covers',
+        ['/app/data/covers' if os.path.isdir('/app/data/covers')
+         else os.path.join(os.path.dirname(_package_dir), 'data', 'covers')],
+        # Cache covers moderately; they can change if users update them
+        'public, max-age=2592000, stale-while-revalidate=604800',
+    )
+
     @app.route('/static/<path:filename>')
     def serve_static(filename):
-        """Serve static files in production mode with robust path fallback.
-
-        Historically we bind-mounted ./app/static to /app/static in Docker. To avoid
-        macOS bind mount deadlocks, we removed that mount. The project structure keeps
-        static assets under the package path app/static (i.e., /app/app/static in the
-        container). This handler checks both locations and serves the first match.
-        """
-        import os
-        import mimetypes
-        from flask import send_from_directory, abort
-
-        docker_static_dir = '/app/static'
-        package_static_dir = os.path.join(os.path.dirname(__file__), 'static')  # /app/app/static
-
-        # Ensure proper MIME types for fonts (bootstrap-icons)
-        mimetypes.add_type('font/woff2', '.woff2')
-        mimetypes.add_type('font/woff', '.woff')
-
-        # Prefer /app/static only if the specific file exists there
-        docker_path = os.path.join(docker_static_dir, filename)
-        pkg_path = os.path.join(package_static_dir, filename)
-
-        from flask import make_response
-        def _with_cache_headers(resp):
-            try:
-                # Long-lived caching for static assets; rely on filename changes to bust cache
-                resp.headers['Cache-Control'] = 'public, max-age=31536000, immutable'
-            except Exception:
-                pass
-            return resp
-
-        if os.path.exists(docker_path):
-            return _with_cache_headers(send_from_directory(docker_static_dir, filename))
-        if os.path.exists(pkg_path):
-            return _with_cache_headers(send_from_directory(package_static_dir, filename))
-
-        # If neither exists, fall back to whichever directory exists to preserve
-        # prior behavior (will 404 from send_from_directory)
-        if os.path.isdir(docker_static_dir):
-            return _with_cache_headers(send_from_directory(docker_static_dir, filename))
-        if os.path.isdir(package_static_dir):
-            return _with_cache_headers(send_from_directory(package_static_dir, filename))
-        return abort(404)
+        """Serve static files in production mode (first match of /app/static, app/static)."""
+        return send_static_file(static_root, filename, static_manifest.cache_control_for(filename))
 
     # Add routes to serve user data files from data directory
     @app.route('/covers/<path:filename>')
     def serve_covers(filename):
         """Serve cover images from data directory."""
-        import os
-        from flask import send_from_directory
-        
-        # Check for Docker (production) or local development
-        docker_data_dir = '/app/data/covers'
-        local_data_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'covers')
-        
-        if os.path.exists(docker_data_dir):
-            covers_dir = docker_data_dir
-        else:
-            covers_dir = local_data_dir
+        from flask import abort
+        # Responsive derivatives are generated on first request if missing
+        if filename.startswith('derived/'):
+            from pathlib import Path
+            from app.utils.cover_derivatives import ensure_derivative
+            from app.utils.cpu_pool import CpuPoolBusy, run_cpu_bound
+            covers_dir = covers_root.candidates[0]
+            if covers_root.resolve(filename) is None:
+                try:
+                    generated = run_cpu_bound(ensure_derivative, Path(covers_dir), filename[len('derived/'):])
+                except CpuPoolBusy:
+                    abort(503)
+                if generated is None:
+                    abort(404)
+            # Derivative names are tied to an immutable original, so cache aggressively
+            return send_static_file(covers_root, filename, 'public, max-age=31536000, immutable')
+        return send_static_file(covers_root, filename)
 
-        from flask import send_from_directory as _sfd, make_response
-        try:
-            resp = _sfd(covers_dir, filename)
-            # Cache covers moderately; they can change if users update them
-            resp.headers['Cache-Control'] = 'public, max-age=2592000, stale-while-revalidate=604800'
-        except Exception:
-            resp = _sfd(covers_dir, filename)
-        return resp
+    uploads_root = StaticRoot(
+        'uploads',
+        ['/app/data/uploads' if os.path.isdir('/app/data/uploads')
+         else os.path.join(os.path.dirname(_package_dir), 'data', 'uploads')],
+        'no-cache',
+    )
 
     @app.route('/uploads/<path:filename>')
     def serve_uploads(filename):
         """Serve uploaded files from data directory."""
-        import os
-        from flask import send_from_directory
-        
-        # Check for Docker (production) or local development
-        docker_data_dir = '/app/data/uploads'
-        local_data_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'uploads')
-        
-        if os.path.exists(docker_data_dir):
-            uploads_dir = docker_data_dir
-        else:
-            uploads_dir = local_data_dir
-            
-        return send_from_directory(uploads_dir, filename)
+        return send_static_file(uploads_root, filename)
+
+    startup_timer.mark('request_hooks_and_static')
 
     # Register application routes via modular blueprints
     from .routes import register_blueprints
@@ -939,6 +975,8 @@ def create_app():
     
     # Note: Genre routes are now registered via register_blueprints() in routes/__init__.py
     
+    startup_timer.mark('blueprints_optional')
+    
     # Register main and modular routes
     register_blueprints(app)
     app.register_blueprint(auth, url_prefix='/auth')
@@ -998,6 +1036,7 @@ def create_app():
     app.register_blueprint(cover_bp)
     if api_book_bp:
         app.register_blueprint(api_book_bp)
+    startup_timer.mark('blueprints_core')
 
     # Add shutdown logging
     from datetime import datetime
@@ -1163,5 +1202,7 @@ def create_app():
             if verbose_probe:
                 print(f"[APP] before_first_request: Readiness DB check failed: {e}")
 
-    print("[APP] Flask app factory completed; application is ready to serve.")
+    startup_timer.mark('shutdown_and_probe_hooks')
+    app.config['STARTUP_REPORT'] = startup_timer.finish()
+    print(f"[APP] Flask app factory completed in {app.config['STARTUP_REPORT']['total_ms']:.0f} ms; application is ready to serve.")
     return app
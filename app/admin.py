@@ -18,6 +18,7 @@ import re
 import logging
 from app.utils.safe_kuzu_manager import SafeKuzuManager, get_safe_kuzu_manager
 from app.domain.models import MediaType
+from app.utils.settings_cache import load_json, write_json
 from app.utils.password_policy import (
     ENV_PASSWORD_MIN_LENGTH_KEY,
     MAX_ALLOWED_PASSWORD_LENGTH,
@@ -346,8 +347,7 @@ def save_system_config(config):
         existing_config['last_updated'] = datetime.now().isoformat()
         
         # Save updated config
-        with open(config_path, 'w') as f:
-            json.dump(existing_config, f, indent=2)
+        write_json(config_path, existing_config)
         
         return True
     except Exception as e:
@@ -372,9 +372,10 @@ def load_system_config():
         
         config_path = os.path.join(data_dir, 'system_config.json')
         
-        if os.path.exists(config_path):
-            with open(config_path, 'r') as f:
-                return json.load(f)
+        # Parsed once and revalidated by mtime (see app.utils.settings_cache)
+        data = load_json(config_path)
+        if data is not None:
+            return data
     except (json.JSONDecodeError, Exception) as e:
         # Log warning if we have current_app context, otherwise print
         try:
@@ -468,8 +469,7 @@ def save_smtp_config(config):
         existing_config['last_updated'] = datetime.now().isoformat()
         
         # Save updated config
-        with open(config_path, 'w') as f:
-            json.dump(existing_config, f, indent=2)
+        write_json(config_path, existing_config)
         
         return True
     except Exception as e:
@@ -508,8 +508,7 @@ def save_backup_config(config):
         existing_config['last_updated'] = datetime.now().isoformat()
         
         # Save updated config
-        with open(config_path, 'w') as f:
-            json.dump(existing_config, f, indent=2)
+        write_json(config_path, existing_config)
         
         return True
     except Exception as e:
@@ -1280,6 +1279,112 @@ def api_stats():
     stats = get_system_stats()
     return jsonify(stats)
 
+@admin.route('/api/jobs')
+@login_required
+@admin_required
+def api_jobs():
+    """Background job scheduler status: pool limits, queue depth and recent jobs."""
+    from app.services.job_scheduler import get_job_scheduler
+    from app.utils.cpu_pool import get_cpu_pool
+    scheduler = get_job_scheduler()
+    return jsonify({'stats': scheduler.stats(), 'cpu_pool': get_cpu_pool().stats(), 'jobs': scheduler.list_jobs()})
+
+@admin.route('/api/covers/gc', methods=['GET', 'POST'])
+@login_required
+@admin_required
+def api_cover_gc():
+    """Report (GET, or POST dry_run=1) or delete (POST dry_run=0) cover files no book, series or person references."""
+    from app.services.cover_storage import collect_garbage
+    dry_run = True
+    if request.method == 'POST':
+        payload = request.get_json(silent=True) or request.form
+        dry_run = str(payload.get('dry_run', 'true')).lower() in ('1', 'true', 'yes', 'on')
+    try:
+        report = collect_garbage(dry_run=dry_run)
+    except Exception as e:
+        _log('error', f"[COVER][GC] failed: {e}")
+        return jsonify({'ok': False, 'error': str(e)}), 500
+    _log('info', f"[COVER][GC] admin={current_user.id} dry_run={dry_run} orphaned={report['orphaned']} deleted={report['deleted']}")
+    if report.get('incomplete'):
+        # Some references could not be read; nothing was deleted
+        return jsonify({'ok': False, 'error': report.get('error'), 'report': report}), 503
+    return jsonify({'ok': True, 'report': report})
+
+@admin.route('/api/covers/integrity', methods=['GET', 'POST'])
+@login_required
+@admin_required
+def api_cover_integrity():
+    """Last integrity report and job status (GET) or start a scan (POST).
+
+    POST options: delete_orphans, clear_dangling (both default false = report only).
+    """
+    from app.services import cover_integrity
+    if request.method == 'GET':
+        return jsonify({'ok': True, 'status': cover_integrity.get_status()})
+    payload = request.get_json(silent=True) or request.form
+    def _flag(name: str) -> bool:
+        return str(payload.get(name, 'false')).lower() in ('1', 'true', 'yes', 'on')
+    try:
+        status = cover_integrity.start_integrity_scan(
+            delete_orphans=_flag('delete_orphans'),
+            clear_dangling=_flag('clear_dangling'),
+            user_id=str(current_user.id),
+        )
+    except Exception as e:
+        _log('error', f"[COVER][INTEGRITY] start failed: {e}")
+        return jsonify({'ok': False, 'error': str(e)}), 500
+    _log('info', f"[COVER][INTEGRITY] admin={current_user.id} queued scan options={status.get('options')}")
+    return jsonify({'ok': True, 'status': status}), 202
+
+@admin.route('/api/covers/integrity/cancel', methods=['POST'])
+@login_required
+@admin_required
+def api_cover_integrity_cancel():
+    from app.services import cover_integrity
+    return jsonify({'ok': cover_integrity.cancel_integrity_scan(), 'status': cover_integrity.get_status()})
+
+@admin.route('/api/startup', methods=['GET'])
+@login_required
+@admin_required
+def api_startup_report():
+    """Cold-start timing of this worker's create_app and warm-up (see app.startup)."""
+    return jsonify({
+        'ok': True,
+        'report': current_app.config.get('STARTUP_REPORT'),
+        'warmup': current_app.config.get('WORKER_WARMUP'),
+    })
+
+@admin.route('/api/covers/backfill', methods=['GET', 'POST'])
+@login_required
+@admin_required
+def api_cover_backfill():
+    """Status (GET) or start/resume (POST) of the bulk cover backfill job."""
+    from app.services import cover_backfill
+    if request.method == 'GET':
+        return jsonify({'ok': True, 'status': cover_backfill.get_status()})
+    payload = request.get_json(silent=True) or request.form
+    def _flag(name: str, default: bool) -> bool:
+        return str(payload.get(name, default)).lower() in ('1', 'true', 'yes', 'on')
+    limit = payload.get('limit')
+    try:
+        status = cover_backfill.start_backfill(
+            include_missing=_flag('include_missing', True),
+            resume=_flag('resume', True),
+            limit=int(limit) if limit else None,
+            user_id=str(current_user.id),
+        )
+    except Exception as e:
+        _log('error', f"[COVER][BACKFILL] start failed: {e}")
+        return jsonify({'ok': False, 'error': str(e)}), 500
+    return jsonify({'ok': True, 'status': status}), 202
+
+@admin.route('/api/covers/backfill/cancel', methods=['POST'])
+@login_required
+@admin_required
+def api_cover_backfill_cancel():
+    from app.services import cover_backfill
+    return jsonify({'ok': cover_backfill.cancel_backfill(), 'status': cover_backfill.get_status()})
+
 @admin.route('/update-ai-settings', methods=['POST'])
 @login_required
 @admin_required
@@ -13,15 +13,14 @@ import traceback
 
 from ..api_auth import api_token_required, api_auth_optional
 from ..services import book_service
-from ..services.kuzu_service_facade import KuzuServiceFacade as KuzuBookService
 from ..domain.models import Book as DomainBook, Author, Publisher, BookContribution, ContributionType
 from ..utils.unified_metadata import fetch_unified_by_isbn, fetch_unified_by_title
 
 # Create API blueprint
 books_api = Blueprint('books_api', __name__, url_prefix='/api/v1/books')
 
-# Initialize the correct services
-kuzu_book_service = KuzuBookService()
+# Shared lazily-built facade (KuzuBookService); constructed on first request, not at import
+kuzu_book_service = book_service
 # Note: KuzuUserBookService was removed - functionality is now part of the facade
 
 
@@ -732,6 +732,7 @@ def settings_data_partial(panel: str):
                     age = 'Just now'
                 size_mb = b.file_size / (1024 * 1024)
                 size_formatted = f"{size_mb:.1f} MB"
+                stored_fmt = f"{b.stored_size / (1024 * 1024):.1f} MB" if b.stored_size is not None else None
                 if b.metadata and 'original_size' in b.metadata:
                     db_sz = b.metadata['original_size']
                     db_fmt = f"{db_sz / (1024 * 1024):.1f} MB"
@@ -744,8 +745,10 @@ def settings_data_partial(panel: str):
                     'created_at': b.created_at,
                     'file_path': b.file_path,
                     'file_size': b.file_size,
+                    'stored_size': b.stored_size,
                     'age': age,
                     'size_formatted': size_formatted,
+                    'stored_size_formatted': stored_fmt,
                     'database_size_formatted': db_fmt,
                     'valid': _Path(b.file_path).exists()
                 })
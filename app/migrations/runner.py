@@ -12,7 +12,7 @@ from __future__ import annotations
 from typing import Dict, List, Tuple
 import logging
 
-from app.utils.safe_kuzu_manager import get_safe_kuzu_manager
+from app.utils.safe_kuzu_manager import get_safe_kuzu_manager, read_catalog
 
 logger = logging.getLogger(__name__)
 
@@ -40,9 +40,14 @@ def _column_exists(conn, table: str, column: str) -> bool:
 
 
 def _detect_missing_book_columns(conn) -> List[Tuple[str, str]]:
+    try:
+        existing = set(read_catalog(conn).get("Book", {}).get("properties", {}))
+    except Exception:  # fall back to probing each column
+        existing = None
     missing = []
     for col, typ in _BOOK_COLUMNS:
-        if not _column_exists(conn, "Book", col):
+        present = (col in existing) if existing is not None else _column_exists(conn, "Book", col)
+        if not present:
             missing.append((col, typ))
     return missing
 
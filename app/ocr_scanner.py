@@ -58,16 +58,10 @@ class ISBNExtractor:
                 temp_path = temp_file.name
             
             try:
-                # Try barcode detection first (most reliable)
-                isbn = self._extract_from_barcode(temp_path)
+                # Decoding, preprocessing and tesseract run in the shared CPU pool
+                from app.utils.cpu_pool import run_cpu_bound
+                isbn = run_cpu_bound(scan_isbn_from_path, temp_path)
                 if isbn:
-                    logger.info(f"ISBN extracted from barcode: {isbn}")
-                    return isbn
-                
-                # Fall back to OCR
-                isbn = self._extract_from_ocr(temp_path)
-                if isbn:
-                    logger.info(f"ISBN extracted from OCR: {isbn}")
                     return isbn
                 
                 logger.warning("No ISBN found in image")
@@ -225,6 +219,21 @@ class ISBNExtractor:
         return None
 
 
+def scan_isbn_from_path(image_path: str) -> Optional[str]:
+    """Barcode detection with OCR fallback for an image on disk (CPU pool entry point)."""
+    scanner = ISBNExtractor()
+    # Try barcode detection first (most reliable)
+    isbn = scanner._extract_from_barcode(image_path)
+    if isbn:
+        logger.info(f"ISBN extracted from barcode: {isbn}")
+        return isbn
+    # Fall back to OCR
+    isbn = scanner._extract_from_ocr(image_path)
+    if isbn:
+        logger.info(f"ISBN extracted from OCR: {isbn}")
+    return isbn
+
+
 def extract_isbn_from_image(image_file) -> Optional[str]:
     """
     Convenience function to extract ISBN from image file.
@@ -28,7 +28,7 @@ import pytz
 from datetime import datetime, timezone
 
 from .advanced_migration_system import AdvancedMigrationSystem, DatabaseVersion
-from .routes.import_routes import store_job_in_kuzu, start_import_job, auto_create_custom_fields, update_job_in_kuzu
+from .routes.import_routes import start_import_job, auto_create_custom_fields
 from .utils.safe_import_manager import (
     safe_import_manager,
     safe_create_import_job,
@@ -2293,11 +2293,7 @@ def start_onboarding_import_job(user_id: str, import_config: Dict) -> Optional[s
             logger.warning(f"⚠️ Could not count CSV rows: {e}")
             job_data['total'] = 0
         
-        # Store job data using the safe import manager
-        print(f"🚀 [IMPORT_JOB] Storing job in Kuzu...")
-        kuzu_success = store_job_in_kuzu(task_id, job_data)
-        print(f"🚀 [IMPORT_JOB] Kuzu storage result: {kuzu_success}")
-        
+        # Store job data using the safe import manager (persisted to ImportJobStore)
         print(f"🚀 [IMPORT_JOB] Storing job safely with user isolation...")
         safe_success = safe_create_import_job(user_id, task_id, job_data)
         print(f"🚀 [IMPORT_JOB] Safe storage complete: {safe_success}")
@@ -2469,13 +2465,6 @@ def execute_csv_import_with_progress(task_id: str, csv_file_path: str, field_map
                     job['current_book'] = f"Row {row_num}"
                     job['processed'] = row_num - 1  # Zero-based for processed count
                     
-                    # Update progress every 5 rows to avoid too many updates
-                    if row_num % 5 == 0:
-                        update_job_in_kuzu(task_id, {
-                            'processed': job['processed'],
-                            'current_book': job['current_book']
-                        })
-                    
                     logger.info(f"📖 Processing row {row_num}: {row}")
                     
                     # Extract book data based on mappings
@@ -2542,14 +2531,6 @@ def execute_csv_import_with_progress(task_id: str, csv_file_path: str, field_map
                 # Update final processed count
                 job['processed'] = row_num
         
-        # Final progress update
-        update_job_in_kuzu(task_id, {
-            'processed': job['processed'],
-            'success': job['success'],
-            'errors': job['errors'],
-            'current_book': None
-        })
-        
         logger.info(f"📊 CSV processing completed. Success: {job['success']}, Errors: {job['errors']}")
         
         # Clean up temp file
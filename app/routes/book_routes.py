@@ -659,6 +659,9 @@ def fetch_book(isbn):
             return (10-(t%10))%10 == int(v[12])
         if not raw or not (_v10(raw) or _v13(raw)):
             return jsonify({'error': 'Invalid ISBN'}), 400
+        # Resolve and download the cover while metadata is being fetched
+        from app.services.cover_service import cover_service
+        cover_service.prefetch(raw)
         from app.utils.metadata_aggregator import fetch_unified_by_isbn
         unified = fetch_unified_by_isbn(isbn) or {}
         book_data = dict(unified)
@@ -822,6 +825,9 @@ def api_quick_isbn(isbn):
             parts.append(f"TOTAL={(last-base)*1000:.1f}ms")
             return ' | '.join(parts)
         _mark('start')
+        from app.services.cover_service import cover_service
+        # Cover candidates + download run concurrently with the metadata lookup
+        cover_service.prefetch(isbn)
         from app.utils.metadata_aggregator import fetch_unified_by_isbn
         unified = fetch_unified_by_isbn(isbn) or {}
         _mark('unified_fetch')
@@ -843,7 +849,6 @@ def api_quick_isbn(isbn):
             pass
         _mark('cover_norm')
         async_mode = request.args.get('async_cover') == '1'
-        from app.services.cover_service import cover_service
         if async_mode:
             cand = cover_service.select_candidate(isbn=isbn, title=data.get('title'), author=data.get('author'))
             if cand:
@@ -1109,6 +1114,9 @@ def add_book_from_image():
             # UI will call unified-metadata separately after we return ISBN, but we include
             # data here when available for completeness/debugging.
             try:
+                # Start cover resolution now; it runs alongside the metadata lookup
+                from app.services.cover_service import cover_service
+                cover_service.prefetch(isbn)
                 # Use unified metadata aggregator (already normalizes covers downstream)
                 from app.utils.unified_metadata import fetch_unified_by_isbn
                 book_data = fetch_unified_by_isbn(isbn)
@@ -1116,7 +1124,11 @@ def add_book_from_image():
                 if book_data:
                     from app.utils.image_processing import process_image_from_url
                     cover_url = book_data.get('cover_url') or book_data.get('cover')
-                    if cover_url:
+                    cr = cover_service.fetch_and_cache(isbn=isbn, title=book_data.get('title'), author=book_data.get('author'))
+                    if cr.cached_url:
+                        book_data['cover'] = cr.cached_url
+                        book_data['cover_url'] = cr.cached_url
+                    elif cover_url:
                         try:
                             processed_cover = process_image_from_url(cover_url)
                             if processed_cover:
@@ -3760,11 +3772,10 @@ def replace_cover(uid):
                         if (new_size < 12000 and old_size > 20000) or (new_size / old_size) < 0.5:
                             downgrade = True
                     if downgrade:
-                        # Remove newly created (inferior) file to avoid clutter
+                        # Remove newly created (inferior) file to avoid clutter, unless another record shares it
                         try:
-                            nf = get_covers_dir() / new_cached_cover_url.split('/')[-1]
-                            if nf.exists():
-                                nf.unlink()
+                            from app.services.cover_storage import release_cover_file
+                            release_cover_file(new_cached_cover_url, keep_url=old_cover_url)
                         except Exception:
                             pass
                         current_app.logger.info(
@@ -3787,14 +3798,12 @@ def replace_cover(uid):
             except Exception as cache_err:
                 current_app.logger.debug(f"[COVER][REPLACE][CACHE_BUMP_FAIL] uid={uid} err={cache_err}")
 
-            # Clean up old cover file if it exists and is a local file
-            if old_cover_url and (old_cover_url.startswith('/covers/') or old_cover_url.startswith('/static/covers/')):
+            # Clean up the old cover file if nothing else references it (covers are content-addressed and may be shared)
+            if old_cover_url:
                 try:
-                    old_filename = old_cover_url.split('/')[-1]
-                    old_filepath = get_covers_dir() / old_filename
-                    if old_filepath.exists():
-                        old_filepath.unlink()
-                        current_app.logger.debug(f"Cleaned up old cover file: {old_filename}")
+                    from app.services.cover_storage import release_cover_file
+                    if release_cover_file(old_cover_url, keep_url=new_cached_cover_url):
+                        current_app.logger.debug(f"Cleaned up old cover file: {old_cover_url}")
                 except Exception as cleanup_error:
                     current_app.logger.debug(f"Failed to clean up old cover file: {cleanup_error}")
 
@@ -3863,14 +3872,12 @@ def upload_cover(uid):
         # Update the book with the new cover URL
         book_service.update_book_sync(user_book.uid, str(current_user.id), cover_url=abs_cover_url)
         
-        # Clean up old cover file if it exists and is a local file
-        if old_cover_url and (old_cover_url.startswith('/covers/') or old_cover_url.startswith('/static/covers/')):
+        # Clean up the old cover file if nothing else references it (covers are content-addressed and may be shared)
+        if old_cover_url:
             try:
-                old_filename = old_cover_url.split('/')[-1]
-                old_filepath = get_covers_dir() / old_filename
-                if old_filepath.exists():
-                    old_filepath.unlink()
-                current_app.logger.debug(f"Cleaned up old cover file: {old_filename}")
+                from app.services.cover_storage import release_cover_file
+                if release_cover_file(old_cover_url, keep_url=new_cover_url):
+                    current_app.logger.debug(f"Cleaned up old cover file: {old_cover_url}")
             except Exception as cleanup_error:
                 current_app.logger.debug(f"Failed to clean up old cover file: {cleanup_error}")
         
@@ -4097,27 +4104,53 @@ def month_review(year, month):
         # This should only be accessed if there are books (from month_wrapup)
         return "No books found", 404
 
-    # Convert to format expected by generate_month_review_image
-    # The function likely expects objects with title, author, cover_url attributes
+    # generate_month_review_image renders in a worker process, so pass plain dicts
     book_objects = []
     for book in books:
-        # Create a simple object with the expected attributes
-        book_obj = type('Book', (), {
-            'title': book.get('title', '') if isinstance(book, dict) else getattr(book, 'title', ''),
-            'author': book.get('author', '') if isinstance(book, dict) else getattr(book, 'author', ''),
-            'cover_url': book.get('cover_url', '') if isinstance(book, dict) else getattr(book, 'cover_url', ''),
-            'finish_date': book.get('finish_date') if isinstance(book, dict) else getattr(book, 'finish_date', None)
-        })()
-        book_objects.append(book_obj)
-
-    img_buffer = generate_month_review_image(book_objects, month, year)
-    
-    # Check if image generation was successful
-    if not img_buffer:
-        return "Error generating month review image", 500
-    
-    # img_buffer is already a BytesIO object from generate_month_review_image
-    return send_file(img_buffer, mimetype='image/png', as_attachment=True, download_name=f"month_review_{year}_{month}.png")
+        def _field(name, default=None):
+            return book.get(name, default) if isinstance(book, dict) else getattr(book, name, default)
+        authors = _field('authors') or _field('author') or ''
+        if isinstance(authors, (list, tuple)):
+            authors = ', '.join(getattr(a, 'name', None) or str(a) for a in authors)
+        book_objects.append({
+            'title': _field('title', '') or '',
+            'authors': authors or 'Unknown Author',
+            'page_count': _field('page_count', 0) or 0,
+        })
+
+    # Serve a cached render immediately; otherwise render in the background and
+    # hand back a job handle to poll (the same URL returns the image once ready)
+    from app.utils.book_utils import month_review_cache_key, get_cached_month_review, start_month_review_job
+    from app.services.job_scheduler import JobQueueFull, job_scheduler
+    download_name = f"month_review_{year}_{month}.png"
+    key = month_review_cache_key(book_objects, month, year)
+    cached = get_cached_month_review(key)
+    if cached is not None:
+        return send_file(cached, mimetype='image/png', as_attachment=True, download_name=download_name, max_age=0)
+
+    job_id = f"month_review:{key}"
+    previous = job_scheduler.get_status(job_id)
+    try:
+        job_id = start_month_review_job(book_objects, month, year, user_id=str(current_user.id), key=key)
+    except JobQueueFull:
+        # Scheduler saturated: render inline rather than fail
+        img_buffer = generate_month_review_image(book_objects, month, year)
+        if not img_buffer:
+            return "Error generating month review image", 500
+        return send_file(img_buffer, mimetype='image/png', as_attachment=True, download_name=download_name)
+    if previous and previous.get('status') == 'failed':
+        # A retry was queued above; report the failure for this poll
+        return jsonify({'status': 'failed', 'job_id': job_id, 'error': previous.get('error')}), 500
+
+    resp = jsonify({
+        'status': 'pending',
+        'job_id': job_id,
+        'job': job_scheduler.get_status(job_id),
+        'poll_url': request.path,
+    })
+    resp.status_code = 202
+    resp.headers['Retry-After'] = '1'
+    return resp
 
 @book_bp.route('/add_book_from_search', methods=['POST'])
 @login_required
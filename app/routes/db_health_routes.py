@@ -42,4 +42,6 @@ def db_integrity():
     info['user_count'] = user_count
     info['book_count'] = book_count
     info['empty_database'] = (user_count == 0 and book_count == 0)
+    # Last background probe (see SafeKuzuManager._run_integrity_probe)
+    info['integrity_probe'] = mgr.get_health_status().get('integrity_probe')
     return jsonify(info)
@@ -11,7 +11,6 @@ from typing import List, Any, Optional, Tuple
 import uuid
 import os
 import csv
-import threading
 import traceback
 import asyncio
 import tempfile
@@ -55,8 +54,11 @@ from app.utils.safe_import_manager import (
     safe_update_import_job, 
     safe_get_import_job,
     safe_get_user_import_jobs,
-    safe_delete_import_job
+    safe_delete_import_job,
+    safe_restore_import_job
 )
+from app.utils.import_job_store import import_job_store
+from app.services.job_scheduler import PRIORITY_BULK, PRIORITY_MAINTENANCE, JobQueueFull, job_scheduler
 
 # DEPRECATED: Global dictionary to store import jobs 
 # This is being replaced with safe_import_manager for thread safety and user isolation
@@ -99,6 +101,21 @@ def _update_import_progress(user_id: str, task_id: str, *, updates: Optional[dic
     return safe_update_import_job(user_id, task_id, payload)
 
 
+def _submit_import_job(fn, task_id: str, user_id: str, *, name: str) -> bool:
+    """Queue an import on the shared background job scheduler.
+
+    Imports run at bulk priority so interactive work (cover processing) stays
+    responsive. If the queue is saturated the job is marked failed instead.
+    """
+    try:
+        job_scheduler.submit(fn, priority=PRIORITY_BULK, user_id=user_id, job_id=task_id, name=name)
+        return True
+    except JobQueueFull as e:
+        logger.warning(f"Import job {task_id} rejected: {e}")
+        safe_update_import_job(user_id, task_id, {'status': 'failed', 'error_messages': [str(e)]})
+        return False
+
+
 def _sanitize_quick_add_inputs(days_raw, pages_raw, minutes_raw, user_id) -> Tuple[int, int, int, List[str]]:
     """Normalize quick-add form inputs and return (days, pages, minutes, errors)."""
     errors: List[str] = []
@@ -1078,14 +1095,11 @@ def import_books_execute():
     except:
         job_data['total'] = 0
     
-    # Store job data in Kuzu instead of Redis
     print(f"🏗️ [EXECUTE] Creating job {task_id} for user {current_user.id}")
-    kuzu_success = store_job_in_kuzu(task_id, job_data)
     
-    # Store in safe import manager with proper user isolation
+    # Store in safe import manager with proper user isolation (persisted to ImportJobStore)
     safe_success = safe_create_import_job(current_user.id, task_id, job_data)
     
-    print(f"📊 [EXECUTE] Kuzu storage: {'✅' if kuzu_success else '❌'}")
     print(f"🔒 [EXECUTE] Safe storage: {'✅' if safe_success else '❌'}")
     print(f"💾 [EXECUTE] Legacy storage: ✅")
     
@@ -1115,20 +1129,16 @@ def import_books_execute():
                     'status': 'failed',
                     'error_messages': [str(e)]
                 }
-                update_job_in_kuzu(task_id, error_update)
-                
                 # Update safely with user isolation
                 safe_update_import_job(current_user.id, task_id, error_update)
                 
             except Exception as update_error:
                 pass  # Error updating job status
     
-    # Start the import process in background
-    thread = threading.Thread(target=run_import)
-    thread.daemon = True
-    thread.start()
+    # Queue the import on the shared background job scheduler
+    _submit_import_job(run_import, task_id, current_user.id, name='import_books_execute')
     
-    print(f"🚀 [EXECUTE] Background thread started for job {task_id}")
+    print(f"🚀 [EXECUTE] Background job queued for job {task_id}")
     
     return redirect(url_for('import.import_books_progress', task_id=task_id))
 
@@ -1377,12 +1387,48 @@ def api_import_cancel(task_id):
     if status in ('completed','failed','cancelled'):
         # Nothing to cancel
         return jsonify({'ok': True, 'status': status})
+    # Jobs still waiting in the scheduler queue are dropped outright
+    job_scheduler.cancel(task_id)
+    scheduled = job_scheduler.get_status(task_id)
+    new_status = 'cancelled' if scheduled and scheduled['status'] == 'cancelled' else 'cancelling'
     # Mark as cancelling and set flag
     safe_update_import_job(current_user.id, task_id, {
         'cancelled': True,
-        'status': 'cancelling'
+        'status': new_status
     })
-    return jsonify({'ok': True, 'status': 'cancelling'})
+    return jsonify({'ok': True, 'status': new_status})
+
+@import_bp.route('/api/import/scheduler')
+@login_required
+def api_import_scheduler_jobs():
+    """Queued, running and recently finished background jobs for the current user."""
+    return jsonify({'jobs': job_scheduler.list_jobs(user_id=str(current_user.id))})
+
+@import_bp.route('/api/import/resume/<task_id>', methods=['POST'])
+@login_required
+def api_import_resume(task_id):
+    """Resume an interrupted import (worker recycle/restart) from its last checkpoint."""
+    ok, message = resume_import_job(current_user.id, task_id)
+    if not ok:
+        status_code = 404 if message == 'Job not found' else 409
+        return jsonify({'ok': False, 'error': message}), status_code
+    return jsonify({'ok': True, 'status': 'running', 'message': message})
+
+@import_bp.route('/api/import/resumable')
+@login_required
+def api_import_resumable():
+    """List the current user's interrupted imports that can be resumed."""
+    jobs = import_job_store.find_resumable(str(current_user.id))
+    return jsonify({'jobs': [
+        {
+            'task_id': job.get('task_id'),
+            'processed': job.get('processed', 0),
+            'total': job.get('total', 0),
+            'checkpoint_row': job.get('checkpoint_row', 0),
+            'updated_at': job.get('updated_at'),
+        }
+        for job in jobs
+    ]})
 
 @import_bp.route('/api/import/errors/<task_id>')
 @login_required
@@ -1611,7 +1657,6 @@ def direct_import():
         
         # Store in safe import manager with proper user isolation
         safe_create_import_job(current_user.id, task_id, job_data)
-        store_job_in_kuzu(task_id, job_data)
         
         # Auto-create any custom fields referenced in the mappings
         auto_create_custom_fields(mappings, current_user.id)
@@ -1643,23 +1688,19 @@ def direct_import():
                         'status': 'failed',
                         'error_messages': [str(e)]
                     }
-                    update_job_in_kuzu(task_id, error_update)
                     # Update safely with user isolation
                     safe_update_import_job(current_user.id, task_id, error_update)
                 except Exception as update_error:
                     pass  # Error updating job status
         
-        # Start the import process in background
-        import threading
-        thread = threading.Thread(target=run_import)
-        thread.daemon = True
-        thread.start()
+        # Queue the import on the shared background job scheduler
+        _submit_import_job(run_import, task_id, current_user.id, name='direct_import')
         
         # Clear session data  
         session.pop('direct_import_file', None)
         session.pop('direct_import_filename', None)
         
-        print(f"🚀 [DIRECT_IMPORT] Background thread started for job {task_id}")
+        print(f"🚀 [DIRECT_IMPORT] Background job queued for job {task_id}")
         
         # Redirect to waiting page instead of library
         return redirect(url_for('import.import_waiting', task_id=task_id, 
@@ -1886,10 +1927,8 @@ def upload_import():
                 safe_update_import_job(current_user.id, task_id, error_updates)
                 logger.error(f"Import job {task_id} failed: {e}")
 
-        # Start the import process in background
-        thread = threading.Thread(target=run_import)
-        thread.daemon = True
-        thread.start()
+        # Queue the import on the shared background job scheduler
+        _submit_import_job(run_import, task_id, current_user.id, name='import_upload')
 
         return redirect(url_for('import.import_books_progress', task_id=task_id))
         
@@ -1917,9 +1956,27 @@ async def process_simple_import(import_config):
     if format_type in ['goodreads', 'storygraph']:
         enable_api_enrichment = True
 
+    # Durable job state: keep the source next to the persisted job and record the
+    # config so an interrupted import can be resumed from its last checkpoint.
+    resume_from_row = int(import_config.get('resume_from_row') or 0)
+    resume_counts = import_config.get('resume_counts') or {}
+    csv_file_path = import_job_store.persist_source_file(task_id, csv_file_path)
+    persisted_config = {k: v for k, v in import_config.items() if k not in ('resume_from_row', 'resume_counts')}
+    persisted_config['csv_file_path'] = csv_file_path
+    safe_update_import_job(user_id, task_id, {
+        'status': 'running',
+        'runner': import_job_store.runner_identity(),
+        'import_config': persisted_config,
+        'checkpoint_row': resume_from_row,
+    })
+    if resume_from_row:
+        print(f"⏩ [PROCESS_SIMPLE] Resuming {task_id} after row {resume_from_row}")
+
     if _META_DEBUG_FLAG:
         logger.debug(f"[IMPORT][PROCESS_START] task={task_id} format={format_type} enrich={enable_api_enrichment} mappings={mappings}")
     simplified_service = SimplifiedBookService()
+    # Preload ISBN and title/author lookups once so per-row duplicate checks are dict hits
+    simplified_service.enable_import_dedup_index()
     # Check if user specified a default import media type; otherwise use system default
     default_import_media_type = import_config.get('default_import_media_type')
     if default_import_media_type and default_import_media_type in ['physical', 'ebook', 'audiobook', 'kindle']:
@@ -1927,7 +1984,13 @@ async def process_simple_import(import_config):
     else:
         default_media_type = get_default_book_format()
 
-    processed_count = success_count = error_count = skipped_count = merged_count = 0
+    processed_count = int(resume_counts.get('processed') or 0)
+    success_count = int(resume_counts.get('success') or 0)
+    error_count = int(resume_counts.get('errors') or 0)
+    skipped_count = int(resume_counts.get('skipped') or 0)
+    merged_count = int(resume_counts.get('merged') or 0)
+    completed = False
+    cancelled = False
     last_progress_emit = time.perf_counter()
     pending_processed_entries: List[dict] = []
     try:
@@ -1945,7 +2008,7 @@ async def process_simple_import(import_config):
             reader = csv.DictReader(fh)
             for idx, scan_row in enumerate(reader, 1):
                 row_count = idx
-                if not enable_api_enrichment:
+                if not enable_api_enrichment or idx <= resume_from_row:
                     continue
                 raw_isbn = scan_row.get('ISBN13') or scan_row.get('isbn13') or scan_row.get('ISBN') or scan_row.get('ISBN/UID') or scan_row.get('isbn')
                 if not raw_isbn:
@@ -1982,6 +2045,8 @@ async def process_simple_import(import_config):
                     chunk_metadata = batch_fetch_book_metadata(batch)
                     if chunk_metadata:
                         aggregated_metadata.update(chunk_metadata)
+                    # Heartbeat so long enrichment phases are not mistaken for an interrupted job
+                    safe_update_import_job(user_id, task_id, {'phase': 'metadata', 'metadata_fetched': start + len(batch)})
                 book_metadata = aggregated_metadata
                 if _META_DEBUG_FLAG:
                     logger.debug(f"[IMPORT][POST_BATCH] requested={len(uniq)} fetched={len(book_metadata)} keys={list(book_metadata.keys())}")
@@ -1990,6 +2055,13 @@ async def process_simple_import(import_config):
         with open(csv_file_path, 'r', encoding='utf-8') as fh:
             reader = csv.DictReader(fh)
             for row_num, row in enumerate(reader, 1):
+                if row_num <= resume_from_row:
+                    # Already committed before the interruption
+                    continue
+                if job_scheduler.is_cancelled(task_id):
+                    cancelled = True
+                    print(f"🛑 [PROCESS_SIMPLE] Cancelled at row {row_num}")
+                    break
                 try:
                     simplified_book = simplified_service.build_book_data_from_row(row, mappings)
                     # Allow ISBN-only rows (title may be filled after enrichment). Skip only if missing both title and ISBN.
@@ -1997,7 +2069,12 @@ async def process_simple_import(import_config):
                         processed_count += 1
                         skipped_count += 1
                         raw_title = row.get('Title') or row.get('title') or row.get('Book Title') or row.get('Name') or row.get('Book Name') or 'Untitled'
-                        _update_import_progress(user_id, task_id, processed_book={'title': raw_title, 'status': 'skipped'})
+                        _update_import_progress(
+                            user_id,
+                            task_id,
+                            updates={'processed': processed_count, 'skipped': skipped_count, 'checkpoint_row': row_num},
+                            processed_book={'title': raw_title, 'status': 'skipped'},
+                        )
                         continue
 
                     if enable_api_enrichment and book_metadata:
@@ -2039,6 +2116,7 @@ async def process_simple_import(import_config):
                                 'errors': error_count,
                                 'skipped': skipped_count,
                                 'current_book': isbn_key,
+                                'checkpoint_row': row_num,
                             }
                             _update_import_progress(
                                 user_id,
@@ -2139,6 +2217,7 @@ async def process_simple_import(import_config):
                         'errors': error_count,
                         'skipped': skipped_count,
                         'current_book': simplified_book.title,
+                        'checkpoint_row': row_num,
                     }
 
                     if not result:
@@ -2178,9 +2257,6 @@ async def process_simple_import(import_config):
                             )
                             pending_processed_entries.clear()
                             last_progress_emit = time.perf_counter()
-
-                    if processed_count % 5 == 0:
-                        update_job_in_kuzu(task_id, progress_update)
                 except Exception as ex:
                     processed_count += 1
                     error_count += 1
@@ -2205,6 +2281,7 @@ async def process_simple_import(import_config):
                         'errors': error_count,
                         'skipped': skipped_count,
                         'current_book': raw_title,
+                        'checkpoint_row': row_num,
                     }
                     _update_import_progress(
                         user_id,
@@ -2235,9 +2312,9 @@ async def process_simple_import(import_config):
             )
             pending_processed_entries.clear()
 
-        final_activity = f"Import completed! {success_count} new, {merged_count} merged, {error_count} errors, {skipped_count} skipped"
+        final_activity = f"Import {'cancelled' if cancelled else 'completed'}! {success_count} new, {merged_count} merged, {error_count} errors, {skipped_count} skipped"
         completion_updates = {
-            'status': 'completed',
+            'status': 'cancelled' if cancelled else 'completed',
             'processed': processed_count,
             'success': success_count,
             'merged': merged_count,
@@ -2253,8 +2330,8 @@ async def process_simple_import(import_config):
             completion['processed_books'] = snap['processed_books']
         if 'error_messages' in snap:
             completion['error_messages'] = snap['error_messages']
-        update_job_in_kuzu(task_id, completion)
         safe_update_import_job(user_id, task_id, completion)
+        completed = True
         print(f"🎉 [PROCESS_SIMPLE] Done: {success_count} success, {error_count} errors, {skipped_count} skipped")
         if success_count > 0:
             try:
@@ -2265,17 +2342,18 @@ async def process_simple_import(import_config):
                         svc.create_backup(description=f'Post-import backup: {success_count} books added', reason='post_import_books')
                     except Exception as be:
                         logger.warning(f"Post-import backup failed: {be}")
-                threading.Thread(target=_run_backup, daemon=True).start()
+                job_scheduler.submit(_run_backup, priority=PRIORITY_MAINTENANCE, name='post_import_backup')
             except Exception as outer_be:
-                logger.warning(f"Failed launching post-import backup thread: {outer_be}")
+                logger.warning(f"Failed queueing post-import backup: {outer_be}")
     except Exception as e:
         traceback.print_exc()
         err = {'status': 'failed', 'error_messages': [str(e)]}
-        update_job_in_kuzu(task_id, err)
         safe_update_import_job(user_id, task_id, err)
+        completed = True
     finally:
+        # Keep the source while the job is resumable (e.g. interpreter shutdown mid-import)
         try:
-            if os.path.exists(csv_file_path):
+            if completed and os.path.exists(csv_file_path):
                 os.unlink(csv_file_path)
         except Exception:
             pass
@@ -2595,17 +2673,18 @@ def start_import_job(task_id, csv_file_path, field_mappings, user_id, **kwargs):
         'enable_api_enrichment': kwargs.get('enable_api_enrichment', True),
         'format_type': kwargs.get('format_type', 'unknown')
     }
+    for optional_key in ('default_import_media_type', 'resume_from_row', 'resume_counts'):
+        if kwargs.get(optional_key) is not None:
+            import_config[optional_key] = kwargs[optional_key]
     
-    # Start the import in a background thread
+    # Queue the import on the shared background job scheduler
     def run_import():
         try:
             asyncio.run(process_simple_import(import_config))
         except Exception as e:
             traceback.print_exc()
     
-    thread = threading.Thread(target=run_import)
-    thread.daemon = True
-    thread.start()
+    _submit_import_job(run_import, task_id, user_id, name='start_import_job')
     
     return task_id
 
@@ -2730,46 +2809,65 @@ def batch_fetch_book_metadata(isbns):
         except Exception as exc:  # pragma: no cover - defensive logging path
             return idx, isbn, None, None, exc
 
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = [executor.submit(_fetch_single, idx, isbn) for idx, isbn in valid_entries]
-        for future in as_completed(futures):
-            idx, isbn, data, provider_errors, exc = future.result()
-            if exc is not None:
-                logger.error(
-                    f"[IMPORT][METADATA] Exception fetching ISBN {isbn}: {exc}",
-                    exc_info=(type(exc), exc, exc.__traceback__)
-                )
-                failed_isbns.append(isbn)
-                continue
+    def _record_result(isbn, data, provider_errors):
+        if _META_DEBUG_FLAG:
+            logger.debug(f"[IMPORT][METADATA][PROVIDERS] isbn={isbn} providers={provider_errors}")
 
+        if data:
+            metadata[isbn] = {
+                'data': data,
+                'source': 'unified',
+                'provider_errors': provider_errors
+            }
+            try:
+                alt13 = data.get('isbn13')
+                alt10 = data.get('isbn10')
+                if alt13 and alt13 != isbn and alt13 not in metadata:
+                    metadata[alt13] = metadata[isbn]
+                    if _META_DEBUG_FLAG:
+                        logger.debug(f"[IMPORT][METADATA][CANON] promoted_isbn13={alt13} original_query={isbn}")
+                for alt in [alt10]:
+                    if alt and alt not in metadata:
+                        metadata[alt] = metadata[isbn]
+                if alt13 and alt10 and alt13 != alt10 and _META_DEBUG_FLAG:
+                    logger.debug(f"[IMPORT][METADATA][ALT_INDEX] isbn_query={isbn} alt13={alt13} alt10={alt10}")
+            except Exception:
+                pass
             if _META_DEBUG_FLAG:
-                logger.debug(f"[IMPORT][METADATA][PROVIDERS] isbn={isbn} providers={provider_errors}")
-
-            if data:
-                metadata[isbn] = {
-                    'data': data,
-                    'source': 'unified',
-                    'provider_errors': provider_errors
-                }
-                try:
-                    alt13 = data.get('isbn13')
-                    alt10 = data.get('isbn10')
-                    if alt13 and alt13 != isbn and alt13 not in metadata:
-                        metadata[alt13] = metadata[isbn]
-                        if _META_DEBUG_FLAG:
-                            logger.debug(f"[IMPORT][METADATA][CANON] promoted_isbn13={alt13} original_query={isbn}")
-                    for alt in [alt10]:
-                        if alt and alt not in metadata:
-                            metadata[alt] = metadata[isbn]
-                    if alt13 and alt10 and alt13 != alt10 and _META_DEBUG_FLAG:
-                        logger.debug(f"[IMPORT][METADATA][ALT_INDEX] isbn_query={isbn} alt13={alt13} alt10={alt10}")
-                except Exception:
-                    pass
-                if _META_DEBUG_FLAG:
-                    logger.debug(f"[IMPORT][METADATA][FETCH_OK] isbn={isbn} title={data.get('title')}")
-            else:
-                logger.warning(f"[IMPORT][METADATA] No metadata for ISBN {isbn}")
-                failed_isbns.append(isbn)
+                logger.debug(f"[IMPORT][METADATA][FETCH_OK] isbn={isbn} title={data.get('title')}")
+        else:
+            logger.warning(f"[IMPORT][METADATA] No metadata for ISBN {isbn}")
+            failed_isbns.append(isbn)
+
+    # Provider-native bulk lookups (OpenLibrary bibkeys lists, OR-ed Google queries) resolve
+    # most ISBNs in a handful of requests; only misses fall back to single lookups.
+    # IMPORT_METADATA_BULK=0 restores the one-request-per-ISBN path with jitter.
+    use_bulk = os.getenv('IMPORT_METADATA_BULK', '1').lower() not in ('0', 'false', 'no', 'off')
+    if use_bulk:
+        from app.utils.unified_metadata import fetch_unified_by_isbns_detailed
+        try:
+            bulk_results = fetch_unified_by_isbns_detailed([isbn for _, isbn in valid_entries], max_workers=max_workers)
+        except Exception as exc:  # pragma: no cover - defensive logging path
+            logger.error(f"[IMPORT][METADATA] Bulk fetch failed, using single lookups: {exc}", exc_info=True)
+            use_bulk = False
+        else:
+            for _, isbn in valid_entries:
+                data, provider_errors = bulk_results.get(isbn, ({}, {}))
+                _record_result(isbn, data, provider_errors)
+
+    if not use_bulk:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(_fetch_single, idx, isbn) for idx, isbn in valid_entries]
+            for future in as_completed(futures):
+                idx, isbn, data, provider_errors, exc = future.result()
+                if exc is not None:
+                    logger.error(
+                        f"[IMPORT][METADATA] Exception fetching ISBN {isbn}: {exc}",
+                        exc_info=(type(exc), exc, exc.__traceback__)
+                    )
+                    failed_isbns.append(isbn)
+                    continue
+                _record_result(isbn, data, provider_errors)
 
     if _META_DEBUG_FLAG:
         success_rate = (len(metadata) / len(isbns)) * 100 if isbns else 0
@@ -2782,24 +2880,33 @@ def batch_fetch_book_metadata(isbns):
         logger.debug("[IMPORT][METADATA] Batch fetch completed with zero failures")
     return metadata
 
-def store_job_in_kuzu(task_id, job_data):
-    """Store import job status in KuzuDB."""
-    try:
-        # TODO: Implement actual Kuzu storage
-        return True
-    except Exception as e:
-        print(f"Error storing job in Kuzu: {e}")
-        return False
+def resume_import_job(user_id, task_id):
+    """Resume an interrupted CSV import from its last committed row.
 
-def update_job_in_kuzu(task_id, update_data):
-    """Update import job status in KuzuDB."""
-    try:
-        # TODO: Implement actual Kuzu update
-        # Note: In-memory updates are now handled by SafeImportJobManager
-        return True
-    except Exception as e:
-        print(f"Error updating job in Kuzu: {e}")
-        return False
+    Rows up to the persisted checkpoint are skipped; rows after it are
+    re-processed, and duplicate detection turns any row that was written but
+    not yet checkpointed into a merge rather than a second copy.
+
+    Returns (ok, message).
+    """
+    job = safe_get_import_job(user_id, task_id)
+    if not job:
+        return False, 'Job not found'
+    if not import_job_store.is_interrupted(job):
+        return False, f"Job is {job.get('status') or 'unknown'}, not interrupted"
+    config = dict(job.get('import_config') or {})
+    csv_file_path = config.get('csv_file_path')
+    if not config or not csv_file_path or not os.path.exists(csv_file_path):
+        return False, 'Import source is no longer available'
+
+    job['status'] = 'running'
+    job['resumed_count'] = int(job.get('resumed_count') or 0) + 1
+    safe_restore_import_job(user_id, task_id, job)
+    extra = {k: v for k, v in config.items() if k not in ('task_id', 'csv_file_path', 'field_mappings', 'user_id')}
+    extra['resume_from_row'] = int(job.get('checkpoint_row') or 0)
+    extra['resume_counts'] = {key: job.get(key, 0) for key in ('processed', 'success', 'errors', 'skipped', 'merged')}
+    start_import_job(task_id, csv_file_path, config.get('field_mappings') or {}, user_id, **extra)
+    return True, f"Resuming after row {extra['resume_from_row']}"
 
 @import_bp.route('/simple', methods=['GET', 'POST'])
 @login_required
@@ -2864,6 +2971,7 @@ def simple_csv_import():
         
         # Initialize service
         simplified_service = SimplifiedBookService()
+        simplified_service.enable_import_dedup_index()
         print(f"🔧 [SIMPLE_IMPORT] Service initialized")
         default_media_type = get_default_book_format()
         
@@ -3082,11 +3190,9 @@ def simple_upload():
                 }
                 safe_update_import_job(current_user.id, task_id, error_updates)
         
-        thread = threading.Thread(target=process_upload)
-        thread.daemon = True
-        thread.start()
+        _submit_import_job(process_upload, task_id, current_user.id, name='simple_upload')
         
-        print(f"🚀 [SIMPLE_UPLOAD] Background processing started for {import_config['task_id']}")
+        print(f"🚀 [SIMPLE_UPLOAD] Background processing queued for {import_config['task_id']}")
         
         return jsonify({
             'status': 'success',
@@ -3494,9 +3600,7 @@ def import_reading_history_execute():
                 safe_update_import_job(import_config['user_id'], task_id, error_updates)
                 logger.error(f"Reading history import job {task_id} failed: {e}")
         
-        thread = threading.Thread(target=run_import)
-        thread.daemon = True
-        thread.start()
+        _submit_import_job(run_import, task_id, current_user.id, name='reading_history_import')
         
         return redirect(url_for('import.import_books_progress', task_id=task_id))
         
@@ -4013,9 +4117,7 @@ def resolve_reading_history_books(task_id):
                     'error_messages': [str(e)]
                 })
         
-        thread = threading.Thread(target=process_reading_logs)
-        thread.daemon = True
-        thread.start()
+        _submit_import_job(process_reading_logs, task_id, job_data['user_id'], name='reading_history_resolve')
         
         flash('Processing book matches. Please check progress page for updates.', 'info')
         return redirect(url_for('import.import_books_progress', task_id=task_id))
@@ -4294,9 +4396,9 @@ async def _process_final_reading_history_import(task_id, job_data, book_resoluti
                         svc.create_backup(description=f'Post-reading-history import backup: {success_count} logs', reason='post_import_reading_history')
                     except Exception as be:
                         logger.warning(f"Post-reading-history backup failed: {be}")
-                threading.Thread(target=_run_backup, daemon=True).start()
+                job_scheduler.submit(_run_backup, priority=PRIORITY_MAINTENANCE, name='post_reading_history_backup')
             except Exception as outer_be:
-                logger.warning(f"Failed launching post-reading-history backup thread: {outer_be}")
+                logger.warning(f"Failed queueing post-reading-history backup: {outer_be}")
     except Exception as e:
         logger.error(f"Fatal reading history import error: {e}")
         try:
@@ -146,13 +146,11 @@ def upload_series_cover(series_id: str):
         if new_cover_rel.startswith('/'):
             abs_url = request.host_url.rstrip('/') + new_cover_rel
         svc.update_series_cover(series_id, abs_url, custom=True, generated_placeholder=False)
-        # Cleanup prior custom file if local
-        if old_custom and old_custom.startswith('/covers/'):
+        # Cleanup prior custom file if local and no longer referenced (cover files may be shared)
+        if old_custom:
             try:
-                fname = old_custom.split('/')[-1]
-                old_path = get_covers_dir() / fname
-                if old_path.exists():
-                    old_path.unlink()
+                from app.services.cover_storage import release_cover_file
+                release_cover_file(old_custom, keep_url=new_cover_rel)
             except Exception:
                 pass
         return jsonify({'success': True, 'cover_url': new_cover_rel})
@@ -249,16 +247,14 @@ def clear_series_cover(series_id: str):
     # Attempt to delete old file if local
     file_deleted = False
     file_delete_error = None
-    if old_custom and isinstance(old_custom, str) and old_custom.startswith('/covers/'):
+    if old_custom and isinstance(old_custom, str) and '/covers/' in old_custom:
         try:
-            from app.utils.image_processing import get_covers_dir
-            p = get_covers_dir() / old_custom.split('/')[-1]
-            if p.exists():
-                p.unlink()
-                file_deleted = True
-                logger.debug(f"[SERIES][CLEAR_COVER][{trace_id}] Deleted previous custom cover file path=%s", p)
+            from app.services.cover_storage import release_cover_file
+            file_deleted = release_cover_file(old_custom, keep_url=fallback_cover)
+            if file_deleted:
+                logger.debug(f"[SERIES][CLEAR_COVER][{trace_id}] Deleted previous custom cover file url=%s", old_custom)
             else:
-                logger.debug(f"[SERIES][CLEAR_COVER][{trace_id}] Previous custom cover file not found path=%s", p)
+                logger.debug(f"[SERIES][CLEAR_COVER][{trace_id}] Previous custom cover kept (missing or still referenced) url=%s", old_custom)
         except Exception as fe:
             file_delete_error = str(fe)
             logger.error(f"[SERIES][CLEAR_COVER][{trace_id}] Failed deleting old cover: %s", fe)
@@ -2,7 +2,7 @@
 Simple Backup routes for Bibliotheca admin interface.
 """
 
-from flask import Blueprint, render_template, request, redirect, url_for, flash, jsonify, send_file, current_app
+from flask import Blueprint, render_template, request, redirect, url_for, flash, jsonify, send_file, current_app, Response, stream_with_context
 from flask_login import login_required, current_user
 from datetime import datetime
 import os
@@ -54,6 +54,10 @@ def index():
             # Format file size
             size_mb = backup.file_size / (1024 * 1024)
             size_formatted = f"{size_mb:.1f} MB"
+            # Chunked backups: space this backup added to the shared store
+            stored_size_formatted = (
+                f"{backup.stored_size / (1024 * 1024):.1f} MB" if backup.stored_size is not None else None
+            )
             
             # Get database size from metadata
             if backup.metadata and 'original_size' in backup.metadata:
@@ -73,8 +77,10 @@ def index():
                 'created_at': backup.created_at,
                 'file_path': backup.file_path,
                 'file_size': backup.file_size,
+                'stored_size': backup.stored_size,
                 'age': age,
                 'size_formatted': size_formatted,
+                'stored_size_formatted': stored_size_formatted,
                 'database_size_formatted': database_size_formatted,
                 'valid': valid
             }
@@ -128,7 +134,10 @@ def create_backup():
         )
         
         if backup_info:
-            flash(f'✅ Backup "{backup_info.name}" created successfully! ({backup_info.file_size / 1024 / 1024:.2f} MB)', 'success')
+            size_note = f"{backup_info.file_size / 1024 / 1024:.2f} MB"
+            if backup_info.stored_size is not None:
+                size_note += f", {backup_info.stored_size / 1024 / 1024:.2f} MB new in store"
+            flash(f'✅ Backup "{backup_info.name}" created successfully! ({size_note})', 'success')
         else:
             flash('❌ Failed to create backup.', 'danger')
             
@@ -261,6 +270,15 @@ def download_backup(backup_id: str):
             flash('❌ Backup not found.', 'danger')
             return redirect(url_for('simple_backup.index'))
         
+        # Chunked backups are assembled into a zip while streaming
+        archive = backup_service.iter_backup_archive(backup_id)
+        if archive is not None:
+            return Response(
+                stream_with_context(archive),
+                mimetype='application/zip',
+                headers={'Content-Disposition': f'attachment; filename="{backup_info.name}.zip"'},
+            )
+        
         backup_path = backup_info.file_path
         if not os.path.exists(backup_path):
             flash('❌ Backup file not found.', 'danger')
@@ -382,6 +400,25 @@ def api_backup_settings():
         current_app.logger.error(f"Error handling backup settings: {e}")
         return jsonify({'error': 'Internal server error'}), 500
 
+@simple_backup_bp.route('/api/verify/<backup_id>', methods=['POST'])
+@login_required
+@admin_required
+@csrf.exempt  # JSON API endpoint; protecting via auth+admin
+def api_verify_backup(backup_id: str):
+    """Queue a background integrity check of a backup; poll /api/status for the result."""
+    try:
+        backup_service = get_simple_backup_service()
+        if not backup_service.get_backup(backup_id):
+            return jsonify({'error': 'Backup not found'}), 404
+        job_id = backup_service.start_verification(backup_id, user_id=str(current_user.id))
+        if not job_id:
+            return jsonify({'error': 'Job queue is full, try again later'}), 503
+        return jsonify({'status': 'queued', 'job_id': job_id}), 202
+    except Exception as e:
+        current_app.logger.error(f"Error queueing verification for backup {backup_id}: {e}")
+        return jsonify({'error': 'Internal server error'}), 500
+
+
 @simple_backup_bp.route('/api/status/<backup_id>')
 @login_required
 @admin_required
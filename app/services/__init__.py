@@ -20,9 +20,7 @@ try:
     from .kuzu_person_service import KuzuPersonService
     from .kuzu_reading_log_service import KuzuReadingLogService
     from .kuzu_series_service import get_series_service
-    from .opds_probe_service import OPDSProbeService
-    from .opds_sync_service import OPDSSyncService
-    from .opds_sync_runner import ensure_opds_sync_runner, get_opds_sync_runner
+    # OPDS modules are imported on first use (see _get_opds_* and the runner wrappers below)
 
     # For backward compatibility, expose the main service
     KuzuBookService = KuzuServiceFacade
@@ -101,6 +99,7 @@ try:
         """Lazy OPDS probe service."""
         global _opds_probe_service
         if _opds_probe_service is None:
+            from .opds_probe_service import OPDSProbeService
             _opds_probe_service = OPDSProbeService()
         return _opds_probe_service
 
@@ -108,9 +107,18 @@ try:
         """Lazy OPDS sync service."""
         global _opds_sync_service
         if _opds_sync_service is None:
+            from .opds_sync_service import OPDSSyncService
             probe = _get_opds_probe_service()
             _opds_sync_service = OPDSSyncService(probe_service=probe)
         return _opds_sync_service
+
+    def ensure_opds_sync_runner():
+        from .opds_sync_runner import ensure_opds_sync_runner as _ensure
+        return _ensure()
+
+    def get_opds_sync_runner():
+        from .opds_sync_runner import get_opds_sync_runner as _get
+        return _get()
     
     # Create property-like access using classes
     class _LazyService:
@@ -362,14 +362,13 @@ class AudiobookshelfImportService:
                     else:
                         ext = '.jpg'
 
-            filename = f"{uuid.uuid4()}{ext}"
-            out_path = covers_dir / filename
-            with open(out_path, 'wb') as f:
-                for chunk in resp.iter_content(chunk_size=16384):
-                    if not chunk:
-                        continue
-                    f.write(chunk)
-            return f"/covers/{filename}"
+            data = bytearray()
+            for chunk in resp.iter_content(chunk_size=16384):
+                if not chunk:
+                    continue
+                data.extend(chunk)
+            from app.utils.image_processing import store_cover_bytes
+            return store_cover_bytes(bytes(data), ext, covers_dir=covers_dir)
         except Exception:
             return None
 
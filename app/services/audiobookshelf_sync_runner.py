@@ -1,34 +1,31 @@
 """
 Audiobookshelf Background Sync Runner
 
-Provides a single background thread that processes ABS sync jobs from a queue
-and also triggers scheduled syncs based on settings. Jobs are visible via the
-existing SafeImportJobManager progress UI.
+Queues ABS sync jobs on the shared background job scheduler and runs a light
+thread that triggers scheduled syncs based on settings. Jobs are visible via
+the existing SafeImportJobManager progress UI.
 """
 from __future__ import annotations
 
 import threading
 import time
-from collections import deque
-from typing import Deque, Dict, Any, Optional, Tuple
+from typing import Dict, Any, Optional
 
 from flask import current_app
 
+from app.services.job_scheduler import PRIORITY_BULK, PRIORITY_NORMAL, JobQueueFull, job_scheduler
 from app.utils.audiobookshelf_settings import load_abs_settings, save_abs_settings
-from app.services.audiobookshelf_service import get_client_from_settings, AudiobookShelfClient
-from app.services.audiobookshelf_import_service import AudiobookshelfImportService
-from app.services.audiobookshelf_listening_sync import AudiobookshelfListeningSync
 from app.utils.safe_import_manager import safe_create_import_job, safe_update_import_job
 import uuid
 
 
 class _AbsSyncRunner:
     def __init__(self):
-        self._queue: Deque[Tuple[str, Dict[str, Any]]] = deque()
         self._lock = threading.RLock()
         self._thread: Optional[threading.Thread] = None
         self._running = False
         self._app = None
+        self._last_scheduler_check = 0.0
 
     def ensure_started(self) -> None:
         with self._lock:
@@ -48,10 +45,9 @@ class _AbsSyncRunner:
         self._create_job(user_id, task_id, 'abs_test_sync', total=limit)
         # Ensure background thread is running
         self.ensure_started()
-        with self._lock:
-            self._queue.append((task_id, {
-                'kind': 'test', 'user_id': user_id, 'library_ids': library_ids, 'limit': limit
-            }))
+        self._submit(task_id, {
+            'kind': 'test', 'user_id': user_id, 'library_ids': library_ids, 'limit': limit
+        }, PRIORITY_NORMAL)
         return task_id
     
     def enqueue_user_composite_sync(self, user_id: str, page_size: int = 50, *, force_books: bool = False, force_listening: bool = False) -> str:
@@ -62,11 +58,10 @@ class _AbsSyncRunner:
         task_id = f"abs_user_{uuid.uuid4().hex[:8]}"
         self._create_job(user_id, task_id, 'abs_user_composite', total=0)
         self.ensure_started()
-        with self._lock:
-            self._queue.append((task_id, {
-                'kind': 'user_composite', 'user_id': user_id, 'page_size': page_size,
-                'force_books': bool(force_books), 'force_listening': bool(force_listening)
-            }))
+        self._submit(task_id, {
+            'kind': 'user_composite', 'user_id': user_id, 'page_size': page_size,
+            'force_books': bool(force_books), 'force_listening': bool(force_listening)
+        }, PRIORITY_BULK)
         return task_id
 
     def enqueue_full_sync(self, user_id: str, library_ids: list[str], page_size: int = 50) -> str:
@@ -74,12 +69,29 @@ class _AbsSyncRunner:
         self._create_job(user_id, task_id, 'abs_full_sync', total=0)
         # Ensure background thread is running
         self.ensure_started()
-        with self._lock:
-            self._queue.append((task_id, {
-                'kind': 'full', 'user_id': user_id, 'library_ids': library_ids, 'page_size': page_size
-            }))
+        self._submit(task_id, {
+            'kind': 'full', 'user_id': user_id, 'library_ids': library_ids, 'page_size': page_size
+        }, PRIORITY_BULK)
         return task_id
 
+    def _submit(self, task_id: str, payload: Dict[str, Any], priority: int) -> None:
+        """Hand a sync off to the shared background job scheduler."""
+        try:
+            job_scheduler.submit(
+                self._process_task,
+                task_id,
+                payload,
+                priority=priority,
+                user_id=payload.get('user_id'),
+                job_id=task_id,
+                name=f"abs_{payload.get('kind')}",
+            )
+        except JobQueueFull as e:
+            safe_update_import_job(payload['user_id'], task_id, {
+                'status': 'failed',
+                'error_messages': [str(e)]
+            })
+
     def _create_job(self, user_id: str, task_id: str, job_type: str, total: int) -> None:
         safe_create_import_job(user_id, task_id, {
             'task_id': task_id,
@@ -110,159 +122,160 @@ class _AbsSyncRunner:
         try:
             while self._running:
                 # Scheduled sync check every 60 seconds
+                now = time.time()
+                if now - self._last_scheduler_check >= 60:
+                    self._last_scheduler_check = now
+                    try:
+                        self._maybe_schedule_automatic_sync()
+                    except Exception:
+                        pass
+                time.sleep(1.0)
+        finally:
+            try:
+                ctx.pop()
+            except Exception:
+                pass
+
+    def _process_task(self, task_id: str, payload: Dict[str, Any]) -> None:
+        # Imported per job so app startup does not load the ABS client/import stack
+        from app.services.audiobookshelf_service import get_client_from_settings, AudiobookShelfClient
+        from app.services.audiobookshelf_import_service import AudiobookshelfImportService
+        from app.services.audiobookshelf_listening_sync import AudiobookshelfListeningSync
+        try:
+            settings = load_abs_settings()
+            client = get_client_from_settings(settings)
+            if not client:
+                # Mark job as failed so UI isn't stuck at started
                 try:
-                    self._maybe_schedule_automatic_sync()
+                    safe_update_import_job(payload['user_id'], task_id, {
+                        'status': 'failed',
+                        'error_messages': ['ABS not configured: base_url or api_key missing']
+                    })
                 except Exception:
                     pass
-
-                task: Optional[Tuple[str, Dict[str, Any]]] = None
-                with self._lock:
-                    if self._queue:
-                        task = self._queue.popleft()
-                if task is None:
-                    time.sleep(1.0)
-                    continue
-                task_id, payload = task
+                return
+            kind = payload.get('kind')
+            if kind == 'listen':
+                # Prefer per-user API key override for listening-only jobs as well
+                eff_client = client
                 try:
-                    settings = load_abs_settings()
-                    client = get_client_from_settings(settings)
-                    if not client:
-                        # Mark job as failed so UI isn't stuck at started
-                        try:
-                            safe_update_import_job(payload['user_id'], task_id, {
-                                'status': 'failed',
-                                'error_messages': ['ABS not configured: base_url or api_key missing']
-                            })
-                        except Exception:
-                            pass
-                        continue
-                    kind = payload.get('kind')
-                    if kind == 'listen':
-                        # Prefer per-user API key override for listening-only jobs as well
-                        eff_client = client
-                        try:
-                            from app.utils.user_settings import load_user_settings
-                            u = load_user_settings(payload['user_id'])
-                        except Exception:
-                            u = {}
-                        base_url = settings.get('base_url') or ''
-                        user_api_key = (u.get('abs_api_key') or '').strip() if isinstance(u, dict) else ''
-                        if base_url and user_api_key:
-                            eff_client = AudiobookShelfClient(base_url, user_api_key)
+                    from app.utils.user_settings import load_user_settings
+                    u = load_user_settings(payload['user_id'])
+                except Exception:
+                    u = {}
+                base_url = settings.get('base_url') or ''
+                user_api_key = (u.get('abs_api_key') or '').strip() if isinstance(u, dict) else ''
+                if base_url and user_api_key:
+                    eff_client = AudiobookShelfClient(base_url, user_api_key)
 
+                try:
+                    current_app.logger.info(
+                        f"[ABS Listen] Starting listening job task={task_id} user={payload['user_id']} page_size={int(payload.get('page_size') or 200)}"
+                    )
+                    # Nudge progress UI
+                    safe_update_import_job(payload['user_id'], task_id, {
+                        'status': 'running',
+                        'recent_activity': ['Starting listening sync...']
+                    })
+                except Exception:
+                    pass
+                listener = AudiobookshelfListeningSync(payload['user_id'], eff_client)
+                def _cb(snapshot: dict):
+                    try:
+                        safe_update_import_job(payload['user_id'], task_id, {
+                            'status': 'running',
+                            'processed': int(snapshot.get('processed') or 0),
+                            'total': int(snapshot.get('total') or 0),
+                            'matched': int(snapshot.get('matched') or 0)
+                        })
+                    except Exception:
+                        pass
+                summary = listener.sync(page_size=int(payload.get('page_size') or 200), progress_cb=_cb)
+                try:
+                    current_app.logger.info(
+                        f"[ABS Listen] Finished task={task_id} user={payload['user_id']} processed={summary.get('processed')} matched={summary.get('matched')}"
+                    )
+                    # Surface summary to UI
+                    safe_update_import_job(payload['user_id'], task_id, {
+                        'recent_activity': [
+                            f"Listening sync complete: processed {summary.get('processed', 0)} sessions; matched {summary.get('matched', 0)} books."
+                        ],
+                        'processed': int(summary.get('processed', 0)),
+                        'total': int(summary.get('total', 0) or 0),
+                        'listening_sessions': int(summary.get('processed', 0)),
+                        'listening_matched': int(summary.get('matched', 0))
+                    })
+                except Exception:
+                    pass
+                try:
+                    from datetime import datetime, timezone
+                    save_abs_settings({'last_listening_sync': datetime.now(timezone.utc).isoformat()})
+                except Exception:
+                    pass
+                # mark job completed
+                try:
+                    safe_update_import_job(payload['user_id'], task_id, {
+                        'status': 'completed', 'processed': 0, 'total': 0
+                    })
+                except Exception:
+                    pass
+            elif kind == 'user_composite':
+                # Optional per-user API key override
+                try:
+                    from app.utils.user_settings import load_user_settings
+                    u = load_user_settings(payload['user_id'])
+                except Exception:
+                    u = {}
+                base_url = settings.get('base_url') or ''
+                user_api_key = (u.get('abs_api_key') or '').strip() if isinstance(u, dict) else ''
+                eff_client = client
+                if base_url and user_api_key:
+                    eff_client = AudiobookShelfClient(base_url, user_api_key)
+                force_books = bool(payload.get('force_books'))
+                force_listening = bool(payload.get('force_listening'))
+                do_books = force_books or (bool(u.get('abs_sync_books')) if isinstance(u, dict) else False)
+                do_listen = force_listening or (bool(u.get('abs_sync_listening')) if isinstance(u, dict) else False)
+                enforce_order = bool(settings.get('enforce_book_first', True))
+                # Always run books first when enabled
+                if do_books:
+                    svc = AudiobookshelfImportService(payload['user_id'], eff_client)
+                    svc._run_full_sync_job(task_id, settings.get('library_ids') or [], int(payload.get('page_size') or 50))
+                if do_listen:
+                    listener = AudiobookshelfListeningSync(payload['user_id'], eff_client)
+                    def _cb(snapshot: dict):
                         try:
-                            current_app.logger.info(
-                                f"[ABS Listen] Starting listening job task={task_id} user={payload['user_id']} page_size={int(payload.get('page_size') or 200)}"
-                            )
-                            # Nudge progress UI
                             safe_update_import_job(payload['user_id'], task_id, {
                                 'status': 'running',
-                                'recent_activity': ['Starting listening sync...']
-                            })
-                        except Exception:
-                            pass
-                        listener = AudiobookshelfListeningSync(payload['user_id'], eff_client)
-                        def _cb(snapshot: dict):
-                            try:
-                                safe_update_import_job(payload['user_id'], task_id, {
-                                    'status': 'running',
-                                    'processed': int(snapshot.get('processed') or 0),
-                                    'total': int(snapshot.get('total') or 0),
-                                    'matched': int(snapshot.get('matched') or 0)
-                                })
-                            except Exception:
-                                pass
-                        summary = listener.sync(page_size=int(payload.get('page_size') or 200), progress_cb=_cb)
-                        try:
-                            current_app.logger.info(
-                                f"[ABS Listen] Finished task={task_id} user={payload['user_id']} processed={summary.get('processed')} matched={summary.get('matched')}"
-                            )
-                            # Surface summary to UI
-                            safe_update_import_job(payload['user_id'], task_id, {
-                                'recent_activity': [
-                                    f"Listening sync complete: processed {summary.get('processed', 0)} sessions; matched {summary.get('matched', 0)} books."
-                                ],
-                                'processed': int(summary.get('processed', 0)),
-                                'total': int(summary.get('total', 0) or 0),
-                                'listening_sessions': int(summary.get('processed', 0)),
-                                'listening_matched': int(summary.get('matched', 0))
-                            })
-                        except Exception:
-                            pass
-                        try:
-                            from datetime import datetime, timezone
-                            save_abs_settings({'last_listening_sync': datetime.now(timezone.utc).isoformat()})
-                        except Exception:
-                            pass
-                        # mark job completed
-                        try:
-                            safe_update_import_job(payload['user_id'], task_id, {
-                                'status': 'completed', 'processed': 0, 'total': 0
+                                'listening_sessions': int(snapshot.get('processed') or 0),
+                                'listening_matched': int(snapshot.get('matched') or 0)
                             })
                         except Exception:
                             pass
-                    elif kind == 'user_composite':
-                        # Optional per-user API key override
-                        try:
-                            from app.utils.user_settings import load_user_settings
-                            u = load_user_settings(payload['user_id'])
-                        except Exception:
-                            u = {}
-                        base_url = settings.get('base_url') or ''
-                        user_api_key = (u.get('abs_api_key') or '').strip() if isinstance(u, dict) else ''
-                        eff_client = client
-                        if base_url and user_api_key:
-                            eff_client = AudiobookShelfClient(base_url, user_api_key)
-                        force_books = bool(payload.get('force_books'))
-                        force_listening = bool(payload.get('force_listening'))
-                        do_books = force_books or (bool(u.get('abs_sync_books')) if isinstance(u, dict) else False)
-                        do_listen = force_listening or (bool(u.get('abs_sync_listening')) if isinstance(u, dict) else False)
-                        enforce_order = bool(settings.get('enforce_book_first', True))
-                        # Always run books first when enabled
-                        if do_books:
-                            svc = AudiobookshelfImportService(payload['user_id'], eff_client)
-                            svc._run_full_sync_job(task_id, settings.get('library_ids') or [], int(payload.get('page_size') or 50))
-                        if do_listen:
-                            listener = AudiobookshelfListeningSync(payload['user_id'], eff_client)
-                            def _cb(snapshot: dict):
-                                try:
-                                    safe_update_import_job(payload['user_id'], task_id, {
-                                        'status': 'running',
-                                        'listening_sessions': int(snapshot.get('processed') or 0),
-                                        'listening_matched': int(snapshot.get('matched') or 0)
-                                    })
-                                except Exception:
-                                    pass
-                            listener.sync(page_size=int(payload.get('page_size') or 200), progress_cb=_cb)
-                        try:
-                            safe_update_import_job(payload['user_id'], task_id, {'status': 'completed'})
-                        except Exception:
-                            pass
-                    else:
-                        # Prefer per-user API key for test/full as well
-                        eff_client = client
-                        try:
-                            from app.utils.user_settings import load_user_settings
-                            u = load_user_settings(payload['user_id'])
-                        except Exception:
-                            u = {}
-                        base_url = settings.get('base_url') or ''
-                        user_api_key = (u.get('abs_api_key') or '').strip() if isinstance(u, dict) else ''
-                        if base_url and user_api_key:
-                            eff_client = AudiobookShelfClient(base_url, user_api_key)
-                        svc = AudiobookshelfImportService(payload['user_id'], eff_client)
-                        if kind == 'test':
-                            svc._run_test_sync_job(task_id, payload.get('library_ids') or [], int(payload.get('limit') or 5))
-                        else:
-                            svc._run_full_sync_job(task_id, payload.get('library_ids') or [], int(payload.get('page_size') or 50))
+                    listener.sync(page_size=int(payload.get('page_size') or 200), progress_cb=_cb)
+                try:
+                    safe_update_import_job(payload['user_id'], task_id, {'status': 'completed'})
                 except Exception:
-                    # Errors recorded inside service methods
                     pass
-        finally:
-            try:
-                ctx.pop()
-            except Exception:
-                pass
+            else:
+                # Prefer per-user API key for test/full as well
+                eff_client = client
+                try:
+                    from app.utils.user_settings import load_user_settings
+                    u = load_user_settings(payload['user_id'])
+                except Exception:
+                    u = {}
+                base_url = settings.get('base_url') or ''
+                user_api_key = (u.get('abs_api_key') or '').strip() if isinstance(u, dict) else ''
+                if base_url and user_api_key:
+                    eff_client = AudiobookShelfClient(base_url, user_api_key)
+                svc = AudiobookshelfImportService(payload['user_id'], eff_client)
+                if kind == 'test':
+                    svc._run_test_sync_job(task_id, payload.get('library_ids') or [], int(payload.get('limit') or 5))
+                else:
+                    svc._run_full_sync_job(task_id, payload.get('library_ids') or [], int(payload.get('page_size') or 50))
+        except Exception:
+            # Errors recorded inside service methods
+            pass
 
     def _maybe_schedule_automatic_sync(self) -> None:
         settings = load_abs_settings()
@@ -359,10 +372,9 @@ class _AbsSyncRunner:
         task_id = f"abs_listen_{uuid.uuid4().hex[:8]}"
         self._create_job(user_id, task_id, 'abs_listen_sync', total=0)
         self.ensure_started()
-        with self._lock:
-            self._queue.append((task_id, {
-                'kind': 'listen', 'user_id': user_id, 'page_size': page_size
-            }))
+        self._submit(task_id, {
+            'kind': 'listen', 'user_id': user_id, 'page_size': page_size
+        }, PRIORITY_BULK)
         return task_id
 
 
@@ -0,0 +1,495 @@
+"""
+Content-addressed chunk store for backups.
+
+Every nightly backup used to be a full DEFLATE zip of the Kùzu directory,
+covers and uploads. The store instead splits each file into fixed-size chunks
+(``BACKUP_CHUNK_SIZE``, default 1 MiB) named by their SHA-256, so unchanged
+covers and unchanged database pages are stored once no matter how many
+backups contain them. A backup is a JSON manifest listing its files and their
+chunk ids.
+
+Layout under ``<backups>/store``::
+
+    chunks/<aa>/<sha256>     1-byte codec header + payload
+    manifests/<id>.json      files, chunk ids and backup metadata
+    index.sqlite3            chunk -> reference count, sizes
+
+- Already-compressed media (JPEG/PNG/WebP/archives...) is stored raw; other
+  chunks are compressed with zstd (``zlib`` when no zstd module is available
+  or ``BACKUP_CODEC=zlib``) and kept raw when that does not pay off.
+- Chunks are hashed and compressed on ``BACKUP_WORKERS`` threads (both release
+  the GIL) while files are read sequentially with a bounded number of chunks
+  in flight; restores write files in parallel the same way.
+- Files whose size and mtime match the previous manifest reuse its chunk list
+  without being read again.
+- Deleting a backup decrements the reference count of its chunks and removes
+  the ones that reach zero; ``sweep_unreferenced`` cleans up chunks left by an
+  interrupted backup.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import io
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zipfile
+import zlib
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from app.utils.paths import atomic_write, write_json_atomic
+
+try:
+    from compression import zstd  # type: ignore  # Python 3.14+
+except ImportError:
+    try:
+        from backports import zstd  # type: ignore  # requirements.txt, Python < 3.14
+    except ImportError:  # pragma: no cover - optional
+        zstd = None
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = int(os.getenv('BACKUP_CHUNK_SIZE', str(1 << 20)))
+MANIFEST_VERSION = 1
+WORKERS = max(1, int(os.getenv('BACKUP_WORKERS', str(min(4, os.cpu_count() or 1)))))
+
+CODEC_RAW = 0
+CODEC_ZLIB = 1
+CODEC_ZSTD = 2
+
+_CODEC_NAME = os.getenv('BACKUP_CODEC', 'zstd').strip().lower()
+if _CODEC_NAME == 'zstd' and zstd is None:
+    _CODEC_NAME = 'zlib'
+WRITE_CODEC = CODEC_ZSTD if _CODEC_NAME == 'zstd' else CODEC_ZLIB
+COMPRESS_LEVEL = int(os.getenv('BACKUP_COMPRESS_LEVEL', '3' if WRITE_CODEC == CODEC_ZSTD else '6'))
+
+# Caught when reading chunks; empty (catches nothing) without a zstd module
+_ZSTD_ERRORS: Tuple[type, ...] = (zstd.ZstdError,) if zstd is not None else ()
+
+# Formats that are already compressed; recompressing them only burns CPU
+INCOMPRESSIBLE_SUFFIXES = frozenset({
+    '.jpg', '.jpeg', '.png', '.gif', '.webp', '.avif', '.heic',
+    '.zip', '.gz', '.tgz', '.br', '.zst', '.bz2', '.xz', '.7z',
+    '.mp3', '.m4a', '.m4b', '.aac', '.ogg', '.opus', '.flac', '.mp4', '.mkv',
+    '.woff', '.woff2', '.epub',
+})
+# Keep a compressed chunk only if it saves at least this fraction
+_MIN_SAVINGS = 0.05
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS chunks (
+    id TEXT PRIMARY KEY,
+    refs INTEGER NOT NULL DEFAULT 0,
+    size INTEGER NOT NULL,
+    stored_size INTEGER NOT NULL
+);
+"""
+
+
+def is_compressible(name: str) -> bool:
+    return Path(name).suffix.lower() not in INCOMPRESSIBLE_SUFFIXES
+
+
+def _compress(data: bytes) -> bytes:
+    if WRITE_CODEC == CODEC_ZSTD:
+        return zstd.compress(data, level=COMPRESS_LEVEL)
+    return zlib.compress(data, COMPRESS_LEVEL)
+
+
+def _decompress_zstd(payload: bytes) -> bytes:
+    if zstd is None:
+        raise RuntimeError("compression.zstd or backports.zstd is required to read zstd-compressed backup chunks")
+    return zstd.decompress(payload)
+
+
+class _ZipStream(io.RawIOBase):
+    """Unseekable sink that lets ``zipfile`` write an archive into a generator."""
+
+    def __init__(self):
+        super().__init__()
+        self._parts: List[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, b) -> int:
+        self._parts.append(bytes(b))
+        return len(b)
+
+    def drain(self) -> bytes:
+        data = b''.join(self._parts)
+        self._parts.clear()
+        return data
+
+
+class ChunkCorrupted(Exception):
+    """A stored chunk is missing or does not match its content hash."""
+
+
+class BackupStore:
+    """Deduplicating chunk store rooted at ``root``."""
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self.chunks_dir = self.root / 'chunks'
+        self.manifests_dir = self.root / 'manifests'
+        self.index_path = self.root / 'index.sqlite3'
+        self._lock = threading.RLock()
+
+    # -- locking / index ----------------------------------------------------
+    @contextlib.contextmanager
+    def locked(self):
+        """In-process lock plus an advisory file lock shared with other workers."""
+        with self._lock:
+            self.root.mkdir(parents=True, exist_ok=True)
+            fh = open(self.root / '.lock', 'w')
+            try:
+                try:
+                    import fcntl  # type: ignore
+                    fcntl.flock(fh.fileno(), fcntl.LOCK_EX)
+                except Exception:
+                    pass
+                yield
+            finally:
+                try:
+                    import fcntl  # type: ignore
+                    fcntl.flock(fh.fileno(), fcntl.LOCK_UN)
+                except Exception:
+                    pass
+                fh.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        self.root.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.index_path), timeout=30.0)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.executescript(_SCHEMA)
+        return conn
+
+    # -- chunks ---------------------------------------------------------------
+    def _chunk_path(self, chunk_id: str) -> Path:
+        return self.chunks_dir / chunk_id[:2] / chunk_id
+
+    def has_chunk(self, chunk_id: str) -> bool:
+        return self._chunk_path(chunk_id).is_file()
+
+    def put_chunk(self, data: bytes, compressible: bool = True) -> Tuple[str, int]:
+        """Store a chunk if new. Returns (chunk id, stored bytes written; 0 if deduplicated)."""
+        chunk_id = hashlib.sha256(data).hexdigest()
+        path = self._chunk_path(chunk_id)
+        if path.is_file():
+            return chunk_id, 0
+        codec, payload = CODEC_RAW, data
+        if compressible and data:
+            packed = _compress(data)
+            if len(packed) <= len(data) * (1 - _MIN_SAVINGS):
+                codec, payload = WRITE_CODEC, packed
+        with atomic_write(path, 'wb') as fh:
+            fh.write(bytes((codec,)))
+            fh.write(payload)
+        return chunk_id, len(payload) + 1
+
+    def read_chunk(self, chunk_id: str, verify: bool = False) -> bytes:
+        try:
+            blob = self._chunk_path(chunk_id).read_bytes()
+        except FileNotFoundError:
+            raise ChunkCorrupted(f"chunk {chunk_id} is missing")
+        if not blob:
+            raise ChunkCorrupted(f"chunk {chunk_id} is empty")
+        codec, payload = blob[0], blob[1:]
+        if codec == CODEC_RAW:
+            data = payload
+        elif codec == CODEC_ZLIB:
+            try:
+                data = zlib.decompress(payload)
+            except zlib.error as e:
+                raise ChunkCorrupted(f"chunk {chunk_id} does not decompress: {e}")
+        elif codec == CODEC_ZSTD:
+            try:
+                data = _decompress_zstd(payload)
+            except _ZSTD_ERRORS as e:
+                raise ChunkCorrupted(f"chunk {chunk_id} does not decompress: {e}")
+        else:
+            raise ChunkCorrupted(f"chunk {chunk_id} has unknown codec {codec}")
+        if verify and hashlib.sha256(data).hexdigest() != chunk_id:
+            raise ChunkCorrupted(f"chunk {chunk_id} content hash mismatch")
+        return data
+
+    # -- manifests ------------------------------------------------------------
+    def manifest_path(self, backup_id: str) -> Path:
+        return self.manifests_dir / f"{backup_id}.json"
+
+    def load_manifest(self, backup_id: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self.manifest_path(backup_id), 'r', encoding='utf-8') as fh:
+                return json.load(fh)
+        except FileNotFoundError:
+            return None
+
+    def latest_manifest(self) -> Optional[Dict[str, Any]]:
+        """Most recent manifest, used to skip re-reading unchanged files."""
+        try:
+            paths = sorted(self.manifests_dir.glob('*.json'), key=lambda p: p.stat().st_mtime, reverse=True)
+        except OSError:
+            return None
+        for path in paths:
+            try:
+                with open(path, 'r', encoding='utf-8') as fh:
+                    return json.load(fh)
+            except Exception:
+                continue
+        return None
+
+    def write_backup(self, backup_id: str, entries: Iterable[Tuple[str, Path]],
+                     metadata: Dict[str, Any]) -> Dict[str, Any]:
+        """Chunk ``(archive name, path)`` entries into the store and commit a manifest.
+
+        Returns the manifest; ``manifest['stats']`` has logical/new/reused byte counts.
+        """
+        with self.locked():
+            previous = self.latest_manifest() or {}
+            prev_files = {f['path']: f for f in previous.get('files', [])}
+            files: List[Dict[str, Any]] = []
+            chunk_sizes: Dict[str, Tuple[int, int]] = {}
+            stats = {'files': 0, 'logical_bytes': 0, 'new_bytes': 0, 'stored_bytes_added': 0,
+                     'reused_files': 0, 'new_chunks': 0}
+            started = time.time()
+            # (file chunk list, slot, length, future); bounded so memory stays ~2 chunks per worker
+            pending: deque = deque()
+            max_in_flight = WORKERS * 2
+
+            def _settle(block_until: int) -> None:
+                while len(pending) > block_until:
+                    chunk_list, slot, length, fut = pending.popleft()
+                    chunk_id, written = fut.result()
+                    chunk_list[slot] = chunk_id
+                    if written and chunk_id not in chunk_sizes:
+                        chunk_sizes[chunk_id] = (length, written)
+                        stats['new_chunks'] += 1
+                        stats['new_bytes'] += length
+                        stats['stored_bytes_added'] += written
+
+            with ThreadPoolExecutor(max_workers=WORKERS, thread_name_prefix='backup-chunk') as pool:
+                for arcname, path in entries:
+                    try:
+                        st = path.stat()
+                    except FileNotFoundError:
+                        continue
+                    prev = prev_files.get(arcname)
+                    if (prev and prev.get('size') == st.st_size and prev.get('mtime_ns') == st.st_mtime_ns
+                            and all(self.has_chunk(c) for c in prev['chunks'])):
+                        chunks: List[Optional[str]] = list(prev['chunks'])
+                        stats['reused_files'] += 1
+                    else:
+                        chunks = []
+                        compressible = is_compressible(arcname)
+                        with open(path, 'rb') as fh:
+                            while True:
+                                data = fh.read(CHUNK_SIZE)
+                                if not data:
+                                    break
+                                chunks.append(None)
+                                fut: Future = pool.submit(self.put_chunk, data, compressible)
+                                pending.append((chunks, len(chunks) - 1, len(data), fut))
+                                _settle(max_in_flight)
+                    files.append({'path': arcname, 'size': st.st_size, 'mtime_ns': st.st_mtime_ns, 'chunks': chunks})
+                    stats['files'] += 1
+                    stats['logical_bytes'] += st.st_size
+                _settle(0)
+            stats['elapsed_seconds'] = round(time.time() - started, 3)
+            manifest = {
+                'version': MANIFEST_VERSION,
+                'backup_id': backup_id,
+                'created_at': datetime.now().isoformat(),
+                'chunk_size': CHUNK_SIZE,
+                'metadata': metadata,
+                'files': files,
+                'stats': stats,
+            }
+            self._add_refs(files, chunk_sizes)
+            write_json_atomic(self.manifest_path(backup_id), manifest)
+            logger.info(
+                f"[BACKUP][STORE] {backup_id}: {stats['files']} files, {stats['logical_bytes']} B logical, "
+                f"{stats['stored_bytes_added']} B new ({stats['reused_files']} files unchanged)"
+            )
+            return manifest
+
+    def _add_refs(self, files: List[Dict[str, Any]], chunk_sizes: Dict[str, Tuple[int, int]]) -> None:
+        unique = set()
+        for f in files:
+            unique.update(f['chunks'])
+        conn = self._connect()
+        try:
+            with conn:
+                for chunk_id in unique:
+                    size, stored = chunk_sizes.get(chunk_id, (0, 0))
+                    conn.execute(
+                        "INSERT INTO chunks (id, refs, size, stored_size) VALUES (?, 1, ?, ?) "
+                        "ON CONFLICT(id) DO UPDATE SET refs = refs + 1",
+                        (chunk_id, size, stored),
+                    )
+        finally:
+            conn.close()
+
+    def delete_backup(self, backup_id: str) -> Dict[str, int]:
+        """Drop a manifest and every chunk no other manifest references."""
+        with self.locked():
+            manifest = self.load_manifest(backup_id)
+            result = {'chunks_deleted': 0, 'bytes_freed': 0}
+            if manifest is None:
+                return result
+            unique = set()
+            for f in manifest.get('files', []):
+                unique.update(f['chunks'])
+            conn = self._connect()
+            try:
+                with conn:
+                    conn.executemany("UPDATE chunks SET refs = refs - 1 WHERE id = ?", [(c,) for c in unique])
+                    dead = [row[0] for row in conn.execute("SELECT id FROM chunks WHERE refs <= 0")]
+                    for chunk_id in dead:
+                        path = self._chunk_path(chunk_id)
+                        try:
+                            result['bytes_freed'] += path.stat().st_size
+                            path.unlink()
+                            result['chunks_deleted'] += 1
+                        except FileNotFoundError:
+                            pass
+                    conn.executemany("DELETE FROM chunks WHERE id = ?", [(c,) for c in dead])
+            finally:
+                conn.close()
+            self.manifest_path(backup_id).unlink(missing_ok=True)
+            logger.info(f"[BACKUP][STORE] Deleted {backup_id}: freed {result['chunks_deleted']} chunks ({result['bytes_freed']} B)")
+            return result
+
+    def sweep_unreferenced(self, grace_seconds: int = 3600) -> int:
+        """Delete chunk files with no index row (left by an interrupted backup)."""
+        removed = 0
+        cutoff = time.time() - grace_seconds
+        with self.locked():
+            conn = self._connect()
+            try:
+                known = {row[0] for row in conn.execute("SELECT id FROM chunks")}
+            finally:
+                conn.close()
+            if not self.chunks_dir.is_dir():
+                return 0
+            for bucket in os.scandir(self.chunks_dir):
+                if not bucket.is_dir():
+                    continue
+                for entry in os.scandir(bucket.path):
+                    if entry.name in known or not entry.is_file():
+                        continue
+                    try:
+                        if entry.stat().st_mtime < cutoff:
+                            os.unlink(entry.path)
+                            removed += 1
+                    except FileNotFoundError:
+                        pass
+        if removed:
+            logger.info(f"[BACKUP][STORE] Swept {removed} unreferenced chunks")
+        return removed
+
+    # -- reading --------------------------------------------------------------
+    def iter_file_bytes(self, file_entry: Dict[str, Any], verify: bool = False) -> Iterator[bytes]:
+        for chunk_id in file_entry['chunks']:
+            yield self.read_chunk(chunk_id, verify=verify)
+
+    def _restore_file(self, file_entry: Dict[str, Any], target_dir: Path, verify: bool) -> None:
+        dest = target_dir / file_entry['path']
+        if target_dir not in dest.resolve().parents:
+            raise ValueError(f"Unsafe path in backup manifest: {file_entry['path']}")
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        with open(dest, 'wb') as out:
+            for data in self.iter_file_bytes(file_entry, verify=verify):
+                out.write(data)
+
+    def restore_to(self, manifest: Dict[str, Any], target_dir: Path, verify: bool = True,
+                   prefix: Optional[str] = None) -> int:
+        """Materialise a manifest under ``target_dir`` in the zip backup layout.
+
+        ``prefix`` (e.g. ``'kuzu/'``) limits the restore to matching files.
+        """
+        target_dir = Path(target_dir).resolve()
+        (target_dir / 'backup_metadata.json').write_text(json.dumps(manifest.get('metadata') or {}, indent=2))
+        files = [f for f in manifest.get('files', []) if not prefix or f['path'].startswith(prefix)]
+        with ThreadPoolExecutor(max_workers=WORKERS, thread_name_prefix='backup-restore') as pool:
+            # list() re-raises the first failure (missing/corrupt chunk, unsafe path)
+            list(pool.map(lambda f: self._restore_file(f, target_dir, verify), files))
+        return len(files)
+
+    def verify_manifest(self, manifest: Dict[str, Any]) -> Dict[str, Any]:
+        """Re-hash every chunk of a manifest and check file sizes add up."""
+        files = manifest.get('files', [])
+        unique = sorted({c for f in files for c in f['chunks']})
+
+        def _check(chunk_id: str) -> Tuple[str, Optional[int], Optional[str]]:
+            try:
+                return chunk_id, len(self.read_chunk(chunk_id, verify=True)), None
+            except ChunkCorrupted as e:
+                return chunk_id, None, str(e)
+
+        with ThreadPoolExecutor(max_workers=WORKERS, thread_name_prefix='backup-verify') as pool:
+            results = list(pool.map(_check, unique))
+        lengths = {chunk_id: length for chunk_id, length, _err in results if length is not None}
+        errors = [err for _chunk_id, _length, err in results if err]
+        for f in files:
+            if all(c in lengths for c in f['chunks']):
+                actual = sum(lengths[c] for c in f['chunks'])
+                if actual != f.get('size'):
+                    errors.append(f"{f['path']}: {actual} bytes, manifest says {f.get('size')}")
+        return {'files': len(files), 'chunks': len(unique), 'errors': errors}
+
+    def _write_zip(self, manifest: Dict[str, Any], zipf: zipfile.ZipFile, after_write=None) -> None:
+        zipf.writestr('backup_metadata.json', json.dumps(manifest.get('metadata') or {}, indent=2))
+        for f in manifest.get('files', []):
+            # Zip timestamps cannot predate 1980
+            mtime = max(f.get('mtime_ns', 0) / 1e9, 315532800)
+            info = zipfile.ZipInfo(f['path'], date_time=time.localtime(mtime)[:6])
+            info.compress_type = zipfile.ZIP_DEFLATED if is_compressible(f['path']) else zipfile.ZIP_STORED
+            with zipf.open(info, 'w', force_zip64=f.get('size', 0) > 0x7FFFFFFF) as out:
+                for data in self.iter_file_bytes(f):
+                    out.write(data)
+                    if after_write is not None:
+                        yield after_write()
+            if after_write is not None:
+                yield after_write()
+
+    def export_zip(self, manifest: Dict[str, Any], dest: Path) -> Path:
+        """Write a manifest as a regular backup zip (media stored, the rest deflated)."""
+        with zipfile.ZipFile(dest, 'w', zipfile.ZIP_DEFLATED) as zipf:
+            for _ in self._write_zip(manifest, zipf):
+                pass
+        return dest
+
+    def iter_zip(self, manifest: Dict[str, Any]) -> Iterator[bytes]:
+        """Stream the same zip as ``export_zip`` without a temporary file."""
+        sink = _ZipStream()
+        with zipfile.ZipFile(sink, 'w', zipfile.ZIP_DEFLATED) as zipf:
+            for data in self._write_zip(manifest, zipf, after_write=sink.drain):
+                if data:
+                    yield data
+        tail = sink.drain()
+        if tail:
+            yield tail
+
+    def stats(self) -> Dict[str, Any]:
+        conn = self._connect()
+        try:
+            chunks, logical, stored = conn.execute(
+                "SELECT count(*), coalesce(sum(size), 0), coalesce(sum(stored_size), 0) FROM chunks"
+            ).fetchone()
+        finally:
+            conn.close()
+        manifests = len(list(self.manifests_dir.glob('*.json'))) if self.manifests_dir.is_dir() else 0
+        return {'chunks': chunks, 'unique_bytes': logical, 'stored_bytes': stored, 'manifests': manifests}
+
+
+__all__ = ['BackupStore', 'ChunkCorrupted', 'is_compressible', 'CHUNK_SIZE', 'INCOMPRESSIBLE_SUFFIXES', 'WRITE_CODEC']
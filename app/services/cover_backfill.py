@@ -0,0 +1,457 @@
+"""
+Bulk cover backfill.
+
+Finds books whose cover is still a remote URL (or missing entirely) and
+downloads, processes and stores them with bounded parallel I/O, instead of the
+one-at-a-time inline downloads done by imports and catalog syncs.
+
+- Downloads run on a thread pool (``COVER_BACKFILL_WORKERS``) with a per-host
+  concurrency cap and minimum request spacing (``COVER_BACKFILL_PER_HOST``,
+  ``COVER_BACKFILL_HOST_INTERVAL``) so one provider is never hammered.
+- At most ``COVER_BACKFILL_CPU_SLOTS`` (default: the CPU pool's worker count)
+  images are processed at once, so the shared CPU pool keeps room for
+  interactive cover requests.
+- Database writes stay on the coordinating thread (Kùzu has a single writer).
+- Progress is checkpointed to ``<data>/cover_backfill.json``; books that were
+  finished already have local covers and drop out of the next scan, and
+  permanently failing ones are remembered, so a restarted job resumes.
+  Transient failures (busy CPU pool, network errors, 5xx/429, no cover
+  source found) are retried by later runs, up to ``COVER_BACKFILL_MAX_ATTEMPTS``.
+- The job runs on the shared job scheduler at bulk priority and honours
+  cancellation between books. Book ids queued while it is active (e.g. by
+  a catalog sync) are merged into the running job instead of dropped.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlparse
+
+import requests
+
+from app.infrastructure.kuzu_graph import safe_execute_kuzu_query
+from app.services.job_scheduler import PRIORITY_BULK, job_scheduler
+from app.utils.cpu_pool import CpuPoolBusy, get_cpu_pool
+from app.utils.paths import resolve_data_dir, write_json_atomic
+
+logger = logging.getLogger(__name__)
+
+BACKFILL_WORKERS = int(os.getenv('COVER_BACKFILL_WORKERS', '8'))
+BACKFILL_PER_HOST = int(os.getenv('COVER_BACKFILL_PER_HOST', '2'))
+BACKFILL_HOST_INTERVAL = float(os.getenv('COVER_BACKFILL_HOST_INTERVAL', '0.25'))
+# Kept below the CPU pool's max_pending so interactive derivative requests are not rejected
+BACKFILL_CPU_SLOTS = int(os.getenv('COVER_BACKFILL_CPU_SLOTS', '0'))
+# Transient failures are retried by later runs; after this many a book is given up on
+BACKFILL_MAX_ATTEMPTS = int(os.getenv('COVER_BACKFILL_MAX_ATTEMPTS', '3'))
+# Checkpoint the state file every N finished books or every few seconds, whichever comes first
+_CHECKPOINT_EVERY = 25
+_CHECKPOINT_SECONDS = 15
+# A running job whose checkpoint is older than this is treated as interrupted (worker gone)
+_STALE_AFTER_SECONDS = 120
+
+BACKFILL_JOB_ID = 'cover_backfill'
+
+_state_lock = threading.Lock()
+
+# Book ids handed to start_backfill while a job in this process will still pick them up
+_pending_lock = threading.Lock()
+_pending_ids: Dict[str, None] = {}
+_draining = False
+# How long start_backfill waits for a job that has stopped draining to leave the scheduler
+_HANDOFF_WAIT_SECONDS = 5.0
+
+
+def _utcnow() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+class HostRateLimiter:
+    """Caps concurrent requests per host and spaces consecutive requests to the same host."""
+
+    def __init__(self, per_host: int = BACKFILL_PER_HOST, min_interval: float = BACKFILL_HOST_INTERVAL):
+        self._per_host = max(1, per_host)
+        self._min_interval = max(0.0, min_interval)
+        self._lock = threading.Lock()
+        self._semaphores: Dict[str, threading.BoundedSemaphore] = {}
+        self._next_slot: Dict[str, float] = {}
+
+    def _semaphore(self, host: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            sem = self._semaphores.get(host)
+            if sem is None:
+                sem = self._semaphores[host] = threading.BoundedSemaphore(self._per_host)
+            return sem
+
+    def acquire(self, host: str) -> None:
+        self._semaphore(host).acquire()
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, 0.0))
+            self._next_slot[host] = slot + self._min_interval
+        if slot > now:
+            time.sleep(slot - now)
+
+    def release(self, host: str) -> None:
+        self._semaphore(host).release()
+
+
+# --- State -------------------------------------------------------------------
+
+def _state_path():
+    return resolve_data_dir() / 'cover_backfill.json'
+
+
+def load_state() -> Dict[str, Any]:
+    try:
+        with open(_state_path(), 'r', encoding='utf-8') as fh:
+            data = json.load(fh)
+        return data if isinstance(data, dict) else {}
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        logger.warning(f"[COVER][BACKFILL] Could not read state: {e}")
+        return {}
+
+
+def _save_state(state: Dict[str, Any]) -> None:
+    path = _state_path()
+    state['updated_at'] = _utcnow()
+    with _state_lock:
+        try:
+            write_json_atomic(path, state)
+        except Exception as e:
+            logger.warning(f"[COVER][BACKFILL] Could not persist state: {e}")
+
+
+def _is_stale(state: Dict[str, Any]) -> bool:
+    try:
+        updated = datetime.fromisoformat(str(state.get('updated_at')))
+    except ValueError:
+        return True
+    return (datetime.now(timezone.utc) - updated).total_seconds() > _STALE_AFTER_SECONDS
+
+
+def get_status() -> Dict[str, Any]:
+    """Persisted progress plus live scheduler status for the backfill job."""
+    state = load_state()
+    state.pop('failed_ids', None)
+    state['retry_pending'] = len(state.pop('attempts', None) or {})
+    live = job_scheduler.get_status(BACKFILL_JOB_ID)
+    if live:
+        state['scheduler'] = live
+    elif state.get('status') in ('queued', 'running') and _is_stale(state):
+        # The worker that ran it is gone; the next start resumes from the checkpoint
+        state['status'] = 'interrupted'
+    return state
+
+
+# --- Candidates --------------------------------------------------------------
+
+def _is_remote(url: Optional[str]) -> bool:
+    return bool(url) and str(url).startswith(('http://', 'https://')) and '/covers/' not in str(url)
+
+
+def find_backfill_candidates(include_missing: bool = True, book_ids: Optional[Iterable[str]] = None,
+                             limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Books whose cover is remote (or, with ``include_missing``, absent)."""
+    where = ["(b.cover_url STARTS WITH 'http' AND NOT b.cover_url CONTAINS '/covers/')"]
+    if include_missing:
+        where.append("b.cover_url IS NULL OR b.cover_url = ''")
+    params: Dict[str, Any] = {}
+    id_filter = ''
+    if book_ids is not None:
+        params['ids'] = list(book_ids)
+        id_filter = 'b.id IN $ids AND '
+    query = (
+        f"MATCH (b:Book) WHERE {id_filter}({' OR '.join(where)}) "
+        "OPTIONAL MATCH (p:Person)-[:AUTHORED]->(b) "
+        "WITH b, collect(p.name) AS authors "
+        "RETURN b.id, b.cover_url, b.isbn13, b.isbn10, b.title, authors"
+    )
+    if limit:
+        query += f" LIMIT {int(limit)}"
+    result = safe_execute_kuzu_query(query, params, operation='cover_backfill_candidates')
+    books: List[Dict[str, Any]] = []
+    if result is None or not hasattr(result, 'has_next'):
+        return books
+    while result.has_next():
+        row = result.get_next()
+        books.append({
+            'id': row[0],
+            'cover_url': row[1],
+            'isbn': row[2] or row[3],
+            'title': row[4],
+            'author': next((a for a in (row[5] or []) if a), None),
+        })
+    return books
+
+
+# --- Worker side -------------------------------------------------------------
+
+def _is_transient(exc: BaseException) -> bool:
+    """Failures worth retrying on a later run (as opposed to a bad or missing image)."""
+    if isinstance(exc, (CpuPoolBusy, requests.ConnectionError, requests.Timeout, TimeoutError)):
+        return True
+    if isinstance(exc, requests.HTTPError):
+        status = getattr(exc.response, 'status_code', None)
+        return status is None or status in (408, 429) or status >= 500
+    return False
+
+
+def _cpu_slots() -> threading.BoundedSemaphore:
+    slots = BACKFILL_CPU_SLOTS or get_cpu_pool().workers
+    return threading.BoundedSemaphore(max(1, min(slots, get_cpu_pool().max_pending - 1)))
+
+
+def _fetch_cover(book: Dict[str, Any], limiter: HostRateLimiter,
+                 auth: Optional[Tuple[str, str]], headers: Optional[Dict[str, str]],
+                 cpu_slots: Optional[threading.BoundedSemaphore] = None) -> Tuple[str, Optional[str], str]:
+    """Resolve and store one cover. Returns (book_id, local_url or None, outcome)."""
+    from app.services.cover_service import _get_cached_processed_url, _record_processed_cache
+    from app.utils.image_processing import process_image_from_url
+
+    source = book.get('cover_url') if _is_remote(book.get('cover_url')) else None
+    if not source:
+        from app.utils.book_utils import get_best_cover_for_book
+        best = get_best_cover_for_book(isbn=book.get('isbn'), title=book.get('title'), author=book.get('author'))
+        source = (best or {}).get('cover_url')
+        if not source:
+            return book['id'], None, 'no_source'
+
+    cached = _get_cached_processed_url(source)
+    if cached:
+        idx = cached.find('/covers/')
+        return book['id'], cached[idx:] if idx >= 0 else cached, 'cached'
+
+    host = (urlparse(source).hostname or '').lower()
+    limiter.acquire(host)
+    try:
+        try:
+            rel = process_image_from_url(source, auth=auth, headers=headers, cpu_slots=cpu_slots)
+        except Exception as e:
+            if (auth is None and not headers) or isinstance(e, CpuPoolBusy):
+                raise
+            # Credentials are only valid for the catalog host; retry plain for CDN redirects
+            rel = process_image_from_url(source, cpu_slots=cpu_slots)
+    finally:
+        limiter.release(host)
+    if rel:
+        _record_processed_cache(source, rel)
+    return book['id'], rel, 'downloaded'
+
+
+def _run_backfill(state: Dict[str, Any], books: List[Dict[str, Any]],
+                  auth: Optional[Tuple[str, str]], headers: Optional[Dict[str, str]]) -> Dict[str, Any]:
+    from flask import current_app
+
+    app = current_app._get_current_object()  # type: ignore[attr-defined]
+    limiter = HostRateLimiter()
+    cpu_slots = _cpu_slots()
+    failed_ids = set(state.get('failed_ids') or [])
+    attempts: Dict[str, int] = dict(state.get('attempts') or {})
+    books = [b for b in books if b['id'] not in failed_ids]
+    state.update({'status': 'running', 'total': state.get('processed', 0) + len(books), 'started_at': state.get('started_at') or _utcnow()})
+    _save_state(state)
+
+    def _task(book):
+        with app.app_context():
+            return _fetch_cover(book, limiter, auth, headers, cpu_slots)
+
+    def _retry_later(book_id: str) -> None:
+        attempts[book_id] = attempts.get(book_id, 0) + 1
+        if attempts[book_id] >= BACKFILL_MAX_ATTEMPTS:
+            attempts.pop(book_id)
+            failed_ids.add(book_id)
+
+    pending: Dict[Any, str] = {}
+    queue = list(reversed(books))
+    since_checkpoint = 0
+    last_checkpoint = time.monotonic()
+    with ThreadPoolExecutor(max_workers=max(1, BACKFILL_WORKERS), thread_name_prefix='cover-backfill') as pool:
+        while queue or pending:
+            cancelled = job_scheduler.is_cancelled(BACKFILL_JOB_ID)
+            # Keep a bounded window in flight so cancellation and memory stay bounded
+            while queue and not cancelled and len(pending) < BACKFILL_WORKERS * 2:
+                book = queue.pop()
+                pending[pool.submit(_task, book)] = book['id']
+            if not pending:
+                break
+            done, _ = wait(pending, timeout=5, return_when=FIRST_COMPLETED)
+            for fut in done:
+                book_id = pending.pop(fut)
+                state['processed'] = state.get('processed', 0) + 1
+                try:
+                    book_id, local_url, outcome = fut.result()
+                except Exception as e:
+                    state['failed'] = state.get('failed', 0) + 1
+                    state['last_error'] = f"{e.__class__.__name__}: {e}"
+                    if _is_transient(e):
+                        _retry_later(book_id)
+                    else:
+                        failed_ids.add(book_id)
+                    continue
+                if not local_url:
+                    state['skipped'] = state.get('skipped', 0) + 1
+                    # No source may just mean the providers were unreachable this time
+                    if outcome == 'no_source':
+                        _retry_later(book_id)
+                    else:
+                        failed_ids.add(book_id)
+                    continue
+                try:
+                    safe_execute_kuzu_query(
+                        "MATCH (b:Book {id: $id}) SET b.cover_url = $url",
+                        {'id': book_id, 'url': local_url},
+                        operation='cover_backfill_update',
+                    )
+                    state['succeeded'] = state.get('succeeded', 0) + 1
+                    state.setdefault('outcomes', {})[outcome] = state.get('outcomes', {}).get(outcome, 0) + 1
+                    attempts.pop(book_id, None)
+                except Exception as e:
+                    # The cover is stored; a failed write (e.g. a busy database) is worth another try
+                    state['failed'] = state.get('failed', 0) + 1
+                    state['last_error'] = f"{e.__class__.__name__}: {e}"
+                    _retry_later(book_id)
+                since_checkpoint += 1
+            if since_checkpoint >= _CHECKPOINT_EVERY or time.monotonic() - last_checkpoint > _CHECKPOINT_SECONDS:
+                state['failed_ids'] = sorted(failed_ids)
+                state['attempts'] = attempts
+                _save_state(state)
+                since_checkpoint = 0
+                last_checkpoint = time.monotonic()
+    if state['status'] == 'running':
+        state['status'] = 'cancelled' if job_scheduler.is_cancelled(BACKFILL_JOB_ID) else 'completed'
+    state['failed_ids'] = sorted(failed_ids)
+    state['attempts'] = attempts
+    state['finished_at'] = _utcnow()
+    _save_state(state)
+    try:
+        from app.utils.simple_cache import bump_user_library_version
+        for uid in state.get('user_ids') or []:
+            bump_user_library_version(uid)
+    except Exception:
+        pass
+    logger.info(
+        f"[COVER][BACKFILL] {state['status']} processed={state.get('processed')} ok={state.get('succeeded', 0)} "
+        f"skipped={state.get('skipped', 0)} failed={state.get('failed', 0)}"
+    )
+    return state
+
+
+def _backfill_entry(options: Dict[str, Any], auth, headers) -> Dict[str, Any]:
+    global _draining
+    state = options.pop('_state')
+    include_missing = options.get('include_missing', True)
+    book_ids = options.get('book_ids')
+    limit = options.get('limit')
+    try:
+        while True:
+            books = find_backfill_candidates(include_missing=include_missing, book_ids=book_ids, limit=limit)
+            state = _run_backfill(state, books, auth, headers)
+            with _pending_lock:
+                if not _pending_ids or state.get('status') == 'cancelled':
+                    _draining = False
+                    return state
+                book_ids = list(_pending_ids)
+                _pending_ids.clear()
+            # Ids merged in while this pass ran
+            logger.info(f"[COVER][BACKFILL] Continuing with {len(book_ids)} queued books")
+            include_missing, limit = False, None
+            state['status'] = 'running'
+    finally:
+        # Left-over ids (error or cancellation) stay queued for the next start_backfill
+        with _pending_lock:
+            _draining = False
+
+
+def start_backfill(*, include_missing: bool = True, book_ids: Optional[Iterable[str]] = None,
+                   limit: Optional[int] = None, resume: bool = True, user_id: Optional[str] = None,
+                   cover_auth: Optional[Tuple[str, str]] = None,
+                   cover_headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+    """Queue the backfill job. Returns the current state.
+
+    While a job is active a call without ``book_ids`` is a no-op; explicit
+    ``book_ids`` are merged into the active job (its credentials are used).
+    ``cover_auth``/``cover_headers`` are kept in memory only; a resumed job
+    fetches without them.
+    """
+    global _draining
+    if book_ids is not None:
+        book_ids = list(book_ids)
+        deadline = time.monotonic() + _HANDOFF_WAIT_SECONDS
+        while True:
+            with _pending_lock:
+                if _draining:
+                    _pending_ids.update(dict.fromkeys(book_ids))
+                    logger.info(f"[COVER][BACKFILL] Merged {len(book_ids)} books into the active job")
+                    return get_status()
+            # Not draining but still listed: the job is returning; wait for it to leave
+            if not job_scheduler.is_active(BACKFILL_JOB_ID) or time.monotonic() > deadline:
+                break
+            time.sleep(0.05)
+    if job_scheduler.is_active(BACKFILL_JOB_ID):
+        if book_ids:
+            with _pending_lock:
+                _pending_ids.update(dict.fromkeys(book_ids))
+        return get_status()
+    previous = load_state()
+    if previous.get('status') in ('queued', 'running') and not _is_stale(previous):
+        # Still heartbeating from another worker process
+        return get_status()
+    resumable = resume and previous.get('status') in ('running', 'queued', 'cancelled', 'interrupted')
+    state: Dict[str, Any] = previous if resumable else {}
+    state.update({
+        'run_id': state.get('run_id') or uuid.uuid4().hex[:12],
+        'status': 'queued',
+        'include_missing': include_missing,
+        'resumed': bool(resumable),
+    })
+    state.setdefault('processed', 0)
+    state.setdefault('created_at', _utcnow())
+    if user_id:
+        state['user_ids'] = sorted(set(state.get('user_ids') or []) | {str(user_id)})
+    _save_state(state)
+    with _pending_lock:
+        if book_ids is not None and _pending_ids:
+            # Ids left over from an earlier job that stopped before reaching them
+            book_ids = list(dict.fromkeys(list(_pending_ids) + book_ids))
+            _pending_ids.clear()
+        _draining = True
+    options = {
+        'include_missing': include_missing,
+        'book_ids': book_ids,
+        'limit': limit,
+        '_state': state,
+    }
+    try:
+        job_scheduler.submit(
+            _backfill_entry, options, cover_auth, cover_headers,
+            priority=PRIORITY_BULK, user_id=user_id, job_id=BACKFILL_JOB_ID, name='cover_backfill',
+        )
+    except Exception:
+        with _pending_lock:
+            _draining = False
+        raise
+    return get_status()
+
+
+def cancel_backfill() -> bool:
+    return job_scheduler.cancel(BACKFILL_JOB_ID)
+
+
+__all__ = [
+    'HostRateLimiter',
+    'find_backfill_candidates',
+    'start_backfill',
+    'cancel_backfill',
+    'get_status',
+    'load_state',
+]
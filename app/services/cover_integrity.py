@@ -0,0 +1,173 @@
+"""
+Scheduled cover storage integrity scan.
+
+Runs ``cover_storage.scan_cover_storage`` as a maintenance job on the shared
+job scheduler and keeps the last report in ``<data>/cover_integrity.json`` for
+the admin API. A lightweight thread starts a report-only scan every
+``COVER_INTEGRITY_INTERVAL_HOURS`` (default 24, ``0`` disables); set
+``COVER_INTEGRITY_AUTO_DELETE=true`` to also delete orphans on scheduled runs.
+Dangling references are only cleared on explicit admin request.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+from app.services.job_scheduler import PRIORITY_MAINTENANCE, JobQueueFull, job_scheduler
+from app.utils.paths import resolve_data_dir, write_json_atomic
+
+logger = logging.getLogger(__name__)
+
+INTEGRITY_JOB_ID = 'cover_integrity'
+INTEGRITY_INTERVAL_HOURS = float(os.getenv('COVER_INTEGRITY_INTERVAL_HOURS', '24'))
+INTEGRITY_AUTO_DELETE = os.getenv('COVER_INTEGRITY_AUTO_DELETE', 'false').lower() in ('1', 'true', 'yes', 'on')
+# Scheduler thread wake-up; scans themselves are spaced by the interval above
+_CHECK_SECONDS = 600
+
+_state_lock = threading.Lock()
+_scheduler_thread: Optional[threading.Thread] = None
+_scheduler_stop = threading.Event()
+
+
+def _utcnow() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _state_path():
+    return resolve_data_dir() / 'cover_integrity.json'
+
+
+def load_state() -> Dict[str, Any]:
+    try:
+        with open(_state_path(), 'r', encoding='utf-8') as fh:
+            data = json.load(fh)
+        return data if isinstance(data, dict) else {}
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        logger.warning(f"[COVER][INTEGRITY] Could not read state: {e}")
+        return {}
+
+
+def _save_state(state: Dict[str, Any]) -> None:
+    path = _state_path()
+    state['updated_at'] = _utcnow()
+    with _state_lock:
+        try:
+            write_json_atomic(path, state)
+        except Exception as e:
+            logger.warning(f"[COVER][INTEGRITY] Could not persist state: {e}")
+
+
+def get_status() -> Dict[str, Any]:
+    """Last report plus live scheduler status of the scan job."""
+    state = load_state()
+    live = job_scheduler.get_status(INTEGRITY_JOB_ID)
+    if live:
+        state['scheduler'] = live
+    state['interval_hours'] = INTEGRITY_INTERVAL_HOURS
+    return state
+
+
+def _run_scan(options: Dict[str, Any]) -> Dict[str, Any]:
+    from app.services.cover_storage import scan_cover_storage
+    state = load_state()
+    state.update({'status': 'running', 'last_started_at': _utcnow(), 'options': options})
+    _save_state(state)
+    try:
+        report = scan_cover_storage(
+            delete_orphans=options.get('delete_orphans', False),
+            clear_dangling=options.get('clear_dangling', False),
+            should_cancel=lambda: job_scheduler.is_cancelled(INTEGRITY_JOB_ID),
+        )
+    except Exception as e:
+        state.update({'status': 'failed', 'error': str(e), 'finished_at': _utcnow()})
+        _save_state(state)
+        raise
+    if report.get('cancelled'):
+        status = 'cancelled'
+    else:
+        status = 'incomplete' if report.get('incomplete') else 'completed'
+    state.update({
+        'status': status,
+        'error': report.get('error'),
+        'finished_at': _utcnow(),
+        'report': report,
+    })
+    _save_state(state)
+    return report
+
+
+def start_integrity_scan(*, delete_orphans: bool = False, clear_dangling: bool = False,
+                         user_id: Optional[str] = None, trigger: str = 'manual') -> Dict[str, Any]:
+    """Queue a scan (no-op while one is active). Returns the current status."""
+    if job_scheduler.is_active(INTEGRITY_JOB_ID):
+        return get_status()
+    options = {'delete_orphans': bool(delete_orphans), 'clear_dangling': bool(clear_dangling), 'trigger': trigger}
+    state = load_state()
+    state.update({'status': 'queued', 'last_queued_at': _utcnow(), 'options': options})
+    _save_state(state)
+    job_scheduler.submit(
+        _run_scan, options,
+        priority=PRIORITY_MAINTENANCE, user_id=user_id, job_id=INTEGRITY_JOB_ID, name='cover_integrity',
+    )
+    return get_status()
+
+
+def cancel_integrity_scan() -> bool:
+    return job_scheduler.cancel(INTEGRITY_JOB_ID)
+
+
+def _scan_due(state: Dict[str, Any]) -> bool:
+    last = state.get('last_queued_at') or state.get('last_started_at')
+    if not last:
+        return True
+    try:
+        elapsed = (datetime.now(timezone.utc) - datetime.fromisoformat(str(last))).total_seconds()
+    except ValueError:
+        return True
+    return elapsed >= INTEGRITY_INTERVAL_HOURS * 3600
+
+
+def ensure_integrity_scheduler() -> None:
+    """Start the periodic scan thread once per process (disabled when the interval is 0)."""
+    global _scheduler_thread
+    if INTEGRITY_INTERVAL_HOURS <= 0:
+        return
+    if _scheduler_thread and _scheduler_thread.is_alive():
+        return
+
+    def _loop():
+        logger.info("Cover integrity scheduler thread started")
+        # Let startup work (migrations, warmups) settle before the first check
+        _scheduler_stop.wait(_CHECK_SECONDS)
+        while not _scheduler_stop.is_set():
+            try:
+                if _scan_due(load_state()):
+                    start_integrity_scan(delete_orphans=INTEGRITY_AUTO_DELETE, trigger='scheduled')
+            except JobQueueFull:
+                pass
+            except Exception as e:
+                logger.warning(f"[COVER][INTEGRITY] Scheduled scan check failed: {e}")
+            _scheduler_stop.wait(_CHECK_SECONDS)
+
+    _scheduler_thread = threading.Thread(target=_loop, name='cover-integrity-scheduler', daemon=True)
+    _scheduler_thread.start()
+
+
+def stop_integrity_scheduler() -> None:
+    _scheduler_stop.set()
+
+
+__all__ = [
+    'start_integrity_scan',
+    'cancel_integrity_scan',
+    'get_status',
+    'ensure_integrity_scheduler',
+    'stop_integrity_scheduler',
+]
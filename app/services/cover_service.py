@@ -1,17 +1,30 @@
-"""Centralized cover fetching & processing service (temporary instrumentation)."""
+"""Centralized cover fetching & processing service (temporary instrumentation).
+
+Scan paths call ``cover_service.prefetch(isbn)`` as soon as an ISBN is known so
+candidate lookup and download run on the shared job scheduler (normal
+priority, outside the bulk slot) concurrently with metadata resolution; the
+later ``fetch_and_cache`` call picks up the prefetched result, or cancels a
+prefetch that has not started yet and resolves the cover itself. Prefetched
+covers are written to the content-addressed covers dir but stay unreferenced
+(and thus collectable after the GC grace period) until a book is saved, at
+which point ``promote_cover_url`` maps the URL to the already stored file.
+"""
 from __future__ import annotations
 import os
+import re
+import threading
 import time
 from collections import OrderedDict
-from dataclasses import dataclass
+from concurrent.futures import Future, TimeoutError as FutureTimeout
+from dataclasses import dataclass, replace
 from typing import Optional, Dict, Any
-from concurrent.futures import ThreadPoolExecutor
 import uuid
 from flask import current_app, request, has_request_context
 
 from app.utils.book_utils import get_best_cover_for_book, get_cover_candidates
-from app.utils.image_processing import process_image_from_url
-import requests
+from app.utils.image_processing import get_covers_dir, process_image_from_url
+from app.utils.persistent_cover_cache import NS_PROCESSED, persistent_cover_cache
+from app.services.job_scheduler import PRIORITY_INTERACTIVE, PRIORITY_NORMAL, JobQueueFull, job_scheduler
 
 
 @dataclass
@@ -25,13 +38,31 @@ class CoverResult:
 
 _PROCESSED_CACHE: "OrderedDict[str, tuple[float, str]]" = OrderedDict()
 _COVER_JOBS: dict[str, dict[str, Any]] = {}
-_EXECUTOR = ThreadPoolExecutor(max_workers=4)
 
 _CACHE_TTL_SECONDS = int(os.getenv('COVER_CACHE_TTL', '21600'))  # 6 hours by default
 _CACHE_MAX_ENTRIES = int(os.getenv('COVER_CACHE_MAX', '512'))
-_HEAD_CACHE_TTL_SECONDS = int(os.getenv('COVER_HEAD_TTL', '900'))  # 15 minutes
-_HEAD_TIMEOUT = float(os.getenv('COVER_HEAD_TIMEOUT', '1.5'))
-_HEAD_CACHE: "OrderedDict[str, tuple[float, Optional[int]]]" = OrderedDict()
+# Source URL -> local file survives restarts; the file itself is permanent, so keep the mapping longer
+_PERSIST_TTL_SECONDS = int(os.getenv('COVER_PERSIST_TTL', str(30 * 24 * 3600)))
+_PERSIST_MAX_ENTRIES = int(os.getenv('COVER_PERSIST_MAX', '20000'))
+# Speculative cover resolution started at ISBN scan time
+_PREFETCH_TTL_SECONDS = int(os.getenv('COVER_PREFETCH_TTL', '600'))
+_PREFETCH_WAIT = float(os.getenv('COVER_PREFETCH_WAIT', '3.0'))
+# Nobody is waiting on a prefetch yet, so it may take longer than the interactive deadline
+_PREFETCH_DEADLINE = float(os.getenv('COVER_PREFETCH_DEADLINE', '15'))
+_PREFETCH: "OrderedDict[str, tuple[float, Future]]" = OrderedDict()
+_prefetch_lock = threading.Lock()
+
+
+def _current_user_id() -> Optional[str]:
+    if not has_request_context():
+        return None
+    try:
+        from flask_login import current_user
+        if getattr(current_user, 'is_authenticated', False):
+            return str(current_user.id)
+    except Exception:
+        pass
+    return None
 
 
 def _purge_expired(cache: "OrderedDict[str, tuple[float, Any]]", ttl: int) -> None:
@@ -45,6 +76,20 @@ def _purge_expired(cache: "OrderedDict[str, tuple[float, Any]]", ttl: int) -> No
             break
 
 
+def _relative_cover_url(cached_url: str) -> Optional[str]:
+    idx = cached_url.find('/covers/')
+    return cached_url[idx:] if idx >= 0 else None
+
+
+def _absolute_cover_url(rel: str) -> str:
+    if has_request_context():
+        try:
+            return request.host_url.rstrip('/') + rel
+        except Exception:
+            pass
+    return rel
+
+
 def _record_processed_cache(url: str, cached_url: str) -> None:
     if not cached_url:
         return
@@ -55,55 +100,69 @@ def _record_processed_cache(url: str, cached_url: str) -> None:
     _purge_expired(_PROCESSED_CACHE, _CACHE_TTL_SECONDS)
     while len(_PROCESSED_CACHE) > _CACHE_MAX_ENTRIES:
         _PROCESSED_CACHE.popitem(last=False)
+    # Persist host-independent path so other workers and later restarts reuse the file
+    rel = _relative_cover_url(cached_url)
+    if rel:
+        persistent_cover_cache.set(NS_PROCESSED, url, rel, max_entries=_PERSIST_MAX_ENTRIES, ttl=_PERSIST_TTL_SECONDS)
 
 
 def _get_cached_processed_url(url: str) -> Optional[str]:
     entry = _PROCESSED_CACHE.get(url)
-    if not entry:
-        return None
-    ts, cached_url = entry
-    if time.time() - ts > _CACHE_TTL_SECONDS:
+    if entry:
+        ts, cached_url = entry
+        if time.time() - ts <= _CACHE_TTL_SECONDS:
+            try:
+                _PROCESSED_CACHE.move_to_end(url)
+            except Exception:
+                pass
+            return cached_url
         _PROCESSED_CACHE.pop(url, None)
+    rel = persistent_cover_cache.get(NS_PROCESSED, url, _PERSIST_TTL_SECONDS)
+    if not rel or not isinstance(rel, str):
         return None
     try:
-        _PROCESSED_CACHE.move_to_end(url)
+        # The file may have been garbage-collected since it was recorded
+        if not (get_covers_dir() / rel.rsplit('/', 1)[-1]).is_file():
+            persistent_cover_cache.delete(NS_PROCESSED, url)
+            return None
     except Exception:
-        pass
+        return None
+    cached_url = _absolute_cover_url(rel)
+    _PROCESSED_CACHE[url] = (time.time(), cached_url)
     return cached_url
 
 
-def _record_head_cache(url: str, value: Optional[int]) -> None:
-    now = time.time()
-    if url in _HEAD_CACHE:
-        _HEAD_CACHE.pop(url, None)
-    _HEAD_CACHE[url] = (now, value)
-    _purge_expired(_HEAD_CACHE, _HEAD_CACHE_TTL_SECONDS)
-    while len(_HEAD_CACHE) > _CACHE_MAX_ENTRIES:
-        _HEAD_CACHE.popitem(last=False)
+def _isbn_key(isbn: Optional[str]) -> Optional[str]:
+    key = re.sub(r'[^0-9Xx]', '', isbn or '').upper()
+    return key if len(key) in (10, 13) else None
+
 
+def promote_cover_url(url: Optional[str]) -> Optional[str]:
+    """Return the local ``/covers/<file>`` for an already stored cover, else None.
 
-def _head_content_length(url: str) -> Optional[int]:
-    if not url.startswith('http'):
+    Handles our own (possibly absolute) cover URLs and remote URLs that were
+    downloaded by a prefetch or an earlier lookup, so saving a book does not
+    download the same image again.
+    """
+    if not url:
+        return None
+    rel = None
+    if url.startswith('/covers/'):
+        rel = url
+    elif has_request_context() and url.startswith(request.host_url.rstrip('/') + '/covers/'):
+        rel = _relative_cover_url(url)
+    else:
+        cached = _get_cached_processed_url(url)
+        rel = _relative_cover_url(cached) if cached else None
+    if not rel:
         return None
-    entry = _HEAD_CACHE.get(url)
-    if entry:
-        ts, val = entry
-        if time.time() - ts <= _HEAD_CACHE_TTL_SECONDS:
-            try:
-                _HEAD_CACHE.move_to_end(url)
-            except Exception:
-                pass
-            return val
-        _HEAD_CACHE.pop(url, None)
     try:
-        resp = requests.head(url, timeout=_HEAD_TIMEOUT, allow_redirects=True)
-        resp.raise_for_status()
-        header_val = resp.headers.get('Content-Length')
-        value = int(header_val) if header_val and header_val.isdigit() else None
+        if (get_covers_dir() / rel.rsplit('/', 1)[-1]).is_file():
+            return rel
     except Exception:
-        value = None
-    _record_head_cache(url, value)
-    return value
+        pass
+    return None
+
 
 class CoverService:
     """Unified facade for selecting & caching book covers.
@@ -111,15 +170,90 @@ class CoverService:
     New flow: collect candidates first (no download), choose preferred, then download if not cached.
     """
 
+    def prefetch(self, isbn: Optional[str]) -> Optional[Future]:
+        """Start resolving and downloading the cover for an ISBN in the background.
+
+        Idempotent per ISBN within COVER_PREFETCH_TTL; returns a future for the
+        result, or None for an invalid ISBN or a full job queue.
+        """
+        key = _isbn_key(isbn)
+        if not key:
+            return None
+        now = time.time()
+        with _prefetch_lock:
+            _purge_expired(_PREFETCH, _PREFETCH_TTL_SECONDS)
+            entry = _PREFETCH.get(key)
+            if entry:
+                return entry[1]
+            future: Future = Future()
+            try:
+                # No user_id: a speculative prefetch must not take the user's background-job slot
+                job_scheduler.submit(
+                    self._prefetch_job, key, future,
+                    priority=PRIORITY_NORMAL, job_id=f"cover_prefetch_{key}", name='cover_prefetch',
+                )
+            except JobQueueFull:
+                return None
+            _PREFETCH[key] = (now, future)
+        return future
+
+    def _prefetch_job(self, isbn: str, future: Future) -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            result = self._resolve_and_cache(isbn=isbn, deadline=_PREFETCH_DEADLINE)
+            future.set_result(replace(result, steps=f"prefetch|{result.steps}"))
+        except Exception as e:
+            future.set_exception(e)
+
+    def _take_prefetched(self, isbn: Optional[str]) -> Optional[CoverResult]:
+        key = _isbn_key(isbn)
+        if not key:
+            return None
+        with _prefetch_lock:
+            entry = _PREFETCH.get(key)
+        if not entry or time.time() - entry[0] > _PREFETCH_TTL_SECONDS:
+            return None
+        future = entry[1]
+        # Only wait on a prefetch that is already running; a queued one would
+        # just delay the save, so drop it and let the caller resolve directly
+        if future.cancel():
+            job_scheduler.cancel(f"cover_prefetch_{key}")
+            with _prefetch_lock:
+                if _PREFETCH.get(key) is entry:
+                    del _PREFETCH[key]
+            return None
+        try:
+            result = future.result(timeout=_PREFETCH_WAIT)
+        except FutureTimeout:
+            return None
+        except Exception:
+            return None
+        if not result or not result.cached_url:
+            return None
+        cached_url = result.cached_url
+        if cached_url.startswith('/covers/'):
+            cached_url = _absolute_cover_url(cached_url)
+        return replace(result, cached_url=cached_url)
+
     def fetch_and_cache(self, isbn: Optional[str] = None, title: Optional[str] = None, author: Optional[str] = None, prefer_provider: Optional[str] = None) -> CoverResult:
+        if isbn and not prefer_provider:
+            prefetched = self._take_prefetched(isbn)
+            if prefetched is not None:
+                current_app.logger.info(f"[COVER][SERVICE] isbn={isbn} prefetch:hit steps={prefetched.steps}")
+                return prefetched
+        return self._resolve_and_cache(isbn=isbn, title=title, author=author, prefer_provider=prefer_provider)
+
+    def _resolve_and_cache(self, isbn: Optional[str] = None, title: Optional[str] = None, author: Optional[str] = None, prefer_provider: Optional[str] = None, deadline: Optional[float] = None) -> CoverResult:
         t0 = time.perf_counter()
         steps: list[str] = []
         sel = None
         # Global processing deadline (seconds) after which we short‑circuit and return original URL unprocessed
-        try:
-            deadline = float(os.getenv('COVER_PROCESS_DEADLINE', '2.5'))
-        except Exception:
-            deadline = 2.5
+        if deadline is None:
+            try:
+                deadline = float(os.getenv('COVER_PROCESS_DEADLINE', '2.5'))
+            except Exception:
+                deadline = 2.5
         try:
             steps.append('candidates:start')
             # Google-only fast path: if ISBN present, avoid OpenLibrary lookups inside get_cover_candidates
@@ -203,13 +337,7 @@ class CoverService:
                             steps.append('deadline:pass_through')
                             cached_url = cover_url  # Return remote URL directly (UI can still display it)
                         else:
-                            content_length = _head_content_length(cover_url)
-                            if content_length is None:
-                                steps.append('probe:unknown')
-                            elif content_length < 15_000:
-                                steps.append(f'probe:tiny={content_length}')
-                            else:
-                                steps.append(f'probe:bytes={content_length}')
+                            # No HEAD probe first: its size was only logged and cost a round trip
                             steps.append('download:start')
                             rel = process_image_from_url(cover_url)
                             steps.append('download:ok')
@@ -318,42 +446,41 @@ class CoverService:
         }
         _COVER_JOBS[job_id] = job_record
 
-        # Capture app context object so background thread can log safely
-        try:
-            # current_app is a proxy; capturing it directly is acceptable
-            app_obj = current_app
-        except Exception:
-            app_obj = None
-
-        def _worker(app_obj=app_obj):
-            ctx = app_obj.app_context() if app_obj else None
-            if ctx:
-                ctx.push()
+        def _worker():
             try:
-                try:
-                    if not selected_cand or not selected_cand.get('url'):
-                        job_record['status'] = 'no_candidate'
-                        job_record['completed'] = time.time()
-                        return
-                    cr = self.fetch_and_cache(isbn=isbn, title=title, author=author, prefer_provider=prefer_provider)
-                    if cr and cr.cached_url:
-                        job_record['processed_url'] = cr.cached_url
-                        job_record['status'] = 'done'
-                    else:
-                        job_record['status'] = 'failed'
-                    job_record['completed'] = time.time()
-                except Exception as e:  # pragma: no cover
-                    job_record['status'] = 'error'
-                    job_record['error'] = str(e)
+                if not selected_cand or not selected_cand.get('url'):
+                    job_record['status'] = 'no_candidate'
                     job_record['completed'] = time.time()
-                    try:
-                        current_app.logger.error(f"[COVER][ASYNC] Job {job_id} failed: {e}")
-                    except Exception:
-                        pass
-            finally:
-                if ctx:
-                    ctx.pop()
-        _EXECUTOR.submit(_worker)
+                    return
+                cr = self.fetch_and_cache(isbn=isbn, title=title, author=author, prefer_provider=prefer_provider)
+                if cr and cr.cached_url:
+                    job_record['processed_url'] = cr.cached_url
+                    job_record['status'] = 'done'
+                else:
+                    job_record['status'] = 'failed'
+                job_record['completed'] = time.time()
+            except Exception as e:  # pragma: no cover
+                job_record['status'] = 'error'
+                job_record['error'] = str(e)
+                job_record['completed'] = time.time()
+                try:
+                    current_app.logger.error(f"[COVER][ASYNC] Job {job_id} failed: {e}")
+                except Exception:
+                    pass
+
+        # Interactive priority: cover jobs jump ahead of bulk imports and syncs
+        try:
+            job_scheduler.submit(
+                _worker,
+                priority=PRIORITY_INTERACTIVE,
+                user_id=_current_user_id(),
+                job_id=f"cover_{job_id}",
+                name='cover_processing',
+            )
+        except JobQueueFull as e:
+            job_record['status'] = 'error'
+            job_record['error'] = str(e)
+            job_record['completed'] = time.time()
         return job_record
 
     def get_job(self, job_id: str) -> Optional[dict]:
@@ -362,4 +489,4 @@ class CoverService:
 
 cover_service = CoverService()
 
-__all__ = ['cover_service', 'CoverService', 'CoverResult']
+__all__ = ['cover_service', 'CoverService', 'CoverResult', 'promote_cover_url']
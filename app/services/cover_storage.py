@@ -0,0 +1,381 @@
+"""
+Content-addressed cover storage: reference index and garbage collection.
+
+Processed covers are stored as ``/covers/<sha256>.<ext>`` (see
+``app.utils.image_processing.store_cover_bytes``), so identical images are kept
+once no matter how many books, series or people point at them. Because a file
+may be shared, callers must never unlink a cover directly when replacing it;
+use ``release_cover_file`` which only deletes when nothing references it any
+more. ``scan_cover_storage`` streams every reference out of Kùzu, walks the
+covers directory in ``os.scandir`` batches and reports (optionally deletes)
+orphaned files and dangling references to missing files; ``collect_garbage``
+is the orphan-only wrapper used by the admin GC endpoint. A failed reference
+query raises ``CoverReferenceError``: the scan then marks its report
+``incomplete`` and deletes nothing, since every file would look orphaned.
+
+Referencing properties: Book.cover_url, Series.cover_url, Series.user_cover,
+Person.image_url (relative ``/covers/x`` or absolute ``http://host/covers/x``).
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import re
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from app.infrastructure.kuzu_graph import safe_execute_kuzu_query
+from app.utils.cover_derivatives import remove_derivatives
+from app.utils.image_processing import get_covers_dir
+from app.utils.paths import write_json_atomic
+
+logger = logging.getLogger(__name__)
+
+# (label, property) pairs that may point at a stored cover file
+COVER_REFERENCE_PROPERTIES: Tuple[Tuple[str, str], ...] = (
+    ('Book', 'cover_url'),
+    ('Series', 'cover_url'),
+    ('Series', 'user_cover'),
+    ('Person', 'image_url'),
+)
+
+# Files younger than this are never collected: they may be staged for a form
+# that has not been saved yet.
+GC_GRACE_SECONDS = int(os.getenv('COVER_GC_GRACE_SECONDS', str(24 * 3600)))
+
+# Page size for reference queries and directory batches
+SCAN_BATCH_SIZE = int(os.getenv('COVER_SCAN_BATCH', '500'))
+# Filenames/references listed in a report (counts are always complete)
+REPORT_SAMPLE_LIMIT = 200
+
+class CoverReferenceError(RuntimeError):
+    """A reference query failed, so the set of referenced covers is unknown."""
+
+
+_COVER_PATH_RE = re.compile(r'/covers/([A-Za-z0-9_.-]+)(?:[?#].*)?$')
+_INDEX_FILENAME = 'cover_references.json'
+
+
+def cover_filename_from_url(url: Optional[str]) -> Optional[str]:
+    """Stored cover filename for a relative or absolute ``/covers/`` URL, else None."""
+    if not url or not isinstance(url, str):
+        return None
+    match = _COVER_PATH_RE.search(url.strip())
+    return match.group(1) if match else None
+
+
+def _rows(result, width: int) -> List[list]:
+    rows: List[list] = []
+    if result is None:
+        return rows
+    if hasattr(result, 'has_next'):
+        while result.has_next():
+            row = result.get_next()
+            rows.append(list(row) if isinstance(row, (list, tuple)) else [row])
+        return rows
+    for row in result:
+        if isinstance(row, dict):
+            rows.append([row.get(f'col_{i}') for i in range(width)])
+        else:
+            rows.append(list(row))
+    return rows
+
+
+def iter_cover_reference_rows(batch_size: int = SCAN_BATCH_SIZE) -> Iterator[Tuple[str, str, str, str, str]]:
+    """Stream ``(filename, label, property, node_id, url)`` for every stored-cover reference.
+
+    Results are paged by id (``WHERE n.id > $last ... LIMIT``) so large
+    libraries are never materialised in one query result, and rows inserted or
+    deleted mid-scan cannot shift later pages (an offset would skip a row,
+    whose cover the orphan sweep would then delete). Raises
+    ``CoverReferenceError`` if a page cannot be read.
+    """
+    batch_size = max(1, batch_size)
+    for label, prop in COVER_REFERENCE_PROPERTIES:
+        match = f"MATCH (n:{label}) WHERE n.{prop} IS NOT NULL AND n.{prop} CONTAINS '/covers/'"
+        tail = f"RETURN n.id, n.{prop} ORDER BY n.id LIMIT $limit"
+        last_id = None
+        while True:
+            if last_id is None:
+                query, params = f"{match} {tail}", {'limit': batch_size}
+            else:
+                query, params = f"{match} AND n.id > $last {tail}", {'last': last_id, 'limit': batch_size}
+            try:
+                result = safe_execute_kuzu_query(query, params, operation=f"cover_refs_{label.lower()}_{prop}")
+            except Exception as e:
+                logger.warning(f"[COVER][INDEX] Could not read {label}.{prop}: {e}")
+                raise CoverReferenceError(f"Could not read {label}.{prop} references: {e}") from e
+            rows = _rows(result, 2)
+            for node_id, url in rows:
+                name = cover_filename_from_url(url)
+                if name:
+                    yield name, label, prop, str(node_id), url
+            if len(rows) < batch_size:
+                break
+            last_id = rows[-1][0]
+
+
+def iter_cover_references() -> Iterator[Tuple[str, str]]:
+    """Yield ``(filename, "<Label>:<id>")`` for every node property pointing at a stored cover."""
+    for name, label, _prop, node_id, _url in iter_cover_reference_rows():
+        yield name, f"{label}:{node_id}"
+
+
+def build_reference_index(persist: bool = True) -> Dict[str, List[str]]:
+    """Map stored cover filename -> referencing nodes, optionally saved next to the covers."""
+    index: Dict[str, List[str]] = {}
+    for name, ref in iter_cover_references():
+        index.setdefault(name, []).append(ref)
+    if persist:
+        _save_index(index)
+    return index
+
+
+def load_reference_index() -> Optional[dict]:
+    """Last persisted reference index (``{'generated_at', 'files'}``), if any."""
+    path = _index_path()
+    try:
+        with open(path, 'r', encoding='utf-8') as fh:
+            return json.load(fh)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"[COVER][INDEX] Failed to read {path}: {e}")
+        return None
+
+
+def _index_path() -> Path:
+    return get_covers_dir().parent / _INDEX_FILENAME
+
+
+def _save_index(index: Dict[str, List[str]]) -> None:
+    path = _index_path()
+    payload = {'generated_at': datetime.now(timezone.utc).isoformat(), 'files': index}
+    try:
+        write_json_atomic(path, payload)
+    except Exception as e:
+        logger.warning(f"[COVER][INDEX] Failed to persist reference index: {e}")
+
+
+def count_references(filename: str) -> int:
+    """Number of node properties currently pointing at ``filename``."""
+    suffix = f"/covers/{filename}"
+    total = 0
+    for label, prop in COVER_REFERENCE_PROPERTIES:
+        query = f"MATCH (n:{label}) WHERE n.{prop} ENDS WITH $suffix RETURN count(n)"
+        try:
+            rows = _rows(safe_execute_kuzu_query(query, {'suffix': suffix}, operation='cover_ref_count'), 1)
+        except Exception as e:
+            # Be conservative: if we cannot tell, treat the file as referenced
+            logger.warning(f"[COVER][REFCOUNT] {label}.{prop} lookup failed for {filename}: {e}")
+            return 1
+        if rows and rows[0] and rows[0][0]:
+            total += int(rows[0][0])
+    return total
+
+
+def _delete_cover(path: Path) -> int:
+    """Remove a cover and its derivatives; returns bytes freed."""
+    freed = 0
+    try:
+        freed = path.stat().st_size
+        path.unlink()
+    except FileNotFoundError:
+        return 0
+    remove_derivatives(path)
+    return freed
+
+
+def release_cover_file(url: Optional[str], keep_url: Optional[str] = None) -> bool:
+    """Delete a replaced cover file if (and only if) nothing references it any more.
+
+    Call after the owning node has been updated. ``keep_url`` guards the common
+    case where the "new" cover hashes to the same file as the old one.
+    """
+    name = cover_filename_from_url(url)
+    if not name or name == cover_filename_from_url(keep_url):
+        return False
+    path = get_covers_dir() / name
+    if not path.is_file():
+        return False
+    if count_references(name) > 0:
+        logger.debug(f"[COVER][RELEASE] {name} still referenced; keeping")
+        return False
+    _delete_cover(path)
+    logger.debug(f"[COVER][RELEASE] Deleted unreferenced cover {name}")
+    return True
+
+
+def _iter_dir_batches(directory: Path, batch_size: int = SCAN_BATCH_SIZE) -> Iterator[List[os.DirEntry]]:
+    """Regular cover files in ``directory``, yielded in lists of ``batch_size``."""
+    batch: List[os.DirEntry] = []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.name.startswith('.') or not entry.is_file(follow_symlinks=False):
+                continue
+            batch.append(entry)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+    if batch:
+        yield batch
+
+
+def _clear_reference(label: str, prop: str, node_id: str, url: str) -> bool:
+    """Null a property that points at a missing file (only if it still has that value)."""
+    query = f"MATCH (n:{label} {{id: $id}}) WHERE n.{prop} = $url SET n.{prop} = NULL RETURN n.id"
+    try:
+        return bool(_rows(safe_execute_kuzu_query(query, {'id': node_id, 'url': url}, operation='cover_ref_clear'), 1))
+    except Exception as e:
+        logger.warning(f"[COVER][SCAN] Could not clear {label}.{prop} on {node_id}: {e}")
+        return False
+
+
+def scan_cover_storage(
+    delete_orphans: bool = False,
+    clear_dangling: bool = False,
+    grace_seconds: int = GC_GRACE_SECONDS,
+    batch_size: int = SCAN_BATCH_SIZE,
+    should_cancel: Optional[Callable[[], bool]] = None,
+) -> dict:
+    """Compare stored-cover references with the covers directory.
+
+    Orphans are files no node references (older than ``grace_seconds``);
+    dangling references are node properties pointing at a file that does not
+    exist. Both are reported; ``delete_orphans`` removes the files (and their
+    derivatives) and ``clear_dangling`` nulls the properties so the cover
+    backfill can fetch a replacement. Lists in the report are truncated to
+    ``REPORT_SAMPLE_LIMIT``; counts are complete.
+
+    If any reference query fails the report is ``incomplete`` (with
+    ``error``): orphans are still listed as candidates but nothing is deleted
+    and the persisted reference index is left alone.
+    """
+    started = time.time()
+    covers_dir = get_covers_dir()
+    cutoff = started - max(0, grace_seconds)
+    report = {
+        'dry_run': not delete_orphans,
+        'delete_orphans': delete_orphans,
+        'clear_dangling': clear_dangling,
+        'started_at': datetime.now(timezone.utc).isoformat(),
+        'references': 0,
+        'scanned': 0,
+        'referenced': 0,
+        'orphaned': 0,
+        'deleted': 0,
+        'bytes_scanned': 0,
+        'bytes_orphaned': 0,
+        'bytes_freed': 0,
+        'skipped_recent': 0,
+        'dangling': 0,
+        'dangling_cleared': 0,
+        'orphans': [],
+        'missing_referenced': [],
+        'dangling_references': [],
+        'cancelled': False,
+        'incomplete': False,
+        'error': None,
+    }
+
+    def _cancelled() -> bool:
+        if should_cancel is not None and should_cancel():
+            report['cancelled'] = True
+            return True
+        return False
+
+    # Pass 1: stream references (filename -> referencing rows)
+    references: Dict[str, List[Tuple[str, str, str, str]]] = {}
+    try:
+        for name, label, prop, node_id, url in iter_cover_reference_rows(batch_size):
+            references.setdefault(name, []).append((label, prop, node_id, url))
+            report['references'] += 1
+            if report['references'] % batch_size == 0 and _cancelled():
+                break
+    except CoverReferenceError as e:
+        report['incomplete'] = True
+        report['error'] = str(e)
+        if delete_orphans:
+            logger.warning("[COVER][SCAN] Reference scan incomplete; not deleting any files")
+        delete_orphans = False
+        report['dry_run'] = True
+    if not report['cancelled'] and not report['incomplete']:
+        _save_index({name: [f"{r[0]}:{r[2]}" for r in refs] for name, refs in references.items()})
+
+    # Pass 2: walk the directory in batches
+    present = set()
+    if not report['cancelled'] and covers_dir.is_dir():
+        for batch in _iter_dir_batches(covers_dir, batch_size):
+            for entry in batch:
+                report['scanned'] += 1
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                report['bytes_scanned'] += stat.st_size
+                if entry.name in references:
+                    present.add(entry.name)
+                    report['referenced'] += 1
+                    continue
+                if stat.st_mtime > cutoff:
+                    report['skipped_recent'] += 1
+                    continue
+                report['orphaned'] += 1
+                report['bytes_orphaned'] += stat.st_size
+                if len(report['orphans']) < REPORT_SAMPLE_LIMIT:
+                    report['orphans'].append(entry.name)
+                if delete_orphans:
+                    freed = _delete_cover(Path(entry.path))
+                    if freed:
+                        report['deleted'] += 1
+                        report['bytes_freed'] += freed
+            if _cancelled():
+                break
+
+    # Pass 3: references whose file is gone (only meaningful after a full directory walk)
+    if not report['cancelled']:
+        for name, refs in references.items():
+            if name in present or (covers_dir / name).is_file():
+                continue
+            report['dangling'] += len(refs)
+            if len(report['missing_referenced']) < REPORT_SAMPLE_LIMIT:
+                report['missing_referenced'].append(name)
+            for label, prop, node_id, url in refs:
+                if len(report['dangling_references']) < REPORT_SAMPLE_LIMIT:
+                    report['dangling_references'].append({'file': name, 'node': f"{label}:{node_id}", 'property': prop})
+                if clear_dangling and _clear_reference(label, prop, node_id, url):
+                    report['dangling_cleared'] += 1
+
+    report['elapsed_seconds'] = round(time.time() - started, 3)
+    logger.info(
+        f"[COVER][SCAN] refs={report['references']} scanned={report['scanned']} orphaned={report['orphaned']} "
+        f"deleted={report['deleted']} freed={report['bytes_freed']}B dangling={report['dangling']} "
+        f"cleared={report['dangling_cleared']} cancelled={report['cancelled']} incomplete={report['incomplete']}"
+    )
+    return report
+
+
+def collect_garbage(dry_run: bool = True, grace_seconds: int = GC_GRACE_SECONDS) -> dict:
+    """Find (and unless ``dry_run``, delete) cover files that no node references.
+
+    Returns a report with counts, bytes and the orphaned filenames.
+    """
+    return scan_cover_storage(delete_orphans=not dry_run, grace_seconds=grace_seconds)
+
+
+__all__ = [
+    'CoverReferenceError',
+    'cover_filename_from_url',
+    'iter_cover_reference_rows',
+    'iter_cover_references',
+    'build_reference_index',
+    'load_reference_index',
+    'count_references',
+    'release_cover_file',
+    'scan_cover_storage',
+    'collect_garbage',
+]
@@ -0,0 +1,378 @@
+"""
+Background Job Scheduler for MyBibliotheca
+
+A single, bounded executor for all background work (imports, OPDS/ABS syncs,
+cover processing, post-import backups) so that concurrent requests can no
+longer spawn an unbounded number of threads competing for the Kùzu
+connection, the CPU and outbound bandwidth.
+
+Key Features:
+- Fixed pool of daemon worker threads (JOB_WORKERS, default 4)
+- Priority classes: interactive cover jobs run ahead of syncs and bulk imports
+- Bounded pending queue (JOB_QUEUE_MAX) - submit() raises JobQueueFull when saturated
+- At least JOB_INTERACTIVE_RESERVED workers are always kept free for
+  interactive jobs; heavy jobs (bulk/maintenance) may use the rest by default,
+  so a long sync does not stall an import (JOB_BULK_SLOTS lowers the cap)
+- Per-user concurrency caps so one user cannot monopolise the pool
+- Cooperative cancellation and a status API for queued/running/finished jobs
+"""
+
+from __future__ import annotations
+
+import itertools
+import logging
+import os
+import threading
+import time
+import traceback
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Priority classes (lower value runs first)
+PRIORITY_INTERACTIVE = 0
+PRIORITY_NORMAL = 10
+PRIORITY_BULK = 20
+PRIORITY_MAINTENANCE = 30
+
+PRIORITY_NAMES = {
+    PRIORITY_INTERACTIVE: 'interactive',
+    PRIORITY_NORMAL: 'normal',
+    PRIORITY_BULK: 'bulk',
+    PRIORITY_MAINTENANCE: 'maintenance',
+}
+
+ACTIVE_STATES = ('queued', 'running', 'cancelling')
+
+
+def _env_int(name: str, default: int, minimum: int = 0) -> int:
+    try:
+        return max(minimum, int(os.getenv(name, str(default))))
+    except ValueError:
+        return default
+
+
+class JobQueueFull(RuntimeError):
+    """Raised when the scheduler's pending queue is at capacity."""
+
+
+@dataclass
+class _Job:
+    id: str
+    name: str
+    fn: Callable[..., Any]
+    args: tuple
+    kwargs: dict
+    priority: int
+    user_id: Optional[str]
+    seq: int
+    app: Any = None
+    status: str = 'queued'
+    error: Optional[str] = None
+    queued_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    cancel_event: threading.Event = field(default_factory=threading.Event)
+
+    @property
+    def heavy(self) -> bool:
+        return self.priority >= PRIORITY_BULK
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            'id': self.id,
+            'name': self.name,
+            'priority': self.priority,
+            'priority_class': PRIORITY_NAMES.get(self.priority, str(self.priority)),
+            'user_id': self.user_id,
+            'status': self.status,
+            'error': self.error,
+            'queued_at': self.queued_at,
+            'started_at': self.started_at,
+            'finished_at': self.finished_at,
+            'cancel_requested': self.cancel_event.is_set(),
+        }
+
+
+class JobScheduler:
+    """Bounded, priority-aware worker pool shared by all background jobs."""
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        queue_max: Optional[int] = None,
+        bulk_slots: Optional[int] = None,
+        interactive_reserved: Optional[int] = None,
+        max_per_user: Optional[int] = None,
+        max_interactive_per_user: Optional[int] = None,
+        history_size: int = 200,
+    ):
+        self.workers = workers if workers is not None else _env_int('JOB_WORKERS', 4, 1)
+        self.queue_max = queue_max if queue_max is not None else _env_int('JOB_QUEUE_MAX', 256, 1)
+        reserved = interactive_reserved if interactive_reserved is not None else _env_int('JOB_INTERACTIVE_RESERVED', 1)
+        # Never reserve every worker, otherwise non-interactive jobs could not run at all
+        self.interactive_reserved = min(reserved, self.workers - 1)
+        non_interactive = self.workers - self.interactive_reserved
+        self.bulk_slots = bulk_slots if bulk_slots is not None else _env_int('JOB_BULK_SLOTS', non_interactive, 1)
+        self.max_per_user = max_per_user if max_per_user is not None else _env_int('JOB_MAX_PER_USER', 1, 1)
+        self.max_interactive_per_user = (
+            max_interactive_per_user if max_interactive_per_user is not None
+            else _env_int('JOB_MAX_INTERACTIVE_PER_USER', 2, 1)
+        )
+        self._history_size = history_size
+
+        self._cond = threading.Condition(threading.Lock())
+        self._pending: List[_Job] = []
+        self._running: Dict[str, _Job] = {}
+        self._finished: "OrderedDict[str, _Job]" = OrderedDict()
+        self._seq = itertools.count()
+        self._threads: List[threading.Thread] = []
+        self._pid: Optional[int] = None
+        self._app = None
+
+    # ------------------------------------------------------------------
+    # Setup
+    # ------------------------------------------------------------------
+    def init_app(self, app) -> None:
+        """Remember the Flask app so jobs submitted outside a context still get one."""
+        self._app = app
+
+    def _ensure_workers(self) -> None:
+        """Start worker threads lazily (and again in a forked child process)."""
+        pid = os.getpid()
+        if self._pid == pid and all(t.is_alive() for t in self._threads):
+            return
+        if self._pid != pid:
+            # Threads do not survive fork(); anything inherited from the parent is stale
+            self._threads = []
+            self._running.clear()
+            self._pid = pid
+        self._threads = [t for t in self._threads if t.is_alive()]
+        while len(self._threads) < self.workers:
+            t = threading.Thread(
+                target=self._worker_loop,
+                name=f"job-worker-{len(self._threads) + 1}",
+                daemon=True,
+            )
+            self._threads.append(t)
+            t.start()
+
+    @staticmethod
+    def _capture_app():
+        try:
+            from flask import current_app
+            return current_app._get_current_object()  # type: ignore[attr-defined]
+        except Exception:
+            return None
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+    def submit(
+        self,
+        fn: Callable[..., Any],
+        *args: Any,
+        priority: int = PRIORITY_NORMAL,
+        user_id: Optional[str] = None,
+        job_id: Optional[str] = None,
+        name: Optional[str] = None,
+        **kwargs: Any,
+    ) -> str:
+        """Queue fn(*args, **kwargs) and return its job id.
+
+        Raises JobQueueFull when the pending queue is at capacity.
+        """
+        job = _Job(
+            id=str(job_id or uuid.uuid4()),
+            name=name or getattr(fn, '__name__', 'job'),
+            fn=fn,
+            args=args,
+            kwargs=kwargs,
+            priority=int(priority),
+            user_id=str(user_id) if user_id is not None else None,
+            seq=next(self._seq),
+            app=self._capture_app() or self._app,
+        )
+        with self._cond:
+            if len(self._pending) >= self.queue_max:
+                raise JobQueueFull(
+                    f"Background job queue is full ({self.queue_max} pending); try again shortly"
+                )
+            self._finished.pop(job.id, None)
+            self._pending.append(job)
+            self._ensure_workers()
+            self._cond.notify_all()
+        logger.debug(f"Queued job {job.id} ({job.name}, {PRIORITY_NAMES.get(job.priority, job.priority)})")
+        return job.id
+
+    def cancel(self, job_id: str) -> bool:
+        """Cancel a queued job, or ask a running job to stop at its next check."""
+        with self._cond:
+            for job in self._pending:
+                if job.id == job_id:
+                    self._pending.remove(job)
+                    job.cancel_event.set()
+                    job.status = 'cancelled'
+                    job.finished_at = time.time()
+                    self._remember(job)
+                    self._cond.notify_all()
+                    return True
+            job = self._running.get(job_id)
+            if job is not None:
+                job.cancel_event.set()
+                job.status = 'cancelling'
+                return True
+        return False
+
+    def is_cancelled(self, job_id: str) -> bool:
+        """True once cancel() was requested for the job."""
+        with self._cond:
+            job = self._running.get(job_id) or self._finished.get(job_id)
+            if job is None:
+                job = next((j for j in self._pending if j.id == job_id), None)
+            return bool(job and job.cancel_event.is_set())
+
+    def is_active(self, job_id: str) -> bool:
+        """True while the job is queued or running."""
+        status = self.get_status(job_id)
+        return bool(status and status['status'] in ACTIVE_STATES)
+
+    def get_status(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._cond:
+            job = self._running.get(job_id) or self._finished.get(job_id)
+            if job is not None:
+                return job.snapshot()
+            for position, queued in enumerate(self._ordered_pending(), start=1):
+                if queued.id == job_id:
+                    snap = queued.snapshot()
+                    snap['position'] = position
+                    return snap
+        return None
+
+    def list_jobs(self, user_id: Optional[str] = None, include_finished: bool = True) -> List[Dict[str, Any]]:
+        """Snapshots of running, queued and (optionally) recently finished jobs."""
+        with self._cond:
+            jobs: List[Dict[str, Any]] = [j.snapshot() for j in self._running.values()]
+            for position, queued in enumerate(self._ordered_pending(), start=1):
+                snap = queued.snapshot()
+                snap['position'] = position
+                jobs.append(snap)
+            if include_finished:
+                jobs.extend(j.snapshot() for j in reversed(self._finished.values()))
+        if user_id is not None:
+            jobs = [j for j in jobs if j['user_id'] == str(user_id)]
+        return jobs
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            queued_by_class: Dict[str, int] = {}
+            for job in self._pending:
+                key = PRIORITY_NAMES.get(job.priority, str(job.priority))
+                queued_by_class[key] = queued_by_class.get(key, 0) + 1
+            return {
+                'workers': self.workers,
+                'alive_workers': sum(1 for t in self._threads if t.is_alive()),
+                'queue_max': self.queue_max,
+                'bulk_slots': self.bulk_slots,
+                'interactive_reserved': self.interactive_reserved,
+                'max_per_user': self.max_per_user,
+                'running': len(self._running),
+                'queued': len(self._pending),
+                'queued_by_class': queued_by_class,
+            }
+
+    # ------------------------------------------------------------------
+    # Dispatch
+    # ------------------------------------------------------------------
+    def _ordered_pending(self) -> List[_Job]:
+        return sorted(self._pending, key=lambda j: (j.priority, j.seq))
+
+    def _can_start(self, job: _Job) -> bool:
+        running = list(self._running.values())
+        if job.priority > PRIORITY_INTERACTIVE:
+            non_interactive = sum(1 for j in running if j.priority > PRIORITY_INTERACTIVE)
+            if non_interactive >= self.workers - self.interactive_reserved:
+                return False
+        if job.heavy and sum(1 for j in running if j.heavy) >= self.bulk_slots:
+            return False
+        if job.user_id is not None:
+            interactive = job.priority == PRIORITY_INTERACTIVE
+            same_user = sum(
+                1 for j in running
+                if j.user_id == job.user_id and (j.priority == PRIORITY_INTERACTIVE) == interactive
+            )
+            limit = self.max_interactive_per_user if interactive else self.max_per_user
+            if same_user >= limit:
+                return False
+        return True
+
+    def _next_job(self) -> Optional[_Job]:
+        for job in self._ordered_pending():
+            if self._can_start(job):
+                return job
+        return None
+
+    def _remember(self, job: _Job) -> None:
+        self._finished[job.id] = job
+        while len(self._finished) > self._history_size:
+            self._finished.popitem(last=False)
+
+    def _worker_loop(self) -> None:
+        while True:
+            with self._cond:
+                job = self._next_job()
+                while job is None:
+                    self._cond.wait(timeout=5.0)
+                    job = self._next_job()
+                self._pending.remove(job)
+                job.status = 'running'
+                job.started_at = time.time()
+                self._running[job.id] = job
+            self._run(job)
+            with self._cond:
+                self._running.pop(job.id, None)
+                job.finished_at = time.time()
+                self._remember(job)
+                self._cond.notify_all()
+
+    def _run(self, job: _Job) -> None:
+        ctx = job.app.app_context() if job.app is not None else None
+        if ctx is not None:
+            ctx.push()
+        try:
+            job.fn(*job.args, **job.kwargs)
+            job.status = 'cancelled' if job.cancel_event.is_set() else 'completed'
+        except Exception as e:
+            job.status = 'failed'
+            job.error = str(e)
+            logger.error(f"Background job {job.id} ({job.name}) failed: {e}")
+            logger.debug(traceback.format_exc())
+        finally:
+            if ctx is not None:
+                try:
+                    ctx.pop()
+                except Exception:
+                    pass
+
+
+# Global instance shared by routes and services
+job_scheduler = JobScheduler()
+
+
+def get_job_scheduler() -> JobScheduler:
+    return job_scheduler
+
+
+__all__ = [
+    'JobScheduler',
+    'JobQueueFull',
+    'job_scheduler',
+    'get_job_scheduler',
+    'PRIORITY_INTERACTIVE',
+    'PRIORITY_NORMAL',
+    'PRIORITY_BULK',
+    'PRIORITY_MAINTENANCE',
+]
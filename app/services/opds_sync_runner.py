@@ -4,15 +4,14 @@ from __future__ import annotations
 import threading
 import time
 import uuid
-from collections import deque
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any, Deque, Dict, Optional, Tuple
+from typing import Any, Dict, Optional, Tuple
 import traceback
 
 from flask import current_app, has_request_context, url_for
 
-from .opds_sync_service import opds_sync_service
+from .job_scheduler import PRIORITY_BULK, PRIORITY_NORMAL, JobQueueFull, job_scheduler
 from app.utils.opds_settings import load_opds_settings, save_opds_settings
 from app.utils.safe_import_manager import safe_create_import_job, safe_update_import_job
 
@@ -24,15 +23,19 @@ class _QueuedItem:
 
 
 class _OpdsSyncRunner:
-    """Single background thread responsible for OPDS sync operations."""
+    """Queues OPDS sync operations on the shared job scheduler.
+
+    The runner's own thread only checks whether an automatic sync is due;
+    the syncs themselves execute on the bounded background job pool.
+    """
 
     def __init__(self) -> None:
-        self._queue: Deque[_QueuedItem] = deque()
         self._lock = threading.RLock()
         self._thread: Optional[threading.Thread] = None
         self._running = False
         self._app = None
         self._last_scheduler_check = 0.0
+        self._auto_task_id: Optional[str] = None
 
     def _describe_exception(self, exc: Exception) -> str:
         message = str(exc).strip()
@@ -65,12 +68,11 @@ class _OpdsSyncRunner:
             metadata={"recent_activity": ["Queued test sync"]},
         )
         self.ensure_started()
-        with self._lock:
-            self._queue.append(_QueuedItem(task_id, {
-                "kind": "test",
-                "user_id": user_id,
-                "limit": limit,
-            }))
+        self._submit(_QueuedItem(task_id, {
+            "kind": "test",
+            "user_id": user_id,
+            "limit": limit,
+        }), PRIORITY_NORMAL)
         return self._response_payload(user_id, task_id)
 
     def enqueue_sync(self, user_id: str, *, limit: Optional[int] = None, origin: str = "manual") -> Dict[str, Any]:
@@ -83,18 +85,34 @@ class _OpdsSyncRunner:
             metadata={"recent_activity": ["Queued OPDS sync"], "origin": origin},
         )
         self.ensure_started()
-        with self._lock:
-            self._queue.append(_QueuedItem(task_id, {
-                "kind": "sync",
-                "user_id": user_id,
-                "limit": limit,
-                "origin": origin,
-            }))
+        self._submit(_QueuedItem(task_id, {
+            "kind": "sync",
+            "user_id": user_id,
+            "limit": limit,
+            "origin": origin,
+        }), PRIORITY_BULK)
         return self._response_payload(user_id, task_id)
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
+    def _submit(self, item: _QueuedItem, priority: int) -> None:
+        user_id = str(item.payload.get("user_id") or "__system__")
+        try:
+            job_scheduler.submit(
+                self._process_item,
+                item,
+                priority=priority,
+                user_id=user_id,
+                job_id=item.task_id,
+                name=f"opds_{item.payload.get('kind')}",
+            )
+        except JobQueueFull as exc:
+            safe_update_import_job(user_id, item.task_id, {
+                "status": "failed",
+                "error_messages": [str(exc)],
+            })
+
     def _create_job(self, user_id: str, task_id: str, job_type: str, total: int, metadata: Optional[Dict[str, Any]] = None) -> None:
         payload = {
             "task_id": task_id,
@@ -143,20 +161,9 @@ class _OpdsSyncRunner:
                     self._last_scheduler_check = now
                     try:
                         self._maybe_schedule_automatic_sync()
-                    except Exception:
-                        pass
-
-                item: Optional[_QueuedItem] = None
-                with self._lock:
-                    if self._queue:
-                        item = self._queue.popleft()
-                if item is None:
-                    time.sleep(1.0)
-                    continue
-                try:
-                    self._process_item(item)
-                except Exception as exc:
-                    current_app.logger.exception("OPDS sync runner error: %s", exc)
+                    except Exception as exc:
+                        current_app.logger.debug("OPDS auto-sync check failed: %s", exc)
+                time.sleep(1.0)
         finally:
             try:
                 ctx.pop()
@@ -164,6 +171,8 @@ class _OpdsSyncRunner:
                 pass
 
     def _process_item(self, item: _QueuedItem) -> None:
+        # Imported per job so app startup does not load the OPDS client stack
+        from .opds_sync_service import opds_sync_service
         payload = item.payload
         user_id = str(payload.get("user_id") or "__system__")
         kind = payload.get("kind")
@@ -357,9 +366,12 @@ class _OpdsSyncRunner:
                 due = True
         if not due:
             return
+        # last_auto_sync is only written once the sync finishes; don't queue it twice
+        if self._auto_task_id and job_scheduler.is_active(self._auto_task_id):
+            return
         user_id = str(settings.get("auto_sync_user_id") or "__system__")
         # Reuse the regular enqueue path so job bookkeeping is consistent
-        self.enqueue_sync(user_id, origin="auto")
+        self._auto_task_id = self.enqueue_sync(user_id, origin="auto")["task_id"]
 
 
 _runner_singleton = _OpdsSyncRunner()
@@ -53,6 +53,8 @@ def _serialize_for_hash(value: Any) -> Any:
 
 
 _HASH_EXCLUDED_KEYS = {"raw_links", "entry"}
+# Larger syncs store remote cover URLs and hand the downloads to the parallel cover backfill job
+INLINE_COVER_LIMIT = int(os.getenv("OPDS_INLINE_COVER_LIMIT", "25"))
 
 
 def _compute_entry_hash(entry: Dict[str, Any]) -> str:
@@ -562,6 +564,8 @@ class OPDSSyncService:
         default_location_id: Optional[str] = None
         location_checked = False
         location_user_id = user_id or "__system__"
+        defer_covers = len(entries) > INLINE_COVER_LIMIT
+        deferred_cover_ids: List[str] = []
 
         context_manager = flask_app.app_context() if flask_app is not None else nullcontext()
 
@@ -576,11 +580,14 @@ class OPDSSyncService:
                         continue
                     book_id = self._find_book_id(conn, oid)
                     if book_id:
-                        self._cache_cover_if_needed(entry, book_id, cover_auth=cover_auth, cover_headers=cover_headers)
-                        success = self._update_book(conn, book_id, entry, now)
+                        if not defer_covers:
+                            self._cache_cover_if_needed(entry, book_id, cover_auth=cover_auth, cover_headers=cover_headers)
+                        success = self._update_book(conn, book_id, entry, now, keep_local_cover=defer_covers)
                         if success:
                             updated += 1
                             book_ids.append(book_id)
+                            if defer_covers:
+                                deferred_cover_ids.append(book_id)
                             try:
                                 self._sync_relationships(book_id, entry)
                             except Exception:
@@ -593,11 +600,14 @@ class OPDSSyncService:
                             skipped += 1
                     else:
                         new_id = str(uuid.uuid4())
-                        self._cache_cover_if_needed(entry, new_id, cover_auth=cover_auth, cover_headers=cover_headers)
+                        if not defer_covers:
+                            self._cache_cover_if_needed(entry, new_id, cover_auth=cover_auth, cover_headers=cover_headers)
                         success = self._create_book(conn, new_id, entry, now)
                         if success:
                             created += 1
                             book_ids.append(new_id)
+                            if defer_covers:
+                                deferred_cover_ids.append(new_id)
                             try:
                                 self._sync_relationships(new_id, entry)
                             except Exception:
@@ -630,8 +640,33 @@ class OPDSSyncService:
                                         logger.exception("Failed to assign default location for OPDS book %s", new_id)
                         else:
                             skipped += 1
+            if deferred_cover_ids and has_app_context():
+                self._queue_cover_backfill(deferred_cover_ids, user_id, cover_auth=cover_auth, cover_headers=cover_headers)
         return SyncResult(created=created, updated=updated, skipped=skipped, entries=book_ids)
 
+    def _queue_cover_backfill(
+        self,
+        book_ids: List[str],
+        user_id: Optional[str],
+        *,
+        cover_auth: Optional[Tuple[str, str]] = None,
+        cover_headers: Optional[Dict[str, str]] = None,
+    ) -> None:
+        try:
+            from .cover_backfill import start_backfill
+
+            start_backfill(
+                include_missing=False,
+                book_ids=book_ids,
+                resume=False,
+                user_id=user_id,
+                cover_auth=cover_auth,
+                cover_headers=cover_headers,
+            )
+            logger.info("Queued cover backfill for %d OPDS books", len(book_ids))
+        except Exception:
+            logger.exception("Failed to queue cover backfill for %d OPDS books", len(book_ids))
+
     def _simulate_entries(self, entries: List[Dict[str, Any]]) -> Dict[str, Any]:
         would_create = 0
         would_update = 0
@@ -988,7 +1023,13 @@ class OPDSSyncService:
             )
             return False
 
-    def _update_book(self, conn, book_id: str, entry: Dict[str, Any], now: datetime) -> bool:  # type: ignore[no-untyped-def]
+    def _update_book(self, conn, book_id: str, entry: Dict[str, Any], now: datetime, *, keep_local_cover: bool = False) -> bool:  # type: ignore[no-untyped-def]
+        """Overwrite the book's catalog fields from ``entry``.
+
+        ``keep_local_cover`` (covers deferred to the backfill) leaves an
+        already stored ``/covers/`` image in place instead of replacing it
+        with the catalog's remote URL.
+        """
         raw_categories_value = entry.get("raw_categories")
         normalized_raw_categories = self._normalize_categories(raw_categories_value)
         if normalized_raw_categories is None:
@@ -1016,7 +1057,14 @@ class OPDSSyncService:
             "updated_at": now,
             "raw_categories": raw_categories_json,
         }
+        cover_value = update_fields.pop("cover_url") if keep_local_cover else None
         set_clause, params = _build_set_clause("b", update_fields, prefix="update")
+        if keep_local_cover:
+            set_clause += (
+                ", b.cover_url = CASE WHEN b.cover_url CONTAINS '/covers/' "
+                "THEN b.cover_url ELSE $update_cover_url END"
+            )
+            params["update_cover_url"] = cover_value
         if not set_clause:
             return True
         params["book_id"] = book_id
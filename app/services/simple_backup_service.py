@@ -22,6 +22,8 @@ import uuid
 
 from flask import current_app
 from app.utils.safe_kuzu_manager import SafeKuzuManager, get_safe_kuzu_manager
+from app.services.backup_store import BackupStore, is_compressible
+from app.utils.paths import write_json_atomic
 
 # Helper function for query result conversion
 def _convert_query_result_to_list(result) -> list:
@@ -42,10 +44,20 @@ def _convert_query_result_to_list(result) -> list:
 
 logger = logging.getLogger(__name__)
 
+# 'chunked' (deduplicating store, default) or 'zip' (one self-contained archive per backup)
+BACKUP_FORMAT = os.getenv('BACKUP_FORMAT', 'chunked').strip().lower()
+# Buffer pool for the read-only Kùzu instance opened by backup verification
+VERIFY_BUFFER_POOL_MB = int(os.getenv('BACKUP_VERIFY_BUFFER_POOL_MB', '128'))
+
 
 @dataclass
 class SimpleBackupInfo:
-    """Information about a simple backup."""
+    """Information about a simple backup.
+
+    ``file_size`` is the size of what the backup restores (the archive for zip
+    backups, the logical content for chunked ones); ``stored_size`` is the
+    disk space a chunked backup added to the shared store (None for zip).
+    """
     id: str
     name: str
     created_at: datetime
@@ -53,6 +65,7 @@ class SimpleBackupInfo:
     file_size: int
     description: str = ""
     metadata: Optional[Dict[str, Any]] = None
+    stored_size: Optional[int] = None
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
@@ -63,13 +76,19 @@ class SimpleBackupInfo:
             'file_path': self.file_path,
             'file_size': self.file_size,
             'description': self.description,
-            'metadata': self.metadata or {}
+            'metadata': self.metadata or {},
+            'stored_size': self.stored_size,
         }
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'SimpleBackupInfo':
         """Create from dictionary."""
         data['created_at'] = datetime.fromisoformat(data['created_at'])
+        stats = (data.get('metadata') or {}).get('store_stats')
+        if stats and data.get('stored_size') is None:
+            # Older chunked entries recorded the stored delta as file_size
+            data['stored_size'] = stats.get('stored_bytes_added', data.get('file_size', 0))
+            data['file_size'] = stats.get('logical_bytes', data.get('file_size', 0))
         return cls(**data)
 
 
@@ -96,7 +115,12 @@ class SimpleBackupService:
         
         # Ensure backup directory exists
         self.backup_dir.mkdir(parents=True, exist_ok=True)
+        # Content-addressed chunk store shared by all chunked backups
+        self.store = BackupStore(self.backup_dir / "store")
         
+        # Guards the in-memory index and its file; backups finish on the job
+        # scheduler thread while requests list, verify or delete them
+        self._index_lock = threading.RLock()
         # Load existing backup index
         self._backup_index: Dict[str, SimpleBackupInfo] = self._load_backup_index()
 
@@ -106,8 +130,9 @@ class SimpleBackupService:
         self._last_scheduled_backup: Optional[datetime] = None
         # Initialize settings (creates defaults if missing)
         self._settings = self._load_or_create_settings()
-        # Auto-start scheduler if enabled
-        if self._settings.get('enabled', True):
+        # Auto-start scheduler if enabled (a preloading gunicorn master leaves it to the worker)
+        from app.startup.worker_warmup import preloading
+        if self._settings.get('enabled', True) and not preloading():
             self.ensure_scheduler()
         # Prevent concurrent create_backup overlap
         self._create_lock = threading.Lock()
@@ -177,6 +202,10 @@ class SimpleBackupService:
             return
         def _loop():
             logger.info("Backup scheduler thread started")
+            try:
+                self.resume_safety_snapshots()
+            except Exception as e:
+                logger.warning(f"Could not resume pre-restore safety backups: {e}")
             while not self._scheduler_stop.is_set():
                 try:
                     self._maybe_run_scheduled_backup()
@@ -203,7 +232,9 @@ class SimpleBackupService:
         # Future expansion: weekly
         if due:
             logger.info("Running scheduled daily backup")
-            self.create_backup(description='Scheduled daily backup', reason='scheduled_daily')
+            backup_info = self.create_backup(description='Scheduled daily backup', reason='scheduled_daily')
+            if backup_info:
+                self.start_verification(backup_info.id)
             self._settings['last_run'] = datetime.now().isoformat()
             if not self._save_settings():
                 logger.error("Failed to save last_run timestamp after scheduled backup")
@@ -277,13 +308,13 @@ class SimpleBackupService:
             return {}
     
     def _save_backup_index(self) -> None:
-        """Save the backup index to disk."""
-        try:
-            data = {backup_id: backup.to_dict() for backup_id, backup in self._backup_index.items()}
-            with open(self.backup_index_file, 'w') as f:
-                json.dump(data, f, indent=2)
-        except Exception as e:
-            logger.error(f"Failed to save backup index: {e}")
+        """Save the backup index to disk (atomically, under the index lock)."""
+        with self._index_lock:
+            try:
+                data = {backup_id: backup.to_dict() for backup_id, backup in self._backup_index.items()}
+                write_json_atomic(self.backup_index_file, data, indent=2)
+            except Exception as e:
+                logger.error(f"Failed to save backup index: {e}")
     
     def create_backup(self, name: Optional[str] = None, description: str = "", reason: str = 'manual') -> Optional[SimpleBackupInfo]:
         """
@@ -311,9 +342,10 @@ class SimpleBackupService:
             if not name:
                 name = f"backup_{timestamp.strftime('%Y%m%d_%H%M%S')}"
             
-            # Create backup file path
+            chunked = self._use_chunked_store()
+            # Create backup file path (chunked backups are a manifest in the store)
             backup_filename = f"{name}_{backup_id[:8]}.zip"
-            backup_path = self.backup_dir / backup_filename
+            backup_path = self.store.manifest_path(backup_id) if chunked else self.backup_dir / backup_filename
             
             logger.info(f"Creating simple backup: {name}")
             
@@ -338,78 +370,25 @@ class SimpleBackupService:
                 'covers_size': self._get_directory_size(self.covers_dir) if self.covers_dir.exists() else 0,
                 'uploads_size': self._get_directory_size(self.uploads_dir) if self.uploads_dir.exists() else 0,
                 'backup_type': 'simple_database_backup_with_images_and_settings',
+                'storage': 'chunked' if chunked else 'zip',
                 'reason': reason
             }
             
-            # Optionally quiesce writes for consistent snapshot
-            quiesce_enabled = os.getenv('KUZU_BACKUP_QUIESCE', 'false').lower() in ('1','true','yes')
-            manager = None
-            if quiesce_enabled:
-                try:
-                    from app.utils.safe_kuzu_manager import get_safe_kuzu_manager as _gskm
-                    manager = _gskm()
-                except Exception:
-                    manager = None
-
-            quiesce_ctx = manager.quiesce_for_backup(reason='simple_backup') if manager and quiesce_enabled else contextlib.nullcontext()
-            with quiesce_ctx:
-                with zipfile.ZipFile(backup_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                    # Add metadata file
-                    zipf.writestr('backup_metadata.json', json.dumps(metadata, indent=2))
-                    
-                    # Add the entire KuzuDB directory (it should always be a directory)
-                    db_files_count = 0
-                    for file_path in self.kuzu_db_path.rglob('*'):
-                        if file_path.is_file():
-                            relative_path = file_path.relative_to(self.kuzu_db_path)
-                            zipf.write(file_path, f"kuzu/{relative_path}")
-                            db_files_count += 1
-                            logger.debug(f"Added to backup: kuzu/{relative_path}")
-                    
-                    logger.info(f"Backed up KuzuDB directory with {db_files_count} files")
-                    
-                    # Add cover images
-                    covers_count = 0
-                    if self.covers_dir.exists():
-                        for file_path in self.covers_dir.rglob('*'):
-                            if file_path.is_file():
-                                relative_path = file_path.relative_to(self.covers_dir)
-                                zipf.write(file_path, f"data/covers/{relative_path}")
-                                covers_count += 1
-                                logger.debug(f"Added cover to backup: data/covers/{relative_path}")
-                        
-                        logger.info(f"Backed up {covers_count} cover images")
-                    
-                    # Add upload files if they exist
-                    uploads_count = 0
-                    if self.uploads_dir.exists():
-                        for file_path in self.uploads_dir.rglob('*'):
-                            if file_path.is_file():
-                                relp = file_path.relative_to(self.uploads_dir)
-                                zipf.write(file_path, f"data/uploads/{relp}")
-                                uploads_count += 1
-                                logger.debug(f"Added upload to backup: data/uploads/{relp}")
-                    
-                    logger.info(f"Backed up {uploads_count} uploaded files")
+            # Snapshot the DB under a brief write barrier, then archive the copy with writes flowing again
+            with self._kuzu_snapshot(backup_id, metadata) as kuzu_source:
+                if chunked:
+                    manifest = self.store.write_backup(backup_id, self._iter_backup_entries(kuzu_source), metadata)
+                    metadata['store_stats'] = manifest['stats']
+                else:
+                    self._write_zip_backup(backup_path, metadata, kuzu_source)
 
-                    # Add settings/config files (non-secret) while zip is still open
-                    settings_added = 0
-                    try:
-                        if self.env_file.exists():
-                            zipf.write(self.env_file, "config/.env")
-                            settings_added += 1
-                        if self.ai_config_file.exists():
-                            zipf.write(self.ai_config_file, "config/ai_config.json")
-                            settings_added += 1
-                        if self.backup_settings_file.exists():
-                            zipf.write(self.backup_settings_file, "config/backup_settings.json")
-                            settings_added += 1
-                        logger.info(f"Included {settings_added} config/settings files in backup")
-                    except Exception as se:
-                        logger.warning(f"Failed adding settings files to backup: {se}")
-            
-            # Get backup file size
-            file_size = backup_path.stat().st_size
+            # Logical size of the backup; chunked backups also record what they added to the store
+            if chunked:
+                file_size = metadata['store_stats']['logical_bytes']
+                stored_size: Optional[int] = metadata['store_stats']['stored_bytes_added']
+            else:
+                file_size = backup_path.stat().st_size
+                stored_size = None
             
             # Create backup info
             backup_info = SimpleBackupInfo(
@@ -419,14 +398,19 @@ class SimpleBackupService:
                 file_path=str(backup_path),
                 file_size=file_size,
                 description=description,
-                metadata=metadata
+                metadata=metadata,
+                stored_size=stored_size,
             )
             
             # Add to index and save
-            self._backup_index[backup_id] = backup_info
-            self._save_backup_index()
+            with self._index_lock:
+                self._backup_index[backup_id] = backup_info
+                self._save_backup_index()
             
-            logger.info(f"Simple backup created successfully: {name} ({file_size / 1024 / 1024:.2f} MB)")
+            logger.info(
+                f"Simple backup created successfully: {name} ({file_size / 1024 / 1024:.2f} MB"
+                + (f", {stored_size / 1024 / 1024:.2f} MB new in store)" if stored_size is not None else ")")
+            )
             # Apply retention pruning
             try:
                 self._apply_retention_policy()
@@ -449,9 +433,14 @@ class SimpleBackupService:
         Restore from a simple backup.
         
         This method:
-        1. Disconnects KuzuDB cleanly
-        2. Replaces database files from backup
-        3. Reconnects KuzuDB
+        1. Extracts the backup into a staging dir next to the database (app still up)
+        2. Disconnects KuzuDB cleanly
+        3. Renames the current database into a ``pre_restore_*`` sibling and the
+           staged one into place; covers/uploads it overwrites are moved there too
+        4. Flags a restart for clean reconnection
+        
+        The pre-restore safety backup is built from the sibling dir by a
+        background job once the swap is done, so the outage is only the swap.
         
         Args:
             backup_id: ID of the backup to restore
@@ -459,6 +448,8 @@ class SimpleBackupService:
         Returns:
             True if successful, False otherwise
         """
+        pre_dir = None
+        staging = None
         try:
             # Get backup info
             backup_info = self.get_backup(backup_id)
@@ -475,222 +466,62 @@ class SimpleBackupService:
             # Mark restore in progress
             self._set_restore_flag(backup_info)
             
-            # Step 1: Disconnect KuzuDB cleanly
+            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            short_id = str(uuid.uuid4())[:8]
+            parent = self.kuzu_db_path.parent
+            parent.mkdir(parents=True, exist_ok=True)
+            
+            # Step 1: Stage the backup on the same filesystem so the swap is a rename
+            staging = parent / f".restore_staging_{timestamp}_{short_id}"
+            staging.mkdir(parents=True)
+            self._extract_backup(backup_info, staging)
+            
+            backup_metadata = {}
+            metadata_path = staging / 'backup_metadata.json'
+            if metadata_path.exists():
+                with open(metadata_path, 'r') as f:
+                    backup_metadata = json.load(f)
+            logger.info(f"Restoring backup type: {backup_metadata.get('backup_type', 'simple_database_backup')}")
+            
+            staged_kuzu = staging / "kuzu"
+            if not staged_kuzu.exists():
+                # Legacy backup format - files in root (excluding metadata and media dirs)
+                staged_kuzu.mkdir()
+                for file_path in list(staging.glob('*')):
+                    if file_path.is_file() and file_path.name != 'backup_metadata.json':
+                        os.replace(file_path, staged_kuzu / file_path.name)
+            
+            # Step 2: Disconnect KuzuDB cleanly (outage starts here)
             logger.info("Disconnecting KuzuDB connections...")
             self._disconnect_kuzu_database()
             
-            # Step 2: Make a pre-restore safety backup by moving aside and zipping (expanded to include covers/uploads/settings)
-            current_backup_path = None
-            moved_old_dir = None
+            # Step 3: Swap directories
+            pre_dir = parent / f"pre_restore_{timestamp}_{short_id}"
+            pre_dir.mkdir(parents=True)
+            (pre_dir / 'pending.json').write_text(json.dumps({
+                'created_at': datetime.now().isoformat(),
+                'source_backup_restored': backup_info.name,
+            }))
             if self.kuzu_db_path.exists():
-                try:
-                    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-                    short_id = str(uuid.uuid4())[:8]
-                    moved_old_dir = self.kuzu_db_path.parent / f"kuzu.pre_restore_{timestamp}_{short_id}"
-                    logger.info(f"Moving current Kuzu directory to {moved_old_dir} for safety snapshot...")
-                    shutil.move(str(self.kuzu_db_path), str(moved_old_dir))
-                    logger.info("Current Kuzu directory moved aside successfully")
-
-                    # Create a zip snapshot in backups including covers/uploads/settings
-                    pre_name = f"pre_restore_{timestamp}"
-                    pre_backup_filename = f"{pre_name}_{short_id}.zip"
-                    pre_backup_path = self.backup_dir / pre_backup_filename
-                    metadata = {
-                        'backup_id': str(uuid.uuid4()),
-                        'created_at': datetime.now().isoformat(),
-                        'kuzu_db_path': str(moved_old_dir),
-                        'original_size': self._get_directory_size(moved_old_dir),
-                        'backup_type': 'pre_restore_snapshot_full',
-                        'source_backup_restored': backup_info.name,
-                    }
-                    logger.info(f"Creating pre-restore backup zip at {pre_backup_path} ...")
-                    with zipfile.ZipFile(pre_backup_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                        zipf.writestr('backup_metadata.json', json.dumps(metadata, indent=2))
-                        files_count = 0
-                        for file_path in moved_old_dir.rglob('*'):
-                            if file_path.is_file():
-                                relative_path = file_path.relative_to(moved_old_dir)
-                                zipf.write(file_path, f"kuzu/{relative_path}")
-                                files_count += 1
-                        # Add covers
-                        if self.covers_dir.exists():
-                            for file_path in self.covers_dir.rglob('*'):
-                                if file_path.is_file():
-                                    rel = file_path.relative_to(self.covers_dir)
-                                    zipf.write(file_path, f"data/covers/{rel}")
-                        # Add uploads
-                        if self.uploads_dir.exists():
-                            for file_path in self.uploads_dir.rglob('*'):
-                                if file_path.is_file():
-                                    rel = file_path.relative_to(self.uploads_dir)
-                                    zipf.write(file_path, f"data/uploads/{rel}")
-                        # Add settings
-                        try:
-                            if self.env_file.exists():
-                                zipf.write(self.env_file, f"config/.env")
-                            if self.ai_config_file.exists():
-                                zipf.write(self.ai_config_file, f"config/ai_config.json")
-                            if self.backup_settings_file.exists():
-                                zipf.write(self.backup_settings_file, f"config/backup_settings.json")
-                        except Exception as se:
-                            logger.warning(f"Failed adding settings to pre-restore snapshot: {se}")
-                        logger.info(f"Pre-restore snapshot archived: {files_count} files")
-
-                    # Record in index for visibility
-                    backup_info_obj = SimpleBackupInfo(
-                        id=metadata['backup_id'],
-                        name=pre_name,
-                        created_at=datetime.now(),
-                        file_path=str(pre_backup_path),
-                        file_size=pre_backup_path.stat().st_size,
-                        description=f"Auto-created before restoring '{backup_info.name}'",
-                        metadata=metadata,
-                    )
-                    self._backup_index[backup_info_obj.id] = backup_info_obj
-                    self._save_backup_index()
-                except Exception as e:
-                    logger.warning(f"Failed to create pre-restore snapshot: {e}. Proceeding cautiously.")
+                os.replace(self.kuzu_db_path, pre_dir / "kuzu")
+                logger.info(f"Current Kuzu directory moved aside to {pre_dir / 'kuzu'}")
+            try:
+                os.replace(staged_kuzu, self.kuzu_db_path)
+            except OSError:
+                # Different filesystem (e.g. KUZU_DB_PATH on its own volume)
+                shutil.move(str(staged_kuzu), str(self.kuzu_db_path))
+            files_restored = sum(1 for p in self.kuzu_db_path.rglob('*') if p.is_file())
+            logger.info(f"Restored KuzuDB directory with {files_restored} files")
             
-            # Step 3: Ensure fresh target directory exists (it was moved away above)
-            self.kuzu_db_path.mkdir(parents=True, exist_ok=True)
+            # Covers/uploads: new layout under data/, legacy under static/
+            for source_root in (staging / "data", staging / "static"):
+                for sub, dest in (('covers', self.covers_dir), ('uploads', self.uploads_dir)):
+                    source = source_root / sub
+                    if source.exists():
+                        count = self._install_tree(source, dest, pre_dir / "displaced" / sub)
+                        logger.info(f"Restored {count} files into {dest}")
             
-            # Step 4: Extract backup to restore database and static files
-            with tempfile.TemporaryDirectory() as temp_dir:
-                temp_path = Path(temp_dir)
-                
-                # Extract backup
-                with zipfile.ZipFile(backup_path, 'r') as zipf:
-                    zipf.extractall(temp_path)
-                
-                # Load backup metadata to determine backup structure
-                metadata_path = temp_path / 'backup_metadata.json'
-                backup_metadata = {}
-                if metadata_path.exists():
-                    with open(metadata_path, 'r') as f:
-                        backup_metadata = json.load(f)
-                
-                backup_type = backup_metadata.get('backup_type', 'simple_database_backup')
-                logger.info(f"Restoring backup type: {backup_type}")
-                
-                # Restore KuzuDB directory
-                self.kuzu_db_path.parent.mkdir(parents=True, exist_ok=True)
-                if not self.kuzu_db_path.exists():
-                    self.kuzu_db_path.mkdir(parents=True)
-                    logger.info(f"Created KuzuDB directory: {self.kuzu_db_path}")
-                
-                # Handle different backup structures
-                kuzu_source_path = temp_path / "kuzu"
-                files_restored = 0
-                
-                if kuzu_source_path.exists():
-                    # New backup format with kuzu/ subdirectory
-                    for file_path in kuzu_source_path.rglob('*'):
-                        if file_path.is_file():
-                            relative_path = file_path.relative_to(kuzu_source_path)
-                            target_path = self.kuzu_db_path / relative_path
-                            target_path.parent.mkdir(parents=True, exist_ok=True)
-                            
-                            self._copy_file_with_retry(file_path, target_path)
-                            files_restored += 1
-                            logger.debug(f"Restored: {relative_path}")
-                else:
-                    # Legacy backup format - files in root (excluding metadata)
-                    for file_path in temp_path.glob('*'):
-                        if file_path.is_file() and file_path.name != 'backup_metadata.json':
-                            target_path = self.kuzu_db_path / file_path.name
-                            self._copy_file_with_retry(file_path, target_path)
-                            files_restored += 1
-                            logger.debug(f"Restored: {file_path.name}")
-                
-                logger.info(f"Restored KuzuDB directory with {files_restored} files")
-                
-                # Restore static files if present (legacy backups)
-                static_source_path = temp_path / "static"
-                if static_source_path.exists():
-                    # Restore cover images from static/covers
-                    covers_source = static_source_path / "covers"
-                    if covers_source.exists():
-                        covers_restored = 0
-                        self.covers_dir.mkdir(parents=True, exist_ok=True)
-                        
-                        for file_path in covers_source.rglob('*'):
-                            if file_path.is_file():
-                                relative_path = file_path.relative_to(covers_source)
-                                target_path = self.covers_dir / relative_path
-                                target_path.parent.mkdir(parents=True, exist_ok=True)
-                                
-                                self._copy_file_with_retry(file_path, target_path)
-                                covers_restored += 1
-                                logger.debug(f"Restored cover: {relative_path}")
-                        
-                        logger.info(f"Restored {covers_restored} cover images from legacy backup")
-                    
-                    # Restore upload files from static/uploads
-                    uploads_source = static_source_path / "uploads"
-                    if uploads_source.exists():
-                        uploads_restored = 0
-                        self.uploads_dir.mkdir(parents=True, exist_ok=True)
-                        
-                        for file_path in uploads_source.rglob('*'):
-                            if file_path.is_file():
-                                relative_path = file_path.relative_to(uploads_source)
-                                target_path = self.uploads_dir / relative_path
-                                target_path.parent.mkdir(parents=True, exist_ok=True)
-                                
-                                self._copy_file_with_retry(file_path, target_path)
-                                uploads_restored += 1
-                                logger.debug(f"Restored upload: {relative_path}")
-                        
-                        logger.info(f"Restored {uploads_restored} uploaded files from legacy backup")
-                
-                # Restore data files if present (new format)
-                data_source_path = temp_path / "data"
-                if data_source_path.exists():
-                    # Restore cover images from data/covers
-                    covers_source = data_source_path / "covers"
-                    if covers_source.exists():
-                        covers_restored = 0
-                        self.covers_dir.mkdir(parents=True, exist_ok=True)
-                        
-                        for file_path in covers_source.rglob('*'):
-                            if file_path.is_file():
-                                relative_path = file_path.relative_to(covers_source)
-                                target_path = self.covers_dir / relative_path
-                                target_path.parent.mkdir(parents=True, exist_ok=True)
-                                
-                                self._copy_file_with_retry(file_path, target_path)
-                                covers_restored += 1
-                                logger.debug(f"Restored cover: {relative_path}")
-                        
-                        logger.info(f"Restored {covers_restored} cover images")
-                    
-                    # Restore upload files from data/uploads
-                    uploads_source = data_source_path / "uploads"
-                    if uploads_source.exists():
-                        uploads_restored = 0
-                        self.uploads_dir.mkdir(parents=True, exist_ok=True)
-                        
-                        for file_path in uploads_source.rglob('*'):
-                            if file_path.is_file():
-                                relative_path = file_path.relative_to(uploads_source)
-                                target_path = self.uploads_dir / relative_path
-                                target_path.parent.mkdir(parents=True, exist_ok=True)
-                                
-                                self._copy_file_with_retry(file_path, target_path)
-                                uploads_restored += 1
-                                logger.debug(f"Restored upload: {relative_path}")
-                        
-                        logger.info(f"Restored {uploads_restored} uploaded files")
-            
-            # Step 5: Cleanup moved old dir after successful restore
-            try:
-                if moved_old_dir and moved_old_dir.exists():
-                    shutil.rmtree(moved_old_dir)
-                    logger.info(f"Removed pre-restore directory: {moved_old_dir}")
-            except Exception as e:
-                logger.warning(f"Failed to remove pre-restore directory {moved_old_dir}: {e}")
-
-            # Step 6: Set restart flag instead of immediate reconnection
+            # Step 4: Set restart flag instead of immediate reconnection
             logger.info("Setting restart flag for clean reconnection...")
             self._set_restart_required_flag()
             
@@ -700,29 +531,24 @@ class SimpleBackupService:
             logger.info(f"Simple restore completed successfully from backup: {backup_info.name}")
             logger.info("Application restart required for clean database reconnection")
             
-            # Clean up temporary backup if restore was successful
-            if current_backup_path and current_backup_path.exists():
-                shutil.rmtree(current_backup_path)
-                logger.info("Cleaned up temporary backup")
-            
+            # Step 5: Safety backup of the previous state, off the restore path
+            self._queue_safety_snapshot(pre_dir)
             return True
         except Exception as e:
             logger.error(f"Failed to restore simple backup {backup_id}: {e}")
             # Attempt rollback if possible
             try:
-                # Find any moved pre-restore directory to roll back
-                parent = self.kuzu_db_path.parent
-                candidates = sorted(parent.glob('kuzu.pre_restore_*'), key=lambda p: p.stat().st_mtime, reverse=True)
-                moved_old_dir = candidates[0] if candidates else None
-                if moved_old_dir and moved_old_dir.exists():
-                    logger.warning(f"Attempting rollback from {moved_old_dir} ...")
+                if pre_dir is not None and (pre_dir / "kuzu").exists():
+                    logger.warning(f"Attempting rollback from {pre_dir} ...")
                     # Remove partially restored target dir
                     if self.kuzu_db_path.exists():
-                        try:
-                            shutil.rmtree(self.kuzu_db_path)
-                        except Exception:
-                            pass
-                    shutil.move(str(moved_old_dir), str(self.kuzu_db_path))
+                        shutil.rmtree(self.kuzu_db_path, ignore_errors=True)
+                    os.replace(pre_dir / "kuzu", self.kuzu_db_path)
+                    for sub, dest in (('covers', self.covers_dir), ('uploads', self.uploads_dir)):
+                        displaced = pre_dir / "displaced" / sub
+                        if displaced.exists():
+                            self._install_tree(displaced, dest, None)
+                    shutil.rmtree(pre_dir, ignore_errors=True)
                     logger.info("Rollback completed; original database restored")
             except Exception as rb_err:
                 logger.error(f"Rollback failed: {rb_err}")
@@ -730,6 +556,111 @@ class SimpleBackupService:
                 # Always clear the restore flag
                 self._clear_restore_flag()
             return False
+        finally:
+            if staging is not None:
+                shutil.rmtree(staging, ignore_errors=True)
+
+    def _install_tree(self, source: Path, dest: Path, displaced: Optional[Path]) -> int:
+        """Move files from ``source`` into ``dest``; files they replace go to ``displaced``."""
+        count = 0
+        dest.mkdir(parents=True, exist_ok=True)
+        for file_path in source.rglob('*'):
+            if not file_path.is_file():
+                continue
+            relative_path = file_path.relative_to(source)
+            target_path = dest / relative_path
+            target_path.parent.mkdir(parents=True, exist_ok=True)
+            if displaced is not None and target_path.exists():
+                keep = displaced / relative_path
+                keep.parent.mkdir(parents=True, exist_ok=True)
+                os.replace(target_path, keep)
+            try:
+                os.replace(file_path, target_path)
+            except OSError:
+                self._copy_file_with_retry(file_path, target_path)
+            count += 1
+        return count
+
+    # -------------------------- Pre-restore safety backups --------------------
+    def _queue_safety_snapshot(self, pre_dir: Path) -> None:
+        from app.services.job_scheduler import PRIORITY_MAINTENANCE, JobQueueFull, job_scheduler
+        job_id = f"pre_restore_snapshot:{pre_dir.name}"
+        if job_scheduler.is_active(job_id):
+            return
+        try:
+            job_scheduler.submit(
+                self._build_safety_snapshot, pre_dir,
+                priority=PRIORITY_MAINTENANCE, job_id=job_id, name='pre_restore_snapshot',
+            )
+            logger.info(f"Queued pre-restore safety backup for {pre_dir.name}")
+        except JobQueueFull:
+            # Picked up again by resume_safety_snapshots() when the scheduler starts
+            logger.warning(f"Job queue full; pre-restore safety backup for {pre_dir.name} deferred")
+
+    def _build_safety_snapshot(self, pre_dir: Path) -> Optional[str]:
+        """Archive a ``pre_restore_*`` dir as a backup, then remove it."""
+        marker = pre_dir / 'pending.json'
+        if not marker.exists():
+            return None
+        try:
+            pending = json.loads(marker.read_text())
+        except Exception:
+            pending = {}
+        kuzu_dir = pre_dir / "kuzu"
+        chunked = self._use_chunked_store()
+        pre_name = pre_dir.name
+        pre_backup_id = str(uuid.uuid4())
+        pre_backup_path = self.store.manifest_path(pre_backup_id) if chunked else self.backup_dir / f"{pre_name}.zip"
+        metadata = {
+            'backup_id': pre_backup_id,
+            'created_at': pending.get('created_at') or datetime.now().isoformat(),
+            'kuzu_db_path': str(kuzu_dir),
+            'original_size': self._get_directory_size(kuzu_dir) if kuzu_dir.exists() else 0,
+            'backup_type': 'pre_restore_snapshot_full',
+            'storage': 'chunked' if chunked else 'zip',
+            'source_backup_restored': pending.get('source_backup_restored'),
+        }
+        entries = self._iter_backup_entries(kuzu_dir, displaced_dir=pre_dir / "displaced")
+        logger.info(f"Creating pre-restore backup at {pre_backup_path} ...")
+        if chunked:
+            manifest = self.store.write_backup(pre_backup_id, entries, metadata)
+            metadata['store_stats'] = manifest['stats']
+            pre_size = manifest['stats']['logical_bytes']
+            pre_stored: Optional[int] = manifest['stats']['stored_bytes_added']
+        else:
+            self._write_zip_backup(pre_backup_path, metadata, kuzu_dir, displaced_dir=pre_dir / "displaced")
+            pre_size = pre_backup_path.stat().st_size
+            pre_stored = None
+        
+        # Record in index for visibility
+        backup_info_obj = SimpleBackupInfo(
+            id=pre_backup_id,
+            name=pre_name,
+            created_at=datetime.now(),
+            file_path=str(pre_backup_path),
+            file_size=pre_size,
+            description=f"Auto-created before restoring '{pending.get('source_backup_restored')}'",
+            metadata=metadata,
+            stored_size=pre_stored,
+        )
+        with self._index_lock:
+            self._backup_index[backup_info_obj.id] = backup_info_obj
+            self._save_backup_index()
+        shutil.rmtree(pre_dir, ignore_errors=True)
+        logger.info(f"Pre-restore snapshot archived; removed {pre_dir}")
+        return pre_backup_id
+
+    def resume_safety_snapshots(self) -> int:
+        """Queue safety backups for pre-restore dirs left by a restart mid-job."""
+        queued = 0
+        parent = self.kuzu_db_path.parent
+        if not parent.exists():
+            return 0
+        for pre_dir in sorted(parent.glob('pre_restore_*')):
+            if (pre_dir / 'pending.json').exists():
+                self._queue_safety_snapshot(pre_dir)
+                queued += 1
+        return queued
     
     def _disconnect_kuzu_database(self) -> None:
         """Cleanly disconnect from KuzuDB."""
@@ -1007,9 +938,212 @@ class SimpleBackupService:
                     logger.error(f"Error copying {source.name}: {e}")
                     raise
     
+    # -------------------------- Snapshot helpers ---------------------------
+    @contextlib.contextmanager
+    def _kuzu_snapshot(self, backup_id: str, metadata: Dict[str, Any]):
+        """Yield a directory holding a consistent copy of the Kùzu files.
+
+        ``KUZU_BACKUP_SNAPSHOT=checkpoint`` (default) checkpoints and copies
+        the DB into a staging dir under a short write barrier; ``live`` reads
+        the live files directly, quiesced for the whole archive only when
+        ``KUZU_BACKUP_QUIESCE`` is set (the previous behaviour).
+        """
+        mode = os.getenv('KUZU_BACKUP_SNAPSHOT', 'checkpoint').strip().lower()
+        manager = None
+        try:
+            manager = get_safe_kuzu_manager()
+        except Exception:
+            manager = None
+
+        if mode == 'live' or manager is None:
+            quiesce_enabled = os.getenv('KUZU_BACKUP_QUIESCE', 'false').lower() in ('1', 'true', 'yes')
+            metadata['snapshot'] = {'mode': 'live', 'quiesced': bool(manager and quiesce_enabled)}
+            quiesce_ctx = manager.quiesce_for_backup(reason='simple_backup') if manager and quiesce_enabled else contextlib.nullcontext()
+            with quiesce_ctx:
+                yield self.kuzu_db_path
+            return
+
+        staging = self.backup_dir / "staging" / backup_id
+        if staging.exists():
+            shutil.rmtree(staging, ignore_errors=True)
+        staging.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            metadata['snapshot'] = manager.snapshot_database(staging, source_dir=self.kuzu_db_path, reason='simple_backup')
+            yield staging
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+
+    # -------------------------- Verification -------------------------------
+    def start_verification(self, backup_id: str, user_id: Optional[str] = None) -> Optional[str]:
+        """Queue ``verify_backup`` as a maintenance job. Returns the job id."""
+        from app.services.job_scheduler import PRIORITY_MAINTENANCE, JobQueueFull, job_scheduler
+        job_id = f"backup_verify:{backup_id}"
+        if job_scheduler.is_active(job_id):
+            return job_id
+        try:
+            job_scheduler.submit(
+                self.verify_backup, backup_id,
+                priority=PRIORITY_MAINTENANCE, user_id=user_id, job_id=job_id, name='backup_verify',
+            )
+        except JobQueueFull:
+            logger.warning(f"Job queue full; verification of backup {backup_id} not queued")
+            return None
+        return job_id
+
+    def verify_backup(self, backup_id: str) -> Optional[Dict[str, Any]]:
+        """Check a backup without restoring it and record the result in the index.
+
+        Archive contents are checked first (chunk hashes for chunked backups,
+        CRCs for zips). The Kùzu snapshot is then opened read-only in a temp
+        dir and the integrity probe's core counts are run against it.
+        """
+        backup_info = self.get_backup(backup_id)
+        if not backup_info:
+            return None
+        started = time.time()
+        result: Dict[str, Any] = {'verified_at': datetime.now().isoformat(), 'errors': []}
+        try:
+            with tempfile.TemporaryDirectory(prefix='.verify_', dir=str(self.backup_dir)) as temp_dir:
+                temp_path = Path(temp_dir)
+                kuzu_dir = temp_path / 'kuzu'
+                if self._is_chunked(backup_info):
+                    manifest = self.store.load_manifest(backup_info.id)
+                    if manifest is None:
+                        raise FileNotFoundError(f"Backup manifest missing for {backup_info.id}")
+                    content = self.store.verify_manifest(manifest)
+                    result['archive'] = {'files': content['files'], 'chunks': content['chunks']}
+                    result['errors'].extend(content['errors'])
+                    if not content['errors']:
+                        self.store.restore_to(manifest, temp_path, verify=False, prefix='kuzu/')
+                else:
+                    with zipfile.ZipFile(backup_info.file_path, 'r') as zipf:
+                        names = zipf.namelist()
+                        result['archive'] = {'files': len(names)}
+                        bad = zipf.testzip()
+                        if bad:
+                            result['errors'].append(f"{bad}: CRC mismatch")
+                        else:
+                            for name in names:
+                                if name.startswith('kuzu/'):
+                                    zipf.extract(name, temp_path)
+                                elif '/' not in name and name != 'backup_metadata.json':
+                                    # Legacy backup format - DB files in root
+                                    zipf.extract(name, kuzu_dir)
+                if not result['errors']:
+                    if not kuzu_dir.exists():
+                        result['errors'].append('Backup contains no Kùzu database')
+                    else:
+                        result['database'] = self._probe_snapshot(kuzu_dir)
+                        result['errors'].extend(result['database'].pop('errors'))
+        except Exception as e:
+            result['errors'].append(str(e))
+        result['ok'] = not result['errors']
+        result['elapsed_seconds'] = round(time.time() - started, 2)
+        with self._index_lock:
+            backup_info.metadata = {**(backup_info.metadata or {}), 'verification': result}
+            self._save_backup_index()
+        if result['ok']:
+            logger.info(f"Backup {backup_info.name} verified: {result.get('database', {}).get('counts')}")
+        else:
+            logger.error(f"Backup {backup_info.name} failed verification: {result['errors']}")
+        return result
+
+    def _probe_snapshot(self, kuzu_dir: Path) -> Dict[str, Any]:
+        import kuzu  # type: ignore
+        from app.utils.safe_kuzu_manager import probe_core_counts
+        db_path = kuzu_dir / 'bibliotheca.db'
+        if not db_path.exists():
+            db_path = kuzu_dir  # directory-format databases from older Kùzu versions
+        database = kuzu.Database(str(db_path), read_only=True, buffer_pool_size=VERIFY_BUFFER_POOL_MB << 20)
+        try:
+            conn = kuzu.Connection(database)
+            try:
+                totals, anomalies = probe_core_counts(conn)
+            finally:
+                conn.close()
+        finally:
+            database.close()
+        errors = [f"{a['label']}: {a.get('error') or a.get('reason')}" for a in anomalies]
+        return {'counts': totals, 'errors': errors}
+
+    # -------------------------- Archive helpers ----------------------------
+    def _use_chunked_store(self) -> bool:
+        return BACKUP_FORMAT != 'zip'
+
+    @staticmethod
+    def _is_chunked(backup_info: SimpleBackupInfo) -> bool:
+        return bool(backup_info.metadata and backup_info.metadata.get('storage') == 'chunked')
+
+    def _iter_backup_entries(self, kuzu_dir: Path, displaced_dir: Optional[Path] = None):
+        """Yield (archive name, path) for everything a backup contains.
+
+        Files under ``displaced_dir/<covers|uploads>`` (set aside by a restore)
+        take the place of the live file with the same name.
+        """
+        for file_path in sorted(kuzu_dir.rglob('*')):
+            if file_path.is_file():
+                yield f"kuzu/{file_path.relative_to(kuzu_dir).as_posix()}", file_path
+        for sub, root in (('covers', self.covers_dir), ('uploads', self.uploads_dir)):
+            seen = set()
+            override = displaced_dir / sub if displaced_dir else None
+            if override and override.exists():
+                for file_path in sorted(override.rglob('*')):
+                    if file_path.is_file():
+                        rel = file_path.relative_to(override).as_posix()
+                        seen.add(rel)
+                        yield f"data/{sub}/{rel}", file_path
+            if root.exists():
+                for file_path in sorted(root.rglob('*')):
+                    if file_path.is_file():
+                        rel = file_path.relative_to(root).as_posix()
+                        if rel not in seen:
+                            yield f"data/{sub}/{rel}", file_path
+        # Settings/config files (non-secret)
+        for arcname, file_path in (
+            ('config/.env', self.env_file),
+            ('config/ai_config.json', self.ai_config_file),
+            ('config/backup_settings.json', self.backup_settings_file),
+        ):
+            if file_path.exists():
+                yield arcname, file_path
+
+    def _write_zip_backup(self, backup_path: Path, metadata: Dict[str, Any], kuzu_dir: Path,
+                          displaced_dir: Optional[Path] = None) -> int:
+        """Self-contained zip backup; already-compressed media is stored, not deflated."""
+        count = 0
+        with zipfile.ZipFile(backup_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
+            zipf.writestr('backup_metadata.json', json.dumps(metadata, indent=2))
+            for arcname, file_path in self._iter_backup_entries(kuzu_dir, displaced_dir):
+                compress_type = zipfile.ZIP_DEFLATED if is_compressible(arcname) else zipfile.ZIP_STORED
+                zipf.write(file_path, arcname, compress_type=compress_type)
+                count += 1
+        logger.info(f"Wrote zip backup with {count} files: {backup_path.name}")
+        return count
+
+    def _extract_backup(self, backup_info: SimpleBackupInfo, target_dir: Path) -> None:
+        if self._is_chunked(backup_info):
+            manifest = self.store.load_manifest(backup_info.id)
+            if manifest is None:
+                raise FileNotFoundError(f"Backup manifest missing for {backup_info.id}")
+            self.store.restore_to(manifest, target_dir)
+            return
+        with zipfile.ZipFile(backup_info.file_path, 'r') as zipf:
+            zipf.extractall(target_dir)
+
+    def iter_backup_archive(self, backup_id: str):
+        """Stream a chunked backup as a zip for download (None if it is not chunked or missing)."""
+        backup_info = self.get_backup(backup_id)
+        if not backup_info or not self._is_chunked(backup_info):
+            return None
+        manifest = self.store.load_manifest(backup_info.id)
+        if manifest is None:
+            return None
+        return self.store.iter_zip(manifest)
+
     def list_backups(self) -> List[SimpleBackupInfo]:
         """Get list of all backups."""
-        return list(self._backup_index.values())
+        with self._index_lock:
+            return list(self._backup_index.values())
     
     def get_backup(self, backup_id: str) -> Optional[SimpleBackupInfo]:
         """Get backup info by ID."""
@@ -1024,13 +1158,16 @@ class SimpleBackupService:
             backup_info = self._backup_index[backup_id]
             backup_path = Path(backup_info.file_path)
             
-            # Remove file if it exists
-            if backup_path.exists():
+            if self._is_chunked(backup_info):
+                # Drops the manifest and only the chunks no other backup references
+                self.store.delete_backup(backup_info.id)
+            elif backup_path.exists():
                 backup_path.unlink()
             
             # Remove from index
-            del self._backup_index[backup_id]
-            self._save_backup_index()
+            with self._index_lock:
+                self._backup_index.pop(backup_id, None)
+                self._save_backup_index()
             
             logger.info(f"Deleted simple backup: {backup_info.name}")
             return True
@@ -1068,10 +1205,12 @@ class SimpleBackupService:
                 'uploads_count': uploads_count,
                 'newest_backup_age': None,
                 'oldest_backup': None,
-                'newest_backup': None
+                'newest_backup': None,
+                'store': self.store.stats(),
             }
         
-        total_size = sum(backup.file_size for backup in backups)
+        # Disk usage: chunked backups share the store, so count what each one added
+        total_size = sum(b.stored_size if b.stored_size is not None else b.file_size for b in backups)
         sorted_backups = sorted(backups, key=lambda b: b.created_at)
         newest_backup = sorted_backups[-1]
         
@@ -1100,7 +1239,8 @@ class SimpleBackupService:
             'uploads_count': uploads_count,
             'newest_backup_age': newest_backup_age,
             'oldest_backup': sorted_backups[0].created_at.isoformat(),
-            'newest_backup': sorted_backups[-1].created_at.isoformat()
+            'newest_backup': sorted_backups[-1].created_at.isoformat(),
+            'store': self.store.stats(),
         }
 
     # -------------------------- Retention Policy ---------------------------
@@ -1111,7 +1251,7 @@ class SimpleBackupService:
             return
         cutoff = datetime.now() - timedelta(days=retention_days)
         to_delete = []
-        for b in self._backup_index.values():
+        for b in self.list_backups():
             # Keep pre-restore snapshots for minimum retention as well; allow deletion like others
             if b.created_at < cutoff:
                 # Allow manual protection via metadata flag protected=True
@@ -1126,6 +1266,11 @@ class SimpleBackupService:
                 self.delete_backup(bid)
             except Exception as e:
                 logger.warning(f"Failed deleting old backup {bid}: {e}")
+        # Chunks are reference-counted per backup; also drop any left by an interrupted run
+        try:
+            self.store.sweep_unreferenced()
+        except Exception as e:
+            logger.warning(f"Backup store sweep failed: {e}")
 
 
 # Global instance
@@ -20,6 +20,8 @@ Design Principles:
 from typing import Optional, Dict, Any, Union
 from dataclasses import dataclass
 from flask import url_for
+from markupsafe import escape
+import json
 import logging
 import re
 
@@ -47,6 +49,9 @@ class UnifiedCoverManager:
     - Update operations that respect existing covers
     """
     
+    # Typical rendered width of a cover card; views with larger covers pass their own
+    DEFAULT_SIZES = "(max-width: 576px) 45vw, 220px"
+
     def __init__(self):
         # URL validation patterns
         self.valid_url_pattern = re.compile(r'^https?://.+\..+')
@@ -214,30 +219,90 @@ class UnifiedCoverManager:
             
         return updates
     
-    def render_cover_html(self, book: Any, css_classes: str = "", style: str = "", img_id: str = "") -> str:
+    def _local_cover_name(self, cover: Any) -> Optional[str]:
+        """Filename of a processed local cover, from a URL string or a book/series object."""
+        from app.utils.cover_derivatives import derivatives_enabled, local_cover_name
+        if not derivatives_enabled():
+            return None
+        if isinstance(cover, str) or cover is None:
+            url = cover
+        else:
+            url = self.get_cover_info(cover).url
+        return local_cover_name(url)
+
+    def get_srcset(self, cover: Any, fmt: str = 'jpg') -> str:
+        """
+        Build a ``srcset`` of responsive derivatives for a local cover.
+        
+        Args:
+            cover: Cover URL or book object
+            fmt: Derivative format ('jpg', 'webp' or 'avif')
+            
+        Returns:
+            srcset string, or '' for remote covers (served as-is)
+        """
+        from app.utils.cover_derivatives import srcset_for, supported_formats
+        name = self._local_cover_name(cover)
+        if not name or fmt not in supported_formats():
+            return ''
+        return srcset_for(name, fmt)
+
+    def render_picture_sources(self, cover: Any, sizes: Optional[str] = None) -> str:
+        """
+        Generate ``<source>`` elements (AVIF/WebP) to place inside a ``<picture>``.
+        
+        The wrapped ``<img>`` stays the JPEG fallback; remote covers get no sources.
+        """
+        from app.utils.cover_derivatives import mime_type, srcset_for, supported_formats
+        name = self._local_cover_name(cover)
+        if not name:
+            return ''
+        sizes = sizes or self.DEFAULT_SIZES
+        return ''.join(
+            f'<source type="{mime_type(ext)}" srcset="{escape(srcset_for(name, ext))}" sizes="{escape(sizes)}">'
+            for ext in supported_formats() if ext != 'jpg'
+        )
+
+    def render_cover_html(self, book: Any, css_classes: str = "", style: str = "", img_id: str = "",
+                          sizes: Optional[str] = None, alt: Optional[str] = None) -> str:
         """
         Generate consistent cover HTML for templates.
         
+        Local covers are wrapped in a ``<picture>`` with AVIF/WebP derivatives and
+        a JPEG ``srcset`` fallback so grids only download thumbnail-sized files.
+        Every interpolated value is HTML-escaped.
+        
         Args:
-            book: Book object
+            book: Book object, or a cover URL (e.g. a series cover)
             css_classes: Additional CSS classes for the image
             style: Inline styles for the image
             img_id: ID attribute for the image
+            sizes: ``sizes`` attribute for the responsive sources
+            alt: Alt text (defaults to the book title)
             
         Returns:
             HTML string for cover display
         """
-        cover_info = self.get_cover_info(book)
+        if isinstance(book, str):
+            # Stored cover URLs (e.g. absolute series cover links) are rendered as given
+            url = book.strip() or None
+            cover_info = CoverInfo(url=url, has_cover=bool(url))
+            title = None
+        else:
+            cover_info = self.get_cover_info(book)
+            title = book.get('title') if isinstance(book, dict) else getattr(book, 'title', None)
+        if alt is None:
+            alt = title or 'Book cover'
         
         if cover_info.has_cover:
             # Has valid cover - show image with fallback
             img_attrs = []
             if css_classes:
-                img_attrs.append(f'class="{css_classes}"')
+                img_attrs.append(f'class="{escape(css_classes)}"')
             if style:
-                img_attrs.append(f'style="{style}"')
+                img_attrs.append(f'style="{escape(style)}"')
             if img_id:
-                img_attrs.append(f'id="{img_id}"')
+                img_attrs.append(f'id="{escape(img_id)}"')
                 
             attrs_str = ' ' + ' '.join(img_attrs) if img_attrs else ''
             
@@ -250,22 +315,26 @@ class UnifiedCoverManager:
             except (ImportError, RuntimeError):
                 pass
             
-            return f'''<img src="{cover_info.url}" alt="{getattr(book, 'title', 'Book cover')}"
-                           onerror="this.onerror=null;this.src='{fallback_url}';"{attrs_str}>'''
+            srcset = self.get_srcset(cover_info.url)
+            if srcset:
+                sizes = sizes or self.DEFAULT_SIZES
+                attrs_str += f' srcset="{escape(srcset)}" sizes="{escape(sizes)}"'
+            # JSON-quote the fallback for the inline handler, then escape it for the attribute
+            img_html = (f'<img src="{escape(cover_info.url)}" alt="{escape(alt)}" loading="lazy" decoding="async" '
+                        f'onerror="this.onerror=null;this.src={escape(json.dumps(fallback_url))};"{attrs_str}>')
+            sources = self.render_picture_sources(cover_info.url, sizes)
+            if sources:
+                return f'<picture>{sources}{img_html}</picture>'
+            return img_html
         else:
             # No cover - show placeholder
-            container_attrs = []
-            if css_classes:
-                # Convert image classes to container classes
-                container_classes = css_classes.replace('img-fluid', 'd-flex align-items-center justify-content-center')
-                container_attrs.append(f'class="bg-light rounded shadow-sm {container_classes}"')
-            else:
-                container_attrs.append('class="bg-light rounded d-flex align-items-center justify-content-center shadow-sm"')
+            container_attrs = ['class="bg-light rounded d-flex align-items-center justify-content-center shadow-sm'
+                               + (f' {escape(css_classes)}"' if css_classes else '"')]
                 
             if style:
-                container_attrs.append(f'style="{style}"')
+                container_attrs.append(f'style="{escape(style)}"')
             if img_id:
-                container_attrs.append(f'id="{img_id}"')
+                container_attrs.append(f'id="{escape(img_id)}"')
                 
             attrs_str = ' ' + ' '.join(container_attrs) if container_attrs else ''
             
@@ -290,7 +359,7 @@ class UnifiedCoverManager:
             url_display = cover_info.url[:50] + ('...' if len(cover_info.url) > 50 else '')
             help_text = f'''
             <div class="form-text">
-                <small class="text-success">✅ Current cover: {url_display}</small>
+                <small class="text-success">✅ Current cover: {escape(url_display)}</small>
                 <br><small class="text-info">💡 Leave this field empty to keep the current cover, or enter a new URL to replace it</small>
             </div>'''
         else:
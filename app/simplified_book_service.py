@@ -165,6 +165,69 @@ class UserBookAnnotation:
     
     # Removed: ownership_status, media_type, location_id
     # Books are universal and stored at locations, not owned by users
+class ImportDedupIndex:
+    """In-memory duplicate-detection index for a single import session.
+
+    Preloaded with one catalog query so per-row duplicate checks are dictionary
+    lookups instead of Book scans, and kept current as the import creates books.
+    Matching mirrors find_book_by_isbn / find_book_by_title_author: exact ISBN
+    against the stored isbn13/isbn10 field, and lowercase title equality plus an
+    author name contained in (or containing) the requested author.
+    Books created outside this session after load() are not visible to it.
+    """
+
+    def __init__(self):
+        self.by_isbn13: Dict[str, str] = {}
+        self.by_isbn10: Dict[str, str] = {}
+        # lowercased title -> [(book_id, [lowercased author names])]
+        self.by_title: Dict[str, List[tuple]] = {}
+
+    @staticmethod
+    def _norm_isbn(isbn) -> str:
+        return ''.join(c for c in str(isbn or '').strip().upper() if c.isdigit() or c == 'X')
+
+    def load(self) -> 'ImportDedupIndex':
+        query = """
+        MATCH (b:Book)
+        OPTIONAL MATCH (b)<-[:AUTHORED {role: 'authored'}]-(p:Person)
+        RETURN b.id, b.isbn13, b.isbn10, b.title, collect(p.name)
+        """
+        result = safe_execute_kuzu_query(query, {}, operation="import_dedup_index_load")
+        # Read positionally: get_as_df() needs pandas and keys rows by 'b.id', not col_N
+        while result.has_next():
+            book_id, isbn13, isbn10, title, authors = result.get_next()
+            if book_id:
+                self.add(book_id, isbn13, isbn10, title, [a for a in (authors or []) if a])
+        return self
+
+    def add(self, book_id: str, isbn13: Optional[str], isbn10: Optional[str],
+            title: Optional[str], authors: Optional[List[str]] = None) -> None:
+        isbn13 = self._norm_isbn(isbn13)
+        isbn10 = self._norm_isbn(isbn10)
+        if len(isbn13) == 13:
+            self.by_isbn13.setdefault(isbn13, book_id)
+        if len(isbn10) == 10:
+            self.by_isbn10.setdefault(isbn10, book_id)
+        if title:
+            names = [str(a).lower() for a in (authors or []) if a]
+            self.by_title.setdefault(str(title).lower(), []).append((book_id, names))
+
+    def find_by_isbn(self, isbn: str) -> Optional[str]:
+        normalized_isbn = self._norm_isbn(isbn)
+        if len(normalized_isbn) == 13:
+            return self.by_isbn13.get(normalized_isbn)
+        if len(normalized_isbn) == 10:
+            return self.by_isbn10.get(normalized_isbn)
+        return None
+
+    def find_by_title_author(self, title: str, author: str) -> Optional[str]:
+        normalized_author = author.lower().strip()
+        for book_id, names in self.by_title.get(title.lower().strip(), ()):
+            if any(name in normalized_author or normalized_author in name for name in names):
+                return book_id
+        return None
+
+
 class SimplifiedBookService:
     """
     Simplified book service with clean separation:
@@ -176,6 +239,21 @@ class SimplifiedBookService:
         # Use global safe connection management instead of separate instance
         self.custom_field_service = KuzuCustomFieldService()
         # Using global safe_execute_kuzu_query for thread-safe database access
+        # Optional import-session duplicate index (see enable_import_dedup_index)
+        self.dedup_index: Optional[ImportDedupIndex] = None
+
+    def enable_import_dedup_index(self) -> bool:
+        """Preload an ImportDedupIndex so duplicate checks skip per-row Book scans.
+
+        Returns False (and keeps the query-based checks) if the preload fails.
+        """
+        try:
+            self.dedup_index = ImportDedupIndex().load()
+            return True
+        except Exception as e:
+            print(f"⚠️ [DEDUP_INDEX] Preload failed, using per-row queries: {e}")
+            self.dedup_index = None
+            return False
     
     def _convert_to_date(self, date_value):
         """Convert various date formats to a format suitable for KuzuDB DATE type."""
@@ -341,56 +419,59 @@ class SimplifiedBookService:
             final_cover_url = book_data.cover_url or ''
             if book_data.cover_url and book_data.cover_url.startswith('http'):
                 try:
-                    print(f"🖼️ [COVER_DOWNLOAD] Downloading cover for '{book_data.title}': {book_data.cover_url}")
-                    
-                    # Use persistent covers directory in data folder (same logic as book_routes.py)
-                    from pathlib import Path
-                    import requests  # type: ignore
+                    # Covers prefetched at scan time (and our own /covers/ URLs) are already stored
+                    from .services.cover_service import promote_cover_url
+                    promoted_cover_url = promote_cover_url(book_data.cover_url)
+                    if promoted_cover_url:
+                        print(f"🖼️ [COVER_DOWNLOAD] Using stored cover for '{book_data.title}': {promoted_cover_url}")
+                        final_cover_url = promoted_cover_url
+                    else:
+                        print(f"🖼️ [COVER_DOWNLOAD] Downloading cover for '{book_data.title}': {book_data.cover_url}")
                     
-                    covers_dir = Path('/app/data/covers')
+                        # Use persistent covers directory in data folder (same logic as book_routes.py)
+                        from pathlib import Path
+                        import requests  # type: ignore
                     
-                    # Fallback to local development path if Docker path doesn't exist
-                    if not covers_dir.exists():
-                        # Check for data directory from app config
-                        try:
-                            from flask import current_app
-                            data_dir = getattr(current_app.config, 'DATA_DIR', None)
-                            if data_dir:
-                                covers_dir = Path(data_dir) / 'covers'
-                            else:
-                                # Last resort - use relative path from app root
-                                base_dir = Path(__file__).parent.parent.parent
-                                covers_dir = base_dir / 'data' / 'covers'
-                        except:
-                            # If no Flask context available, use fallback
-                            covers_dir = Path('./data/covers')
+                        covers_dir = Path('/app/data/covers')
                     
-                    covers_dir.mkdir(parents=True, exist_ok=True)
+                        # Fallback to local development path if Docker path doesn't exist
+                        if not covers_dir.exists():
+                            # Check for data directory from app config
+                            try:
+                                from flask import current_app
+                                data_dir = getattr(current_app.config, 'DATA_DIR', None)
+                                if data_dir:
+                                    covers_dir = Path(data_dir) / 'covers'
+                                else:
+                                    # Last resort - use relative path from app root
+                                    base_dir = Path(__file__).parent.parent.parent
+                                    covers_dir = base_dir / 'data' / 'covers'
+                            except:
+                                # If no Flask context available, use fallback
+                                covers_dir = Path('./data/covers')
                     
-                    # Generate new filename with UUID
-                    book_temp_id = str(uuid.uuid4())
-                    file_extension = '.jpg'
-                    if book_data.cover_url.lower().endswith('.png'):
-                        file_extension = '.png'
-                    elif book_data.cover_url.lower().endswith('.gif'):
-                        file_extension = '.gif'
-                    elif book_data.cover_url.lower().endswith('.webp'):
-                        file_extension = '.webp'
+                        covers_dir.mkdir(parents=True, exist_ok=True)
                     
-                    filename = f"{book_temp_id}{file_extension}"
-                    filepath = covers_dir / filename
+                        file_extension = '.jpg'
+                        if book_data.cover_url.lower().endswith('.png'):
+                            file_extension = '.png'
+                        elif book_data.cover_url.lower().endswith('.gif'):
+                            file_extension = '.gif'
+                        elif book_data.cover_url.lower().endswith('.webp'):
+                            file_extension = '.webp'
                     
-                    # Download the image
-                    response = requests.get(book_data.cover_url, timeout=10, stream=True, 
-                                          headers={'User-Agent': 'Mozilla/5.0 (compatible; BookLibrary/1.0)'})
-                    response.raise_for_status()
+                        # Download the image
+                        response = requests.get(book_data.cover_url, timeout=10, stream=True, 
+                                              headers={'User-Agent': 'Mozilla/5.0 (compatible; BookLibrary/1.0)'})
+                        response.raise_for_status()
                     
-                    with open(filepath, 'wb') as f:
+                        image_data = bytearray()
                         for chunk in response.iter_content(chunk_size=8192):
-                            f.write(chunk)
+                            image_data.extend(chunk)
                     
-                    # Update the book node with the local cover URL
-                    final_cover_url = f"/covers/{filename}"
+                        # Content-addressed name: the same cover downloaded twice is stored once
+                        from .utils.image_processing import store_cover_bytes
+                        final_cover_url = store_cover_bytes(bytes(image_data), file_extension, covers_dir=covers_dir)
                     
                     # Update book record with local cover URL
                     update_cover_result = safe_execute_kuzu_query(
@@ -909,6 +990,8 @@ class SimplifiedBookService:
     
     def find_book_by_isbn(self, isbn: str) -> Optional[str]:
         """Find existing book by ISBN. Returns book_id if found."""
+        if self.dedup_index is not None:
+            return self.dedup_index.find_by_isbn(isbn)
         try:
             # Normalize ISBN: keep digits and the letter X (uppercase)
             normalized_isbn = ''.join(c for c in str(isbn).strip().upper() if c.isdigit() or c == 'X')
@@ -936,6 +1019,11 @@ class SimplifiedBookService:
 
     def find_book_by_title_author(self, title: str, author: str) -> Optional[str]:
         """Find existing book by exact title and author match. Returns book_id if found."""
+        if self.dedup_index is not None:
+            book_id = self.dedup_index.find_by_title_author(title, author)
+            if book_id:
+                print(f"🔍 [DUPLICATE] Found matching book: '{title}' by author containing '{author}'")
+            return book_id
         try:
             # Normalize title and author for comparison
             normalized_title = title.lower().strip()
@@ -1014,7 +1102,11 @@ class SimplifiedBookService:
                     raise BookAlreadyExistsError(existing_id, f"Book already exists: '{book_data.title}' by '{book_data.author}'")
             
             # Book doesn't exist, create new one
-            return await self.create_standalone_book(book_data)
+            book_id = await self.create_standalone_book(book_data)
+            if book_id and self.dedup_index is not None:
+                self.dedup_index.add(book_id, book_data.isbn13, book_data.isbn10,
+                                     book_data.title, [book_data.author] if book_data.author else [])
+            return book_id
             
         except BookAlreadyExistsError:
             # Re-raise duplicate error
@@ -26,10 +26,10 @@ import json
 import hashlib
 from pathlib import Path
 import time
-from typing import Dict, List, Tuple, Any
+from typing import Dict, List, Tuple, Any, Optional
 from datetime import datetime
 
-from app.utils.safe_kuzu_manager import get_safe_kuzu_manager
+from app.utils.safe_kuzu_manager import get_safe_kuzu_manager, read_catalog
 from app.migrations.runner import run_pending as run_additive_migrations
 
 logger = logging.getLogger(__name__)
@@ -151,6 +151,15 @@ def _load_master_schema() -> Dict[str, Any]:
     _SCHEMA_META["sha256"] = sha256
     return data
 
+def _read_catalog(conn) -> Optional[Dict[str, Dict[str, Any]]]:
+    """Catalog snapshot for the diff, or None to fall back to per-property probes."""
+    try:
+        return read_catalog(conn)
+    except Exception as e:
+        logger.debug(f"Schema preflight: catalog read failed, probing properties individually: {e}")
+        return None
+
+
 def _column_exists(conn, table: str, column: str) -> bool:
     """Return True if a property exists by attempting to project it.
 
@@ -168,17 +177,19 @@ def _column_exists(conn, table: str, column: str) -> bool:
         logger.debug(f"Schema preflight: ambiguous error probing {table}.{column}: {e}")
         return True
 
-def _detect_missing_columns(conn) -> List[Tuple[str, str, str]]:
+def _detect_missing_columns(conn, catalog: Optional[Dict[str, Dict[str, Any]]] = None) -> List[Tuple[str, str, str]]:
     schema = _load_master_schema()
     node_defs: Dict[str, Any] = schema.get("nodes", {})
     missing: List[Tuple[str, str, str]] = []
     for table, meta in node_defs.items():
         columns: Dict[str, str] = meta.get("columns", {})
         pk = meta.get("primary_key", "id")
+        existing = catalog.get(table, {}).get("properties", {}) if catalog is not None else None
         for col, col_type in columns.items():
             if col == pk:  # skip PK (cannot ALTER ADD)
                 continue
-            if not _column_exists(conn, table, col):
+            present = (col in existing) if existing is not None else _column_exists(conn, table, col)
+            if not present:
                 missing.append((table, col, col_type))
     return missing
 
@@ -207,19 +218,27 @@ def _relationship_property_exists(conn, rel_type: str, prop: str) -> bool:
         return True
 
 
-def _detect_relationship_changes(conn):
+def _detect_relationship_changes(conn, catalog: Optional[Dict[str, Dict[str, Any]]] = None):
     schema = _load_master_schema()
     rel_defs: Dict[str, Any] = schema.get("relationships", {})
     create_missing: List[str] = []
     add_props: List[Tuple[str, str, str]] = []
     for rel_type, meta in rel_defs.items():
-        exists = _relationship_table_exists(conn, rel_type)
+        entry = catalog.get(rel_type) if catalog is not None else None
+        if catalog is not None:
+            exists = entry is not None and entry.get("type") == "REL"
+        else:
+            exists = _relationship_table_exists(conn, rel_type)
         if not exists:
             create_missing.append(rel_type)
             continue
         props: Dict[str, str] = meta.get("properties", {})
         for prop, ptype in props.items():
-            if not _relationship_property_exists(conn, rel_type, prop):
+            if entry is not None:
+                present = prop in entry.get("properties", {})
+            else:
+                present = _relationship_property_exists(conn, rel_type, prop)
+            if not present:
                 add_props.append((rel_type, prop, ptype))
     return create_missing, add_props
 
@@ -348,10 +367,12 @@ def run_schema_preflight() -> None:
         create_rel: List[str] = []
         alter_rel_props: List[Tuple[str, str, str]] = []
 
+        # Read the catalog once and diff it in memory (no per-property probe queries)
+        catalog = _read_catalog(conn)
         if process_nodes:
-            missing_node_cols = _detect_missing_columns(conn)
+            missing_node_cols = _detect_missing_columns(conn, catalog)
         if process_rels:
-            create_rel, alter_rel_props = _detect_relationship_changes(conn)
+            create_rel, alter_rel_props = _detect_relationship_changes(conn, catalog)
 
         # Always evaluate migration runner (dry run) to see if additional additive changes needed
         mig_preview = run_additive_migrations(dry_run=True)
@@ -379,11 +400,14 @@ def run_schema_preflight() -> None:
                 f"Migration runner columns to add ({len(pending_migration_cols)}): " + ", ".join(f"Book.{c}" for c in pending_migration_cols)
             )
 
-        if os.getenv("SKIP_PREFLIGHT_BACKUP", "false").lower() not in ("1", "true", "yes"):
-            _create_backup_if_needed("pre_schema_upgrade")
-        else:
-            logger.info("Skipping automatic pre-upgrade backup per SKIP_PREFLIGHT_BACKUP")
+    # The backup quiesces the database until every connection is returned, so
+    # it must run after the detection connection above has been released
+    if os.getenv("SKIP_PREFLIGHT_BACKUP", "false").lower() not in ("1", "true", "yes"):
+        _create_backup_if_needed("pre_schema_upgrade")
+    else:
+        logger.info("Skipping automatic pre-upgrade backup per SKIP_PREFLIGHT_BACKUP")
 
+    with manager.get_connection(operation="schema_preflight") as conn:
         try:
             if missing_node_cols:
                 _apply_alter_statements(conn, missing_node_cols)
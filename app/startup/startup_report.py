@@ -0,0 +1,121 @@
+"""
+Cold-start timing for ``create_app``.
+
+Gunicorn recycles workers (``--max-requests``), so app construction time is
+paid again on every recycle. ``create_app`` calls ``StartupTimer.mark(<phase>)``
+after each step; the report (per-phase milliseconds and modules imported) is
+stored in ``app.config['STARTUP_REPORT']`` and served at
+``/admin/api/startup``. A warning with the slowest phases is logged when the
+total exceeds ``STARTUP_BUDGET_MS`` (default 2500).
+
+Set ``STARTUP_PROFILE_IMPORTS=true`` to also time every ``app.*`` module
+import (inclusive of the modules it imports) and list the slowest ones; for
+third-party imports use ``python -X importtime``.
+"""
+
+from __future__ import annotations
+
+import importlib.abc
+import logging
+import os
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+STARTUP_BUDGET_MS = float(os.getenv('STARTUP_BUDGET_MS', '2500'))
+PROFILE_IMPORTS = os.getenv('STARTUP_PROFILE_IMPORTS', 'false').lower() in ('1', 'true', 'yes', 'on')
+_TOP_IMPORTS = 15
+
+
+class _ImportTimer(importlib.abc.MetaPathFinder):
+    """Wraps the loaders of ``app.*`` modules to time their execution."""
+
+    def __init__(self, prefix: str = 'app'):
+        self.prefix = prefix
+        self.timings: Dict[str, float] = {}
+
+    def find_spec(self, fullname, path, target=None):
+        if fullname != self.prefix and not fullname.startswith(self.prefix + '.'):
+            return None
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, 'find_spec'):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+        loader = spec.loader
+        if loader is None or not hasattr(loader, 'exec_module'):
+            return spec
+        exec_module = loader.exec_module
+        timings = self.timings
+
+        def _timed_exec(module):
+            started = time.perf_counter()
+            try:
+                exec_module(module)
+            finally:
+                timings[fullname] = (time.perf_counter() - started) * 1000
+
+        loader.exec_module = _timed_exec  # type: ignore[method-assign]
+        return spec
+
+
+class StartupTimer:
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.phases: List[Dict[str, Any]] = []
+        self.finished_ms: Optional[float] = None
+        self._last_mark = self.started
+        self._last_modules = len(sys.modules)
+        self._import_timer: Optional[_ImportTimer] = None
+        if PROFILE_IMPORTS:
+            self._import_timer = _ImportTimer()
+            sys.meta_path.insert(0, self._import_timer)
+
+    def mark(self, name: str) -> None:
+        """Close the phase that started at the previous mark (or at construction)."""
+        now = time.perf_counter()
+        modules = len(sys.modules)
+        self.phases.append({
+            'phase': name,
+            'ms': round((now - self._last_mark) * 1000, 1),
+            'modules_imported': modules - self._last_modules,
+        })
+        self._last_mark, self._last_modules = now, modules
+
+    def finish(self) -> Dict[str, Any]:
+        """Stop timing (once) and return the report."""
+        if self.finished_ms is None:
+            self.finished_ms = round((time.perf_counter() - self.started) * 1000, 1)
+            if self._import_timer is not None:
+                try:
+                    sys.meta_path.remove(self._import_timer)
+                except ValueError:
+                    pass
+            if self.finished_ms > STARTUP_BUDGET_MS:
+                slow = sorted(self.phases, key=lambda p: p['ms'], reverse=True)[:5]
+                summary = ', '.join(f"{p['phase']}={p['ms']:.0f}ms" for p in slow)
+                logger.warning(f"[STARTUP] create_app took {self.finished_ms:.0f} ms "
+                               f"(budget {STARTUP_BUDGET_MS:.0f} ms); slowest: {summary}")
+        return self.report()
+
+    def report(self) -> Dict[str, Any]:
+        out: Dict[str, Any] = {
+            'pid': os.getpid(),
+            'total_ms': self.finished_ms,
+            'budget_ms': STARTUP_BUDGET_MS,
+            'over_budget': bool(self.finished_ms and self.finished_ms > STARTUP_BUDGET_MS),
+            'modules_loaded': len(sys.modules),
+            'phases': list(self.phases),
+        }
+        if self._import_timer is not None:
+            slowest = sorted(self._import_timer.timings.items(), key=lambda kv: kv[1], reverse=True)[:_TOP_IMPORTS]
+            out['slowest_app_imports'] = [{'module': m, 'ms': round(ms, 1)} for m, ms in slowest]
+        return out
+
+
+__all__ = ['StartupTimer', 'STARTUP_BUDGET_MS']
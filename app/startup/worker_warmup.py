@@ -0,0 +1,163 @@
+"""
+Gunicorn worker lifecycle: preload compatibility and warm-up.
+
+Workers are recycled every ``--max-requests``; without help each new worker
+opens Kùzu, instantiates services and compiles templates on its first
+requests. The hooks in ``gunicorn.conf.py`` call into this module:
+
+- ``GUNICORN_PRELOAD=true`` sets ``preload_app`` and ``MYBIBLIOTHECA_PRELOAD``.
+  ``create_app`` then runs once in the master (imports, schema preflight,
+  migrations) but hands its background threads to ``run_in_worker`` instead
+  of starting them, because threads do not survive ``fork()``.
+- ``pre_fork`` -> ``release_before_fork``: the master closes its Kùzu handle
+  so the worker can take the database file lock.
+- ``post_fork`` -> ``after_fork``: the worker starts the deferred services
+  and times each one (``create_app``'s startup report is already closed).
+- ``post_worker_init`` -> ``warm_worker``: before accepting traffic the worker
+  opens the database and prefetches hot read-only data (user count, system
+  config, category tree, locations, global custom fields) and compiles the
+  most used templates. Set ``WORKER_WARMUP=false`` to skip it.
+
+The warm-up report is kept in ``app.config['WORKER_WARMUP']`` and served with
+the startup report at ``/admin/api/startup``.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+PRELOAD_ENV = 'MYBIBLIOTHECA_PRELOAD'
+WARMUP_ENABLED = os.getenv('WORKER_WARMUP', 'true').lower() in ('1', 'true', 'yes', 'on')
+WARMUP_TEMPLATES = ('base.html', 'library_enhanced.html', 'view_book_enhanced.html', 'auth/login.html')
+
+# Recorded at import; a forked worker inherits the master's value
+_master_pid = os.getpid()
+_forked = False
+_deferred: List[Tuple[str, Callable[[], Any]]] = []
+_deferred_timings: List[Dict[str, Any]] = []
+
+
+def preloading() -> bool:
+    """True while running in a preloading gunicorn master (before any fork)."""
+    if _forked or os.getpid() != _master_pid:
+        return False
+    return os.getenv(PRELOAD_ENV, 'false').lower() in ('1', 'true', 'yes', 'on')
+
+
+def run_in_worker(name: str, fn: Callable[[], Any]) -> None:
+    """Run ``fn`` now, or after fork when the app is being preloaded."""
+    if preloading():
+        _deferred.append((name, fn))
+        logger.info(f"[WORKER] Deferred '{name}' until after fork")
+        return
+    fn()
+
+
+def release_before_fork() -> None:
+    """Master side: drop the Kùzu handle so workers can open the database."""
+    try:
+        from app.utils.safe_kuzu_manager import get_safe_kuzu_manager, is_safe_kuzu_initialized
+        if is_safe_kuzu_initialized():
+            get_safe_kuzu_manager().release_database(reason='pre_fork')
+    except Exception as e:
+        logger.warning(f"[WORKER] Could not release database before fork: {e}")
+
+
+def after_fork() -> None:
+    """Worker side: start the services the preloading master deferred."""
+    global _forked
+    _forked = True
+    for name, fn in _deferred:
+        started = time.perf_counter()
+        entry: Dict[str, Any] = {'step': name}
+        try:
+            fn()
+        except Exception as e:
+            entry['error'] = str(e)
+            logger.warning(f"[WORKER] Deferred '{name}' failed: {e}")
+        entry['ms'] = round((time.perf_counter() - started) * 1000, 1)
+        _deferred_timings.append(entry)
+
+
+def _warm_steps(app) -> List[Tuple[str, Callable[[], Any]]]:
+    def _kuzu():
+        from app.utils.safe_kuzu_manager import get_safe_kuzu_manager
+        return get_safe_kuzu_manager().execute_query("RETURN 1 AS ok")
+
+    def _user_count():
+        from app.services import user_service
+        return user_service.get_user_count_sync()
+
+    def _system_config():
+        from app.admin import load_system_config
+        return load_system_config()
+
+    def _categories():
+        from app.services import book_service
+        return len(book_service.list_all_categories_sync() or [])
+
+    def _locations():
+        from app.location_service import LocationService
+        return len(LocationService().get_all_locations() or [])
+
+    def _custom_fields():
+        from app.services import custom_field_service
+        return len(custom_field_service.get_available_fields_sync('', is_global=True) or [])
+
+    def _templates():
+        compiled = 0
+        for name in WARMUP_TEMPLATES:
+            try:
+                app.jinja_env.get_template(name)
+                compiled += 1
+            except Exception:
+                pass
+        return compiled
+
+    return [
+        ('kuzu', _kuzu),
+        ('user_count', _user_count),
+        ('system_config', _system_config),
+        ('categories', _categories),
+        ('locations', _locations),
+        ('custom_fields', _custom_fields),
+        ('templates', _templates),
+    ]
+
+
+def warm_worker(app) -> Dict[str, Any]:
+    """Prefetch hot read-only data into this worker; failures only cost the warm-up."""
+    report: Dict[str, Any] = {'pid': os.getpid(), 'enabled': WARMUP_ENABLED,
+                              'deferred': list(_deferred_timings), 'steps': []}
+    if app is None:
+        return report
+    if not WARMUP_ENABLED:
+        app.config['WORKER_WARMUP'] = report
+        return report
+    started = time.perf_counter()
+    with app.app_context():
+        for name, step in _warm_steps(app):
+            step_started = time.perf_counter()
+            entry: Dict[str, Any] = {'step': name}
+            try:
+                result = step()
+                if isinstance(result, int) and not isinstance(result, bool):
+                    entry['items'] = result
+            except Exception as e:
+                entry['error'] = str(e)
+            entry['ms'] = round((time.perf_counter() - step_started) * 1000, 1)
+            report['steps'].append(entry)
+    report['total_ms'] = round((time.perf_counter() - started) * 1000, 1)
+    app.config['WORKER_WARMUP'] = report
+    failed = [s['step'] for s in report['steps'] if 'error' in s]
+    logger.info(f"[WORKER] Warm-up finished in {report['total_ms']:.0f} ms"
+                + (f" (failed: {', '.join(failed)})" if failed else ""))
+    return report
+
+
+__all__ = ['preloading', 'run_in_worker', 'release_before_fork', 'after_fork', 'warm_worker']
@@ -13,6 +13,8 @@ _CANDIDATE_CACHE_MAX_ENTRIES = int((_os_cover_debug.getenv('COVER_CANDIDATE_CACH
 
 _BEST_COVER_CACHE: OrderedDict[str, Tuple[float, dict]] = OrderedDict()
 _COVER_CANDIDATE_CACHE: OrderedDict[str, Tuple[float, List[dict]]] = OrderedDict()
+# Both caches are backed by the shared on-disk cache so restarts/other workers skip provider lookups
+_PERSIST_MAX_ENTRIES = int((_os_cover_debug.getenv('COVER_PERSIST_MAX') or '20000'))
 
 # Verbose flag for cover & search debug (ENV: VERBOSE, IMPORT_VERBOSE, COVER_VERBOSE)
 _COVER_VERBOSE = (
@@ -61,19 +63,31 @@ def _normalized_cover_key(isbn: Optional[str], title: Optional[str], author: Opt
     ])
 
 
+def _persistent_cache():
+    from app.utils.persistent_cover_cache import persistent_cover_cache
+    return persistent_cover_cache
+
+
 def _best_cache_get(cache_key: str) -> Optional[dict]:
     entry = _BEST_COVER_CACHE.get(cache_key)
-    if not entry:
-        return None
-    ts, payload = entry
-    if _time.time() - ts > _BEST_CACHE_TTL_SECONDS:
+    if entry:
+        ts, payload = entry
+        if _time.time() - ts <= _BEST_CACHE_TTL_SECONDS:
+            try:
+                _BEST_COVER_CACHE.move_to_end(cache_key)
+            except Exception:
+                pass
+            return payload
         _BEST_COVER_CACHE.pop(cache_key, None)
+    if _BEST_CACHE_MAX_ENTRIES <= 0:
         return None
-    try:
-        _BEST_COVER_CACHE.move_to_end(cache_key)
-    except Exception:
-        pass
-    return payload
+    from app.utils.persistent_cover_cache import NS_BEST
+    payload = _persistent_cache().get(NS_BEST, cache_key, _BEST_CACHE_TTL_SECONDS)
+    if isinstance(payload, dict):
+        _BEST_COVER_CACHE[cache_key] = (_time.time(), payload)
+        _purge_ordered_dict(_BEST_COVER_CACHE, _BEST_CACHE_TTL_SECONDS, _BEST_CACHE_MAX_ENTRIES)
+        return payload
+    return None
 
 
 def _best_cache_set(cache_key: str, value: dict) -> None:
@@ -81,6 +95,8 @@ def _best_cache_set(cache_key: str, value: dict) -> None:
         return
     _BEST_COVER_CACHE[cache_key] = (_time.time(), value)
     _purge_ordered_dict(_BEST_COVER_CACHE, _BEST_CACHE_TTL_SECONDS, _BEST_CACHE_MAX_ENTRIES)
+    from app.utils.persistent_cover_cache import NS_BEST
+    _persistent_cache().set(NS_BEST, cache_key, value, max_entries=_PERSIST_MAX_ENTRIES, ttl=_BEST_CACHE_TTL_SECONDS)
 
 
 def _candidate_cache_key(isbn: Optional[str], title: Optional[str], author: Optional[str]) -> str:
@@ -92,17 +108,22 @@ def _candidate_cache_get(isbn: Optional[str], title: Optional[str], author: Opti
         return None
     key = _candidate_cache_key(isbn, title, author)
     entry = _COVER_CANDIDATE_CACHE.get(key)
-    if not entry:
-        return None
-    ts, payload = entry
-    if _time.time() - ts > _CANDIDATE_CACHE_TTL_SECONDS:
+    if entry:
+        ts, payload = entry
+        if _time.time() - ts <= _CANDIDATE_CACHE_TTL_SECONDS:
+            try:
+                _COVER_CANDIDATE_CACHE.move_to_end(key)
+            except Exception:
+                pass
+            return [candidate.copy() for candidate in payload]
         _COVER_CANDIDATE_CACHE.pop(key, None)
-        return None
-    try:
-        _COVER_CANDIDATE_CACHE.move_to_end(key)
-    except Exception:
-        pass
-    return [candidate.copy() for candidate in payload]
+    from app.utils.persistent_cover_cache import NS_CANDIDATES
+    payload = _persistent_cache().get(NS_CANDIDATES, key, _CANDIDATE_CACHE_TTL_SECONDS)
+    if isinstance(payload, list):
+        _COVER_CANDIDATE_CACHE[key] = (_time.time(), payload)
+        _purge_ordered_dict(_COVER_CANDIDATE_CACHE, _CANDIDATE_CACHE_TTL_SECONDS, _CANDIDATE_CACHE_MAX_ENTRIES)
+        return [candidate.copy() for candidate in payload]
+    return None
 
 
 def _candidate_cache_set(isbn: Optional[str], title: Optional[str], author: Optional[str], candidates: List[dict]) -> None:
@@ -111,6 +132,8 @@ def _candidate_cache_set(isbn: Optional[str], title: Optional[str], author: Opti
     key = _candidate_cache_key(isbn, title, author)
     _COVER_CANDIDATE_CACHE[key] = (_time.time(), [candidate.copy() for candidate in candidates])
     _purge_ordered_dict(_COVER_CANDIDATE_CACHE, _CANDIDATE_CACHE_TTL_SECONDS, _CANDIDATE_CACHE_MAX_ENTRIES)
+    from app.utils.persistent_cover_cache import NS_CANDIDATES
+    _persistent_cache().set(NS_CANDIDATES, key, candidates, max_entries=_PERSIST_MAX_ENTRIES, ttl=_CANDIDATE_CACHE_TTL_SECONDS)
 
 # --- Google Cover Utilities ---
 _GOOGLE_SIZE_ORDER = ['extraLarge','large','medium','small','thumbnail','smallThumbnail']
@@ -1039,13 +1062,79 @@ def get_google_books_cover(isbn, fetch_title_author=False):
         print(f"❌ [GOOGLE_BOOKS] Unexpected error for ISBN {isbn}: {e}")
         return None
 
+# Bump when render_month_review_png's output changes
+MONTH_REVIEW_RENDER_VERSION = 1
+MONTH_REVIEW_CACHE_MAX = int(os.getenv('MONTH_REVIEW_CACHE_MAX', '500'))
+
+
+def month_review_cache_key(books, month, year):
+    """Input hash for a month review; any change to the listed books yields a new key."""
+    from app.utils.rendered_image_cache import render_key
+    payload = {'month': int(month), 'year': int(year), 'books': [dict(book) for book in books]}
+    return render_key('month_review', payload, MONTH_REVIEW_RENDER_VERSION)
+
+
+def get_cached_month_review(key):
+    """Path of an already rendered month review PNG, or None."""
+    from app.utils.rendered_image_cache import rendered_image_cache
+    return rendered_image_cache.get('month_review', key, '.png')
+
+
+def render_month_review_to_cache(books, month, year, key=None):
+    """Render a month review in the CPU pool and store it; returns the PNG bytes.
+
+    Used directly and as the body of the background job started by
+    ``start_month_review_job``.
+    """
+    from app.utils.cpu_pool import run_cpu_bound
+    from app.utils.rendered_image_cache import rendered_image_cache
+    books = [dict(book) for book in books]
+    key = key or month_review_cache_key(books, month, year)
+    data = run_cpu_bound(render_month_review_png, books, month, year)
+    rendered_image_cache.put('month_review', key, '.png', data, max_files=MONTH_REVIEW_CACHE_MAX)
+    return data
+
+
+def start_month_review_job(books, month, year, user_id=None, key=None):
+    """Queue a background render unless one for the same inputs is already active.
+
+    Returns the job id (``month_review:<key>``). Raises JobQueueFull when the
+    scheduler is saturated.
+    """
+    from app.services.job_scheduler import PRIORITY_INTERACTIVE, job_scheduler
+    books = [dict(book) for book in books]
+    key = key or month_review_cache_key(books, month, year)
+    job_id = f"month_review:{key}"
+    if not job_scheduler.is_active(job_id):
+        job_scheduler.submit(
+            render_month_review_to_cache, books, month, year, key=key,
+            priority=PRIORITY_INTERACTIVE, user_id=user_id, job_id=job_id, name='month_review',
+        )
+    return job_id
+
+
 def generate_month_review_image(books, month, year):
     """
     Generate a monthly reading review image showing books read in the given month.
+
+    ``books`` are plain dicts (title, authors, page_count); rendering runs in the
+    shared CPU pool, results are cached by input hash and the PNG is returned as
+    a BytesIO.
     """
     if not books:
         return None
-    
+    key = month_review_cache_key(books, month, year)
+    cached = get_cached_month_review(key)
+    if cached is not None:
+        try:
+            return BytesIO(cached.read_bytes())
+        except OSError:
+            pass
+    return BytesIO(render_month_review_to_cache(books, month, year, key=key))
+
+
+def render_month_review_png(books, month, year) -> bytes:
+    """Render the month review PNG bytes (no app context; runs in the CPU pool)."""
     # Image dimensions
     width = 1200
     height = 800
@@ -1132,9 +1221,7 @@ def generate_month_review_image(books, month, year):
     # Convert to bytes for return
     img_buffer = BytesIO()
     img.save(img_buffer, format='PNG', quality=95)
-    img_buffer.seek(0)
-    
-    return img_buffer
+    return img_buffer.getvalue()
 
 
 def normalize_goodreads_value(value, field_type='text'):
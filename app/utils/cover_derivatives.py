@@ -0,0 +1,189 @@
+"""
+Responsive cover derivatives.
+
+Every stored cover (``/covers/<name>``) can be served at a few fixed widths in
+modern formats so grids do not download 1200px originals:
+
+    /covers/derived/<stem>-<width>w.<ext>     ext in avif | webp | jpg
+
+WebP and JPEG derivatives are written when a cover is stored; anything missing
+(older covers, AVIF) is generated lazily on first request by ``serve_covers``.
+Templates get matching ``srcset`` values from ``UnifiedCoverManager``.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import re
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from PIL import Image, ImageOps, features
+
+from app.utils.paths import atomic_write
+
+logger = logging.getLogger(__name__)
+
+DERIVED_DIRNAME = 'derived'
+DERIVATIVE_WIDTHS: Tuple[int, ...] = (160, 320, 640)
+
+# ext -> (Pillow format, MIME type, save kwargs)
+_FORMATS: Dict[str, Tuple[str, str, dict]] = {
+    'avif': ('AVIF', 'image/avif', {'quality': 55, 'speed': 8}),
+    'webp': ('WEBP', 'image/webp', {'quality': 80, 'method': 4}),
+    'jpg': ('JPEG', 'image/jpeg', {'quality': 82, 'optimize': True, 'progressive': True}),
+}
+
+_ORIGINAL_EXTS = ('.jpg', '.jpeg', '.png', '.webp', '.gif')
+_DERIVED_RE = re.compile(r'^(?P<stem>[A-Za-z0-9_.-]+)-(?P<width>\d+)w\.(?P<ext>avif|webp|jpg)$')
+_LOCAL_COVER_RE = re.compile(r'^/covers/(?P<name>[A-Za-z0-9_.-]+\.(?:jpg|jpeg|png|webp|gif))(?:\?.*)?$', re.IGNORECASE)
+
+
+def _format_supported(ext: str) -> bool:
+    if ext == 'jpg':
+        return True
+    try:
+        return bool(features.check(ext))
+    except Exception:
+        return False
+
+
+def derivatives_enabled() -> bool:
+    return os.getenv('COVER_DERIVATIVES', 'true').lower() not in ('0', 'false', 'no', 'off')
+
+
+def supported_formats() -> List[str]:
+    """Derivative formats this Pillow build can encode, best first (JPEG always last)."""
+    return [ext for ext in ('avif', 'webp', 'jpg') if _format_supported(ext)]
+
+
+def mime_type(ext: str) -> str:
+    return _FORMATS[ext][1]
+
+
+def local_cover_name(url: Optional[str]) -> Optional[str]:
+    """Filename of a processed local cover (``/covers/<name>``), or None for remote/derived URLs."""
+    if not url or not isinstance(url, str):
+        return None
+    match = _LOCAL_COVER_RE.match(url.strip())
+    return match.group('name') if match else None
+
+
+def derivative_filename(original_name: str, width: int, ext: str) -> str:
+    return f"{Path(original_name).stem}-{width}w.{ext}"
+
+
+def derivative_url(original_name: str, width: int, ext: str) -> str:
+    return f"/covers/{DERIVED_DIRNAME}/{derivative_filename(original_name, width, ext)}"
+
+
+def srcset_for(original_name: str, ext: str) -> str:
+    return ', '.join(f"{derivative_url(original_name, w, ext)} {w}w" for w in DERIVATIVE_WIDTHS)
+
+
+def _find_original(covers_dir: Path, stem: str) -> Optional[Path]:
+    for ext in _ORIGINAL_EXTS:
+        candidate = covers_dir / f"{stem}{ext}"
+        if candidate.is_file():
+            return candidate
+    return None
+
+
+def _encode(img: Image.Image, width: int, ext: str, target: Path) -> None:
+    pil_format, _mime, save_kwargs = _FORMATS[ext]
+    resized = ImageOps.contain(img, (width, width * 3), Image.Resampling.LANCZOS) if img.width > width else img
+    if ext == 'jpg':
+        if resized.mode in ('RGBA', 'LA') or (resized.mode == 'P' and 'transparency' in resized.info):
+            rgba = resized.convert('RGBA')
+            background = Image.new('RGB', rgba.size, (255, 255, 255))
+            background.paste(rgba, mask=rgba.split()[-1])
+            resized = background
+        elif resized.mode != 'RGB':
+            resized = resized.convert('RGB')
+    elif resized.mode not in ('RGB', 'RGBA'):
+        resized = resized.convert('RGBA' if 'transparency' in resized.info else 'RGB')
+    # Write atomically so concurrent lazy requests never serve a half-written file
+    with atomic_write(target, 'wb') as fh:
+        resized.save(fh, format=pil_format, **save_kwargs)
+
+
+def generate_derivatives(original: Path, formats: Optional[Iterable[str]] = None,
+                         widths: Iterable[int] = DERIVATIVE_WIDTHS) -> List[Path]:
+    """Write missing derivatives of ``original`` for the given formats/widths."""
+    formats = [f for f in (formats or ('webp', 'jpg')) if _format_supported(f)]
+    derived_dir = original.parent / DERIVED_DIRNAME
+    written: List[Path] = []
+    todo = [(w, ext, derived_dir / derivative_filename(original.name, w, ext)) for ext in formats for w in widths]
+    todo = [item for item in todo if not item[2].exists()]
+    if not todo:
+        return written
+    with Image.open(original) as img:
+        img.load()
+        for width, ext, target in todo:
+            try:
+                _encode(img, width, ext, target)
+                written.append(target)
+            except Exception as e:
+                logger.warning(f"[COVER][DERIVED] Failed {target.name}: {e}")
+    return written
+
+
+def ensure_derivative(covers_dir: Path, derived_name: str) -> Optional[Path]:
+    """Return the path of ``derived/<derived_name>``, generating it from the original if needed.
+
+    Only the configured widths and supported formats are accepted, so arbitrary
+    URLs cannot be used to make the server encode unbounded variants.
+    """
+    match = _DERIVED_RE.match(derived_name)
+    if not match:
+        return None
+    width, ext = int(match.group('width')), match.group('ext')
+    if width not in DERIVATIVE_WIDTHS or not _format_supported(ext):
+        return None
+    target = covers_dir / DERIVED_DIRNAME / derived_name
+    if target.is_file():
+        return target
+    original = _find_original(covers_dir, match.group('stem'))
+    if original is None:
+        return None
+    try:
+        with Image.open(original) as img:
+            img.load()
+            _encode(img, width, ext, target)
+    except Exception as e:
+        logger.warning(f"[COVER][DERIVED] Lazy generation failed for {derived_name}: {e}")
+        return None
+    return target
+
+
+def remove_derivatives(original: Path) -> int:
+    """Delete all derivatives of an original cover; returns the number removed."""
+    derived_dir = original.parent / DERIVED_DIRNAME
+    removed = 0
+    if not derived_dir.is_dir():
+        return removed
+    for candidate in derived_dir.glob(f"{original.stem}-*w.*"):
+        match = _DERIVED_RE.match(candidate.name)
+        if match and match.group('stem') == original.stem:
+            try:
+                candidate.unlink()
+                removed += 1
+            except OSError:
+                pass
+    return removed
+
+
+__all__ = [
+    'DERIVATIVE_WIDTHS',
+    'DERIVED_DIRNAME',
+    'derivatives_enabled',
+    'supported_formats',
+    'mime_type',
+    'local_cover_name',
+    'derivative_url',
+    'srcset_for',
+    'generate_derivatives',
+    'ensure_derivative',
+    'remove_derivatives',
+]
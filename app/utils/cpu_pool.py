@@ -0,0 +1,158 @@
+"""
+Shared process pool for CPU-bound image work.
+
+Pillow resizing/encoding, placeholder and month-review rendering and OCR
+preprocessing used to run in the request thread, holding the GIL for hundreds
+of milliseconds per image and stalling every other request on the worker.
+They now run in a small process pool shared by the whole worker process.
+
+- ``run_cpu_bound(fn, *args)`` blocks the caller (not the worker) until done.
+- ``await run_cpu_bound_async(fn, *args)`` is the asyncio flavour.
+- At most ``CPU_POOL_MAX_PENDING`` tasks are in flight; callers wait up to
+  ``CPU_POOL_WAIT`` seconds for a slot and then get ``CpuPoolBusy``.
+- ``CPU_POOL_WORKERS=0`` (or a broken pool) runs the function inline.
+
+Functions submitted must be module-level and take/return picklable values
+(bytes, paths, plain dicts) because they execute in another process.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+CPU_POOL_WORKERS = int(os.getenv('CPU_POOL_WORKERS', str(min(2, os.cpu_count() or 1))))
+CPU_POOL_MAX_PENDING = int(os.getenv('CPU_POOL_MAX_PENDING', str(max(1, CPU_POOL_WORKERS) * 4)))
+CPU_POOL_WAIT_SECONDS = float(os.getenv('CPU_POOL_WAIT', '10'))
+CPU_POOL_TIMEOUT_SECONDS = float(os.getenv('CPU_POOL_TIMEOUT', '120'))
+# spawn avoids inheriting locks/threads from a multi-threaded worker; override with fork/forkserver
+CPU_POOL_START_METHOD = os.getenv('CPU_POOL_START_METHOD', 'spawn')
+
+
+class CpuPoolBusy(RuntimeError):
+    """Raised when no pool slot frees up within the wait budget."""
+
+
+class CpuPool:
+    """Lazily started, fork-aware ProcessPoolExecutor with bounded in-flight work."""
+
+    def __init__(self, workers: int = CPU_POOL_WORKERS, max_pending: int = CPU_POOL_MAX_PENDING):
+        self.workers = max(0, workers)
+        self.max_pending = max(1, max_pending)
+        self._lock = threading.Lock()
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._pid: Optional[int] = None
+        self._slots = threading.BoundedSemaphore(self.max_pending)
+        self._stats = {'submitted': 0, 'inline': 0, 'rejected': 0, 'failed': 0}
+
+    @property
+    def enabled(self) -> bool:
+        return self.workers > 0
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None or self._pid != os.getpid():
+                # After a fork the parent's executor is unusable in the child; start fresh
+                self._slots = threading.BoundedSemaphore(self.max_pending)
+                ctx = multiprocessing.get_context(CPU_POOL_START_METHOD)
+                self._executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=ctx)
+                self._pid = os.getpid()
+            return self._executor
+
+    def _reset(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            try:
+                executor.shutdown(wait=False, cancel_futures=True)
+            except Exception:
+                pass
+
+    def submit(self, fn: Callable[..., Any], *args: Any, wait: Optional[float] = None, **kwargs: Any) -> Future:
+        """Queue ``fn`` in the pool, waiting up to ``wait`` seconds for a free slot."""
+        executor = self._get_executor()
+        slots = self._slots
+        timeout = CPU_POOL_WAIT_SECONDS if wait is None else wait
+        if not slots.acquire(timeout=max(0.0, timeout)):
+            self._stats['rejected'] += 1
+            raise CpuPoolBusy(f"Image processing is busy ({self.max_pending} tasks in flight); try again shortly")
+        try:
+            future = executor.submit(fn, *args, **kwargs)
+        except Exception:
+            slots.release()
+            raise
+        future.add_done_callback(lambda _f: slots.release())
+        self._stats['submitted'] += 1
+        return future
+
+    def run(self, fn: Callable[..., Any], *args: Any, timeout: Optional[float] = None,
+            wait: Optional[float] = None, **kwargs: Any) -> Any:
+        """Run ``fn`` in the pool and return its result (inline if the pool is disabled or broken)."""
+        if not self.enabled:
+            self._stats['inline'] += 1
+            return fn(*args, **kwargs)
+        try:
+            future = self.submit(fn, *args, wait=wait, **kwargs)
+            return future.result(timeout=CPU_POOL_TIMEOUT_SECONDS if timeout is None else timeout)
+        except BrokenProcessPool as e:
+            # A child died (OOM, segfault in a codec); rebuild the pool and do this one inline
+            logger.warning(f"[CPU_POOL] Pool broken, restarting: {e}")
+            self._stats['failed'] += 1
+            self._reset()
+            self._stats['inline'] += 1
+            return fn(*args, **kwargs)
+
+    async def run_async(self, fn: Callable[..., Any], *args: Any, wait: Optional[float] = None, **kwargs: Any) -> Any:
+        if not self.enabled:
+            self._stats['inline'] += 1
+            return await asyncio.to_thread(fn, *args, **kwargs)
+        # Waiting for a slot blocks, so do it off the event loop
+        future = await asyncio.to_thread(self.submit, fn, *args, wait=wait, **kwargs)
+        return await asyncio.wrap_future(future)
+
+    def stats(self) -> Dict[str, Any]:
+        in_flight = self.max_pending - getattr(self._slots, '_value', self.max_pending)
+        return {
+            'workers': self.workers,
+            'max_pending': self.max_pending,
+            'in_flight': in_flight,
+            'started': self._executor is not None and self._pid == os.getpid(),
+            **self._stats,
+        }
+
+    def shutdown(self) -> None:
+        self._reset()
+
+
+# Global instance shared by image processing call sites
+cpu_pool = CpuPool()
+
+
+def get_cpu_pool() -> CpuPool:
+    return cpu_pool
+
+
+def run_cpu_bound(fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    return cpu_pool.run(fn, *args, **kwargs)
+
+
+async def run_cpu_bound_async(fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    return await cpu_pool.run_async(fn, *args, **kwargs)
+
+
+__all__ = [
+    'CpuPool',
+    'CpuPoolBusy',
+    'cpu_pool',
+    'get_cpu_pool',
+    'run_cpu_bound',
+    'run_cpu_bound_async',
+]
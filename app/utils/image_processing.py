@@ -1,18 +1,23 @@
 from __future__ import annotations
 
+import contextlib
 from io import BytesIO
+import hashlib
 import ipaddress
+import os
 import socket
 import time
 from urllib.parse import urlparse
 from pathlib import Path
-import uuid
 from typing import Any, Dict, Optional
 
 import requests
 from PIL import Image, ImageOps
 from flask import current_app
 
+from app.utils.cover_derivatives import derivatives_enabled, generate_derivatives
+from app.utils.cpu_pool import run_cpu_bound
+from app.utils.paths import atomic_write
 
 MAX_REMOTE_IMAGE_BYTES = 5 * 1024 * 1024  # 5MB safety ceiling
 
@@ -106,29 +111,75 @@ def ensure_safe_remote_image_url(url: str) -> str:
     return url
 
 
-def process_image_bytes_and_store(image_bytes: bytes, filename_hint: str | None = None) -> str:
-    """Process image bytes with LANCZOS resampling and store into covers dir.
+def store_cover_bytes(data: bytes, ext: str, covers_dir: Optional[Path] = None) -> str:
+    """Store encoded cover bytes content-addressed and return "/covers/<sha256><ext>".
+
+    Identical bytes map to the same file, so re-importing or re-downloading a
+    cover reuses the existing file instead of writing another copy. Files may
+    therefore be shared; release them via ``cover_storage.release_cover_file``.
+    """
+    ext = ext if ext.startswith('.') else f".{ext}"
+    filename = f"{hashlib.sha256(data).hexdigest()}{ext.lower()}"
+    covers_dir = covers_dir or get_covers_dir()
+    out_path = covers_dir / filename
+    if not out_path.exists():
+        with atomic_write(out_path, 'wb') as fh:
+            fh.write(data)
+    else:
+        # Refresh mtime so the orphan sweep's grace period covers a just-staged reuse
+        try:
+            os.utime(out_path, None)
+        except OSError:
+            pass
+    return f"/covers/{filename}"
+
 
-    Returns the relative URL like "/covers/<uuid>.jpg|.png".
+def encode_cover_image(image_bytes: bytes) -> tuple[bytes, str]:
+    """Resize (LANCZOS) and encode a cover; returns (encoded bytes, extension).
+
+    Pure CPU work with no app context, so it can run in the shared process pool.
     """
-    covers_dir = get_covers_dir()
     with Image.open(BytesIO(image_bytes)) as img:
         out_fmt, out_ext = _choose_format(img.mode, img.format)
         img_resized = _resize_high_quality(img)
         img_prepared = _prepare_image(img_resized, out_fmt)
 
-        filename = f"{uuid.uuid4()}{out_ext}"
-        out_path = covers_dir / filename
-
         save_kwargs = {}
         if out_fmt == 'JPEG':
             save_kwargs.update(dict(quality=92, optimize=True, progressive=True, subsampling=0))
         elif out_fmt == 'PNG':
             save_kwargs.update(dict(optimize=True))
 
-        img_prepared.save(out_path, format=out_fmt, **save_kwargs)
+        buffer = BytesIO()
+        img_prepared.save(buffer, format=out_fmt, **save_kwargs)
+    return buffer.getvalue(), out_ext
 
-    return f"/covers/{filename}"
+
+def process_image_bytes_and_store(image_bytes: bytes, filename_hint: str | None = None,
+                                  cpu_slots: Optional[Any] = None) -> str:
+    """Process image bytes with LANCZOS resampling and store into covers dir.
+
+    Returns the relative URL like "/covers/<sha256>.jpg|.png"; the name is the
+    hash of the normalized output, so the same image is only stored once.
+    Decoding/encoding runs in the shared CPU pool, off the request thread.
+    ``cpu_slots`` (a semaphore) is held around each pool submission so bulk
+    callers can leave pool capacity for interactive requests.
+    """
+    gate = cpu_slots if cpu_slots is not None else contextlib.nullcontext()
+    with gate:
+        encoded, out_ext = run_cpu_bound(encode_cover_image, image_bytes)
+    url = store_cover_bytes(encoded, out_ext)
+    filename = url.rsplit('/', 1)[-1]
+
+    # Grid-sized WebP/JPEG variants up front; AVIF and anything missing are made on first request
+    if derivatives_enabled():
+        try:
+            with gate:
+                run_cpu_bound(generate_derivatives, get_covers_dir() / filename)
+        except Exception as e:
+            current_app.logger.warning(f"[COVER][DERIVED] Could not pre-generate derivatives for {filename}: {e}")
+
+    return url
 
 
 def process_image_from_url(
@@ -136,6 +187,7 @@ def process_image_from_url(
     *,
     auth: Optional[Any] = None,
     headers: Optional[Dict[str, str]] = None,
+    cpu_slots: Optional[Any] = None,
 ) -> str:
     """Download image from URL, process and store, return relative URL.
 
@@ -199,7 +251,7 @@ def process_image_from_url(
             raise ValueError("Remote image download exceeded maximum allowed size")
     copy_time = time.perf_counter() - copy_start
     proc_start = time.perf_counter()
-    out_url = process_image_bytes_and_store(buf.getvalue())
+    out_url = process_image_bytes_and_store(buf.getvalue(), cpu_slots=cpu_slots)
     proc_time = time.perf_counter() - proc_start
     total_time = time.perf_counter() - start_total
     current_app.logger.info(
@@ -0,0 +1,289 @@
+"""
+Durable Import Job Store for MyBibliotheca
+
+Persists import job snapshots as JSON files under data/import_jobs/ so that
+progress, per-row checkpoints and the uploaded source file survive gunicorn
+worker recycles and container restarts.
+
+Key Features:
+- One JSON document per job, written atomically (temp file + os.replace)
+  under a per-job advisory file lock shared by all workers
+- Source CSVs are moved next to the job so a resume can re-read them
+- Heartbeat-based detection of jobs whose worker went away ("interrupted")
+- Readable from any worker process, so progress polling works across workers
+"""
+
+import contextlib
+import json
+import logging
+import os
+import re
+import shutil
+import socket
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from app.utils.paths import resolve_data_dir, write_json_atomic
+
+logger = logging.getLogger(__name__)
+
+# A running job that has not written a heartbeat for this long is treated as interrupted.
+STALE_AFTER_SECONDS = int(os.getenv('IMPORT_JOB_STALE_SECONDS', '300'))
+
+ACTIVE_STATUSES = ('pending', 'running', 'cancelling')
+TERMINAL_STATUSES = ('completed', 'failed', 'cancelled')
+
+_TASK_ID_RE = re.compile(r'^[A-Za-z0-9_-]{1,128}$')
+
+
+def _parse_iso(value: Any) -> Optional[datetime]:
+    if not value or not isinstance(value, str):
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+class ImportJobStore:
+    """
+    File-backed store for import job snapshots.
+
+    All methods swallow I/O errors and log them; the in-memory job manager
+    remains the source of truth for a running job, this store is what
+    survives the process.
+    """
+
+    def __init__(self, base_dir: Optional[Path] = None):
+        self._base_dir = Path(base_dir) if base_dir else None
+        self._lock = threading.RLock()
+
+    @property
+    def base_dir(self) -> Path:
+        base = self._base_dir or (resolve_data_dir() / 'import_jobs')
+        base.mkdir(parents=True, exist_ok=True)
+        return base
+
+    def _job_path(self, task_id: str) -> Optional[Path]:
+        if not task_id or not _TASK_ID_RE.match(str(task_id)):
+            logger.warning(f"Refusing unsafe import task id: {task_id!r}")
+            return None
+        return self.base_dir / f"{task_id}.json"
+
+    @contextlib.contextmanager
+    def _locked(self, path: Path):
+        """In-process lock plus an advisory file lock on the job, shared with other workers."""
+        with self._lock:
+            fh = open(path.with_suffix('.lock'), 'w')
+            try:
+                try:
+                    import fcntl  # type: ignore
+                    fcntl.flock(fh.fileno(), fcntl.LOCK_EX)
+                except Exception:
+                    pass
+                yield
+            finally:
+                try:
+                    import fcntl  # type: ignore
+                    fcntl.flock(fh.fileno(), fcntl.LOCK_UN)
+                except Exception:
+                    pass
+                fh.close()
+
+    def _read(self, path: Path) -> Optional[dict]:
+        if not path.exists():
+            return None
+        with open(path, 'r', encoding='utf-8') as fh:
+            data = json.load(fh)
+        return data if isinstance(data, dict) else None
+
+    def save(self, task_id: str, job: dict) -> bool:
+        """Atomically write the job snapshot.
+
+        A cancellation requested through another worker (``update``) is kept:
+        the owner's next snapshot would otherwise overwrite it. ``job`` is
+        updated in place so the owner sees the flag.
+        """
+        path = self._job_path(task_id)
+        if path is None:
+            return False
+        try:
+            with self._locked(path):
+                try:
+                    current = self._read(path)
+                except Exception:
+                    current = None
+                if current and current.get('cancelled') and not job.get('cancelled'):
+                    job['cancelled'] = True
+                write_json_atomic(path, job, default=str)
+            return True
+        except Exception as e:
+            logger.error(f"Failed to persist import job {task_id}: {e}")
+            return False
+
+    def update(self, task_id: str, updates: dict, user_id: Optional[str] = None) -> Optional[dict]:
+        """Merge ``updates`` into the persisted job under the job lock.
+
+        For jobs held by another worker: the read, merge and write happen
+        atomically with respect to every other writer. Returns the merged job,
+        or None if it is missing, belongs to someone else, or the write failed.
+        """
+        path = self._job_path(task_id)
+        if path is None:
+            return None
+        try:
+            with self._locked(path):
+                job = self._read(path)
+                if job is None or (user_id is not None and str(job.get('user_id')) != str(user_id)):
+                    return None
+                job.update(updates)
+                job['updated_at'] = datetime.now(timezone.utc).isoformat()
+                write_json_atomic(path, job, default=str)
+            return job
+        except Exception as e:
+            logger.error(f"Failed to update import job {task_id}: {e}")
+            return None
+
+    def load(self, task_id: str) -> Optional[dict]:
+        path = self._job_path(task_id)
+        if path is None:
+            return None
+        try:
+            return self._read(path)
+        except Exception as e:
+            logger.warning(f"Failed to read import job {task_id}: {e}")
+            return None
+
+    def delete(self, task_id: str) -> bool:
+        path = self._job_path(task_id)
+        if path is None:
+            return False
+        removed = False
+        for candidate in (path, self.source_path(task_id)):
+            try:
+                if candidate and candidate.exists():
+                    candidate.unlink()
+                    removed = True
+            except Exception as e:
+                logger.warning(f"Failed to remove {candidate}: {e}")
+        try:
+            path.with_suffix('.lock').unlink()
+        except OSError:
+            pass
+        return removed
+
+    def list_jobs(self, user_id: Optional[str] = None) -> Dict[str, dict]:
+        """Return task_id -> job for all persisted jobs (optionally for one user)."""
+        jobs: Dict[str, dict] = {}
+        try:
+            entries = list(self.base_dir.glob('*.json'))
+        except Exception:
+            return jobs
+        for entry in entries:
+            job = self.load(entry.stem)
+            if not job:
+                continue
+            if user_id is not None and str(job.get('user_id')) != str(user_id):
+                continue
+            jobs[entry.stem] = job
+        return jobs
+
+    # --- Source files -----------------------------------------------------
+
+    def source_path(self, task_id: str) -> Optional[Path]:
+        path = self._job_path(task_id)
+        return path.with_suffix('.csv') if path is not None else None
+
+    def persist_source_file(self, task_id: str, csv_file_path: str) -> str:
+        """Move an uploaded CSV into the store so it outlives temp dirs and restarts.
+
+        Returns the durable path, or the original path if the move failed.
+        """
+        target = self.source_path(task_id)
+        if target is None or not csv_file_path:
+            return csv_file_path
+        try:
+            if Path(csv_file_path).resolve() == target.resolve():
+                return str(target)
+            if not os.path.exists(csv_file_path):
+                return str(target) if target.exists() else csv_file_path
+            shutil.move(csv_file_path, target)
+            return str(target)
+        except Exception as e:
+            logger.warning(f"Could not persist import source for {task_id}: {e}")
+            return csv_file_path
+
+    # --- Liveness ---------------------------------------------------------
+
+    @staticmethod
+    def runner_identity() -> Dict[str, Any]:
+        """Identify the current process so other workers can tell if it is gone."""
+        return {'host': socket.gethostname(), 'pid': os.getpid()}
+
+    @staticmethod
+    def _runner_gone(job: dict) -> bool:
+        runner = job.get('runner') or {}
+        if runner.get('host') != socket.gethostname():
+            return False
+        try:
+            os.kill(int(runner.get('pid')), 0)
+        except ProcessLookupError:
+            return True
+        except Exception:
+            return False
+        return False
+
+    @classmethod
+    def is_interrupted(cls, job: Optional[dict], stale_after: int = STALE_AFTER_SECONDS) -> bool:
+        """True when an active job's worker is gone or stopped heartbeating."""
+        if not job:
+            return False
+        status = (job.get('status') or '').lower()
+        if status == 'interrupted':
+            return True
+        if status not in ACTIVE_STATUSES:
+            return False
+        if cls._runner_gone(job):
+            return True
+        last_seen = _parse_iso(job.get('updated_at')) or _parse_iso(job.get('created_at'))
+        if last_seen is None:
+            return True
+        return datetime.now(timezone.utc) - last_seen > timedelta(seconds=stale_after)
+
+    def find_resumable(self, user_id: str) -> List[dict]:
+        """Interrupted CSV imports for a user whose source file is still on disk."""
+        resumable = []
+        for task_id, job in self.list_jobs(user_id).items():
+            if job.get('import_type') == 'reading_history':
+                continue
+            if not job.get('import_config') or not self.is_interrupted(job):
+                continue
+            source = self.source_path(task_id)
+            if source is None or not source.exists():
+                continue
+            job.setdefault('task_id', task_id)
+            resumable.append(job)
+        return resumable
+
+    def cleanup(self, max_age_hours: int = 24) -> int:
+        """Remove terminal jobs (and their sources) older than max_age_hours."""
+        cutoff = time.time() - max_age_hours * 3600
+        removed = 0
+        for task_id, job in self.list_jobs().items():
+            if (job.get('status') or '').lower() not in TERMINAL_STATUSES:
+                continue
+            updated = _parse_iso(job.get('updated_at')) or _parse_iso(job.get('created_at'))
+            if updated is None or updated.timestamp() < cutoff:
+                if self.delete(task_id):
+                    removed += 1
+        return removed
+
+
+# Global instance shared by the import job manager and routes
+import_job_store = ImportJobStore()
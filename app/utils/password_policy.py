@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
-import json
 import os
-from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Union
 
+from app.utils.paths import resolve_data_dir
+from app.utils.settings_cache import load_json
+
 DEFAULT_MIN_PASSWORD_LENGTH: int = 8
 MIN_ALLOWED_PASSWORD_LENGTH: int = 6
 MAX_ALLOWED_PASSWORD_LENGTH: int = 128
@@ -33,36 +34,10 @@ def _parse_length(value: Union[str, int, float, None]) -> Optional[int]:
     return length
 
 
-def _resolve_data_dir() -> Path:
-    """Best-effort resolution of the application's data directory."""
-    env_dir = os.getenv("MYBIBLIOTHECA_DATA_DIR") or os.getenv("DATA_DIR")
-    if env_dir:
-        return Path(env_dir)
-    try:
-        from flask import current_app
-
-        data_dir = current_app.config.get("DATA_DIR")  # type: ignore[attr-defined]
-        if data_dir:
-            return Path(str(data_dir))
-    except Exception:
-        pass
-    try:
-        return Path(__file__).resolve().parents[2] / "data"
-    except Exception:
-        return Path.cwd() / "data"
-
-
 def _load_system_config() -> Dict[str, object]:
     """Load the persisted system configuration if present."""
-    config_path = _resolve_data_dir() / "system_config.json"
-    if not config_path.exists():
-        return {}
-    try:
-        with config_path.open("r", encoding="utf-8") as fh:
-            data = json.load(fh)
-        return data if isinstance(data, dict) else {}
-    except Exception:
-        return {}
+    data = load_json(str(resolve_data_dir() / "system_config.json"))
+    return data if isinstance(data, dict) else {}
 
 
 def coerce_min_password_length(value: Union[str, int, float, None]) -> Optional[int]:
@@ -0,0 +1,64 @@
+"""
+Filesystem locations and atomic file writes shared by services that run with
+or without an app context.
+"""
+
+import contextlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import IO, Any, Iterator, Union
+
+
+def resolve_data_dir() -> Path:
+    """Best-effort resolution of the application's data directory.
+
+    ``MYBIBLIOTHECA_DATA_DIR`` / ``DATA_DIR`` win, then the Flask app's
+    ``DATA_DIR`` config when an app context is active, then ``<repo>/data``.
+    """
+    env_dir = os.getenv('MYBIBLIOTHECA_DATA_DIR') or os.getenv('DATA_DIR')
+    if env_dir:
+        return Path(env_dir)
+    try:
+        from flask import current_app
+
+        data_dir = current_app.config.get('DATA_DIR')  # type: ignore[attr-defined]
+        if data_dir:
+            return Path(str(data_dir))
+    except Exception:
+        pass
+    return Path(__file__).resolve().parents[2] / 'data'
+
+
+@contextlib.contextmanager
+def atomic_write(path: Union[str, Path], mode: str = 'w', encoding: str = 'utf-8') -> Iterator[IO[Any]]:
+    """Open a temp file next to ``path`` and replace ``path`` with it on success.
+
+    Readers (other threads, other workers) see the old or the new file, never
+    a partial one. The file keeps its current permissions (0644 when new).
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        file_mode = os.stat(path).st_mode & 0o777
+    except OSError:
+        file_mode = 0o644
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{path.name}.", suffix='.tmp', dir=str(path.parent))
+    try:
+        os.fchmod(fd, file_mode)  # mkstemp creates 0600
+        with os.fdopen(fd, mode, encoding=None if 'b' in mode else encoding) as fh:
+            yield fh
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+
+
+def write_json_atomic(path: Union[str, Path], data: Any, **dump_kwargs: Any) -> None:
+    """Atomically replace ``path`` with ``data`` serialised as JSON."""
+    with atomic_write(path) as fh:
+        json.dump(data, fh, **dump_kwargs)
+
+
+__all__ = ['resolve_data_dir', 'atomic_write', 'write_json_atomic']
@@ -0,0 +1,179 @@
+"""
+Persistent cover lookup cache shared by all workers.
+
+The in-process OrderedDict caches in ``cover_service`` and ``book_utils`` are
+lost on every restart or gunicorn worker recycle, so the same provider lookups
+and downloads were repeated. This module backs them with a small SQLite file in
+the data directory (``<data>/cache/cover_cache.sqlite3``):
+
+- ``processed``:  source image URL -> local ``/covers/<file>``
+- ``best``:       normalized (isbn|title|author) -> best cover selection
+- ``candidates``: normalized (isbn|title|author) -> candidate list
+
+Entries expire after a per-namespace TTL and each namespace is trimmed to a
+maximum size (least recently used first). WAL mode lets several worker
+processes read and write concurrently. Set ``COVER_PERSISTENT_CACHE=false`` to
+disable. All failures degrade to a cache miss.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+from app.utils.paths import resolve_data_dir
+
+logger = logging.getLogger(__name__)
+
+NS_PROCESSED = 'processed'
+NS_BEST = 'best'
+NS_CANDIDATES = 'candidates'
+
+# Access timestamps are only refreshed when older than this, to keep reads read-only
+_TOUCH_INTERVAL_SECONDS = 300
+# Run size-based eviction after this many writes per process
+_EVICT_EVERY_WRITES = 50
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    ns TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    PRIMARY KEY (ns, key)
+);
+CREATE INDEX IF NOT EXISTS idx_entries_ns_accessed ON entries (ns, accessed_at);
+"""
+
+
+def persistent_cache_enabled() -> bool:
+    return os.getenv('COVER_PERSISTENT_CACHE', 'true').lower() not in ('0', 'false', 'no', 'off')
+
+
+class PersistentCoverCache:
+    """Namespaced JSON key/value store with TTL and LRU trimming, backed by SQLite."""
+
+    def __init__(self, path: Optional[Path] = None):
+        self._path = Path(path) if path else None
+        self._local = threading.local()
+        self._writes = 0
+        self._lock = threading.Lock()
+        self._disabled_reason: Optional[str] = None
+
+    @property
+    def path(self) -> Path:
+        return self._path or (resolve_data_dir() / 'cache' / 'cover_cache.sqlite3')
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        if self._disabled_reason or not persistent_cache_enabled():
+            return None
+        conn = getattr(self._local, 'conn', None)
+        # Connections must not cross a fork (gunicorn preload)
+        if conn is not None and getattr(self._local, 'pid', None) == os.getpid():
+            return conn
+        try:
+            path = self.path
+            path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(path), timeout=2.0, isolation_level=None, check_same_thread=False)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.executescript(_SCHEMA)
+        except Exception as e:
+            self._disabled_reason = str(e)
+            logger.warning(f"[COVER][PCACHE] Disabled persistent cover cache: {e}")
+            return None
+        self._local.conn = conn
+        self._local.pid = os.getpid()
+        return conn
+
+    def get(self, ns: str, key: str, ttl: int) -> Optional[Any]:
+        conn = self._connect()
+        if conn is None or not key:
+            return None
+        try:
+            row = conn.execute(
+                'SELECT value, created_at, accessed_at FROM entries WHERE ns=? AND key=?', (ns, key)
+            ).fetchone()
+            if not row:
+                return None
+            value, created_at, accessed_at = row
+            now = time.time()
+            if ttl > 0 and now - created_at > ttl:
+                conn.execute('DELETE FROM entries WHERE ns=? AND key=?', (ns, key))
+                return None
+            if now - accessed_at > _TOUCH_INTERVAL_SECONDS:
+                conn.execute('UPDATE entries SET accessed_at=? WHERE ns=? AND key=?', (now, ns, key))
+            return json.loads(value)
+        except Exception as e:
+            logger.debug(f"[COVER][PCACHE] get {ns}:{key[:60]} failed: {e}")
+            return None
+
+    def set(self, ns: str, key: str, value: Any, max_entries: int = 0, ttl: int = 0) -> None:
+        conn = self._connect()
+        if conn is None or not key:
+            return
+        now = time.time()
+        try:
+            conn.execute(
+                'INSERT OR REPLACE INTO entries (ns, key, value, created_at, accessed_at) VALUES (?, ?, ?, ?, ?)',
+                (ns, key, json.dumps(value), now, now),
+            )
+        except Exception as e:
+            logger.debug(f"[COVER][PCACHE] set {ns}:{key[:60]} failed: {e}")
+            return
+        with self._lock:
+            self._writes += 1
+            due = self._writes % _EVICT_EVERY_WRITES == 0
+        if due:
+            self.evict(ns, max_entries=max_entries, ttl=ttl)
+
+    def delete(self, ns: str, key: str) -> None:
+        conn = self._connect()
+        if conn is None:
+            return
+        try:
+            conn.execute('DELETE FROM entries WHERE ns=? AND key=?', (ns, key))
+        except Exception as e:
+            logger.debug(f"[COVER][PCACHE] delete {ns}:{key[:60]} failed: {e}")
+
+    def evict(self, ns: str, max_entries: int = 0, ttl: int = 0) -> int:
+        """Drop expired entries, then the least recently used beyond ``max_entries``."""
+        conn = self._connect()
+        if conn is None:
+            return 0
+        removed = 0
+        try:
+            if ttl > 0:
+                removed += conn.execute(
+                    'DELETE FROM entries WHERE ns=? AND created_at < ?', (ns, time.time() - ttl)
+                ).rowcount
+            if max_entries > 0:
+                removed += conn.execute(
+                    'DELETE FROM entries WHERE ns=? AND key IN ('
+                    ' SELECT key FROM entries WHERE ns=? ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)',
+                    (ns, ns, max_entries),
+                ).rowcount
+        except Exception as e:
+            logger.debug(f"[COVER][PCACHE] evict {ns} failed: {e}")
+        return removed
+
+    def stats(self) -> dict:
+        conn = self._connect()
+        if conn is None:
+            return {'enabled': False, 'reason': self._disabled_reason}
+        try:
+            counts = dict(conn.execute('SELECT ns, COUNT(*) FROM entries GROUP BY ns').fetchall())
+        except Exception:
+            counts = {}
+        return {'enabled': True, 'path': str(self.path), 'entries': counts}
+
+
+# Global instance shared by cover_service and book_utils
+persistent_cover_cache = PersistentCoverCache()
@@ -2,16 +2,25 @@
 
 We generate a deterministic (but currently randomized color) image with the
 series initials when no cover is available. Stored in the standard covers dir.
+Renders are cached by series name, so repeated placeholders skip Pillow.
 """
 
 from __future__ import annotations
 
+from io import BytesIO
 from pathlib import Path
-import uuid
 from PIL import Image, ImageDraw, ImageFont, ImageOps
 from flask import current_app
 
-from .image_processing import get_covers_dir
+import os
+
+from .cpu_pool import run_cpu_bound
+from .image_processing import store_cover_bytes
+from .rendered_image_cache import render_key, rendered_image_cache
+
+# Bump when render_series_placeholder's output changes
+PLACEHOLDER_RENDER_VERSION = 1
+PLACEHOLDER_CACHE_MAX = int(os.getenv('SERIES_PLACEHOLDER_CACHE_MAX', '2000'))
 
 
 def _load_font(size: int) -> ImageFont.FreeTypeFont | ImageFont.ImageFont:
@@ -29,11 +38,8 @@ def _load_font(size: int) -> ImageFont.FreeTypeFont | ImageFont.ImageFont:
     return ImageFont.load_default()
 
 
-def create_series_placeholder(series_name: str, series_id: str | None = None) -> str:
-    """Generate a neutral grey placeholder cover with series name wrapped.
-
-    Returns relative /covers/<file>.jpg
-    """
+def render_series_placeholder(series_name: str) -> bytes:
+    """Render the placeholder JPEG bytes (no app context; runs in the CPU pool)."""
     name = (series_name or "Untitled Series").strip()
     width, height = 600, 900
     # Neutral mid grey background; subtle border
@@ -81,14 +87,25 @@ def create_series_placeholder(series_name: str, series_id: str | None = None) ->
         draw.text((tx, start_y), ln, font=font, fill=(255,255,255))
         start_y += bbox[3] + 8
 
-    covers_dir = get_covers_dir()
-    filename = f"placeholder_{uuid.uuid4().hex}.jpg"
-    out_path = covers_dir / filename
+    buffer = BytesIO()
+    img.save(buffer, format="JPEG", quality=88, optimize=True, progressive=True)
+    return buffer.getvalue()
+
+
+def create_series_placeholder(series_name: str, series_id: str | None = None) -> str:
+    """Generate a neutral grey placeholder cover with series name wrapped.
+
+    Returns relative /covers/<file>.jpg
+    """
+    key = render_key('series_placeholder', (series_name or "Untitled Series").strip(), PLACEHOLDER_RENDER_VERSION)
     try:
-        img.save(out_path, format="JPEG", quality=88, optimize=True, progressive=True)
+        data = rendered_image_cache.get_bytes('series_placeholder', key, '.jpg')
+        if data is None:
+            data = run_cpu_bound(render_series_placeholder, series_name)
+            rendered_image_cache.put('series_placeholder', key, '.jpg', data, max_files=PLACEHOLDER_CACHE_MAX)
+        rel = store_cover_bytes(data, '.jpg')
     except Exception as e:
         current_app.logger.error(f"[SERIES][PLACEHOLDER] Failed to save placeholder: {e}")
         raise
-    rel = f"/covers/{filename}"
     current_app.logger.info(f"[SERIES][PLACEHOLDER] Generated {rel} for '{series_name}'")
     return rel
@@ -0,0 +1,126 @@
+"""
+On-disk cache for images rendered with Pillow from app data.
+
+Series placeholders and month-review images are pure functions of their
+inputs, so they are stored under ``<data>/cache/rendered/<kind>/<key><ext>``
+where ``key`` is a hash of the JSON-serialised inputs plus a render version
+(bump the version when the drawing code changes). A hit skips Pillow entirely;
+each kind is trimmed to a maximum number of files, oldest first.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Optional
+
+from app.utils.paths import resolve_data_dir
+
+logger = logging.getLogger(__name__)
+
+# Trim a kind back to its limit after this many writes per process
+_PRUNE_EVERY_WRITES = 25
+
+
+def render_key(kind: str, payload: Any, version: int = 1) -> str:
+    """Stable hash of the render inputs."""
+    blob = json.dumps({'kind': kind, 'v': version, 'in': payload}, sort_keys=True, default=str)
+    return hashlib.sha256(blob.encode('utf-8')).hexdigest()
+
+
+class RenderedImageCache:
+    def __init__(self, root: Optional[Path] = None):
+        self._root = root
+        self._lock = threading.Lock()
+        self._writes: dict = {}
+
+    @property
+    def root(self) -> Path:
+        return self._root or (resolve_data_dir() / 'cache' / 'rendered')
+
+    def path_for(self, kind: str, key: str, ext: str) -> Path:
+        return self.root / kind / f"{key}{ext}"
+
+    def get(self, kind: str, key: str, ext: str) -> Optional[Path]:
+        """Path of a cached render, or None."""
+        path = self.path_for(kind, key, ext)
+        try:
+            if path.stat().st_size > 0:
+                return path
+        except OSError:
+            pass
+        return None
+
+    def get_bytes(self, kind: str, key: str, ext: str) -> Optional[bytes]:
+        path = self.get(kind, key, ext)
+        if path is None:
+            return None
+        try:
+            return path.read_bytes()
+        except OSError:
+            return None
+
+    def put(self, kind: str, key: str, ext: str, data: bytes, max_files: int = 0) -> Optional[Path]:
+        """Atomically store a render; failures are logged and return None."""
+        path = self.path_for(kind, key, ext)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+            tmp.write_bytes(data)
+            os.replace(tmp, path)
+        except OSError as e:
+            logger.warning(f"[RENDER_CACHE] Could not store {kind}/{key}{ext}: {e}")
+            return None
+        if max_files:
+            with self._lock:
+                count = self._writes.get(kind, 0) + 1
+                self._writes[kind] = count
+            if count % _PRUNE_EVERY_WRITES == 0:
+                self.prune(kind, max_files)
+        return path
+
+    def prune(self, kind: str, max_files: int) -> int:
+        """Delete the oldest renders of a kind beyond max_files."""
+        directory = self.root / kind
+        try:
+            entries = [(e.stat().st_mtime, e.path) for e in os.scandir(directory) if e.is_file() and not e.name.startswith('.')]
+        except OSError:
+            return 0
+        excess = len(entries) - max_files
+        if excess <= 0:
+            return 0
+        entries.sort()
+        removed = 0
+        for _mtime, path in entries[:excess]:
+            try:
+                os.unlink(path)
+                removed += 1
+            except OSError:
+                pass
+        logger.info(f"[RENDER_CACHE] Pruned {removed} {kind} renders")
+        return removed
+
+    def stats(self) -> dict:
+        out = {'root': str(self.root), 'kinds': {}}
+        try:
+            for kind_dir in os.scandir(self.root):
+                if kind_dir.is_dir():
+                    files = [e.stat().st_size for e in os.scandir(kind_dir.path) if e.is_file()]
+                    out['kinds'][kind_dir.name] = {'files': len(files), 'bytes': sum(files)}
+        except OSError:
+            pass
+        return out
+
+
+rendered_image_cache = RenderedImageCache()
+
+
+def get_rendered_image_cache() -> RenderedImageCache:
+    return rendered_image_cache
+
+
+__all__ = ['RenderedImageCache', 'rendered_image_cache', 'get_rendered_image_cache', 'render_key']
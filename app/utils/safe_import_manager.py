@@ -9,6 +9,8 @@ Key Features:
 - Thread safety: Proper locking prevents race conditions
 - Memory management: Automatic cleanup of old jobs
 - Privacy protection: Users cannot access other users' data
+- Durability: Jobs are written through to ImportJobStore so progress and
+  checkpoints survive worker recycles and restarts
 """
 
 import threading
@@ -17,6 +19,8 @@ import logging
 from datetime import datetime, timedelta, timezone
 from typing import Dict, Optional, List, Any
 
+from app.utils.import_job_store import ImportJobStore, import_job_store
+
 logger = logging.getLogger(__name__)
 
 
@@ -28,7 +32,8 @@ class SafeImportJobManager:
     user-scoped storage and thread safety mechanisms.
     """
     
-    def __init__(self):
+    def __init__(self, store: Optional[ImportJobStore] = None):
+        self._store = store
         self._jobs_by_user = {}  # user_id -> {task_id -> job_data}
         self._locks_by_user = {}  # user_id -> threading.RLock()
         self._global_lock = threading.RLock()
@@ -53,6 +58,26 @@ class SafeImportJobManager:
                 logger.debug(f"Created new lock for user {user_id}")
             return self._locks_by_user[user_id]
     
+    def _persist(self, task_id: str, job: dict):
+        """Write a job snapshot through to the durable store (if configured)."""
+        if self._store is not None:
+            self._store.save(task_id, job)
+
+    def _load_persisted(self, user_id: str, task_id: str) -> Optional[dict]:
+        """Load a job this process does not hold (other worker or before a restart)."""
+        if self._store is None:
+            return None
+        job = self._store.load(task_id)
+        if not job or str(job.get('user_id')) != str(user_id):
+            return None
+        runner = job.get('runner') or {}
+        # Same pid but not held here means an earlier process that reused our pid
+        reused_pid = runner == self._store.runner_identity()
+        if reused_pid or self._store.is_interrupted(job):
+            if (job.get('status') or '').lower() in ('pending', 'running', 'cancelling', 'interrupted'):
+                job['status'] = 'interrupted'
+        return job
+
     def _increment_stat(self, stat_name: str):
         """Thread-safe statistics increment."""
         with self._global_lock:
@@ -94,6 +119,7 @@ class SafeImportJobManager:
             job_copy['user_id'] = user_id  # Ensure user_id is always set
             
             self._jobs_by_user[user_id][task_id] = job_copy
+            self._persist(task_id, job_copy)
             
             self._increment_stat('jobs_created')
             logger.info(f"Created job {task_id} for user {user_id}")
@@ -120,12 +146,16 @@ class SafeImportJobManager:
             user_jobs = self._jobs_by_user.get(user_id, {})
             
             if task_id not in user_jobs:
-                logger.warning(f"Task {task_id} not found for user {user_id}")
-                return False
+                # Not held by this process: merge into the persisted copy under its file lock
+                if self._store is None or self._store.update(task_id, updates, user_id=user_id) is None:
+                    logger.warning(f"Task {task_id} not found for user {user_id}")
+                    return False
+                return True
             
             # Update the job data
             user_jobs[task_id].update(updates)
             user_jobs[task_id]['updated_at'] = datetime.now(timezone.utc).isoformat()
+            self._persist(task_id, user_jobs[task_id])
             
             # Update statistics based on status change
             if 'status' in updates:
@@ -162,6 +192,10 @@ class SafeImportJobManager:
                 # Return a copy to prevent external modification
                 return job.copy()
             
+            persisted = self._load_persisted(user_id, task_id)
+            if persisted is not None:
+                return persisted
+            
             logger.debug(f"Job {task_id} not found for user {user_id}")
             return None
     
@@ -183,7 +217,14 @@ class SafeImportJobManager:
             user_jobs = self._jobs_by_user.get(user_id, {})
             
             # Return copies of all jobs to prevent external modification
-            return {task_id: job.copy() for task_id, job in user_jobs.items()}
+            jobs = {task_id: job.copy() for task_id, job in user_jobs.items()}
+            if self._store is not None:
+                for task_id, job in self._store.list_jobs(user_id).items():
+                    if task_id not in jobs:
+                        if self._store.is_interrupted(job):
+                            job['status'] = 'interrupted'
+                        jobs[task_id] = job
+            return jobs
     
     def delete_job(self, user_id: str, task_id: str) -> bool:
         """
@@ -203,8 +244,11 @@ class SafeImportJobManager:
         with self._get_user_lock(user_id):
             user_jobs = self._jobs_by_user.get(user_id, {})
             
-            if task_id in user_jobs:
-                del user_jobs[task_id]
+            persisted = self._load_persisted(user_id, task_id) if task_id not in user_jobs else None
+            if task_id in user_jobs or persisted is not None:
+                user_jobs.pop(task_id, None)
+                if self._store is not None:
+                    self._store.delete(task_id)
                 logger.info(f"Deleted job {task_id} for user {user_id}")
                 return True
             
@@ -269,6 +313,19 @@ class SafeImportJobManager:
             
             return len(to_remove)
     
+    def restore_job(self, user_id: str, task_id: str, job_data: dict) -> bool:
+        """Adopt a persisted job into this process so it can be resumed here."""
+        if not user_id or not task_id:
+            return False
+        with self._get_user_lock(user_id):
+            job_copy = job_data.copy()
+            job_copy['user_id'] = user_id
+            job_copy['updated_at'] = datetime.now(timezone.utc).isoformat()
+            self._jobs_by_user.setdefault(user_id, {})[task_id] = job_copy
+            self._persist(task_id, job_copy)
+            logger.info(f"Restored job {task_id} for user {user_id}")
+            return True
+    
     def cleanup_all_users(self, max_age_hours: int = 24) -> int:
         """
         Clean up old jobs for all users.
@@ -288,6 +345,9 @@ class SafeImportJobManager:
             cleaned = self.cleanup_completed_jobs(user_id, max_age_hours)
             total_cleaned += cleaned
         
+        if self._store is not None:
+            total_cleaned += self._store.cleanup(max_age_hours)
+        
         if total_cleaned > 0:
             logger.info(f"Cleaned up {total_cleaned} total jobs across all users")
         
@@ -362,7 +422,7 @@ class SafeImportJobManager:
 
 
 # Global instance - this will replace the dangerous import_jobs dictionary
-safe_import_manager = SafeImportJobManager()
+safe_import_manager = SafeImportJobManager(store=import_job_store)
 
 
 # Compatibility functions for gradual migration
@@ -389,3 +449,8 @@ def safe_get_user_import_jobs(user_id: str) -> Dict[str, dict]:
 def safe_delete_import_job(user_id: str, task_id: str) -> bool:
     """Delete an import job safely with user isolation."""
     return safe_import_manager.delete_job(user_id, task_id)
+
+
+def safe_restore_import_job(user_id: str, task_id: str, job_data: dict) -> bool:
+    """Adopt a persisted import job into this process for resumption."""
+    return safe_import_manager.restore_job(user_id, task_id, job_data)
@@ -14,8 +14,10 @@ import kuzu  # type: ignore
 import os
 import time
 import json
+import random
 import re
 import atexit
+import shutil
 from pathlib import Path
 from typing import Optional, Dict, Any, List, Generator, Iterable
 from contextlib import contextmanager
@@ -33,6 +35,87 @@ _VERBOSE_INIT = os.getenv('MYBIBLIOTHECA_VERBOSE_INIT', 'false').lower() in ('1'
                 os.getenv('KUZU_DEBUG', 'false').lower() in ('1', 'true', 'on', 'yes')
 
 
+# Node tables counted by the integrity probe and by backup verification
+CORE_PROBE_LABELS = ('User', 'Book', 'Person')
+
+# Background integrity probe: 'stats' reads catalog statistics, 'count' scans the tables
+_PROBE_MODE = (os.getenv('KUZU_INTEGRITY_PROBE_MODE', 'stats') or 'stats').strip().lower()
+# Each wait is interval * (1 ± jitter) so workers and restarts don't line up
+_PROBE_JITTER = min(max(float(os.getenv('KUZU_INTEGRITY_PROBE_JITTER', '0.2') or 0), 0.0), 0.9)
+# Skip a run while queries are in flight or the DB was used within this many seconds
+_PROBE_IDLE_SEC = float(os.getenv('KUZU_INTEGRITY_PROBE_IDLE_SEC', '5') or 0)
+_PROBE_RETRY_SEC = 30
+
+
+def probe_core_counts(conn, labels: Iterable[str] = CORE_PROBE_LABELS):
+    """Count core node tables on ``conn``. Returns (totals, anomalies)."""
+    anomalies = []
+    totals = {}
+    for label in labels:
+        try:
+            _res = conn.execute(f"MATCH (n:{label}) RETURN COUNT(n) AS c")
+            if isinstance(_res, list) and _res:
+                _res = _res[0]
+            c = 0
+            if _res and hasattr(_res, 'has_next') and _res.has_next():  # type: ignore[attr-defined]
+                row = _res.get_next()  # type: ignore[attr-defined]
+                try:
+                    c = int(row[0])  # type: ignore[index]
+                except Exception:
+                    c = 0
+            totals[label] = c
+            if c < 0:
+                anomalies.append({'label': label, 'count': c, 'reason': 'negative_count'})
+        except Exception as e:
+            anomalies.append({'label': label, 'error': str(e)})
+    return totals, anomalies
+
+
+def probe_core_stats(conn, labels: Iterable[str] = CORE_PROBE_LABELS):
+    """Row counts from Kùzu's table statistics (no scan). Returns (totals, anomalies).
+
+    ``stats_info`` reports the table cardinality kept in the catalog; deleted
+    rows are only subtracted once their node group is compacted, so the value
+    is an upper bound. Raises if the call is unavailable.
+    """
+    anomalies = []
+    totals = {}
+    for label in labels:
+        res = conn.execute(f"CALL stats_info('{label}') RETURN cardinality")
+        if isinstance(res, list) and res:
+            res = res[0]
+        c = int(res.get_next()[0]) if res is not None and res.has_next() else 0
+        totals[label] = c
+        if c < 0:
+            anomalies.append({'label': label, 'count': c, 'reason': 'negative_count'})
+    return totals, anomalies
+
+
+def read_catalog(conn) -> Dict[str, Dict[str, Any]]:
+    """Read table and property definitions from Kùzu's catalog.
+
+    Returns ``{table: {'type': 'NODE'|'REL'|..., 'properties': {name: type}}}``.
+    Only catalog metadata is touched (``show_tables`` + ``table_info``), so the
+    cost does not grow with the number of rows.
+    """
+    def _rows(result):
+        if isinstance(result, list):
+            result = result[0] if result else None
+        while result is not None and result.has_next():
+            yield result.get_next()
+
+    catalog: Dict[str, Dict[str, Any]] = {}
+    res = conn.execute("CALL show_tables() RETURN name, type")
+    for name, table_type in _rows(res):
+        catalog[str(name)] = {'type': str(table_type).upper(), 'properties': {}}
+    for name, entry in catalog.items():
+        props = entry['properties']
+        info = conn.execute(f"CALL table_info('{name}') RETURN name, type")
+        for prop, prop_type in _rows(info):
+            props[str(prop)] = str(prop_type)
+    return catalog
+
+
 class SafeKuzuManager:
     """
     Thread-safe KuzuDB connection manager that prevents concurrent access issues.
@@ -81,6 +164,7 @@ class SafeKuzuManager:
         self._integrity_stop = threading.Event()
         self._integrity_interval_sec = self._load_probe_interval()
         self._last_integrity_probe: Optional[datetime] = None
+        self._integrity_stats: Dict[str, Any] = {'runs': 0, 'skipped': 0, 'failures': 0}
 
         # Quiesce (write pause) controls for backups
         self._quiesce_condition = threading.Condition(self._lock)
@@ -172,49 +256,70 @@ class SafeKuzuManager:
             return
 
         def _loop():
-            logger.info(f"[KUZU] Integrity probe thread started (interval={self._integrity_interval_sec}s)")
-            while not self._integrity_stop.is_set():
+            logger.info(f"[KUZU] Integrity probe thread started (interval={self._integrity_interval_sec}s, mode={_PROBE_MODE})")
+            # First run after a jittered delay rather than at start-up
+            wait = self._integrity_interval_sec * random.uniform(_PROBE_JITTER, 1.0)
+            while not self._integrity_stop.wait(wait):
+                wait = self._integrity_interval_sec * random.uniform(1 - _PROBE_JITTER, 1 + _PROBE_JITTER)
                 try:
-                    self._run_integrity_probe()
+                    if not self._run_integrity_probe():
+                        wait = min(wait, _PROBE_RETRY_SEC * random.uniform(1.0, 2.0))
                 except Exception as e:
+                    self._integrity_stats['failures'] += 1
                     logger.warning(f"[KUZU] Integrity probe failed: {e}")
-                # Sleep with interrupt
-                self._integrity_stop.wait(self._integrity_interval_sec)
             logger.info("[KUZU] Integrity probe thread exiting")
 
         self._integrity_thread = threading.Thread(target=_loop, daemon=True, name='kuzu-integrity-probe')
         self._integrity_thread.start()
 
-    def _run_integrity_probe(self):
-        """Perform lightweight counts on core node types and log anomalies."""
-        core_nodes: Iterable[str] = ('User','Book','Person')
+    def _probe_busy_reason(self) -> Optional[str]:
+        """Why the background probe should yield right now, or None."""
+        if self._writes_quiesced:
+            return 'quiesced'
+        if self._connection_count > 0:
+            return 'active_connections'
+        last = self._last_access_time
+        if last and _PROBE_IDLE_SEC > 0 and (datetime.now(timezone.utc) - last).total_seconds() < _PROBE_IDLE_SEC:
+            return 'recent_traffic'
+        return None
+
+    def _run_integrity_probe(self, force: bool = False) -> bool:
+        """Check core node tables and log anomalies. Returns False if skipped for load."""
+        stats = self._integrity_stats
+        busy = None if force else self._probe_busy_reason()
+        if busy:
+            stats['skipped'] += 1
+            stats['last_skip_reason'] = busy
+            logger.debug(f"[KUZU] Integrity probe skipped ({busy})")
+            return False
         now = datetime.now(timezone.utc)
+        started = time.perf_counter()
+        mode = _PROBE_MODE
         with self.get_connection(operation='integrity_probe') as conn:
-            anomalies = []
-            totals = {}
-            for label in core_nodes:
+            totals = anomalies = None
+            if mode == 'stats':
                 try:
-                    _res = conn.execute(f"MATCH (n:{label}) RETURN COUNT(n) AS c")
-                    if isinstance(_res, list) and _res:
-                        _res = _res[0]
-                    c = 0
-                    if _res and hasattr(_res, 'has_next') and _res.has_next():  # type: ignore[attr-defined]
-                        row = _res.get_next()  # type: ignore[attr-defined]
-                        try:
-                            c = int(row[0])  # type: ignore[index]
-                        except Exception:
-                            c = 0
-                    totals[label] = c
-                    if c < 0:
-                        anomalies.append({'label': label, 'count': c, 'reason': 'negative_count'})
+                    totals, anomalies = probe_core_stats(conn)
                 except Exception as e:
-                    anomalies.append({'label': label, 'error': str(e)})
+                    logger.debug(f"[KUZU] stats_info unavailable, counting instead: {e}")
+                    mode = 'count'
+            if totals is None:
+                totals, anomalies = probe_core_counts(conn)
         self._last_integrity_probe = now
+        stats.update({
+            'runs': stats['runs'] + 1,
+            'last_run_at': now.isoformat(),
+            'last_duration_ms': round((time.perf_counter() - started) * 1000, 2),
+            'last_mode': mode,
+            'last_totals': totals,
+            'last_anomalies': anomalies,
+        })
         if anomalies:
             logger.warning(f"[KUZU] Integrity anomalies: {anomalies}")
             self._log_corruption_event({'type':'INTEGRITY_ANOMALY','anomalies':anomalies,'totals':totals})
         else:
             logger.debug(f"[KUZU] Integrity probe OK {totals}")
+        return True
 
     # ------------------------------------------------------------------
     # Quiesce (write pause) logic
@@ -246,6 +351,47 @@ class SafeKuzuManager:
                 self._quiesce_condition.notify_all()
                 logger.info("[KUZU] Writes unquiesced")
 
+    def snapshot_database(self, dest_dir: Path, source_dir: Optional[Path] = None,
+                          reason: str = 'backup') -> Dict[str, Any]:
+        """Copy a consistent image of the database directory into ``dest_dir``.
+
+        New connections are held only while in-flight ones drain, a
+        ``CHECKPOINT`` folds the WAL into the main file, and the directory is
+        copied (``copy2`` uses ``copy_file_range``/``sendfile`` on Linux).
+        Compression and archiving of the copy happen after the barrier lifts.
+        """
+        source = Path(source_dir) if source_dir else self._db_dir
+        dest_dir = Path(dest_dir)
+        checkpointed = False
+        barrier_start = time.perf_counter()
+        with self.quiesce_for_backup(reason=reason):
+            drained_ms = (time.perf_counter() - barrier_start) * 1000
+            if self._database is not None:
+                conn = None
+                try:
+                    conn = kuzu.Connection(self._database)
+                    conn.execute("CHECKPOINT;")
+                    checkpointed = True
+                except Exception as e:
+                    logger.warning(f"[KUZU][SNAPSHOT] Checkpoint failed, copying files with WAL: {e}")
+                finally:
+                    try:
+                        if conn is not None:
+                            conn.close()
+                    except Exception:
+                        pass
+            shutil.copytree(source, dest_dir, dirs_exist_ok=True,
+                            ignore=shutil.ignore_patterns('.lock', '.clean_shutdown'))
+        barrier_ms = (time.perf_counter() - barrier_start) * 1000
+        logger.info(f"[KUZU][SNAPSHOT] Snapshot for {reason} copied in {barrier_ms:.0f} ms "
+                    f"(drain {drained_ms:.0f} ms, checkpointed={checkpointed})")
+        return {
+            'mode': 'checkpoint_copy',
+            'checkpointed': checkpointed,
+            'drain_ms': round(drained_ms, 1),
+            'barrier_ms': round(barrier_ms, 1),
+        }
+
     # ------------------------------------------------------------------
     # Corruption / anomaly logging
     # ------------------------------------------------------------------
@@ -754,6 +900,11 @@ class SafeKuzuManager:
                     'max_lock_wait_ms': round(max_lock_wait * 1000, 2),
                     'lock_samples': len(self._lock_wait_times)
                 },
+                'integrity_probe': {
+                    'interval_sec': self._integrity_interval_sec,
+                    'mode': _PROBE_MODE,
+                    **self._integrity_stats,
+                },
                 'active_connections_detail': {
                     thread_id: {
                         'connection_id': info['connection_id'],
@@ -829,7 +980,33 @@ class SafeKuzuManager:
             self._last_access_time = None
             self._initialization_time = None
             self._lock_wait_times.clear()
-            
+
+    def release_database(self, reason: str = "release") -> bool:
+        """Close the database handle (and its file lock) so another process can open it.
+
+        Used by the gunicorn master before forking workers when the app is
+        preloaded; the next ``get_connection`` reopens the database. Returns
+        False while connections are still checked out.
+        """
+        with self._lock:
+            if self._database is None:
+                return True
+            if self._active_connections:
+                logger.warning(f"[KUZU] Not releasing database ({reason}): {len(self._active_connections)} connection(s) active")
+                return False
+            self._integrity_stop.set()
+            try:
+                self._database.close()
+            except Exception as e:
+                logger.debug(f"[KUZU] Database close during release failed: {e}")
+            self._database = None
+            self._is_initialized = False
+            self._initialization_time = None
+            self._integrity_thread = None
+            self._integrity_stop = threading.Event()
+            logger.info(f"[KUZU] Database handle released ({reason})")
+            return True
+
     def _initialize_schema(self):
         """Initialize the graph schema with node and relationship tables."""
         try:
@@ -856,51 +1033,22 @@ class SafeKuzuManager:
                         
                         # Check for key tables that indicate a complete schema
                         essential_tables = ['User', 'Book', 'Location', 'Person', 'Category', 'Author', 'Publisher', 'Series']
-                        missing_tables = []
-                        
-                        for table_name in essential_tables:
-                            try:
-                                # Try to query each essential table
-                                result = temp_conn.execute(f"MATCH (n:{table_name}) RETURN COUNT(n) as count LIMIT 1")
-                                logger.debug(f"✅ Table {table_name} exists")
-                            except Exception as table_e:
-                                if "does not exist" in str(table_e).lower():
-                                    missing_tables.append(table_name)
-                                    logger.debug(f"❌ Table {table_name} missing: {table_e}")
-                                else:
-                                    # Some other error, assume table exists but has issues
-                                    logger.debug(f"⚠️ Table {table_name} exists but has issues: {table_e}")
-                        
+                        # One catalog read instead of a COUNT scan per table
+                        catalog = read_catalog(temp_conn)
+                        missing_tables = [t for t in essential_tables if catalog.get(t, {}).get('type') != 'NODE']
+
                         if not missing_tables:
                             has_complete_schema = True
                             logger.info("✅ All essential tables exist - schema appears complete")
 
                             # Minimal post-check: ensure ReadingLog.updated_at exists (older DBs may miss it)
-                            try:
-                                temp_conn.execute("MATCH (rl:ReadingLog) RETURN rl.updated_at LIMIT 1")
-                            except Exception as rl_e:
-                                if "Cannot find property updated_at" in str(rl_e):
-                                    try:
-                                        temp_conn.execute("ALTER TABLE ReadingLog ADD updated_at TIMESTAMP")
-                                        logger.info("🛠️ Added missing updated_at column to ReadingLog table")
-                                    except Exception as alter_e:
-                                        logger.debug(f"Could not add updated_at to ReadingLog: {alter_e}")
-
-                            # Log some stats for confirmation
-                            try:
-                                user_result = temp_conn.execute("MATCH (u:User) RETURN COUNT(u) as count LIMIT 1")
-                                if isinstance(user_result, list):
-                                    user_result = user_result[0] if user_result else None
-                                if user_result and user_result.has_next():
-                                    try:
-                                        _row = user_result.get_next()
-                                        _vals = _row if isinstance(_row, (list, tuple)) else list(_row)
-                                        user_count = _vals[0] if _vals else 0
-                                    except Exception:
-                                        user_count = 0
-                                    logger.info(f"📊 Database contains {user_count} users")
-                            except Exception as e:
-                                logger.debug(f"Could not get user count: {e}")
+                            reading_log = catalog.get('ReadingLog')
+                            if reading_log and 'updated_at' not in reading_log['properties']:
+                                try:
+                                    temp_conn.execute("ALTER TABLE ReadingLog ADD updated_at TIMESTAMP")
+                                    logger.info("🛠️ Added missing updated_at column to ReadingLog table")
+                                except Exception as alter_e:
+                                    logger.debug(f"Could not add updated_at to ReadingLog: {alter_e}")
                         else:
                             logger.info(f"❌ Missing essential tables: {missing_tables} - will create full schema")
                             
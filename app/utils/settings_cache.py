@@ -0,0 +1,95 @@
+"""
+In-memory cache for JSON settings files.
+
+``system_config.json`` is read by the ``inject_site_config`` context processor
+on every render, and the per-user ``user_settings/<id>.json`` by every library
+page. ``load_json`` keeps the parsed document per path and revalidates it with
+a single ``os.stat``: a different mtime, size or inode (``write_json`` replaces
+the file atomically) means a re-read, so edits from another worker or by hand
+are picked up on the next call. Callers get a deep copy they may mutate.
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import logging
+import os
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+from app.utils.paths import write_json_atomic
+
+logger = logging.getLogger(__name__)
+
+_Signature = Tuple[int, int, int]
+
+
+def _signature(st: os.stat_result) -> _Signature:
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+class JsonSettingsCache:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Tuple[_Signature, Any]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def load(self, path: str) -> Optional[Any]:
+        """Parsed contents of ``path`` (a copy), or None if missing or invalid."""
+        key = os.path.abspath(path)
+        try:
+            sig = _signature(os.stat(key))
+        except OSError:
+            with self._lock:
+                self._entries.pop(key, None)
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == sig:
+                self.hits += 1
+                return copy.deepcopy(entry[1])
+        try:
+            with open(key, 'r', encoding='utf-8') as fh:
+                data = json.load(fh)
+        except (OSError, ValueError) as e:
+            logger.warning(f"[SETTINGS] Could not read {key}: {e}")
+            return None
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = (sig, data)
+        return copy.deepcopy(data)
+
+    def write(self, path: str, data: Any) -> None:
+        """Atomically replace ``path`` with ``data`` as JSON and drop the cached copy."""
+        key = os.path.abspath(path)
+        try:
+            write_json_atomic(key, data, indent=2)
+        finally:
+            self.invalidate(key)
+
+    def invalidate(self, path: Optional[str] = None) -> None:
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(os.path.abspath(path), None)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {'entries': len(self._entries), 'hits': self.hits, 'misses': self.misses}
+
+
+settings_cache = JsonSettingsCache()
+
+
+def load_json(path: str) -> Optional[Any]:
+    return settings_cache.load(path)
+
+
+def write_json(path: str, data: Any) -> None:
+    settings_cache.write(path, data)
+
+
+__all__ = ['JsonSettingsCache', 'settings_cache', 'load_json', 'write_json']
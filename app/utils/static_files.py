@@ -0,0 +1,142 @@
+"""
+Static, cover and upload file serving.
+
+The previous handlers probed two directories with ``os.path.exists`` and
+re-resolved the covers dir on every hit. ``StaticRoot`` resolves its directory
+once, and ``send_static_file`` then:
+
+- serves ``<file>.br`` / ``<file>.gz`` siblings (built by
+  ``scripts/precompress_static.py`` at image build time) when the client
+  accepts them, with ``Content-Encoding`` and ``Vary: Accept-Encoding``;
+- emits strong ETags derived from the file contents (cached per
+  path/size/mtime) and answers conditional and range requests;
+- hands the file to the WSGI server's ``wsgi.file_wrapper`` so gunicorn can
+  use zero-copy ``sendfile`` (see ``GUNICORN_SENDFILE`` in the Dockerfile);
+- or, when ``X_ACCEL_REDIRECT_PREFIX`` is set, returns an empty response with
+  ``X-Accel-Redirect`` so a fronting nginx streams the file itself.
+  ``<prefix>/<root name>/<path>`` must map to the root's directory via an
+  ``internal`` location; nginx's ``gzip_static``/``brotli_static`` then pick
+  the precompressed siblings.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import mimetypes
+import os
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from flask import Response, abort, request, send_file
+from werkzeug.security import safe_join
+
+# Ensure proper MIME types for fonts (bootstrap-icons)
+mimetypes.add_type('font/woff2', '.woff2')
+mimetypes.add_type('font/woff', '.woff')
+
+X_ACCEL_REDIRECT_PREFIX = (os.getenv('X_ACCEL_REDIRECT_PREFIX') or '').rstrip('/')
+
+# Encodings we look for next to a file, in preference order
+_PRECOMPRESSED: Tuple[Tuple[str, str], ...] = (('br', '.br'), ('gzip', '.gz'))
+
+_etag_lock = threading.Lock()
+_ETAG_CACHE: Dict[Tuple[str, int, int], str] = {}
+_ETAG_CACHE_MAX = 4096
+
+
+def file_etag(path: str, st: os.stat_result) -> str:
+    """Strong ETag from file contents, memoized by (path, size, mtime)."""
+    key = (path, st.st_size, st.st_mtime_ns)
+    with _etag_lock:
+        cached = _ETAG_CACHE.get(key)
+    if cached:
+        return cached
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as fh:
+        for chunk in iter(lambda: fh.read(1 << 16), b''):
+            digest.update(chunk)
+    etag = digest.hexdigest()
+    with _etag_lock:
+        if len(_ETAG_CACHE) >= _ETAG_CACHE_MAX:
+            _ETAG_CACHE.clear()
+        _ETAG_CACHE[key] = etag
+    return etag
+
+
+def _accepted_encodings() -> set:
+    accepted = set()
+    for part in request.headers.get('Accept-Encoding', '').split(','):
+        token, _, params = part.partition(';')
+        token = token.strip().lower()
+        q = params.strip().lower()
+        if token and not (q.startswith('q=') and q[2:].strip('0.') == ''):
+            accepted.add(token)
+    return accepted
+
+
+@dataclass
+class StaticRoot:
+    """A named directory (or ordered list of candidate directories) resolved once."""
+
+    name: str
+    candidates: List[str]
+    cache_control: str
+    precompressed: bool = False
+    _dirs: Optional[List[str]] = field(default=None, init=False, repr=False)
+
+    @property
+    def dirs(self) -> List[str]:
+        if not self._dirs:
+            # Not cached until at least one directory exists (e.g. covers/ is created on first upload)
+            self._dirs = [d for d in self.candidates if d and os.path.isdir(d)]
+        return self._dirs
+
+    def resolve(self, filename: str) -> Optional[Tuple[str, str]]:
+        """Return (directory, absolute path) of the first existing match."""
+        for directory in self.dirs:
+            path = safe_join(directory, filename)
+            if path and os.path.isfile(path):
+                return directory, path
+        return None
+
+
+def send_static_file(root: StaticRoot, filename: str, cache_control: Optional[str] = None) -> Response:
+    found = root.resolve(filename)
+    if found is None:
+        abort(404)
+    _directory, path = found
+    mimetype = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+    encoding = None
+    if root.precompressed and not X_ACCEL_REDIRECT_PREFIX:
+        accepted = _accepted_encodings()
+        for enc, suffix in _PRECOMPRESSED:
+            if enc in accepted and os.path.isfile(path + suffix):
+                encoding, path, filename = enc, path + suffix, filename + suffix
+                break
+
+    if X_ACCEL_REDIRECT_PREFIX:
+        resp = Response(status=200, mimetype=mimetype)
+        resp.headers['X-Accel-Redirect'] = f"{X_ACCEL_REDIRECT_PREFIX}/{root.name}/{filename}"
+    else:
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            abort(404)
+        resp = send_file(
+            path,
+            mimetype=mimetype,
+            etag=file_etag(path, st),
+            conditional=True,
+            max_age=None,
+            last_modified=st.st_mtime,
+        )
+    if encoding:
+        resp.headers['Content-Encoding'] = encoding
+    if root.precompressed:
+        resp.vary.add('Accept-Encoding')
+    resp.headers['Cache-Control'] = cache_control or root.cache_control
+    return resp
+
+
+__all__ = ['StaticRoot', 'send_static_file', 'file_etag', 'X_ACCEL_REDIRECT_PREFIX']
@@ -0,0 +1,88 @@
+"""
+Runtime side of the fingerprinted static asset manifest.
+
+``scripts/build_static_manifest.py`` writes ``name.<hash>.ext`` copies and
+``manifest.json`` at image build time. ``static_url('bootstrap.min.css')``
+resolves through the manifest to the fingerprinted name, which is served with
+``immutable`` caching. Without a manifest (development checkouts), the URL
+gets a ``?v=<content hash>`` instead so edits still bust caches; plain
+unversioned requests are served with ``no-cache`` and revalidated by ETag.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import re
+import threading
+from typing import Dict, Optional, Set
+
+from flask import request, url_for
+
+from app.utils.static_files import StaticRoot, file_etag
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = 'manifest.json'
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+REVALIDATE_CACHE_CONTROL = 'no-cache'
+_VERSION_RE = re.compile(r'^[0-9a-f]{6,64}$')
+
+
+class StaticManifest:
+    """Maps logical static names to fingerprinted ones for one ``StaticRoot``."""
+
+    def __init__(self, root: StaticRoot):
+        self.root = root
+        self._lock = threading.Lock()
+        self._files: Optional[Dict[str, str]] = None
+        self._fingerprinted: Set[str] = set()
+
+    def _load(self) -> Dict[str, str]:
+        if self._files is not None:
+            return self._files
+        with self._lock:
+            if self._files is None:
+                files: Dict[str, str] = {}
+                for directory in self.root.dirs:
+                    path = os.path.join(directory, MANIFEST_NAME)
+                    if not os.path.isfile(path):
+                        continue
+                    try:
+                        with open(path, 'r', encoding='utf-8') as fh:
+                            files = dict(json.load(fh).get('files') or {})
+                    except Exception as e:
+                        logger.warning(f"[STATIC] Ignoring unreadable manifest {path}: {e}")
+                        continue
+                    break
+                self._fingerprinted = set(files.values())
+                self._files = files
+        return self._files
+
+    def url_for(self, filename: str) -> str:
+        """``static_url()`` template helper."""
+        hashed = self._load().get(filename)
+        if hashed:
+            return url_for('serve_static', filename=hashed)
+        found = self.root.resolve(filename)
+        if found is None:
+            return url_for('serve_static', filename=filename)
+        _directory, path = found
+        try:
+            version = file_etag(path, os.stat(path))[:10]
+        except OSError:
+            return url_for('serve_static', filename=filename)
+        return url_for('serve_static', filename=filename, v=version)
+
+    def cache_control_for(self, filename: str) -> str:
+        """Immutable for fingerprinted or content-versioned URLs, revalidate otherwise."""
+        self._load()
+        if filename in self._fingerprinted:
+            return IMMUTABLE_CACHE_CONTROL
+        if _VERSION_RE.match(request.args.get('v', '')):
+            return IMMUTABLE_CACHE_CONTROL
+        return REVALIDATE_CACHE_CONTROL
+
+
+__all__ = ['StaticManifest', 'MANIFEST_NAME']
@@ -291,6 +291,135 @@ def _date_specificity(date_str: Optional[str]) -> int:
 	return 0
 
 
+def _google_item_isbns(item: Dict[str, Any]) -> Tuple[Optional[str], Optional[str]]:
+	"""Return the raw (isbn10, isbn13) identifiers listed on a Google Books volume."""
+	isbn10 = None
+	isbn13 = None
+	for ident in (item.get('volumeInfo') or {}).get('industryIdentifiers', []) or []:
+		t = ident.get('type')
+		if t == 'ISBN_10':
+			isbn10 = ident.get('identifier')
+		elif t == 'ISBN_13':
+			isbn13 = ident.get('identifier')
+	return isbn10, isbn13
+
+
+def _google_item_matches(item: Dict[str, Any], isbn: str) -> bool:
+	"""True when the volume lists no ISBNs or one of them matches the requested ISBN."""
+	isbn10, isbn13 = _google_item_isbns(item)
+	provided_variants: set[str] = set()
+	provided_variants |= _collect_isbn_variants(isbn10)
+	provided_variants |= _collect_isbn_variants(isbn13)
+	req_variants = _collect_isbn_variants(isbn)
+	return not (req_variants and provided_variants and not (req_variants & provided_variants))
+
+
+def _build_google_payload(item: Dict[str, Any], fvi: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+	"""Convert a Google Books volume into our provider payload shape.
+
+	``fvi`` is the optional ``volumeInfo`` from a ``projection=full`` fetch of the
+	same volume; when present it supplies longer descriptions, printed page
+	counts, missing ISBNs and richer category paths.
+	"""
+	vi = item.get('volumeInfo', {})
+	isbn10, isbn13 = _google_item_isbns(item)
+
+	# Cover
+	cover_url = None
+	image_links = vi.get('imageLinks') or {}
+	for size in ['extraLarge', 'large', 'medium', 'small', 'thumbnail']:
+		if image_links.get(size):
+			cover_url = image_links[size].replace('http://', 'https://')
+			break
+
+	raw_date = vi.get('publishedDate')
+	published_date = _normalize_date(raw_date)
+	specificity = _date_specificity(raw_date)
+
+	description = vi.get('description')
+	printed_page = vi.get('printedPageCount')
+	page_count_val = vi.get('pageCount')
+	if fvi:
+		# Prefer longer description if available
+		full_desc = fvi.get('description')
+		if full_desc and (not description or len(str(full_desc)) > len(str(description))):
+			description = full_desc
+		# Pull printed/page counts from full
+		if fvi.get('printedPageCount'):
+			printed_page = fvi.get('printedPageCount')
+		if fvi.get('pageCount'):
+			page_count_val = fvi.get('pageCount')
+		# Pull ISBNs if missing
+		if not (isbn10 and isbn13):
+			fids = fvi.get('industryIdentifiers', []) or []
+			for ident in fids:
+				if ident.get('type') == 'ISBN_10' and not isbn10:
+					isbn10 = ident.get('identifier')
+				elif ident.get('type') == 'ISBN_13' and not isbn13:
+					isbn13 = ident.get('identifier')
+	# Fallback to text snippet if still none
+	if not description:
+		description = (item.get('searchInfo') or {}).get('textSnippet')
+
+	# Categories handling: initial shallow categories vs. richer full volume categories.
+	# We prefer any full categories list that either:
+	# 1) Has more entries OR
+	# 2) Contains at least one hierarchical delimiter ('/' or '>') not present in the initial list.
+	# This guards against cases where the initial search only returns a top-level umbrella (e.g. ['Fiction'])
+	# while the full volume reveals hierarchical genre paths (e.g. ['Fiction / Science Fiction / Action & Adventure', ...]).
+	base_categories = vi.get('categories') or []
+	try:
+		if fvi:
+			full_cats = fvi.get('categories') or []
+			def _has_hierarchy(cats):
+				return any(isinstance(c, str) and ('/' in c or '>' in c) for c in cats)
+			if full_cats and (
+				len(full_cats) > len(base_categories)
+				or _has_hierarchy(full_cats) and not _has_hierarchy(base_categories)
+			):
+				base_categories = full_cats
+	except Exception:
+		pass
+
+	# Peel a 'Series:' category if present from Google categories
+	series_value = None
+	_cleaned = []
+	for c in base_categories:
+		if isinstance(c, str):
+			s = c.strip()
+			if s.lower().startswith('series:') and not series_value:
+				series_value = s.split(':', 1)[1].strip() or None
+			else:
+				_cleaned.append(s)
+	base_categories = _cleaned
+
+	# Preserve raw hierarchical category path strings; frontend can expand
+	raw_category_paths = list(base_categories)
+
+	return {
+		'title': vi.get('title') or '',
+		'subtitle': vi.get('subtitle') or None,
+		'authors': vi.get('authors') or [],
+		'publisher': vi.get('publisher') or None,
+		'published_date': published_date,
+		'published_date_raw': raw_date,
+		'published_date_specificity': specificity,
+		# Prefer printedPageCount if present (from full or initial response)
+		'page_count': printed_page or page_count_val,
+		'language': vi.get('language') or 'en',
+		'description': description,
+		'categories': base_categories,
+		'raw_category_paths': raw_category_paths,
+		'average_rating': vi.get('averageRating'),
+		'rating_count': vi.get('ratingsCount'),
+		'cover_url': cover_url,
+		'isbn10': isbn10,
+		'isbn13': isbn13,
+		'google_books_id': item.get('id'),
+		'series': series_value,
+	}
+
+
 def _fetch_google_by_isbn(isbn: str) -> Dict[str, Any]:
 	"""Fetch Google Books metadata for an ISBN.
 
@@ -312,75 +441,30 @@ def _fetch_google_by_isbn(isbn: str) -> Dict[str, Any]:
 			return {}
 
 		# Normalize target ISBN (strip non-digits/X)
-		import re as _re
-		target = _re.sub(r"[^0-9Xx]", "", str(isbn))
-		def _extract_isbns(it):
-			vi = it.get('volumeInfo', {})
-			ids = vi.get('industryIdentifiers', []) or []
-			i10 = None
-			i13 = None
-			for ident in ids:
-				t = ident.get('type')
-				val = _re.sub(r"[^0-9Xx]", "", str(ident.get('identifier') or ''))
-				if t == 'ISBN_10' and val:
-					i10 = val
-				elif t == 'ISBN_13' and val:
-					i13 = val
-			return i10, i13
+		target = _normalize_isbn_value(isbn)
 
 		def _score(it):
-			vi = it.get('volumeInfo', {})
-			i10, i13 = _extract_isbns(it)
-			raw_date = vi.get('publishedDate')
+			i10, i13 = _google_item_isbns(it)
+			raw_date = (it.get('volumeInfo') or {}).get('publishedDate')
 			spec = _date_specificity(raw_date)
-			match = 1 if (target and (target == (i13 or '') or target == (i10 or ''))) else 0
+			match = 1 if (target and target in (_normalize_isbn_value(i13), _normalize_isbn_value(i10))) else 0
 			return (match, spec)
 
 		# Choose item with best (match, specificity)
 		item = max(items, key=_score)
-		vi = item.get('volumeInfo', {})
-		ids = vi.get('industryIdentifiers', [])
-		isbn10 = None
-		isbn13 = None
-		for ident in ids:
-			t = ident.get('type')
-			if t == 'ISBN_10':
-				isbn10 = ident.get('identifier')
-			elif t == 'ISBN_13':
-				isbn13 = ident.get('identifier')
 		# Guard against Google returning a different ISBN entirely.
 		# If neither ISBN matches the requested value, treat the Google payload as empty
 		# so we don't overwrite correct metadata (e.g., different manga volumes).
-		norm_isbn10 = _re.sub(r"[^0-9Xx]", "", isbn10 or "")
-		norm_isbn13 = _re.sub(r"[^0-9Xx]", "", isbn13 or "")
-		provided_variants: set[str] = set()
-		provided_variants |= _collect_isbn_variants(norm_isbn10)
-		provided_variants |= _collect_isbn_variants(norm_isbn13)
-		req_variants = _collect_isbn_variants(target)
-		if req_variants and provided_variants and not (req_variants & provided_variants):
+		if not _google_item_matches(item, target):
 			if _META_DEBUG:
+				isbn10, isbn13 = _google_item_isbns(item)
 				_META_LOG.warning(
-					f"[UNIFIED_METADATA][GOOGLE][ISBN_MISMATCH_DROP] requested={target} got10={norm_isbn10 or 'None'} got13={norm_isbn13 or 'None'} variants={sorted(provided_variants)}"
+					f"[UNIFIED_METADATA][GOOGLE][ISBN_MISMATCH_DROP] requested={target} got10={_normalize_isbn_value(isbn10) or 'None'} got13={_normalize_isbn_value(isbn13) or 'None'}"
 				)
 			return {}
 
-		# Cover
-		cover_url = None
-		image_links = vi.get('imageLinks') or {}
-		for size in ['extraLarge', 'large', 'medium', 'small', 'thumbnail']:
-			if image_links.get(size):
-				cover_url = image_links[size].replace('http://', 'https://')
-				break
-
-		raw_date = vi.get('publishedDate')
-		published_date = _normalize_date(raw_date)
-		specificity = _date_specificity(raw_date)
-
-		# Prepare to enhance with full volume fetch
-		description = vi.get('description')
-		printed_page = vi.get('printedPageCount')
-		page_count_val = vi.get('pageCount')
 		# Secondary fetch: prefer longer description, printed page count, and real ISBNs
+		fvi: Optional[Dict[str, Any]] = None
 		try:
 			vol_id = item.get('id')
 			if vol_id:
@@ -388,89 +472,10 @@ def _fetch_google_by_isbn(isbn: str) -> Dict[str, Any]:
 				full_resp.raise_for_status()
 				full_data = full_resp.json() or {}
 				fvi = (full_data.get('volumeInfo') or {})
-				# Prefer longer description if available
-				full_desc = fvi.get('description')
-				if full_desc and (not description or len(str(full_desc)) > len(str(description))):
-					description = full_desc
-				# Pull printed/page counts from full
-				if fvi.get('printedPageCount'):
-					printed_page = fvi.get('printedPageCount')
-				if fvi.get('pageCount'):
-					page_count_val = fvi.get('pageCount')
-				# Pull ISBNs if missing
-				if not (isbn10 and isbn13):
-					fids = fvi.get('industryIdentifiers', []) or []
-					for ident in fids:
-						if ident.get('type') == 'ISBN_10' and not isbn10:
-							isbn10 = ident.get('identifier')
-						elif ident.get('type') == 'ISBN_13' and not isbn13:
-							isbn13 = ident.get('identifier')
-		except Exception:
-			pass
-		# Fallback to text snippet if still none
-		if not description:
-			description = (item.get('searchInfo') or {}).get('textSnippet')
-
-
-		# Categories handling: initial shallow categories vs. richer full volume categories.
-		# We prefer any full categories list that either:
-		# 1) Has more entries OR
-		# 2) Contains at least one hierarchical delimiter ('/' or '>') not present in the initial list.
-		# This guards against cases where the initial search only returns a top-level umbrella (e.g. ['Fiction'])
-		# while the full volume reveals hierarchical genre paths (e.g. ['Fiction / Science Fiction / Action & Adventure', ...]).
-		base_categories = vi.get('categories') or []
-		full_cats = []
-		try:
-			fvi_obj = locals().get('fvi')
-			if fvi_obj:
-				full_cats = fvi_obj.get('categories') or []
-				def _has_hierarchy(cats):
-					return any(isinstance(c, str) and ('/' in c or '>' in c) for c in cats)
-				if full_cats and (
-					len(full_cats) > len(base_categories)
-					or _has_hierarchy(full_cats) and not _has_hierarchy(base_categories)
-				):
-					base_categories = full_cats
 		except Exception:
 			pass
 
-		# Peel a 'Series:' category if present from Google categories
-		series_value = None
-		_cleaned = []
-		for c in base_categories:
-			if isinstance(c, str):
-				s = c.strip()
-				if s.lower().startswith('series:') and not series_value:
-					series_value = s.split(':', 1)[1].strip() or None
-				else:
-					_cleaned.append(s)
-		base_categories = _cleaned
-
-		# Preserve raw hierarchical category path strings; frontend can expand
-		raw_category_paths = list(base_categories)
-
-		return {
-			'title': vi.get('title') or '',
-			'subtitle': vi.get('subtitle') or None,
-			'authors': vi.get('authors') or [],
-			'publisher': vi.get('publisher') or None,
-			'published_date': published_date,
-			'published_date_raw': raw_date,
-			'published_date_specificity': specificity,
-			# Prefer printedPageCount if present (from full or initial response)
-			'page_count': printed_page or page_count_val,
-			'language': vi.get('language') or 'en',
-			'description': description,
-			'categories': base_categories,
-			'raw_category_paths': raw_category_paths,
-			'average_rating': vi.get('averageRating'),
-			'rating_count': vi.get('ratingsCount'),
-			'cover_url': cover_url,
-			'isbn10': isbn10,
-			'isbn13': isbn13,
-			'google_books_id': item.get('id'),
-			'series': series_value,
-		}
+		return _build_google_payload(item, fvi)
 	except Exception as e:
 		# Suppress but record when debugging; callers still treat empty dict as failure.
 		if _META_DEBUG:
@@ -478,20 +483,107 @@ def _fetch_google_by_isbn(isbn: str) -> Dict[str, Any]:
 		return {}
 
 
+def _target_isbn_pair(isbn: Optional[str]) -> Tuple[Optional[str], Optional[str]]:
+	"""Return (isbn13, isbn10) variants of the requested ISBN for identifier preference."""
+	target_norm = _normalize_isbn_value(isbn)
+	if len(target_norm) == 13:
+		return target_norm, _isbn13_to_10(target_norm)
+	if len(target_norm) == 10:
+		return _isbn10_to_13(target_norm), target_norm
+	return None, None
+
+
+def _build_openlibrary_payload(
+	ol: Dict[str, Any],
+	target_isbn13: Optional[str],
+	target_isbn10: Optional[str],
+) -> Dict[str, Any]:
+	"""Convert a single jscmd=data record from /api/books into our provider payload shape."""
+	# jscmd=data shape
+	authors = [a.get('name') for a in (ol.get('authors') or []) if isinstance(a, dict)]
+	publishers = [p.get('name') if isinstance(p, dict) else str(p) for p in (ol.get('publishers') or [])]
+	raw_date = ol.get('publish_date')
+	published_date = _normalize_date(raw_date)
+	number_of_pages = ol.get('number_of_pages')
+	cover = ol.get('cover') or {}
+	cover_url = cover.get('large') or cover.get('medium') or cover.get('small')
+	identifiers = ol.get('identifiers') or {}
+	# Description normalization (string or dict)
+	desc = ol.get('description')
+	if isinstance(desc, dict):
+		desc = desc.get('value')
+	if not desc:
+		# Sometimes only 'notes' exists
+		notes = ol.get('notes')
+		if isinstance(notes, dict):
+			desc = notes.get('value')
+		elif isinstance(notes, str):
+			desc = notes
+	# Extract ISBNs from identifiers if available (prefer the requested one)
+	isbn10 = _pick_preferred_identifier(identifiers.get('isbn_10'), target_isbn10)
+	isbn13 = _pick_preferred_identifier(identifiers.get('isbn_13'), target_isbn13)
+	# Try to get a usable OpenLibrary link path
+	ol_key = ol.get('key')  # often '/books/OL...M'
+	if not ol_key:
+		openlibrary = identifiers.get('openlibrary') or []
+		if openlibrary:
+			# edition id like 'OL12345M' -> build books path
+			ol_key = f"/books/{openlibrary[0]}"
+
+	# Normalize categories (subjects) to names
+	base_categories: List[str] = []
+	for s in (ol.get('subjects') or []):
+		name = s.get('name') if isinstance(s, dict) else (str(s) if s is not None else None)
+		if name and name not in base_categories:
+			base_categories.append(name)
+
+	return {
+		'title': ol.get('title'),
+		'subtitle': ol.get('subtitle'),
+		'authors': authors,
+		'publisher': publishers[0] if publishers else None,
+		'published_date': published_date,
+		'published_date_raw': raw_date,
+		'published_date_specificity': _date_specificity(raw_date),
+		'page_count': number_of_pages,
+		'language': None,
+		'description': desc,
+		'categories': base_categories,
+		'cover_url': cover_url,
+		'openlibrary_id': ol_key,
+		'series': _extract_series_label(ol.get('series')),
+		'isbn10': isbn10,
+		'isbn13': isbn13,
+	}
+
+
+_EDITION_OVERLAY_KEYS = (
+	'title', 'subtitle', 'publisher', 'published_date', 'published_date_raw', 'published_date_specificity',
+	'page_count', 'language', 'description', 'series', 'isbn10', 'isbn13', 'openlibrary_id',
+)
+
+
+def _overlay_openlibrary_edition(
+	payload: Dict[str, Any],
+	edition_payload: Dict[str, Any],
+	target_isbn13: Optional[str],
+	target_isbn10: Optional[str],
+) -> Dict[str, Any]:
+	"""Overlay edition-specific fields to ensure correct volume metadata."""
+	if edition_payload:
+		edition_overlay = _build_payload_from_edition(edition_payload, target_isbn13, target_isbn10)
+		for key in _EDITION_OVERLAY_KEYS:
+			val = edition_overlay.get(key)
+			if val:
+				payload[key] = val
+	return payload
+
+
 def _fetch_openlibrary_by_isbn(isbn: str) -> Dict[str, Any]:
 	"""Fetch OpenLibrary metadata for an ISBN using the lightweight data API."""
 	bibkey = f"ISBN:{isbn}"
 	url = f"https://openlibrary.org/api/books?bibkeys={bibkey}&format=json&jscmd=data"
-	target_norm = _normalize_isbn_value(isbn)
-	target_isbn13 = None
-	target_isbn10 = None
-	if target_norm:
-		if len(target_norm) == 13:
-			target_isbn13 = target_norm
-			target_isbn10 = _isbn13_to_10(target_norm)
-		elif len(target_norm) == 10:
-			target_isbn10 = target_norm
-			target_isbn13 = _isbn10_to_13(target_norm)
+	target_isbn13, target_isbn10 = _target_isbn_pair(isbn)
 	edition_payload = _load_openlibrary_edition_payload(isbn)
 	try:
 		resp = requests.get(url, timeout=_REQUEST_TIMEOUT, headers={
@@ -502,96 +594,8 @@ def _fetch_openlibrary_by_isbn(isbn: str) -> Dict[str, Any]:
 		if not ol:
 			return _build_payload_from_edition(edition_payload, target_isbn13, target_isbn10)
 
-		# jscmd=data shape
-		authors = [a.get('name') for a in (ol.get('authors') or []) if isinstance(a, dict)]
-		publishers = [p.get('name') if isinstance(p, dict) else str(p) for p in (ol.get('publishers') or [])]
-		raw_date = ol.get('publish_date')
-		published_date = _normalize_date(raw_date)
-		number_of_pages = ol.get('number_of_pages')
-		cover = ol.get('cover') or {}
-		cover_url = cover.get('large') or cover.get('medium') or cover.get('small')
-		identifiers = ol.get('identifiers') or {}
-		# Description normalization (string or dict)
-		desc = ol.get('description')
-		if isinstance(desc, dict):
-			desc = desc.get('value')
-		if not desc:
-			# Sometimes only 'notes' exists
-			notes = ol.get('notes')
-			if isinstance(notes, dict):
-				desc = notes.get('value')
-			elif isinstance(notes, str):
-				desc = notes
-		# Extract ISBNs from identifiers if available (prefer the requested one)
-		isbn10 = _pick_preferred_identifier(identifiers.get('isbn_10'), target_isbn10)
-		isbn13 = _pick_preferred_identifier(identifiers.get('isbn_13'), target_isbn13)
-		# Try to get a usable OpenLibrary link path
-		ol_key = ol.get('key')  # often '/books/OL...M'
-		if not ol_key:
-			openlibrary = identifiers.get('openlibrary') or []
-			if openlibrary:
-				# edition id like 'OL12345M' -> build books path
-				ol_key = f"/books/{openlibrary[0]}"
-
-		# Normalize categories (subjects) to names
-		def _norm_subjects(subjs):
-			out = []
-			for s in (subjs or []):
-				name = s.get('name') if isinstance(s, dict) else (str(s) if s is not None else None)
-				if name and name not in out:
-					out.append(name)
-			return out
-
-		# Series may appear explicitly in OL 'series' field (string or list)
-		def _extract_series(val):
-			if not val:
-				return None
-			try:
-				if isinstance(val, list) and val:
-					candidate = str(val[0])
-				elif isinstance(val, str):
-					candidate = val
-				else:
-					return None
-				candidate = candidate.strip()
-				# Strip a leading 'Series:' if present and any trailing parenthetical like '(1)'
-				import re as _re
-				candidate = _re.sub(r'^\s*Series\s*:\s*', '', candidate, flags=_re.IGNORECASE)
-				candidate = _re.sub(r'\s*\([^)]*\)\s*$', '', candidate).strip()
-				return candidate or None
-			except Exception:
-				return None
-
-		series_value = _extract_series_label(ol.get('series'))
-
-		base_categories = _norm_subjects(ol.get('subjects'))
-
-		payload = {
-			'title': ol.get('title'),
-			'subtitle': ol.get('subtitle'),
-			'authors': authors,
-			'publisher': publishers[0] if publishers else None,
-			'published_date': published_date,
-			'published_date_raw': raw_date,
-			'published_date_specificity': _date_specificity(raw_date),
-			'page_count': number_of_pages,
-			'language': None,
-			'description': desc,
-			'categories': base_categories,
-			'cover_url': cover_url,
-			'openlibrary_id': ol_key,
-			'series': series_value,
-			'isbn10': isbn10,
-			'isbn13': isbn13,
-		}
-		# Overlay edition-specific fields to ensure correct volume metadata
-		if edition_payload:
-			edition_overlay = _build_payload_from_edition(edition_payload, target_isbn13, target_isbn10)
-			for key in ['title', 'subtitle', 'publisher', 'published_date', 'published_date_raw', 'published_date_specificity', 'page_count', 'language', 'description', 'series', 'isbn10', 'isbn13', 'openlibrary_id']:
-				val = edition_overlay.get(key)
-				if val:
-					payload[key] = val
-		return payload
+		payload = _build_openlibrary_payload(ol, target_isbn13, target_isbn10)
+		return _overlay_openlibrary_edition(payload, edition_payload, target_isbn13, target_isbn10)
 	except Exception as e:
 		if _META_DEBUG:
 			_META_LOG.warning(f"[UNIFIED_METADATA][OPENLIB][EXC] isbn={isbn} err={e}")
@@ -754,41 +758,49 @@ def _merge_dicts(google: Dict[str, Any], openlib: Dict[str, Any]) -> Dict[str, A
 	return merged
 
 
+def _valid_isbn10(val: str) -> bool:
+	if len(val) != 10: return False
+	if not re.match(r'^[0-9]{9}[0-9Xx]$', val): return False
+	s = 0
+	for i, ch in enumerate(val[:9]):
+		if not ch.isdigit(): return False
+		s += (10 - i) * int(ch)
+	check = val[9]
+	if check in 'Xx':
+		s += 10
+	else:
+		if not check.isdigit(): return False
+		s += int(check)
+	return s % 11 == 0
+
+
+def _valid_isbn13(val: str) -> bool:
+	if len(val) != 13 or not val.isdigit(): return False
+	if not (val.startswith('978') or val.startswith('979')): return False
+	tot = 0
+	for i, ch in enumerate(val[:12]):
+		w = 1 if i % 2 == 0 else 3
+		tot += int(ch) * w
+	calc = (10 - (tot % 10)) % 10
+	return calc == int(val[12])
+
+
+def _isbn_valid(val: str) -> bool:
+	"""Structural + checksum validation to avoid wasting provider calls."""
+	return _valid_isbn10(val) or _valid_isbn13(val)
+
+
+def _clean_isbn_input(isbn: Optional[str]) -> str:
+	return re.sub(r'[^0-9Xx]', '', (isbn or '').strip())
+
+
 def _unified_fetch_pair(isbn: str):
 	"""Internal: concurrently fetch provider raw dicts and gather error states.
 
 	Returns (google_dict, openlib_dict, errors_dict).
 	Errors dict entries are provider -> description ('empty' if empty successful response).
 	"""
-	import re as _re_norm
-	isbn_clean = (isbn or '').strip()
-	isbn_clean = _re_norm.sub(r'[^0-9Xx]', '', isbn_clean)
-	# Early structural + checksum validation to avoid wasting provider calls
-	def _valid_isbn10(val: str) -> bool:
-		if len(val) != 10: return False
-		if not _re_norm.match(r'^[0-9]{9}[0-9Xx]$', val): return False
-		s = 0
-		for i, ch in enumerate(val[:9]):
-			if not ch.isdigit(): return False
-			s += (10 - i) * int(ch)
-		check = val[9]
-		if check in 'Xx':
-			s += 10
-		else:
-			if not check.isdigit(): return False
-			s += int(check)
-		return s % 11 == 0
-	def _valid_isbn13(val: str) -> bool:
-		if len(val) != 13 or not val.isdigit(): return False
-		if not (val.startswith('978') or val.startswith('979')): return False
-		tot = 0
-		for i, ch in enumerate(val[:12]):
-			w = 1 if i % 2 == 0 else 3
-			tot += int(ch) * w
-		calc = (10 - (tot % 10)) % 10
-		return calc == int(val[12])
-	def _isbn_valid(val: str) -> bool:
-		return _valid_isbn10(val) or _valid_isbn13(val)
+	isbn_clean = _clean_isbn_input(isbn)
 	if not isbn_clean:
 		return {}, {}, {'input': 'empty'}
 	if not _isbn_valid(isbn_clean):
@@ -834,14 +846,88 @@ def _unified_fetch_pair(isbn: str):
 	return google, openlib, _errors
 
 
-def fetch_unified_by_isbn_detailed(isbn: str) -> Tuple[Dict[str, Any], Dict[str, str]]:
-	"""Public detailed fetch returning (merged_metadata, provider_errors).
+# Provider-native bulk lookups. OpenLibrary accepts many bibkeys per /api/books
+# call; Google Books accepts OR-ed isbn: terms but caps a page at 40 volumes,
+# so its chunks stay small enough that every match fits in one response.
+_OPENLIB_BULK_SIZE = max(1, int(os.getenv('METADATA_OPENLIB_BULK_SIZE', '50')))
+_GOOGLE_BULK_SIZE = max(1, min(40, int(os.getenv('METADATA_GOOGLE_BULK_SIZE', '10'))))
 
-	If both providers empty, merged_metadata is {} and errors indicate causes.
-	Now includes ISBN mismatch detection to warn when metadata sources return
-	information for a different ISBN than requested.
+
+def _chunked(values: List[str], size: int) -> List[List[str]]:
+	return [values[i:i + size] for i in range(0, len(values), size)]
+
+
+def _fetch_openlibrary_bulk(isbns: List[str]) -> Dict[str, Dict[str, Any]]:
+	"""Resolve many ISBNs with a single OpenLibrary /api/books request.
+
+	Returns a mapping of requested ISBN -> provider payload for every ISBN the
+	response contained. ISBNs absent from the mapping are misses; the caller
+	falls back to single lookups for those. Raises on transport errors so the
+	caller can treat the whole chunk as missed.
 	"""
-	google, openlib, _errors = _unified_fetch_pair(isbn)
+	if not isbns:
+		return {}
+	bibkeys = ','.join(f"ISBN:{isbn}" for isbn in isbns)
+	url = f"https://openlibrary.org/api/books?bibkeys={bibkeys}&format=json&jscmd=data"
+	resp = requests.get(url, timeout=_REQUEST_TIMEOUT, headers={
+		'User-Agent': 'MyBibliotheca/metadata-fetch (+https://example.local)'})
+	resp.raise_for_status()
+	data = resp.json() or {}
+	results: Dict[str, Dict[str, Any]] = {}
+	for isbn in isbns:
+		ol = data.get(f"ISBN:{isbn}") or {}
+		if not ol:
+			continue
+		target_isbn13, target_isbn10 = _target_isbn_pair(isbn)
+		payload = _build_openlibrary_payload(ol, target_isbn13, target_isbn10)
+		if payload:
+			results[isbn] = payload
+	return results
+
+
+def _fetch_google_bulk(isbns: List[str]) -> Dict[str, Dict[str, Any]]:
+	"""Resolve many ISBNs with one OR-ed Google Books volumes query.
+
+	Volumes are assigned to requested ISBNs by their industryIdentifiers, so a
+	volume for a different edition can never be attributed to the wrong row.
+	The per-volume ``projection=full`` request of the single path is skipped
+	here; that is where most of the request savings come from.
+	"""
+	if not isbns:
+		return {}
+	query = '+OR+'.join(f"isbn:{isbn}" for isbn in isbns)
+	url = f"https://www.googleapis.com/books/v1/volumes?q={query}&maxResults=40"
+	resp = requests.get(url, timeout=_REQUEST_TIMEOUT, headers={
+		'User-Agent': 'MyBibliotheca/metadata-fetch (+https://example.local)'})
+	resp.raise_for_status()
+	items = (resp.json() or {}).get('items') or []
+	wanted: Dict[str, str] = {}
+	for isbn in isbns:
+		for variant in _collect_isbn_variants(isbn):
+			wanted.setdefault(variant, isbn)
+	best: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+	for item in items:
+		isbn10, isbn13 = _google_item_isbns(item)
+		raw_date = (item.get('volumeInfo') or {}).get('publishedDate')
+		for provided in (_normalize_isbn_value(isbn13), _normalize_isbn_value(isbn10)):
+			requested = wanted.get(provided) if provided else None
+			if not requested:
+				continue
+			# Same ranking as the single path: exact identifier match, then date specificity
+			score = (1 if provided == requested else 0, _date_specificity(raw_date))
+			current = best.get(requested)
+			if current is None or score > current[0]:
+				best[requested] = (score, item)
+	return {isbn: _build_google_payload(item) for isbn, (_, item) in best.items()}
+
+
+def _finalize_unified(
+	isbn: str,
+	google: Dict[str, Any],
+	openlib: Dict[str, Any],
+	_errors: Dict[str, str],
+) -> Tuple[Dict[str, Any], Dict[str, str]]:
+	"""Drop mismatched providers, merge, and attach quality indicators."""
 	req_variants = _collect_isbn_variants(isbn)
 	req_isbn = _normalize_isbn_value(isbn)
 	dropped_providers: List[str] = []
@@ -933,6 +1019,136 @@ def fetch_unified_by_isbn_detailed(isbn: str) -> Tuple[Dict[str, Any], Dict[str,
 	return merged, _errors
 
 
+def fetch_unified_by_isbn_detailed(isbn: str) -> Tuple[Dict[str, Any], Dict[str, str]]:
+	"""Public detailed fetch returning (merged_metadata, provider_errors).
+
+	If both providers empty, merged_metadata is {} and errors indicate causes.
+	Now includes ISBN mismatch detection to warn when metadata sources return
+	information for a different ISBN than requested.
+	"""
+	google, openlib, _errors = _unified_fetch_pair(isbn)
+	return _finalize_unified(isbn, google, openlib, _errors)
+
+
+def fetch_unified_by_isbns_detailed(
+	isbns: List[str],
+	max_workers: int = 4,
+) -> Dict[str, Tuple[Dict[str, Any], Dict[str, str]]]:
+	"""Batched variant of fetch_unified_by_isbn_detailed.
+
+	Resolves ISBNs with provider-native bulk requests (OpenLibrary bibkeys lists,
+	OR-ed Google Books queries) and only issues single-ISBN provider lookups for
+	the ISBNs a bulk response missed. OpenLibrary bulk hits still get the
+	per-edition overlay of the single path. Each ISBN then goes through the same
+	mismatch filtering and merge as the single fetch. Every round of lookups is
+	bounded by METADATA_FETCH_TIMEOUT like the single fetch.
+
+	Returns a mapping keyed by the caller's original ISBN strings. Invalid or
+	empty inputs map to ({}, {'input': ...}) exactly like the single fetch.
+	"""
+	results: Dict[str, Tuple[Dict[str, Any], Dict[str, str]]] = {}
+	cleaned: Dict[str, str] = {}
+	for raw in isbns or []:
+		if raw in results or raw in cleaned:
+			continue
+		isbn_clean = _clean_isbn_input(raw)
+		if not isbn_clean:
+			results[raw] = ({}, {'input': 'empty'})
+		elif not _isbn_valid(isbn_clean):
+			results[raw] = ({}, {'input': 'invalid_format'})
+		else:
+			cleaned[raw] = isbn_clean
+	unique = list(dict.fromkeys(cleaned.values()))
+	if not unique:
+		return results
+
+	google: Dict[str, Dict[str, Any]] = {}
+	openlib: Dict[str, Dict[str, Any]] = {}
+	errors: Dict[str, Dict[str, str]] = {isbn: {} for isbn in unique}
+
+	def _run_bulk(kind: str, chunk: List[str]):
+		fetcher = _fetch_google_bulk if kind == 'google' else _fetch_openlibrary_bulk
+		try:
+			return fetcher(chunk)
+		except Exception as exc:
+			if _META_DEBUG:
+				_META_LOG.warning(f"[UNIFIED_METADATA][BULK][{kind.upper()}][EXC] size={len(chunk)} err={exc}")
+			return {}
+
+	workers = max(1, max_workers)
+
+	def _phase_timeout(tasks: int) -> float:
+		# Same bound as the single fetch, per round of lookups the pool has to run
+		return _FETCH_TIMEOUT * max(1, -(-tasks // workers))
+
+	def _drain(future_map: Dict[Any, Tuple[str, Any]]):
+		"""Yield (kind, key, result) as futures finish; stragglers past the bound are cancelled."""
+		try:
+			for fut in as_completed(future_map, timeout=_phase_timeout(len(future_map))):
+				kind, key = future_map[fut]
+				try:
+					yield kind, key, fut.result() or {}
+				except Exception as exc:  # defensive; provider funcs should swallow
+					yield kind, key, exc
+		except TimeoutError:
+			for fut, (kind, key) in future_map.items():
+				if not fut.done():
+					fut.cancel()
+					yield kind, key, TimeoutError()
+			_META_LOG.warning(f"[UNIFIED_METADATA][BULK][TIMEOUT] isbns={len(unique)} timeout={_FETCH_TIMEOUT}s/round")
+
+	ex = ThreadPoolExecutor(max_workers=workers)
+	try:
+		bulk = {ex.submit(_run_bulk, 'google', c): ('google', c) for c in _chunked(unique, _GOOGLE_BULK_SIZE)}
+		bulk.update({ex.submit(_run_bulk, 'openlib', c): ('openlib', c) for c in _chunked(unique, _OPENLIB_BULK_SIZE)})
+		for kind, chunk, found in _drain(bulk):
+			if isinstance(found, Exception):
+				continue
+			(google if kind == 'google' else openlib).update(found)
+
+		# Per ISBN: the edition overlay the single OpenLibrary path applies for bulk hits,
+		# and single lookups for bulk misses, per provider
+		single_fetchers = {'google': _fetch_google_by_isbn, 'openlib': _fetch_openlibrary_by_isbn}
+		followup = {}
+		for isbn in unique:
+			if isbn in openlib:
+				followup[ex.submit(_load_openlibrary_edition_payload, isbn)] = ('edition', isbn)
+			else:
+				followup[ex.submit(single_fetchers['openlib'], isbn)] = ('openlib', isbn)
+			if isbn not in google:
+				followup[ex.submit(single_fetchers['google'], isbn)] = ('google', isbn)
+		if _META_DEBUG:
+			_META_LOG.info(
+				f"[UNIFIED_METADATA][BULK] isbns={len(unique)} google_hits={len(google)} openlib_hits={len(openlib)} followups={len(followup)}"
+			)
+		for kind, isbn, data in _drain(followup):
+			if isinstance(data, Exception):
+				if kind == 'edition':
+					continue
+				errors[isbn][kind] = 'timeout' if isinstance(data, TimeoutError) else f"exception:{data}"
+			elif kind == 'edition':
+				target_isbn13, target_isbn10 = _target_isbn_pair(isbn)
+				_overlay_openlibrary_edition(openlib[isbn], data, target_isbn13, target_isbn10)
+			elif data:
+				(google if kind == 'google' else openlib)[isbn] = data
+	finally:
+		ex.shutdown(wait=False, cancel_futures=True)
+
+	merged_by_isbn: Dict[str, Tuple[Dict[str, Any], Dict[str, str]]] = {}
+	for isbn in unique:
+		g = google.get(isbn) or {}
+		o = openlib.get(isbn) or {}
+		err = errors[isbn]
+		if not g and 'google' not in err:
+			err['google'] = 'empty'
+		if not o and 'openlib' not in err:
+			err['openlib'] = 'empty'
+		merged_by_isbn[isbn] = _finalize_unified(isbn, dict(g), dict(o), err)
+	for raw, isbn_clean in cleaned.items():
+		results[raw] = merged_by_isbn[isbn_clean]
+	return results
+
+
 def fetch_unified_by_isbn(isbn: str) -> Dict[str, Any]:
 	"""Fetch and merge Google Books and OpenLibrary metadata for an ISBN (parallel IO).
 
@@ -9,11 +9,11 @@ from the database first and fall back to JSON.
 from __future__ import annotations
 
 import os
-import json
 from typing import Any, Dict, List, Optional, Tuple
 from flask import current_app
 
 from app.domain.models import MediaType, ReadingStatus
+from app.utils.settings_cache import load_json, write_json
 
 
 _MEDIA_TYPE_VALUES = {mt.value for mt in MediaType}
@@ -138,21 +138,16 @@ def _data_dir() -> str:
 
 
 def _user_settings_path(user_id: str) -> str:
-    base = os.path.join(_data_dir(), 'user_settings')
-    os.makedirs(base, exist_ok=True)
-    return os.path.join(base, f"{user_id}.json")
+    return os.path.join(_data_dir(), 'user_settings', f"{user_id}.json")
 
 
 def load_user_settings(user_id: Optional[str]) -> Dict[str, Any]:
     """Load per-user settings JSON. Returns an empty dict if not found or invalid."""
     if not user_id:
         return {}
-    path = _user_settings_path(str(user_id))
-    if not os.path.exists(path):
-        return {}
     try:
-        with open(path, 'r') as f:
-            data = json.load(f)
+        # Cached in memory; a changed mtime triggers a re-read
+        data = load_json(_user_settings_path(str(user_id)))
         # Ensure known ABS fields exist with defaults
         if isinstance(data, dict):
             data.setdefault('abs_username', '')
@@ -195,9 +190,7 @@ def save_user_settings(user_id: Optional[str], updates: Dict[str, Any]) -> bool:
 
     existing.update(normalized_updates)
     try:
-        path = _user_settings_path(str(user_id))
-        with open(path, 'w') as f:
-            json.dump(existing, f, indent=2)
+        write_json(_user_settings_path(str(user_id)), existing)
         return True
     except Exception as e:
         try:
@@ -207,6 +200,28 @@ def save_user_settings(user_id: Optional[str], updates: Dict[str, Any]) -> bool:
         return False
 
 
+def get_system_section(name: str) -> Dict[str, Any]:
+    """Return a section of the admin system_config (cached; empty dict if unset)."""
+    try:
+        from app.admin import load_system_config
+        section = (load_system_config() or {}).get(name)
+    except Exception:
+        return {}
+    return section if isinstance(section, dict) else {}
+
+
+def get_system_int(section: str, key: str, minimum: Optional[int] = None) -> Optional[int]:
+    """Integer system setting, or None when unset, invalid or below ``minimum``."""
+    raw = get_system_section(section).get(key)
+    try:
+        value = int(raw) if raw not in (None, "") else None
+    except Exception:
+        return None
+    if value is not None and minimum is not None and value < minimum:
+        return None
+    return value
+
+
 def get_effective_reading_defaults(user_id: Optional[str]) -> Tuple[Optional[int], Optional[int]]:
     """
     Return (pages, minutes) defaults for reading logs for the given user.
@@ -228,17 +243,10 @@ def get_effective_reading_defaults(user_id: Optional[str]) -> Tuple[Optional[int
         return up_i, um_i
 
     # Fall back to admin/system defaults
-    try:
-        from app.admin import load_system_config
-        cfg = load_system_config() or {}
-        rld = cfg.get('reading_log_defaults') or {}
-        ap = rld.get('default_pages_per_log')
-        am = rld.get('default_minutes_per_log')
-        ap_i = int(ap) if ap not in (None, "") else None
-        am_i = int(am) if am not in (None, "") else None
-        return ap_i, am_i
-    except Exception:
-        return None, None
+    return (
+        get_system_int('reading_log_defaults', 'default_pages_per_log'),
+        get_system_int('reading_log_defaults', 'default_minutes_per_log'),
+    )
 
 
 def get_effective_rows_per_page(user_id: Optional[str]) -> Optional[int]:
@@ -260,18 +268,7 @@ def get_effective_rows_per_page(user_id: Optional[str]) -> Optional[int]:
         pass
 
     # Fallback to admin/system defaults
-    try:
-        from app.admin import load_system_config
-        cfg = load_system_config() or {}
-        lib = cfg.get('library_defaults') or {}
-        dv = lib.get('default_rows_per_page')
-        try:
-            dv_i = int(dv) if dv not in (None, "") else None
-        except Exception:
-            dv_i = None
-        return dv_i if (dv_i is None or dv_i >= 1) else None
-    except Exception:
-        return None
+    return get_system_int('library_defaults', 'default_rows_per_page', minimum=1)
 
 
 def get_library_view_defaults(user_id: Optional[str]) -> Tuple[str, str]:
@@ -293,16 +290,9 @@ def get_default_reading_status(user_id: Optional[str]) -> str:
 
 def get_default_book_format() -> str:
     """Return the admin-configured default book format with a safe fallback."""
-    try:
-        from app.admin import load_system_config
-
-        cfg = load_system_config() or {}
-        lib = cfg.get('library_defaults') or {}
-        raw = lib.get('default_book_format')
-        if isinstance(raw, str):
-            candidate = raw.strip().lower()
-            if candidate in _MEDIA_TYPE_VALUES:
-                return candidate
-    except Exception:
-        pass
+    raw = get_system_section('library_defaults').get('default_book_format')
+    if isinstance(raw, str):
+        candidate = raw.strip().lower()
+        if candidate in _MEDIA_TYPE_VALUES:
+            return candidate
     return MediaType.PHYSICAL.value
@@ -0,0 +1,34 @@
+"""Gunicorn hooks (picked up automatically from the working directory).
+
+Command-line flags in the Dockerfile still set workers, timeouts and
+``--max-requests``; this file only wires the worker lifecycle to
+``app.startup.worker_warmup``:
+
+- ``GUNICORN_PRELOAD=true`` loads the app once in the master so recycled
+  workers fork with imports, templates and migrations already done.
+- every new worker prefetches hot read-only data before accepting requests
+  (``WORKER_WARMUP=false`` disables it).
+"""
+
+import os
+
+preload_app = os.getenv('GUNICORN_PRELOAD', 'false').lower() in ('1', 'true', 'yes', 'on')
+if preload_app:
+    os.environ.setdefault('MYBIBLIOTHECA_PRELOAD', 'true')
+
+
+def pre_fork(server, worker):
+    if server.cfg.preload_app:
+        from app.startup.worker_warmup import release_before_fork
+        release_before_fork()
+
+
+def post_fork(server, worker):
+    if server.cfg.preload_app:
+        from app.startup.worker_warmup import after_fork
+        after_fork()
+
+
+def post_worker_init(worker):
+    from app.startup.worker_warmup import warm_worker
+    warm_worker(getattr(worker, 'wsgi', None))
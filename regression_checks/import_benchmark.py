@@ -0,0 +1,460 @@
+"""Import throughput benchmark.
+
+Generates synthetic Goodreads and StoryGraph exports (with realistic author,
+series and duplicate overlap), runs ``process_simple_import`` against a
+throwaway Kùzu database with a local stub metadata provider, and reports
+rows/sec, database queries per row, peak RSS and per-phase timings as JSON.
+Outbound HTTP (cover probes, author lookups) is answered by a local stub and
+counted, so runs never touch real providers.
+
+Each scenario runs in its own subprocess so the database, caches and peak
+RSS measurement start clean.
+
+Usage:
+    python regression_checks/import_benchmark.py                     # 1k/10k/50k, both formats
+    python regression_checks/import_benchmark.py --sizes 1000 --formats goodreads
+    python regression_checks/import_benchmark.py --output bench.json
+"""
+
+import argparse
+import asyncio
+import csv
+import json
+import os
+import platform
+import random
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+DEFAULT_SIZES = (1000, 10000, 50000)
+FORMATS = ('goodreads', 'storygraph')
+
+GOODREADS_HEADERS = [
+    'Book Id', 'Title', 'Author', 'Author l-f', 'Additional Authors', 'ISBN', 'ISBN13',
+    'My Rating', 'Average Rating', 'Publisher', 'Binding', 'Number of Pages', 'Year Published',
+    'Original Publication Year', 'Date Read', 'Date Added', 'Bookshelves',
+    'Bookshelves with positions', 'Exclusive Shelf', 'My Review', 'Spoiler', 'Private Notes',
+    'Read Count', 'Owned Copies',
+]
+
+STORYGRAPH_HEADERS = [
+    'Title', 'Authors', 'Contributors', 'ISBN/UID', 'Format', 'Read Status', 'Date Added',
+    'Last Date Read', 'Dates Read', 'Read Count', 'Moods', 'Pace', 'Character- or Plot-Driven?',
+    'Strong Character Development?', 'Loveable Characters?', 'Diverse Characters?',
+    'Flawed Characters?', 'Star Rating', 'Review', 'Content Warnings',
+    'Content Warning Description', 'Tags', 'Owned?',
+]
+
+_FIRST = ['Ada', 'Brandon', 'Celia', 'Dmitri', 'Elena', 'Farah', 'Gareth', 'Hana', 'Ivan', 'Jun',
+          'Kemi', 'Liam', 'Mara', 'Nikolai', 'Octavia', 'Priya', 'Quentin', 'Rosa', 'Soren', 'Tamsin']
+_LAST = ['Abernathy', 'Baptiste', 'Castellano', 'Dunmore', 'Ekwueme', 'Fairweather', 'Grünwald',
+         'Hollis', 'Ishikawa', 'Jovanović', 'Kowalczyk', 'Lindqvist', 'Moreau', 'Nakamura',
+         "O'Rourke", 'Petrov', 'Quintero', 'Rasmussen', 'Sato', 'Thorne']
+_WORDS = ['Shadow', 'River', 'Crown', 'Glass', 'Ember', 'Winter', 'Garden', 'Iron', 'Silent',
+          'Hollow', 'Star', 'Paper', 'Salt', 'Thorn', 'Lantern', 'Orchard', 'Tide', 'Ash', 'Echo', 'Harbor']
+_PUBLISHERS = ['Tor Books', 'Penguin', 'Orbit', 'HarperCollins', 'Del Rey', 'Vintage', 'Ace', 'Gollancz']
+_SHELVES = ['fantasy', 'sci-fi', 'favorites', 'book-club', 'owned', 'kindle', 'audiobooks', 'classics']
+_MOODS = ['adventurous', 'dark', 'emotional', 'funny', 'hopeful', 'mysterious', 'reflective', 'tense']
+
+
+def _isbn13(seq: int) -> str:
+    body = f"978{seq:09d}"[:12]
+    total = sum(int(d) * (1 if i % 2 == 0 else 3) for i, d in enumerate(body))
+    return body + str((10 - total % 10) % 10)
+
+
+def _isbn10_from_13(isbn13: str) -> str:
+    core = isbn13[3:12]
+    total = sum(int(d) * (10 - i) for i, d in enumerate(core))
+    check = (11 - total % 11) % 11
+    return core + ('X' if check == 10 else str(check))
+
+
+def _zipf_pick(rng: random.Random, pool: list):
+    # Heavy-tailed choice: a few prolific authors/series, long tail of one-offs
+    idx = min(int(rng.paretovariate(1.2)) - 1, len(pool) - 1)
+    return pool[idx if rng.random() < 0.7 else rng.randrange(len(pool))]
+
+
+def generate_books(rows: int, seed: int = 42) -> list:
+    """Synthetic book records shared by both export formats."""
+    rng = random.Random(seed)
+    authors = [f"{rng.choice(_FIRST)} {rng.choice(_LAST)}" for _ in range(max(10, rows // 8))]
+    series = [f"The {rng.choice(_WORDS)} {rng.choice(['Cycle', 'Chronicles', 'Saga', 'Trilogy'])}"
+              for _ in range(max(5, rows // 20))]
+    series_counters: dict = {}
+    books = []
+    for i in range(rows):
+        if books and rng.random() < 0.02:
+            # Re-exported duplicate (same ISBN/title), exercises dedup + merge
+            books.append(dict(rng.choice(books)))
+            continue
+        title = f"{rng.choice(_WORDS)} of {rng.choice(_WORDS)} {i}"
+        series_name = _zipf_pick(rng, series) if rng.random() < 0.35 else None
+        if series_name:
+            series_counters[series_name] = series_counters.get(series_name, 0) + 1
+            title = f"{title} ({series_name}, #{series_counters[series_name]})"
+        isbn13 = _isbn13(100000 + i) if rng.random() > 0.1 else ''
+        added = date(2015, 1, 1) + timedelta(days=rng.randrange(3500))
+        read = added + timedelta(days=rng.randrange(200)) if rng.random() < 0.6 else None
+        books.append({
+            'id': str(1000000 + i),
+            'title': title,
+            'author': _zipf_pick(rng, authors),
+            'co_author': rng.choice(authors) if rng.random() < 0.1 else '',
+            'isbn13': isbn13,
+            'isbn10': _isbn10_from_13(isbn13) if isbn13 else '',
+            'rating': rng.choice([0, 0, 3, 4, 4, 5]),
+            'publisher': rng.choice(_PUBLISHERS),
+            'pages': rng.randrange(120, 900),
+            'year': rng.randrange(1950, 2025),
+            'added': added,
+            'read': read,
+            'shelves': rng.sample(_SHELVES, k=rng.randrange(0, 3)),
+            'moods': rng.sample(_MOODS, k=rng.randrange(1, 3)),
+        })
+    return books
+
+
+def write_goodreads_csv(path: Path, books: list) -> None:
+    with path.open('w', encoding='utf-8', newline='') as fh:
+        writer = csv.writer(fh)
+        writer.writerow(GOODREADS_HEADERS)
+        for b in books:
+            last_first = ', '.join(reversed(b['author'].split(' ', 1)))
+            exclusive = 'read' if b['read'] else random.Random(b['id']).choice(['to-read', 'currently-reading'])
+            writer.writerow([
+                b['id'], b['title'], b['author'], last_first, b['co_author'],
+                f'="{b["isbn10"]}"', f'="{b["isbn13"]}"', b['rating'], '3.97', b['publisher'],
+                'Paperback', b['pages'], b['year'], b['year'],
+                b['read'].strftime('%Y/%m/%d') if b['read'] else '', b['added'].strftime('%Y/%m/%d'),
+                ', '.join(b['shelves']), ', '.join(f"{s} (#{n})" for n, s in enumerate(b['shelves'], 1)),
+                exclusive, '', '', '', 1 if b['read'] else 0, 0,
+            ])
+
+
+def write_storygraph_csv(path: Path, books: list) -> None:
+    with path.open('w', encoding='utf-8', newline='') as fh:
+        writer = csv.writer(fh)
+        writer.writerow(STORYGRAPH_HEADERS)
+        for b in books:
+            authors = ', '.join(a for a in (b['author'], b['co_author']) if a)
+            status = 'read' if b['read'] else 'to-read'
+            writer.writerow([
+                b['title'], authors, '', b['isbn13'], 'paperback', status,
+                b['added'].strftime('%Y/%m/%d'), b['read'].strftime('%Y/%m/%d') if b['read'] else '',
+                b['read'].strftime('%Y/%m/%d') if b['read'] else '', 1 if b['read'] else 0,
+                ', '.join(b['moods']), 'medium', 'A mix', 'Yes', 'Yes', 'No', 'Yes',
+                f"{b['rating']}.0" if b['rating'] else '', '', '', '', ', '.join(b['shelves']), 'No',
+            ])
+
+
+def stub_metadata_for_isbn(isbn: str) -> dict:
+    """Deterministic provider payload shaped like unified_metadata's merged result."""
+    rng = random.Random(isbn)
+    digits = ''.join(ch for ch in isbn if ch.isdigit() or ch in 'Xx')
+    isbn13 = digits if len(digits) == 13 else ''
+    isbn10 = _isbn10_from_13(isbn13) if isbn13 else (digits if len(digits) == 10 else '')
+    return {
+        'title': f"{rng.choice(_WORDS)} {rng.choice(_WORDS)}",
+        'subtitle': None,
+        'authors': [f"{rng.choice(_FIRST)} {rng.choice(_LAST)}"],
+        'publisher': rng.choice(_PUBLISHERS),
+        'published_date': str(rng.randrange(1950, 2025)),
+        'page_count': rng.randrange(120, 900),
+        'language': 'en',
+        'description': 'Synthetic benchmark description.',
+        'categories': rng.sample(['Fantasy', 'Science Fiction', 'Mystery', 'History', 'Romance'], k=2),
+        'cover_url': None,
+        'isbn13': isbn13 or None,
+        'isbn10': isbn10 or None,
+    }
+
+
+# Canned "nothing found" bodies for the providers the import path talks to directly
+# (cover selection, author lookups); anything else gets a 404.
+_STUB_HTTP_BODIES = {
+    'www.googleapis.com': {'kind': 'books#volumes', 'totalItems': 0, 'items': []},
+    'openlibrary.org/api/books': {},
+    'openlibrary.org/search': {'numFound': 0, 'docs': []},
+}
+
+
+def _stub_http_response(request):
+    from urllib.parse import urlsplit
+    import requests
+
+    parts = urlsplit(request.url)
+    key = parts.netloc + parts.path
+    body = next((v for k, v in _STUB_HTTP_BODIES.items() if key.startswith(k)), None)
+    response = requests.Response()
+    response.url = request.url
+    response.request = request
+    response.status_code = 200 if body is not None else 404
+    response.headers['Content-Type'] = 'application/json'
+    response._content = json.dumps(body if body is not None else {'error': 'not found'}).encode('utf-8')
+    return response
+
+
+class _Counters:
+    def __init__(self):
+        self.queries = 0
+        self.provider_isbns = 0
+        self.http_requests: dict = {}
+        self.phases: dict = {}
+
+    def add_phase(self, name: str, elapsed: float) -> None:
+        self.phases[name] = self.phases.get(name, 0.0) + elapsed
+
+
+def _install_instrumentation(counters: _Counters) -> None:
+    """Count Kùzu queries, time import phases and replace network metadata providers."""
+    import kuzu
+    import requests.adapters
+    import app.routes.import_routes as import_routes
+    import app.utils.unified_metadata as unified_metadata
+    from app.simplified_book_service import ImportDedupIndex
+
+    original_execute = kuzu.Connection.execute
+
+    def counting_execute(self, *args, **kwargs):
+        counters.queries += 1
+        return original_execute(self, *args, **kwargs)
+
+    kuzu.Connection.execute = counting_execute
+
+    def stub_bulk(isbns, max_workers=4):
+        counters.provider_isbns += len(isbns)
+        return {isbn: (stub_metadata_for_isbn(isbn), {}) for isbn in isbns}
+
+    def stub_single(isbn):
+        counters.provider_isbns += 1
+        return stub_metadata_for_isbn(isbn), {}
+
+    def stub_send(self, request, *args, **kwargs):
+        from urllib.parse import urlsplit
+        host = urlsplit(request.url).netloc
+        counters.http_requests[host] = counters.http_requests.get(host, 0) + 1
+        return _stub_http_response(request)
+
+    # Every other outbound call (cover probes, author lookups) is answered locally
+    requests.adapters.HTTPAdapter.send = stub_send
+
+    unified_metadata.fetch_unified_by_isbns_detailed = stub_bulk
+    unified_metadata.fetch_unified_by_isbn_detailed = stub_single
+
+    original_batch = import_routes.batch_fetch_book_metadata
+
+    def timed_batch(isbns):
+        start = time.perf_counter()
+        try:
+            return original_batch(isbns)
+        finally:
+            counters.add_phase('metadata', time.perf_counter() - start)
+
+    import_routes.batch_fetch_book_metadata = timed_batch
+
+    original_custom_fields = import_routes.pre_analyze_and_create_custom_fields
+
+    async def timed_custom_fields(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return await original_custom_fields(*args, **kwargs)
+        finally:
+            counters.add_phase('custom_fields', time.perf_counter() - start)
+
+    import_routes.pre_analyze_and_create_custom_fields = timed_custom_fields
+
+    original_load = ImportDedupIndex.load
+
+    def timed_load(self, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return original_load(self, *args, **kwargs)
+        finally:
+            counters.add_phase('dedup_index', time.perf_counter() - start)
+
+    ImportDedupIndex.load = timed_load
+
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS reports bytes
+    return round(peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024, 1)
+
+
+def run_scenario(fmt: str, rows: int, workdir: Path, seed: int) -> dict:
+    """Run one import in this process (expects a fresh interpreter)."""
+    os.environ['KUZU_DB_PATH'] = str(workdir / 'kuzu')
+    os.environ['MYBIBLIOTHECA_DATA_DIR'] = str(workdir / 'data')
+    os.environ.setdefault('SECRET_KEY', 'import-benchmark')
+    (workdir / 'kuzu').mkdir(parents=True, exist_ok=True)
+
+    csv_path = workdir / f"{fmt}-{rows}.csv"
+    books = generate_books(rows, seed=seed)
+    (write_goodreads_csv if fmt == 'goodreads' else write_storygraph_csv)(csv_path, books)
+
+    counters = _Counters()
+    timings: dict = {}
+    start = time.perf_counter()
+    from app import create_app
+    flask_app = create_app()
+    timings['app_startup'] = time.perf_counter() - start
+
+    with flask_app.app_context():
+        _install_instrumentation(counters)
+        import app.routes.import_routes as import_routes
+        from app.services import user_service
+        from app.utils.safe_import_manager import safe_create_import_job, safe_get_import_job
+
+        user = user_service.create_user_sync(
+            username=f"bench_{uuid.uuid4().hex[:6]}", email=f"bench-{uuid.uuid4().hex[:6]}@example.com",
+            password_hash='x', is_admin=True,
+        )
+        if user is None:
+            raise RuntimeError('Could not create benchmark user')
+        user_id = str(user.id)
+
+        with csv_path.open('r', encoding='utf-8') as fh:
+            headers = next(csv.reader(fh))
+        detected, _confidence = import_routes.detect_csv_format(str(csv_path))
+        mappings = import_routes.auto_detect_fields(headers, user_id)
+
+        task_id = f"bench_{uuid.uuid4().hex[:10]}"
+        safe_create_import_job(user_id, task_id, {
+            'task_id': task_id, 'status': 'pending', 'processed': 0, 'success': 0, 'errors': 0,
+            'skipped': 0, 'total': rows, 'start_time': datetime.now(timezone.utc).isoformat(),
+            'current_book': None, 'error_messages': [], 'recent_activity': [],
+        })
+        queries_before = counters.queries
+        start = time.perf_counter()
+        asyncio.run(import_routes.process_simple_import({
+            'task_id': task_id,
+            'csv_file_path': str(csv_path),
+            'field_mappings': mappings,
+            'user_id': user_id,
+            'default_reading_status': '',
+            'enable_api_enrichment': True,
+            'format_type': detected,
+        }))
+        total = time.perf_counter() - start
+        job = safe_get_import_job(user_id, task_id) or {}
+
+    phases = {name: round(value, 3) for name, value in counters.phases.items()}
+    phases['rows'] = round(max(0.0, total - sum(counters.phases.values())), 3)
+    phases['app_startup'] = round(timings['app_startup'], 3)
+    queries = counters.queries - queries_before
+    return {
+        'format': fmt,
+        'detected_format': detected,
+        'rows': rows,
+        'seconds': round(total, 3),
+        'rows_per_sec': round(rows / total, 2) if total else None,
+        'queries': queries,
+        'queries_per_row': round(queries / rows, 2) if rows else None,
+        'provider_isbns': counters.provider_isbns,
+        'http_requests': dict(sorted(counters.http_requests.items())),
+        'http_requests_per_row': round(sum(counters.http_requests.values()) / rows, 2) if rows else None,
+        'peak_rss_mb': _peak_rss_mb(),
+        'phases': phases,
+        'status': job.get('status'),
+        'counts': {key: job.get(key) for key in ('processed', 'success', 'merged', 'errors', 'skipped')},
+    }
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.check_output(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=PROJECT_ROOT, stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except Exception:
+        return 'unknown'
+
+
+def _run_in_subprocess(fmt: str, rows: int, seed: int, keep: bool, verbose: bool) -> dict:
+    workdir = Path(tempfile.mkdtemp(prefix=f"import-bench-{fmt}-{rows}-"))
+    result_path = workdir / 'result.json'
+    cmd = [sys.executable, str(Path(__file__).resolve()), '--child', fmt, str(rows),
+           '--seed', str(seed), '--workdir', str(workdir), '--result', str(result_path)]
+    try:
+        proc = subprocess.run(
+            cmd, cwd=PROJECT_ROOT,
+            stdout=None if verbose else subprocess.DEVNULL,
+            stderr=None if verbose else subprocess.PIPE,
+            text=True,
+        )
+        if proc.returncode != 0 or not result_path.exists():
+            tail = (proc.stderr or '')[-2000:] if not verbose else ''
+            return {'format': fmt, 'rows': rows, 'error': f"exit code {proc.returncode}", 'stderr_tail': tail}
+        return json.loads(result_path.read_text(encoding='utf-8'))
+    finally:
+        if not keep:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', default=','.join(str(s) for s in DEFAULT_SIZES),
+                        help='Comma-separated row counts (default: 1000,10000,50000)')
+    parser.add_argument('--formats', default=','.join(FORMATS), help='goodreads,storygraph')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output', help='Write JSON results to this file instead of stdout')
+    parser.add_argument('--keep', action='store_true', help='Keep temporary databases and CSVs')
+    parser.add_argument('--verbose', action='store_true', help='Show import output from each run')
+    parser.add_argument('--child', nargs=2, metavar=('FORMAT', 'ROWS'), help=argparse.SUPPRESS)
+    parser.add_argument('--workdir', help=argparse.SUPPRESS)
+    parser.add_argument('--result', help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        fmt, rows = args.child[0], int(args.child[1])
+        result = run_scenario(fmt, rows, Path(args.workdir), args.seed)
+        Path(args.result).write_text(json.dumps(result), encoding='utf-8')
+        return 0
+
+    sizes = [int(s) for s in args.sizes.split(',') if s.strip()]
+    formats = [f.strip() for f in args.formats.split(',') if f.strip()]
+    unknown = set(formats) - set(FORMATS)
+    if unknown:
+        parser.error(f"unknown format(s): {', '.join(sorted(unknown))}")
+
+    results = []
+    for fmt in formats:
+        for rows in sizes:
+            print(f"[import-benchmark] {fmt} x {rows} rows ...", file=sys.stderr)
+            result = _run_in_subprocess(fmt, rows, args.seed, args.keep, args.verbose)
+            if 'error' not in result:
+                print(f"[import-benchmark]   {result['rows_per_sec']} rows/s, "
+                      f"{result['queries_per_row']} queries/row, peak {result['peak_rss_mb']} MB",
+                      file=sys.stderr)
+            results.append(result)
+
+    report = {
+        'generated_at': datetime.now(timezone.utc).isoformat(),
+        'git_commit': _git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'seed': args.seed,
+        'results': results,
+    }
+    payload = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(payload + '\n', encoding='utf-8')
+    else:
+        print(payload)
+    return 0 if all('error' not in r for r in results) else 1
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Fingerprint static assets and write app/static/manifest.json.
+
+For every asset a content-hashed copy ``name.<hash>.ext`` is written next to
+the original and recorded in the manifest; templates resolve names through
+``static_url()`` so fingerprinted files can be cached forever while a deploy
+takes effect immediately. Relative ``url(...)`` references inside CSS are
+rewritten to the fingerprinted names first, so fonts are fingerprinted too.
+
+Optional minification (--minify) uses rjsmin/rcssmin when installed and skips
+files that are already ``.min``. Run before precompress_static.py:
+
+    python scripts/build_static_manifest.py app/static --minify
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+from pathlib import Path
+
+MANIFEST_NAME = 'manifest.json'
+HASH_LENGTH = 10
+# Downloads and docs under static/ are not page assets
+SKIP_DIRS = {'templates'}
+SKIP_SUFFIXES = {'.gz', '.br', '.md', '.tmp'}
+FINGERPRINTED_RE = re.compile(r'\.[0-9a-f]{%d}(\.[^.]+)$' % HASH_LENGTH)
+_CSS_URL_RE = re.compile(r'url\(\s*([\'"]?)([^\'")]+)\1\s*\)')
+
+
+def _minifier(suffix):
+    try:
+        if suffix == '.js':
+            import rjsmin  # type: ignore
+            return lambda text: rjsmin.jsmin(text)
+        if suffix == '.css':
+            import rcssmin  # type: ignore
+            return lambda text: rcssmin.cssmin(text)
+    except ImportError:
+        return None
+    return None
+
+
+def _iter_assets(root: Path):
+    for path in sorted(root.rglob('*')):
+        rel = path.relative_to(root)
+        if not path.is_file() or rel.parts[0] in SKIP_DIRS or path.name == MANIFEST_NAME:
+            continue
+        if path.suffix.lower() in SKIP_SUFFIXES or path.name.startswith('.') or FINGERPRINTED_RE.search(path.name):
+            continue
+        yield path, rel.as_posix()
+
+
+def _rewrite_css(text: str, css_rel: str, files: dict) -> str:
+    base = os.path.dirname(css_rel)
+
+    def _sub(match):
+        quote, ref = match.group(1), match.group(2)
+        if ref.startswith(('data:', 'http:', 'https:', '//', '/', '#')):
+            return match.group(0)
+        path_part, sep, rest = ref.partition('?') if '?' in ref else ref.partition('#')
+        target = os.path.normpath(os.path.join(base, path_part)).replace(os.sep, '/')
+        hashed = files.get(target)
+        if not hashed:
+            return match.group(0)
+        new_ref = os.path.relpath(hashed, base or '.').replace(os.sep, '/')
+        return f"url({quote}{new_ref}{sep}{rest}{quote})"
+
+    return _CSS_URL_RE.sub(_sub, text)
+
+
+def build(root: Path, minify: bool = False) -> dict:
+    files = {}
+    written = set()
+    assets = list(_iter_assets(root))
+    # CSS last so url() references can point at already-fingerprinted files
+    assets.sort(key=lambda item: item[0].suffix.lower() == '.css')
+    for path, rel in assets:
+        data = path.read_bytes()
+        suffix = path.suffix.lower()
+        if suffix == '.css':
+            data = _rewrite_css(data.decode('utf-8'), rel, files).encode('utf-8')
+        if minify and suffix in ('.js', '.css') and '.min.' not in path.name:
+            minify_fn = _minifier(suffix)
+            if minify_fn:
+                data = minify_fn(data.decode('utf-8')).encode('utf-8')
+        digest = hashlib.sha256(data).hexdigest()[:HASH_LENGTH]
+        hashed_path = path.with_name(f"{path.stem}.{digest}{path.suffix}")
+        if not hashed_path.exists():
+            tmp = hashed_path.with_name(f".{hashed_path.name}.tmp")
+            tmp.write_bytes(data)
+            os.replace(tmp, hashed_path)
+        hashed_rel = hashed_path.relative_to(root).as_posix()
+        files[rel] = hashed_rel
+        written.add(hashed_path)
+    # Drop fingerprinted copies left over from previous builds
+    removed = 0
+    for path in root.rglob('*'):
+        if path.is_file() and FINGERPRINTED_RE.search(path.name) and path not in written:
+            path.unlink()
+            removed += 1
+    manifest = {'version': 1, 'files': files}
+    tmp = root / f".{MANIFEST_NAME}.tmp"
+    tmp.write_text(json.dumps(manifest, indent=2, sort_keys=True), encoding='utf-8')
+    os.replace(tmp, root / MANIFEST_NAME)
+    return {'assets': len(files), 'removed_stale': removed}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('root', nargs='?', default=str(Path(__file__).resolve().parent.parent / 'app' / 'static'))
+    parser.add_argument('--minify', action='store_true', help='minify non-.min JS/CSS (needs rjsmin/rcssmin)')
+    args = parser.parse_args(argv)
+    root = Path(args.root)
+    if not root.is_dir():
+        print(f"❌ Static dir not found: {root}")
+        return 1
+    if args.minify:
+        missing = [name for suffix, name in (('.js', 'rjsmin'), ('.css', 'rcssmin')) if _minifier(suffix) is None]
+        if missing:
+            print(f"⚠️ --minify: {', '.join(missing)} not installed; those assets are left unminified")
+    stats = build(root, minify=args.minify)
+    print(f"🔖 {root}: fingerprinted {stats['assets']} assets, removed {stats['removed_stale']} stale copies")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
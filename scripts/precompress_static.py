@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Write precompressed .gz (and .br when the brotli module is available) siblings
+for compressible static assets (JS, CSS, SVG, JSON, source maps, fonts that are
+not already compressed).
+
+Run at image build time; serve_static picks the variants up automatically:
+
+    python scripts/precompress_static.py app/static
+"""
+
+import gzip
+import os
+import sys
+from pathlib import Path
+
+try:
+    import brotli  # type: ignore  # installed with Flask-Compress
+except ImportError:  # pragma: no cover - optional
+    brotli = None
+
+COMPRESSIBLE_SUFFIXES = {'.js', '.css', '.svg', '.json', '.map', '.txt', '.html', '.ttf', '.eot'}
+MIN_SIZE = 1024  # not worth the extra file below this
+
+
+def _write_if_smaller(target: Path, data: bytes, original_size: int) -> bool:
+    # Keep only variants that actually save bytes
+    if len(data) >= original_size:
+        if target.exists():
+            target.unlink()
+        return False
+    tmp = target.with_name(f".{target.name}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, target)
+    return True
+
+
+def precompress(root: Path) -> dict:
+    stats = {'files': 0, 'gzip': 0, 'brotli': 0, 'saved_bytes': 0}
+    for path in sorted(root.rglob('*')):
+        if not path.is_file() or path.suffix.lower() not in COMPRESSIBLE_SUFFIXES:
+            continue
+        raw = path.read_bytes()
+        if len(raw) < MIN_SIZE:
+            continue
+        stats['files'] += 1
+        gz = gzip.compress(raw, compresslevel=9, mtime=0)
+        if _write_if_smaller(path.with_name(path.name + '.gz'), gz, len(raw)):
+            stats['gzip'] += 1
+            stats['saved_bytes'] += len(raw) - len(gz)
+        if brotli is not None:
+            br = brotli.compress(raw, quality=11)
+            if _write_if_smaller(path.with_name(path.name + '.br'), br, len(raw)):
+                stats['brotli'] += 1
+    return stats
+
+
+def main(argv):
+    roots = [Path(p) for p in (argv[1:] or [Path(__file__).resolve().parent.parent / 'app' / 'static'])]
+    for root in roots:
+        if not root.is_dir():
+            print(f"⚠️  Skipping missing static dir: {root}")
+            continue
+        stats = precompress(root)
+        print(
+            f"🗜️  {root}: {stats['files']} assets, {stats['gzip']} .gz, {stats['brotli']} .br"
+            f"{'' if brotli else ' (brotli module not installed)'}, saved {stats['saved_bytes'] // 1024} KiB (gzip)"
+        )
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))
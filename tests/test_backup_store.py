@@ -0,0 +1,147 @@
+import importlib.util
+import os
+import sys
+import time
+import types
+from pathlib import Path
+
+import pytest
+
+
+def _load(monkeypatch, module_name, module_path):
+    spec = importlib.util.spec_from_file_location(module_name, module_path)
+    module = importlib.util.module_from_spec(spec)
+    monkeypatch.setitem(sys.modules, module_name, module)
+    spec.loader.exec_module(module)
+    return module
+
+
+def load_backup_store_module(monkeypatch):
+    app_dir = Path(__file__).resolve().parent.parent / "app"
+
+    # The store only needs app.utils.paths; load both without the Flask app package
+    for name in ("app", "app.utils"):
+        package = types.ModuleType(name)
+        package.__path__ = []
+        monkeypatch.setitem(sys.modules, name, package)
+    _load(monkeypatch, "app.utils.paths", app_dir / "utils" / "paths.py")
+    return _load(monkeypatch, "app.services.backup_store", app_dir / "services" / "backup_store.py")
+
+
+@pytest.fixture
+def backup_store(monkeypatch):
+    return load_backup_store_module(monkeypatch)
+
+
+def _write(path: Path, data: bytes) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    return path
+
+
+def _entries(src: Path):
+    return [(str(p.relative_to(src)), p) for p in sorted(src.rglob('*')) if p.is_file()]
+
+
+def _chunk_files(store):
+    return {p.name for p in store.chunks_dir.rglob('*') if p.is_file()}
+
+
+def test_second_backup_reuses_chunks_and_delete_keeps_shared_ones(backup_store, tmp_path):
+    src = tmp_path / "src"
+    _write(src / "kuzu" / "data.kz", b"database page " * 4096)
+    changing = _write(src / "notes.txt", b"first version")
+    store = backup_store.BackupStore(tmp_path / "store")
+
+    first = store.write_backup("b1", _entries(src), {"name": "first"})
+    assert first["stats"]["new_chunks"] == 2
+
+    changing.write_bytes(b"second version, longer")
+    second = store.write_backup("b2", _entries(src), {"name": "second"})
+    assert second["stats"]["reused_files"] == 1
+    assert second["stats"]["new_chunks"] == 1
+    assert len(_chunk_files(store)) == 3
+
+    freed = store.delete_backup("b1")
+    assert freed["chunks_deleted"] == 1
+    assert not store.manifest_path("b1").exists()
+
+    out = tmp_path / "restored"
+    out.mkdir()
+    assert store.restore_to(store.load_manifest("b2"), out) == 2
+    assert (out / "kuzu" / "data.kz").read_bytes() == b"database page " * 4096
+    assert (out / "notes.txt").read_bytes() == b"second version, longer"
+
+    store.delete_backup("b2")
+    assert _chunk_files(store) == set()
+    assert store.stats()["chunks"] == 0
+
+
+def test_sweep_only_removes_unindexed_chunks_past_grace(backup_store, tmp_path):
+    src = tmp_path / "src"
+    _write(src / "kept.bin", b"referenced")
+    store = backup_store.BackupStore(tmp_path / "store")
+    store.write_backup("b1", _entries(src), {})
+
+    stray_id, _ = store.put_chunk(b"left by an interrupted backup")
+    assert store.sweep_unreferenced(grace_seconds=3600) == 0
+    assert store.has_chunk(stray_id)
+
+    old = time.time() - 7200
+    os.utime(store._chunk_path(stray_id), (old, old))
+    assert store.sweep_unreferenced(grace_seconds=3600) == 1
+    assert not store.has_chunk(stray_id)
+    assert len(_chunk_files(store)) == 1
+
+
+def test_restore_rejects_paths_outside_target(backup_store, tmp_path):
+    store = backup_store.BackupStore(tmp_path / "store")
+    chunk_id, _ = store.put_chunk(b"payload")
+    manifest = {"metadata": {}, "files": [{"path": "../escaped.txt", "size": 7, "chunks": [chunk_id]}]}
+
+    target = tmp_path / "target"
+    target.mkdir()
+    with pytest.raises(ValueError, match="Unsafe path"):
+        store.restore_to(manifest, target)
+    assert not (tmp_path / "escaped.txt").exists()
+
+
+@pytest.mark.parametrize("codec_name", ["zlib", "zstd"])
+def test_compressed_chunk_round_trip(backup_store, monkeypatch, tmp_path, codec_name):
+    if codec_name == "zstd":
+        if backup_store.zstd is None:
+            pytest.skip("no zstd module available")
+        codec = backup_store.CODEC_ZSTD
+    else:
+        codec = backup_store.CODEC_ZLIB
+    monkeypatch.setattr(backup_store, "WRITE_CODEC", codec)
+    store = backup_store.BackupStore(tmp_path / "store")
+
+    data = b"compressible text " * 2048
+    chunk_id, written = store.put_chunk(data)
+    blob = store._chunk_path(chunk_id).read_bytes()
+    assert blob[0] == codec
+    assert written == len(blob) < len(data)
+    assert store.read_chunk(chunk_id, verify=True) == data
+
+    # Incompressible input is stored raw behind the codec header
+    raw_id, _ = store.put_chunk(os.urandom(4096))
+    assert store._chunk_path(raw_id).read_bytes()[0] == backup_store.CODEC_RAW
+
+
+def test_verify_manifest_reports_corrupted_chunk(backup_store, tmp_path):
+    src = tmp_path / "src"
+    _write(src / "a.txt", b"alpha " * 1000)
+    _write(src / "b.txt", b"beta " * 1000)
+    store = backup_store.BackupStore(tmp_path / "store")
+    manifest = store.write_backup("b1", _entries(src), {})
+    assert store.verify_manifest(manifest)["errors"] == []
+
+    bad_id = next(f["chunks"][0] for f in manifest["files"] if f["path"] == "b.txt")
+    path = store._chunk_path(bad_id)
+    path.write_bytes(bytes([backup_store.CODEC_RAW]) + b"tampered")
+
+    report = store.verify_manifest(manifest)
+    assert report["files"] == 2
+    assert len(report["errors"]) == 1
+    assert bad_id in report["errors"][0]
@@ -0,0 +1,77 @@
+import importlib.util
+import sys
+import types
+from pathlib import Path
+
+import kuzu
+
+
+def load_simplified_book_service_module(monkeypatch, conn):
+    module_name = "app.simplified_book_service"
+    module_path = Path(__file__).resolve().parent.parent / "app" / "simplified_book_service.py"
+
+    # Stub required app modules to avoid importing Flask-heavy app package;
+    # queries run against the given Kùzu connection
+    app_mod = types.ModuleType("app")
+    app_mod.__path__ = []
+
+    models = types.ModuleType("app.domain.models")
+    for name in ("Book", "Person", "Publisher", "Series", "Category",
+                 "BookContribution", "ContributionType", "MediaType"):
+        setattr(models, name, type(name, (), {}))
+
+    kuzu_graph = types.ModuleType("app.infrastructure.kuzu_graph")
+    kuzu_graph.safe_execute_kuzu_query = lambda query, params=None, user_id=None, operation="query": conn.execute(query, params or {})
+
+    custom_fields = types.ModuleType("app.services.kuzu_custom_field_service")
+    custom_fields.KuzuCustomFieldService = type("KuzuCustomFieldService", (), {})
+
+    user_settings = types.ModuleType("app.utils.user_settings")
+    user_settings.get_default_book_format = lambda *_args, **_kwargs: None
+
+    for name, mod in {
+        "app": app_mod,
+        "app.domain": types.ModuleType("app.domain"),
+        "app.domain.models": models,
+        "app.infrastructure": types.ModuleType("app.infrastructure"),
+        "app.infrastructure.kuzu_graph": kuzu_graph,
+        "app.services": types.ModuleType("app.services"),
+        "app.services.kuzu_custom_field_service": custom_fields,
+        "app.utils": types.ModuleType("app.utils"),
+        "app.utils.user_settings": user_settings,
+    }.items():
+        monkeypatch.setitem(sys.modules, name, mod)
+
+    spec = importlib.util.spec_from_file_location(module_name, module_path)
+    module = importlib.util.module_from_spec(spec)
+    monkeypatch.setitem(sys.modules, module_name, module)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _seed_catalog(conn):
+    conn.execute("CREATE NODE TABLE Book(id STRING, title STRING, isbn13 STRING, isbn10 STRING, PRIMARY KEY(id))")
+    conn.execute("CREATE NODE TABLE Person(id STRING, name STRING, PRIMARY KEY(id))")
+    conn.execute("CREATE REL TABLE AUTHORED(FROM Person TO Book, role STRING)")
+    conn.execute("CREATE (:Book {id: 'b1', title: 'Fruits Basket, Vol. 2', isbn13: '9781591826040', isbn10: '1591826047'})")
+    conn.execute("CREATE (:Book {id: 'b2', title: 'The Hobbit', isbn13: NULL, isbn10: NULL})")
+    conn.execute("CREATE (:Person {id: 'p1', name: 'J.R.R. Tolkien'})")
+    conn.execute(
+        "MATCH (p:Person {id: 'p1'}), (b:Book {id: 'b2'}) "
+        "CREATE (p)-[:AUTHORED {role: 'authored'}]->(b)"
+    )
+
+
+def test_dedup_index_loads_from_kuzu_result(monkeypatch, tmp_path):
+    """The preload reads a real Kùzu result and serves ISBN and title+author hits."""
+    db = kuzu.Database(str(tmp_path / "kuzu"))
+    conn = kuzu.Connection(db)
+    _seed_catalog(conn)
+
+    service = load_simplified_book_service_module(monkeypatch, conn)
+    index = service.ImportDedupIndex().load()
+
+    assert index.find_by_isbn("978-1-59182-604-0") == "b1"
+    assert index.find_by_isbn("1591826047") == "b1"
+    assert index.find_by_title_author("the hobbit", "J.R.R. Tolkien") == "b2"
+    assert index.find_by_title_author("The Hobbit", "Someone Else") is None
@@ -0,0 +1,196 @@
+import importlib
+import importlib.util
+import os
+import subprocess
+import sys
+import threading
+import types
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+
+def load_import_job_store_module(monkeypatch):
+    module_name = "app.utils.import_job_store"
+    module_path = Path(__file__).resolve().parent.parent / "app" / "utils" / "import_job_store.py"
+
+    # Stub the app package; the store only needs app.utils.paths, and tests pass base_dir
+    app_mod = types.ModuleType("app")
+    app_mod.__path__ = []
+    utils_mod = types.ModuleType("app.utils")
+    utils_mod.__path__ = []
+    for name, mod in {"app": app_mod, "app.utils": utils_mod}.items():
+        monkeypatch.setitem(sys.modules, name, mod)
+    paths_spec = importlib.util.spec_from_file_location("app.utils.paths", module_path.with_name("paths.py"))
+    paths_mod = importlib.util.module_from_spec(paths_spec)
+    monkeypatch.setitem(sys.modules, "app.utils.paths", paths_mod)
+    paths_spec.loader.exec_module(paths_mod)
+
+    spec = importlib.util.spec_from_file_location(module_name, module_path)
+    module = importlib.util.module_from_spec(spec)
+    monkeypatch.setitem(sys.modules, module_name, module)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def store_module(monkeypatch):
+    return load_import_job_store_module(monkeypatch)
+
+
+def _now(delta_seconds=0):
+    return (datetime.now(timezone.utc) + timedelta(seconds=delta_seconds)).isoformat()
+
+
+def _dead_pid():
+    proc = subprocess.Popen([sys.executable, "-c", "pass"])
+    proc.wait()
+    return proc.pid
+
+
+def _job(store_module, **overrides):
+    job = {
+        "user_id": "u1",
+        "status": "running",
+        "processed": 0,
+        "runner": store_module.ImportJobStore.runner_identity(),
+        "updated_at": _now(),
+        "import_config": {"csv_file_path": "x.csv", "field_mappings": {}},
+    }
+    job.update(overrides)
+    return job
+
+
+def test_update_from_another_worker_merges_and_survives_owner_save(store_module, tmp_path):
+    owner = store_module.ImportJobStore(tmp_path)
+    other = store_module.ImportJobStore(tmp_path)
+    job = _job(store_module, processed=10)
+    assert owner.save("t1", job)
+
+    merged = other.update("t1", {"cancelled": True, "status": "cancelling"}, user_id="u1")
+    assert merged["processed"] == 10
+    assert merged["cancelled"] is True
+    assert other.update("t1", {"cancelled": False}, user_id="someone-else") is None
+
+    # The owner's next snapshot does not know about the cancel; it must be kept
+    job["processed"] = 20
+    assert owner.save("t1", job)
+    assert job["cancelled"] is True
+    persisted = owner.load("t1")
+    assert persisted["cancelled"] is True
+    assert persisted["processed"] == 20
+
+
+def test_concurrent_updates_are_not_lost(store_module, tmp_path):
+    store_module.ImportJobStore(tmp_path).save("t1", _job(store_module))
+
+    def worker(n):
+        store = store_module.ImportJobStore(tmp_path)  # own in-process lock, like another worker
+        for i in range(20):
+            store.update("t1", {f"w{n}_{i}": i})
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    job = store_module.ImportJobStore(tmp_path).load("t1")
+    assert sum(1 for key in job if key.startswith("w")) == 80
+
+
+def test_is_interrupted(store_module):
+    is_interrupted = store_module.ImportJobStore.is_interrupted
+    assert not is_interrupted(_job(store_module))
+    assert is_interrupted(_job(store_module, runner={"host": store_module.socket.gethostname(), "pid": _dead_pid()}))
+    assert is_interrupted(_job(store_module, updated_at=_now(-3600)), stale_after=300)
+    assert is_interrupted(_job(store_module, status="interrupted"))
+    assert not is_interrupted(_job(store_module, status="completed", updated_at=_now(-3600)))
+    # A runner on another host cannot be probed; only the heartbeat counts
+    assert not is_interrupted(_job(store_module, runner={"host": "elsewhere", "pid": _dead_pid()}))
+
+
+def test_find_resumable_requires_interrupted_job_with_source(store_module, tmp_path):
+    store = store_module.ImportJobStore(tmp_path)
+    stale = _now(-3600)
+    store.save("ready", _job(store_module, updated_at=stale))
+    store.source_path("ready").write_text("isbn\n1\n")
+    store.save("no_source", _job(store_module, updated_at=stale))
+    store.save("history", _job(store_module, updated_at=stale, import_type="reading_history"))
+    store.source_path("history").write_text("isbn\n")
+    store.save("live", _job(store_module))
+    store.source_path("live").write_text("isbn\n")
+    store.save("other_user", _job(store_module, user_id="u2", updated_at=stale))
+    store.source_path("other_user").write_text("isbn\n")
+
+    resumable = store.find_resumable("u1")
+    assert [job["task_id"] for job in resumable] == ["ready"]
+
+
+def test_delete_removes_job_source_and_lock(store_module, tmp_path):
+    store = store_module.ImportJobStore(tmp_path)
+    store.save("t1", _job(store_module))
+    store.source_path("t1").write_text("isbn\n")
+    assert store.delete("t1")
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.fixture
+def import_routes(monkeypatch, tmp_path):
+    # resume_import_job lives in the routes module, which needs the real app package
+    monkeypatch.setenv("SECRET_KEY", os.environ.get("SECRET_KEY", "test-secret"))
+    monkeypatch.setenv("SCHEMA_PREFLIGHT_AUTORUN", "0")
+    monkeypatch.setenv("MYBIBLIOTHECA_DATA_DIR", str(tmp_path))
+    try:
+        return importlib.import_module("app.routes.import_routes")
+    except ImportError as e:
+        pytest.skip(f"app dependencies unavailable: {e}")
+
+
+def test_resume_import_job_restarts_after_checkpoint(import_routes, monkeypatch, tmp_path):
+    source = tmp_path / "t1.csv"
+    source.write_text("isbn\n1\n2\n3\n")
+    job = {
+        "user_id": "u1",
+        "status": "running",
+        "runner": {"host": import_routes.import_job_store.runner_identity()["host"], "pid": _dead_pid()},
+        "updated_at": _now(),
+        "checkpoint_row": 2,
+        "processed": 2,
+        "success": 1,
+        "skipped": 1,
+        "import_config": {
+            "task_id": "t1",
+            "csv_file_path": str(source),
+            "field_mappings": {"ISBN": "isbn"},
+            "user_id": "u1",
+            "format_type": "goodreads",
+        },
+    }
+    restored, started = [], []
+    monkeypatch.setattr(import_routes, "safe_get_import_job", lambda user_id, task_id: dict(job))
+    monkeypatch.setattr(import_routes, "safe_restore_import_job", lambda user_id, task_id, data: restored.append(data))
+    monkeypatch.setattr(import_routes, "start_import_job", lambda *args, **kwargs: started.append((args, kwargs)))
+
+    ok, message = import_routes.resume_import_job("u1", "t1")
+
+    assert ok, message
+    assert restored[0]["status"] == "running"
+    assert restored[0]["resumed_count"] == 1
+    (task_id, csv_path, mappings, user_id), kwargs = started[0]
+    assert (task_id, csv_path, mappings, user_id) == ("t1", str(source), {"ISBN": "isbn"}, "u1")
+    assert kwargs["resume_from_row"] == 2
+    assert kwargs["resume_counts"] == {"processed": 2, "success": 1, "errors": 0, "skipped": 1, "merged": 0}
+    assert kwargs["format_type"] == "goodreads"
+
+
+def test_resume_import_job_refuses_live_or_sourceless_jobs(import_routes, monkeypatch, tmp_path):
+    live = {"user_id": "u1", "status": "running", "runner": import_routes.import_job_store.runner_identity(),
+            "updated_at": _now(), "import_config": {"csv_file_path": str(tmp_path / "t1.csv")}}
+    monkeypatch.setattr(import_routes, "safe_get_import_job", lambda user_id, task_id: dict(live))
+    monkeypatch.setattr(import_routes, "start_import_job", lambda *a, **k: pytest.fail("must not start"))
+    assert import_routes.resume_import_job("u1", "t1") == (False, "Job is running, not interrupted")
+
+    live["status"] = "interrupted"
+    assert import_routes.resume_import_job("u1", "t1") == (False, "Import source is no longer available")
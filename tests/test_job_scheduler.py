@@ -0,0 +1,109 @@
+import importlib.util
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+
+def load_job_scheduler_module(monkeypatch):
+    module_name = "app.services.job_scheduler"
+    module_path = Path(__file__).resolve().parent.parent / "app" / "services" / "job_scheduler.py"
+
+    # Standard library only; load it without the Flask app package
+    spec = importlib.util.spec_from_file_location(module_name, module_path)
+    module = importlib.util.module_from_spec(spec)
+    monkeypatch.setitem(sys.modules, module_name, module)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def js(monkeypatch):
+    for name in ("JOB_WORKERS", "JOB_QUEUE_MAX", "JOB_BULK_SLOTS", "JOB_INTERACTIVE_RESERVED", "JOB_MAX_PER_USER"):
+        monkeypatch.delenv(name, raising=False)
+    return load_job_scheduler_module(monkeypatch)
+
+
+def _wait_until(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def _status(scheduler, job_id):
+    return (scheduler.get_status(job_id) or {}).get('status')
+
+
+def _blocker(release: threading.Event):
+    def run():
+        release.wait(5)
+    return run
+
+
+def test_jobs_start_in_priority_order(js):
+    scheduler = js.JobScheduler(workers=1, interactive_reserved=0)
+    release = threading.Event()
+    gate = scheduler.submit(_blocker(release), priority=js.PRIORITY_NORMAL)
+    assert _wait_until(lambda: _status(scheduler, gate) == 'running')
+
+    order = []
+    submitted = [
+        ('maintenance', js.PRIORITY_MAINTENANCE),
+        ('bulk_1', js.PRIORITY_BULK),
+        ('normal', js.PRIORITY_NORMAL),
+        ('bulk_2', js.PRIORITY_BULK),
+        ('interactive', js.PRIORITY_INTERACTIVE),
+    ]
+    ids = [scheduler.submit(order.append, name, priority=priority, name=name) for name, priority in submitted]
+    release.set()
+
+    assert _wait_until(lambda: all(_status(scheduler, job_id) == 'completed' for job_id in ids))
+    assert order == ['interactive', 'normal', 'bulk_1', 'bulk_2', 'maintenance']
+
+
+def test_max_per_user_holds_back_the_same_users_second_job(js):
+    scheduler = js.JobScheduler(workers=3, interactive_reserved=0, max_per_user=1)
+    release = threading.Event()
+    first = scheduler.submit(_blocker(release), priority=js.PRIORITY_BULK, user_id='u1')
+    second = scheduler.submit(_blocker(release), priority=js.PRIORITY_BULK, user_id='u1')
+    other = scheduler.submit(_blocker(release), priority=js.PRIORITY_BULK, user_id='u2')
+
+    assert _wait_until(lambda: _status(scheduler, first) == 'running' and _status(scheduler, other) == 'running')
+    time.sleep(0.1)
+    assert _status(scheduler, second) == 'queued'
+
+    release.set()
+    assert _wait_until(lambda: _status(scheduler, second) == 'completed')
+
+
+def test_long_bulk_job_does_not_stall_another_users_import(js):
+    scheduler = js.JobScheduler(workers=4, interactive_reserved=1)
+    assert scheduler.bulk_slots == 3
+    release = threading.Event()
+    sync = scheduler.submit(_blocker(release), priority=js.PRIORITY_BULK, user_id='u1', name='abs_sync')
+    imported = threading.Event()
+    scheduler.submit(imported.set, priority=js.PRIORITY_BULK, user_id='u2', name='csv_import')
+
+    assert imported.wait(2)
+    assert _status(scheduler, sync) == 'running'
+    release.set()
+
+
+def test_submit_raises_when_queue_is_full(js):
+    scheduler = js.JobScheduler(workers=1, interactive_reserved=0, queue_max=2)
+    release = threading.Event()
+    gate = scheduler.submit(_blocker(release))
+    assert _wait_until(lambda: _status(scheduler, gate) == 'running')
+
+    queued = [scheduler.submit(lambda: None), scheduler.submit(lambda: None)]
+    with pytest.raises(js.JobQueueFull):
+        scheduler.submit(lambda: None)
+
+    assert scheduler.cancel(queued[0])
+    scheduler.submit(lambda: None)
+    release.set()
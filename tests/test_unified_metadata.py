@@ -110,3 +110,83 @@ def test_unified_fetch_prefers_matching_metadata(monkeypatch):
     assert merged["title"] == "Fruits Basket, Vol. 2"
     assert merged.get("_isbn_mismatch") is False
     assert errors.get("google") == "empty"
+
+
+def test_bulk_fetch_resolves_many_isbns_per_request(monkeypatch):
+    """One OpenLibrary and one Google request should cover every ISBN in the batch."""
+    unified_metadata = load_unified_metadata_module()
+
+    isbn_a = "9781591826040"
+    isbn_b = "9780306406157"
+    calls = []
+
+    def fake_get(url, timeout=None, headers=None):
+        if "openlibrary.org/isbn/" in url:
+            # Per-edition overlay, as applied by the single OpenLibrary path
+            if isbn_a in url:
+                return DummyResponse({"title": "Book A", "publishers": ["Edition Press"]})
+            return DummyResponse({})
+        calls.append(url)
+        if "googleapis.com/books/v1/volumes?q=" in url:
+            assert f"isbn:{isbn_a}" in url and f"isbn:{isbn_b}" in url
+            payload_a = _google_payload(isbn_a)["items"][0]
+            payload_a["volumeInfo"]["title"] = "Book A"
+            payload_b = _google_payload(isbn_b)["items"][0]
+            payload_b["id"] = "vol2"
+            payload_b["volumeInfo"]["title"] = "Book B"
+            return DummyResponse({"items": [payload_a, payload_b]})
+        if "openlibrary.org/api/books" in url:
+            assert f"ISBN:{isbn_a},ISBN:{isbn_b}" in url
+            return DummyResponse(
+                {
+                    f"ISBN:{isbn_a}": {"title": "Book A", "identifiers": {"isbn_13": [isbn_a]}},
+                    f"ISBN:{isbn_b}": {"title": "Book B", "identifiers": {"isbn_13": [isbn_b]}},
+                }
+            )
+        raise AssertionError(f"Unexpected URL: {url}")
+
+    monkeypatch.setattr(requests, "get", fake_get)
+
+    results = unified_metadata.fetch_unified_by_isbns_detailed([isbn_a, isbn_b, "12345"])
+
+    assert len(calls) == 2
+    assert results[isbn_a][0]["title"] == "Book A"
+    assert results[isbn_a][0]["publisher"] == "Edition Press"
+    assert results[isbn_b][0]["title"] == "Book B"
+    assert results[isbn_b][0]["google_books_id"] == "vol2"
+    assert results["12345"] == ({}, {"input": "invalid_format"})
+
+
+def test_bulk_fetch_falls_back_to_single_lookup_for_misses(monkeypatch):
+    """ISBNs missing from a bulk response are retried with the single-ISBN provider path."""
+    unified_metadata = load_unified_metadata_module()
+
+    requested_isbn = "9781591826040"
+    single_calls = []
+
+    def fake_get(url, timeout=None, headers=None):
+        if "googleapis.com/books/v1/volumes?q=" in url and "maxResults" in url:
+            return DummyResponse({"items": []})
+        if "googleapis.com/books/v1/volumes?q=isbn:" in url:
+            single_calls.append(url)
+            return DummyResponse({"items": []})
+        if "openlibrary.org/api/books" in url:
+            return DummyResponse(
+                {
+                    f"ISBN:{requested_isbn}": {
+                        "title": "Fruits Basket, Vol. 2",
+                        "identifiers": {"isbn_13": [requested_isbn]},
+                    }
+                }
+            )
+        raise AssertionError(f"Unexpected URL: {url}")
+
+    monkeypatch.setattr(requests, "get", fake_get)
+
+    results = unified_metadata.fetch_unified_by_isbns_detailed([requested_isbn])
+    merged, errors = results[requested_isbn]
+
+    assert len(single_calls) == 1
+    assert merged["title"] == "Fruits Basket, Vol. 2"
+    assert merged["isbn13"] == requested_isbn
+    assert errors.get("google") == "empty"